@@ -3,7 +3,12 @@ import uuid
 from datetime import datetime
 from pathlib import Path
 
-from blog_writer.graph import create_blog_graph
+from langgraph.types import Command
+
+from blog_writer.graph import get_blog_graph
+from blog_writer.jobs import get_job_runner
+from blog_writer.metrics import get_metrics, start_metrics_server
+from blog_writer.persistence.retention import start_background_retention
 from blog_writer.config import settings
 
 # 페이지 설정
@@ -13,15 +18,92 @@ st.set_page_config(
     layout="wide"
 )
 
-# 세션 상태 초기화
+# 체크포인트 자동 정리 (CHECKPOINT_RETENTION_INTERVAL_SECONDS > 0일 때, 프로세스당 한 번)
+start_background_retention()
+
+# Prometheus /metrics 노출 (METRICS_PORT > 0일 때, 프로세스당 한 번)
+start_metrics_server()
+
+
+
+@st.cache_resource
+def load_graph():
+    """모든 세션이 공유하는 컴파일 그래프 (체크포인터 연결, LLM 클라이언트 포함)"""
+    return get_blog_graph()
+
+
+graph = load_graph()
+
+runner = get_job_runner()
+
+# 세션 상태 초기화 (스레드 ID와 진행 여부만 저장, 워크플로우 상태는 체크포인터에서 읽음)
 if 'thread_id' not in st.session_state:
-    st.session_state.thread_id = None
-if 'graph' not in st.session_state:
-    st.session_state.graph = create_blog_graph()
-if 'current_state' not in st.session_state:
-    st.session_state.current_state = None
+    # 새로 고침한 페이지는 URL의 스레드 ID로 진행 중인 작업에 다시 연결
+    st.session_state.thread_id = st.query_params.get("thread")
 if 'workflow_started' not in st.session_state:
+    st.session_state.workflow_started = st.session_state.thread_id is not None
+
+
+def thread_config():
+    """현재 세션 스레드의 그래프 설정"""
+    return {"configurable": {"thread_id": st.session_state.thread_id}}
+
+
+def reset_workflow():
+    """새 작업을 위해 세션 초기화"""
+    st.session_state.thread_id = None
     st.session_state.workflow_started = False
+    st.query_params.clear()
+
+
+# 노드별 진행률 표시
+NODE_PROGRESS = {
+    "research": (20, "🔍 조사 중..."),
+    "write": (50, "✍️ 작성 중..."),
+    "edit": (80, "🎨 퇴고 중..."),
+    "save": (100, "✅ 완료!"),
+}
+
+
+def run_graph(graph_input):
+    """그래프를 다음 인터럽트(또는 종료)까지 실행하는 작업을 작업자 풀에 넣고 화면 갱신"""
+    runner.submit(st.session_state.thread_id, graph_input, graph)
+    st.rerun()
+
+
+@st.fragment(run_every=settings.job_poll_interval_seconds)
+def show_job_progress(job_id: str):
+    """실행 중인 작업의 단계·경과 시간·대기열·실시간 생성 텍스트 (이 영역만 주기적으로 갱신)"""
+    job = runner.get(job_id)
+    if job is None or not job.active:
+        # 작업이 끝나면 전체 화면을 다시 그려 다음 인터럽트 표시
+        st.rerun()
+
+    snapshot = job.snapshot()
+    stats = runner.stats()
+
+    if snapshot["status"] == "queued":
+        st.info(
+            f"⏳ 대기 중... 앞에 {runner.queue_position(job)}개 작업 "
+            f"(실행 중 {stats['running']}/{stats['workers']}, 대기 {stats['queued']})"
+        )
+        return
+
+    percent, message = NODE_PROGRESS.get(snapshot["node"], (5, "🚀 실행 중..."))
+    st.progress(percent)
+    st.text(f"{message} · 경과 {snapshot['elapsed_seconds']:.0f}초 · 대기열 {stats['queued']}개")
+
+    live = snapshot["live"]
+    if live["label"]:
+        done = live["ended_at"] is not None
+        st.markdown(f"**{'✅' if done else '✍️'} {live['label']} {'생성 완료' if done else '생성 중...'}**")
+        if "tokens" in live:
+            st.caption(
+                f"⏱️ 첫 토큰까지 {live['ttft']:.2f}초 · {live['tokens']:,} 토큰 · "
+                f"{live['tokens_per_second']:.1f} 토큰/초" + (" · 완료" if done else "")
+            )
+        st.markdown(live["text"])
+
 
 # 타이틀
 st.title("✍️ AI 블로그 작가")
@@ -38,9 +120,7 @@ with st.sidebar:
     """)
 
     if st.button("🔄 새 작업 시작"):
-        st.session_state.thread_id = None
-        st.session_state.current_state = None
-        st.session_state.workflow_started = False
+        reset_workflow()
         st.rerun()
 
     st.divider()
@@ -87,8 +167,9 @@ if not st.session_state.workflow_started:
         # 키워드 파싱
         keywords = [k.strip() for k in keywords_input.split(',') if k.strip()]
 
-        # 새 스레드 생성
+        # 새 스레드 생성 (URL에도 기록해 새로 고침 후 다시 연결)
         st.session_state.thread_id = str(uuid.uuid4())
+        st.query_params["thread"] = st.session_state.thread_id
 
         # 초기 상태
         initial_state = {
@@ -99,59 +180,32 @@ if not st.session_state.workflow_started:
             "current_stage": "initialized"
         }
 
-        # 워크플로우 시작
+        # 워크플로우 시작 (첫 인터럽트까지 백그라운드 실행)
         st.session_state.workflow_started = True
+        run_graph(initial_state)
 
-        config = {
-            "configurable": {
-                "thread_id": st.session_state.thread_id
-            }
-        }
-
-        # 진행 상황 표시
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-
-        try:
-            # 그래프 실행
-            for i, event in enumerate(st.session_state.graph.stream(
-                initial_state,
-                config,
-                stream_mode="updates"
-            )):
-                # 인터럽트 확인
-                if "__interrupt__" in event:
-                    st.session_state.current_state = st.session_state.graph.get_state(config)
-                    st.rerun()
-                    break
-
-                # 진행 상황 업데이트
-                node_name = list(event.keys())[0]
-                if node_name == "research":
-                    progress_bar.progress(20)
-                    status_text.text("🔍 조사 중...")
-                elif node_name == "write":
-                    progress_bar.progress(50)
-                    status_text.text("✍️ 작성 중...")
-                elif node_name == "edit":
-                    progress_bar.progress(80)
-                    status_text.text("🎨 퇴고 중...")
-                elif node_name == "save":
-                    progress_bar.progress(100)
-                    status_text.text("✅ 완료!")
-
-            # 최종 상태 확인
-            st.session_state.current_state = st.session_state.graph.get_state(config)
+else:
+    job = runner.latest(st.session_state.thread_id)
+    current_state = graph.get_state(thread_config())
+
+    if job is not None and job.active:
+        # 백그라운드 실행 중 - 진행 상황만 표시
+        st.header("⚙️ 실행 중")
+        show_job_progress(job.id)
+
+    elif job is not None and job.status == "failed":
+        st.error(f"오류 발생: {job.error}")
+        col1, col2 = st.columns(2)
+        if col1.button("🔁 다시 시도", type="primary"):
+            # 마지막 체크포인트에서 같은 입력으로 재실행
+            run_graph(job.graph_input)
+        if col2.button("🔄 처음부터"):
+            reset_workflow()
             st.rerun()
 
-        except Exception as e:
-            st.error(f"오류 발생: {str(e)}")
-            st.session_state.workflow_started = False
-
-else:
     # 워크플로우 진행 중 - 승인 및 질문 UI
-    if st.session_state.current_state:
-        state_values = st.session_state.current_state.values
+    elif current_state.values:
+        state_values = current_state.values
 
         # 현재 단계 표시
         current_stage = state_values.get("current_stage", "unknown")
@@ -159,10 +213,10 @@ else:
         st.header(f"📍 현재 단계: {current_stage}")
 
         # 인터럽트 데이터 확인
-        if hasattr(st.session_state.current_state, 'tasks') and st.session_state.current_state.tasks:
+        if current_state.tasks:
             # 승인 또는 질문 대기 중
             interrupt_data = None
-            for task in st.session_state.current_state.tasks:
+            for task in current_state.tasks:
                 if hasattr(task, 'interrupts') and task.interrupts:
                     interrupt_data = task.interrupts[0].value
                     break
@@ -209,47 +263,12 @@ else:
                             submit = st.form_submit_button("✅ 답변 제출", type="primary")
 
                         if skip:
-                            config = {
-                                "configurable": {
-                                    "thread_id": st.session_state.thread_id
-                                }
-                            }
-
-                            from langgraph.types import Command
-
-                            for event in st.session_state.graph.stream(
-                                Command(resume={"skipped": True, "answers": []}),
-                                config,
-                                stream_mode="updates"
-                            ):
-                                if "__interrupt__" in event:
-                                    break
-
-                            st.session_state.current_state = st.session_state.graph.get_state(config)
-                            st.rerun()
+                            run_graph(Command(resume={"skipped": True, "answers": []}))
 
                         if submit:
-                            config = {
-                                "configurable": {
-                                    "thread_id": st.session_state.thread_id
-                                }
-                            }
-
-                            from langgraph.types import Command
-
                             # 빈 답변 포함하여 제출 (사용자가 선택적으로 답변 가능)
                             filtered_answers = [a.strip() for a in answers]
-
-                            for event in st.session_state.graph.stream(
-                                Command(resume={"skipped": False, "answers": filtered_answers}),
-                                config,
-                                stream_mode="updates"
-                            ):
-                                if "__interrupt__" in event:
-                                    break
-
-                            st.session_state.current_state = st.session_state.graph.get_state(config)
-                            st.rerun()
+                            run_graph(Command(resume={"skipped": False, "answers": filtered_answers}))
 
                 # Approval 폼
                 elif interrupt_type == "approval":
@@ -285,6 +304,19 @@ else:
                         seo_score = interrupt_data.get("seo_score", 0)
                         st.metric("SEO 점수", f"{seo_score}/100")
 
+                        seo_report = interrupt_data.get("seo_report")
+                        if seo_report:
+                            with st.expander("📊 SEO 분석 상세"):
+                                col1, col2, col3 = st.columns(3)
+                                col1.metric("글자 수", seo_report["word_count"])
+                                col2.metric("평균 문장 길이", seo_report["avg_sentence_length"])
+                                col3.metric("H2 / H3", f"{seo_report['h2_count']} / {seo_report['h3_count']}")
+
+                                for kw, density in seo_report["keyword_density"].items():
+                                    st.markdown(f"- 키워드 **{kw}**: {density:.2f}%")
+                                for rec in seo_report["recommendations"]:
+                                    st.markdown(f"- 💡 {rec}")
+
                         st.markdown(content)
 
                     # 승인/거부 버튼
@@ -294,55 +326,29 @@ else:
                     with col1:
                         if st.button("✅ 승인하고 다음 단계로", key="approve", type="primary"):
                             # 승인 응답
-                            config = {
-                                "configurable": {
-                                    "thread_id": st.session_state.thread_id
-                                }
-                            }
-
-                            from langgraph.types import Command
-
                             # 그래프 재개
-                            for event in st.session_state.graph.stream(
-                                Command(resume={"approved": True, "feedback": ""}),
-                                config,
-                                stream_mode="updates"
-                            ):
-                                if "__interrupt__" in event:
-                                    break
-
-                            st.session_state.current_state = st.session_state.graph.get_state(config)
-                            st.rerun()
+                            run_graph(Command(resume={"approved": True, "feedback": ""}))
 
                     with col2:
                         if st.button("❌ 수정 요청", key="reject"):
                             feedback = st.text_area("수정 요청 사항", key="feedback_input")
 
                             if st.button("수정 요청 제출", key="submit_feedback"):
-                                config = {
-                                    "configurable": {
-                                        "thread_id": st.session_state.thread_id
-                                    }
-                                }
-
-                                from langgraph.types import Command
-
                                 # 그래프 재개 (거부)
-                                for event in st.session_state.graph.stream(
-                                    Command(resume={"approved": False, "feedback": feedback}),
-                                    config,
-                                    stream_mode="updates"
-                                ):
-                                    if "__interrupt__" in event:
-                                        break
-
-                                st.session_state.current_state = st.session_state.graph.get_state(config)
-                                st.rerun()
+                                run_graph(Command(resume={"approved": False, "feedback": feedback}))
 
         # 완료 확인
         if state_values.get("current_stage") == "complete":
             st.success("🎉 블로그 작성이 완료되었습니다!")
 
+            usage = get_metrics().thread_summary(st.session_state.thread_id)
+            if usage.get("llm_calls"):
+                st.caption(
+                    f"🤖 LLM {usage['llm_calls']:.0f}회 · 입력 {usage.get('prompt_tokens', 0):,.0f} / "
+                    f"출력 {usage.get('completion_tokens', 0):,.0f} 토큰 · 약 ${usage.get('cost_usd', 0):.4f} · "
+                    f"검색 {usage.get('search_calls', 0):.0f}회"
+                )
+
             output_file = state_values.get("output_file", "")
             if output_file:
                 st.info(f"📁 저장 위치: `{output_file}`")
@@ -360,7 +366,5 @@ else:
                     )
 
             if st.button("🔄 새 블로그 작성"):
-                st.session_state.thread_id = None
-                st.session_state.current_state = None
-                st.session_state.workflow_started = False
+                reset_workflow()
                 st.rerun()
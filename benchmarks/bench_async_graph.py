@@ -0,0 +1,112 @@
+"""동시 워크플로우 벤치마크: 스레드 풀 + 동기 그래프 vs 이벤트 루프 하나 + 비동기 그래프
+
+가짜 LLM/검색 백엔드(benchmarks.fakes)로 전체 워크플로우를 interrupt마다
+자동 승인하며 끝까지 실행하고, 벽시계 시간·처리량·최대 스레드 수를 비교한다.
+
+    python -m benchmarks.bench_async_graph --workflows 50 --llm-latency 0.2 --search-latency 0.3
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from benchmarks.fakes import arun_workflow, initial_state, install_fakes, run_workflow
+from blog_writer.config import settings
+from blog_writer.graph import create_blog_graph
+from blog_writer.persistence import (
+    aclose_checkpointers,
+    close_checkpointers,
+    get_async_checkpointer,
+    get_checkpointer
+)
+
+
+class _ThreadSampler:
+    """실행 중 최대 활성 스레드 수 기록"""
+
+    def __init__(self):
+        self.peak = threading.active_count()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(0.01):
+            self.peak = max(self.peak, threading.active_count())
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def _report(label: str, workflows: int, wall: float, peak_threads: int, saver) -> None:
+    put = saver.write_stats()["put"]
+    print(
+        f"{label:<10} {workflows}개 워크플로우  wall {wall:6.2f}s  "
+        f"{workflows / wall:6.2f} wf/s  최대 스레드 {peak_threads:>3}  "
+        f"체크포인트 put p95 {put['p95_ms']:.1f}ms"
+    )
+
+
+def _run_threaded(db_path: str, workflows: int) -> float:
+    saver = get_checkpointer(db_path)
+    graph = create_blog_graph(saver)
+
+    with _ThreadSampler() as sampler, contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workflows) as executor:
+            list(executor.map(
+                lambda i: run_workflow(graph, f"threaded-{i}", initial_state(f"주제 {i}")),
+                range(workflows)
+            ))
+        wall = time.perf_counter() - start
+
+    _report("threaded", workflows, wall, sampler.peak, saver)
+    close_checkpointers()
+    return wall
+
+
+async def _run_async(db_path: str, workflows: int) -> float:
+    saver = get_async_checkpointer(db_path)
+    graph = create_blog_graph(saver, async_mode=True)
+
+    with _ThreadSampler() as sampler, contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            arun_workflow(graph, f"async-{i}", initial_state(f"주제 {i}"))
+            for i in range(workflows)
+        ))
+        wall = time.perf_counter() - start
+
+    _report("async", workflows, wall, sampler.peak, saver)
+    await aclose_checkpointers()
+    return wall
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workflows", type=int, default=50)
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="LLM 호출당 지연 (초)")
+    parser.add_argument("--search-latency", type=float, default=0.3, help="검색 호출당 지연 (초)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, install_fakes(args.llm_latency, args.search_latency):
+        settings.output_dir = str(Path(tmp) / "output")
+        settings.research_dir = str(Path(tmp) / "research")
+
+        threaded = _run_threaded(str(Path(tmp) / "threaded.sqlite"), args.workflows)
+        async_wall = asyncio.run(_run_async(str(Path(tmp) / "async.sqlite"), args.workflows))
+        print(f"속도 향상: {threaded / async_wall:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
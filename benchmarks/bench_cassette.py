@@ -0,0 +1,68 @@
+"""녹화/재생 벤치마크: 가짜 Gemini/Tavily 지연으로 한 번 녹화한 뒤 네트워크 없이 재생
+
+    python -m benchmarks.bench_cassette --llm-latency lognormal:1.0,0.4 --search-latency 0.5 --replays 5
+"""
+
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+from pathlib import Path
+
+from langgraph.checkpoint.memory import MemorySaver
+
+from benchmarks.fakes import initial_state, install_fakes, run_workflow
+from blog_writer.cassette import close_cassettes, get_cassette
+from blog_writer.config import settings
+from blog_writer.graph import create_blog_graph
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--llm-latency", default="lognormal:1.0,0.4", help="녹화 시 LLM 호출당 지연")
+    parser.add_argument("--search-latency", default="0.5", help="녹화 시 검색 호출당 지연")
+    parser.add_argument("--replays", type=int, default=5)
+    args = parser.parse_args()
+
+    settings.google_api_key = settings.google_api_key or "benchmark-key"
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        settings.output_dir = str(tmp / "output")
+        settings.research_dir = str(tmp / "research")
+        settings.cassette_db = str(tmp / "cassettes.sqlite")
+
+        with install_fakes(llm_latency=args.llm_latency, search_latency=args.search_latency):
+            def timed(mode: str, thread_id: str) -> float:
+                # 노드는 그래프를 만들 때 모델을 받으므로 모드를 바꾼 뒤 컴파일
+                settings.cassette_mode = mode
+                graph = create_blog_graph(MemorySaver())
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    run_workflow(graph, thread_id, initial_state("아이 열날 때 대처법"))
+                return time.perf_counter() - start
+
+            live = timed("off", "live")
+            record = timed("record", "record")
+            recorded = get_cassette().stats()
+            replays = [timed("replay", f"replay-{i}") for i in range(args.replays)]
+            cassette = get_cassette()
+            stats, coverage = cassette.stats(), cassette.coverage()
+        settings.cassette_mode = "off"
+        close_cassettes()
+        size = (tmp / "cassettes.sqlite").stat().st_size
+
+    print(f"녹화 없음   {live * 1000:9.1f}ms")
+    print(f"녹화        {record * 1000:9.1f}ms  " + ", ".join(
+        f"{kind} {s['recorded']}건" for kind, s in recorded.items()
+    ) + f"  (파일 {size / 1024:.0f}KB)")
+    print(f"재생        {min(replays) * 1000:9.1f}ms (최소)  {max(replays) * 1000:9.1f}ms (최대)  "
+          f"{live / min(replays):,.0f}x")
+    for kind, s in stats.items():
+        print(f"  {kind:<8} 재생 {s['hits']}회, 미스 {s['misses']}회")
+    for name, s in coverage["series"].items():
+        print(f"  {name:<24} 커버리지 {s['coverage']:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""체크포인트 DB 증가량 벤치마크 (blob 오프로드 전/후)
+
+BlogState와 비슷한 크기의 텍스트 필드(조사 결과, 개요, 초안, 최종본)를
+단계마다 기록하고, 최종 승인 거부 루프를 몇 번 도는 워크플로우를 실행해
+워크플로우당 DB 증가량을 비교한다.
+
+    python -m benchmarks.bench_checkpoint_size --workflows 10 --rejections 3
+"""
+
+import argparse
+import random
+import sqlite3
+import tempfile
+from pathlib import Path
+from typing import TypedDict
+
+from langgraph.graph import StateGraph, START, END
+
+from blog_writer.persistence.blobs import make_blob_serializer
+from blog_writer.persistence.checkpointer import InstrumentedSqliteSaver, connect_checkpoint_db
+
+_SYLLABLES = "가나다라마바사아자차카타파하열성경련응급처치아이부모체온병원"
+
+
+class _State(TypedDict):
+    topic: str
+    research_data: str
+    outline: str
+    draft_content: str
+    final_content: str
+    rejections: int
+
+
+def _text(chars: int, rng: random.Random) -> str:
+    return "".join(rng.choice(_SYLLABLES) if i % 7 else " " for i in range(chars))
+
+
+def _build_graph(checkpointer, rejections: int, seed: int):
+    rng = random.Random(seed)
+    research = _text(30000, rng)
+    outline = _text(3000, rng)
+    draft = _text(15000, rng)
+
+    def research_node(state: _State) -> dict:
+        return {"research_data": research}
+
+    def write_node(state: _State) -> dict:
+        return {"outline": outline, "draft_content": draft}
+
+    def edit_node(state: _State) -> dict:
+        # 퇴고마다 최종본은 달라지지만 조사 결과/초안은 그대로
+        return {"final_content": _text(15000, rng)}
+
+    def approval_node(state: _State) -> dict:
+        return {"rejections": state["rejections"] + 1}
+
+    def route(state: _State) -> str:
+        return "edit" if state["rejections"] <= rejections else END
+
+    builder = StateGraph(_State)
+    builder.add_node("research", research_node)
+    builder.add_node("write", write_node)
+    builder.add_node("edit", edit_node)
+    builder.add_node("final_approval", approval_node)
+    builder.add_edge(START, "research")
+    builder.add_edge("research", "write")
+    builder.add_edge("write", "edit")
+    builder.add_edge("edit", "final_approval")
+    builder.add_conditional_edges("final_approval", route)
+    return builder.compile(checkpointer=checkpointer)
+
+
+def _db_bytes(db_path: str) -> int:
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    pages = conn.execute("PRAGMA page_count").fetchone()[0]
+    free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    conn.close()
+    return (pages - free) * page_size
+
+
+def _run(label: str, db_path: str, offload: bool, workflows: int, rejections: int) -> int:
+    serde = make_blob_serializer(connect_checkpoint_db(db_path)) if offload else None
+    saver = InstrumentedSqliteSaver(connect_checkpoint_db(db_path), serde=serde)
+
+    for i in range(workflows):
+        graph = _build_graph(saver, rejections, seed=i)
+        graph.invoke(
+            {"topic": f"주제 {i}", "research_data": "", "outline": "", "draft_content": "",
+             "final_content": "", "rejections": 0},
+            {"configurable": {"thread_id": f"{label}-{i}"}}
+        )
+
+    (checkpoints,) = saver.conn.execute("SELECT COUNT(*) FROM checkpoints").fetchone()
+    saver.conn.close()
+    if saver.blob_store is not None:
+        stats = saver.blob_store.stats()
+        print(
+            f"{'':<10} blobs {stats['blobs']}  raw {stats['raw_bytes'] / 1024:.0f}KB  "
+            f"stored {stats['stored_bytes'] / 1024:.0f}KB"
+        )
+        saver.blob_store.close()
+
+    size = _db_bytes(db_path)
+    print(
+        f"{label:<10} checkpoints {checkpoints:>4}  DB {size / 1024:8.0f}KB  "
+        f"per workflow {size / workflows / 1024:7.0f}KB"
+    )
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workflows", type=int, default=10)
+    parser.add_argument("--rejections", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        before = _run("inline", str(Path(tmp) / "inline.sqlite"), False, args.workflows, args.rejections)
+        after = _run("offload", str(Path(tmp) / "offload.sqlite"), True, args.workflows, args.rejections)
+        print(f"DB 크기 감소: {(1 - after / before) * 100:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
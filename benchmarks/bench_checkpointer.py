@@ -0,0 +1,124 @@
+"""체크포인터 동시성 부하 테스트
+
+N개 스레드가 각자 다른 thread_id로 작은 워크플로우(노드 4개, 노드마다
+수 KB 텍스트 기록)를 반복 실행한다. 세션마다 연결을 따로 여는 기존 방식과
+공용 체크포인터(get_checkpointer)를 비교해 잠금 오류 수와 쓰기 지연을 출력한다.
+
+    python -m benchmarks.bench_checkpointer --threads 16 --runs 5
+"""
+
+import argparse
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import TypedDict
+
+from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.graph import StateGraph, START, END
+
+from blog_writer.persistence import close_checkpointers, get_checkpointer
+
+
+class _State(TypedDict):
+    research_data: str
+    draft_content: str
+    final_content: str
+    step: int
+
+
+def _build_graph(checkpointer, payload_chars: int):
+    text = "가" * payload_chars
+
+    def research(state: _State) -> dict:
+        return {"research_data": text, "step": state["step"] + 1}
+
+    def write(state: _State) -> dict:
+        return {"draft_content": text + "초안", "step": state["step"] + 1}
+
+    def edit(state: _State) -> dict:
+        return {"final_content": text + "최종", "step": state["step"] + 1}
+
+    def save(state: _State) -> dict:
+        return {"step": state["step"] + 1}
+
+    builder = StateGraph(_State)
+    for name, fn in (("research", research), ("write", write), ("edit", edit), ("save", save)):
+        builder.add_node(name, fn)
+    builder.add_edge(START, "research")
+    builder.add_edge("research", "write")
+    builder.add_edge("write", "edit")
+    builder.add_edge("edit", "save")
+    builder.add_edge("save", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+def _run(label: str, make_checkpointer, threads: int, runs: int, payload_chars: int) -> None:
+    errors = []
+    durations = []
+    lock = threading.Lock()
+
+    def worker(index: int) -> None:
+        graph = _build_graph(make_checkpointer(), payload_chars)
+        for run in range(runs):
+            config = {"configurable": {"thread_id": f"{label}-{index}-{run}"}}
+            start = time.perf_counter()
+            try:
+                graph.invoke({"research_data": "", "draft_content": "", "final_content": "", "step": 0}, config)
+            except sqlite3.OperationalError as e:
+                with lock:
+                    errors.append(str(e))
+                continue
+            with lock:
+                durations.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    wall = time.perf_counter() - start
+
+    durations.sort()
+    p95 = durations[int(len(durations) * 0.95) - 1] * 1000 if durations else 0.0
+    print(
+        f"{label:<18} ok {len(durations):>4}  lock errors {len(errors):>3}  "
+        f"workflow p95 {p95:7.1f}ms  wall {wall:6.2f}s"
+    )
+    if errors:
+        print(f"{'':<18} e.g. {errors[0]}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--payload-chars", type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_db = str(Path(tmp) / "legacy.sqlite")
+        shared_db = str(Path(tmp) / "shared.sqlite")
+
+        # 1) 기존 방식: 세션(스레드)마다 기본 설정 연결 + SqliteSaver
+        _run(
+            "connection/session",
+            lambda: SqliteSaver(sqlite3.connect(legacy_db, check_same_thread=False)),
+            args.threads, args.runs, args.payload_chars
+        )
+
+        # 2) 공용 체크포인터
+        _run("shared saver", lambda: get_checkpointer(shared_db), args.threads, args.runs, args.payload_chars)
+
+        for op, stats in get_checkpointer(shared_db).write_stats().items():
+            print(
+                f"  {op:<11} n={stats['count']:<5} mean {stats['mean_ms']:6.2f}ms  "
+                f"p95 {stats['p95_ms']:6.2f}ms  max {stats['max_ms']:6.2f}ms"
+            )
+        close_checkpointers()
+
+
+if __name__ == "__main__":
+    main()
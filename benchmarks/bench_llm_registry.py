@@ -0,0 +1,64 @@
+"""LLM 클라이언트 재사용 마이크로벤치마크 (네트워크 호출 없음)
+
+1) 질문 생성 호출마다 모델을 새로 만드는 기존 방식 vs 공용 레지스트리
+2) 그래프 컴파일: 레지스트리가 빈 상태(기존과 같이 매번 Client 생성) vs 채워진 상태
+
+    python -m benchmarks.bench_llm_registry --calls 50 --compiles 20
+"""
+
+import argparse
+import time
+
+from langchain_google_genai import ChatGoogleGenerativeAI
+from langgraph.checkpoint.memory import MemorySaver
+
+from blog_writer.agents.clarification_agent import _get_gemini_model
+from blog_writer.config import settings
+from blog_writer.graph import create_blog_graph
+from blog_writer.llm import clear_llm_registry, llm_stats
+
+
+def _per_call_ms(fn, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--compiles", type=int, default=20)
+    args = parser.parse_args()
+
+    settings.google_api_key = settings.google_api_key or "benchmark-key"
+
+    # 1. 질문 생성 호출당 모델 준비 비용
+    legacy = _per_call_ms(
+        lambda: ChatGoogleGenerativeAI(
+            model="gemini-2.5-flash", google_api_key=settings.google_api_key, temperature=0.7
+        ),
+        args.calls
+    )
+    clear_llm_registry()
+    _get_gemini_model()  # 첫 호출의 생성 비용은 한 번뿐
+    shared = _per_call_ms(_get_gemini_model, args.calls)
+    print(f"질문 생성 모델 준비   new {legacy:8.3f}ms/call   registry {shared:8.3f}ms/call "
+          f"({legacy / shared:,.0f}x)  Client 생성 {llm_stats()['instantiations']}회")
+
+    # 2. 그래프 컴파일 (세션마다 그래프를 만드는 경우)
+    def cold_compile():
+        clear_llm_registry()
+        create_blog_graph(MemorySaver())
+
+    cold = _per_call_ms(cold_compile, args.compiles)
+    clear_llm_registry()
+    warm = _per_call_ms(lambda: create_blog_graph(MemorySaver()), args.compiles)
+    stats = llm_stats()
+    print(f"그래프 컴파일          new {cold:8.3f}ms/graph  registry {warm:8.3f}ms/graph "
+          f"({cold / warm:,.1f}x)  Client 생성 {stats['instantiations']}회, "
+          f"변형 {stats['variants']}회, 재사용 {stats['hits']}회")
+
+
+if __name__ == "__main__":
+    main()
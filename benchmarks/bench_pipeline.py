@@ -0,0 +1,258 @@
+"""오프라인 파이프라인 벤치마크 (가짜 Gemini/Tavily, 저장된 기준값과 비교)
+
+API 키 없이 전체 그래프를 interrupt마다 자동 응답하며 끝까지 실행하고
+워크플로우 전체/단계별 소요 시간, LLM 토큰, 검색 응답 크기, 체크포인트 DB 크기,
+워크플로우 하나의 최대 메모리(tracemalloc)를 측정한다. 기준값 파일이 있으면
+비교해서 허용 범위를 넘게 나빠진 항목이 있으면 종료 코드 1로 끝난다.
+
+    python -m benchmarks.bench_pipeline                          # 실행 + 기준값 비교
+    python -m benchmarks.bench_pipeline --save-baseline          # 기준값 갱신
+    python -m benchmarks.bench_pipeline --llm-latency lognormal:0.3,0.5 --workflows 20 --concurrency 8
+
+기준값은 설정(워크플로우 수, 지연 분포, 응답 크기 등)이 같을 때만 비교한다.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks.fakes import AUTO_RESPONSE, initial_state, install_fakes, run_workflow
+from blog_writer.config import settings
+from blog_writer.graph import create_blog_graph
+from blog_writer.metrics import get_metrics
+from blog_writer.persistence import close_checkpointers, get_checkpointer
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "pipeline.json"
+
+# 이 값보다 작은 차이는 측정 잡음으로 보고 회귀로 판정하지 않음
+_ABSOLUTE_FLOOR = {"ms": 10.0, "bytes": 4096, "mb": 0.25, "tokens": 50}
+
+# 가짜 백엔드에서는 결정적인 크기 지표(체크포인트, 토큰)는 시간/메모리보다 엄격하게 비교
+_SIZE_UNITS = ("bytes", "tokens")
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "p50": ordered[len(ordered) // 2],
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "max": ordered[-1]
+    }
+
+
+def _responder(rejections: int, answers: bool):
+    """최종 승인을 rejections번 거부하고, answers면 질문에 답하는 자동 응답"""
+    state = {"rejected": 0}
+
+    def respond(value: Dict) -> Dict:
+        if value.get("type") == "clarification" and answers:
+            return {"skipped": False, "answers": ["벤치마크 답변"] * len(value.get("questions", []))}
+        if value.get("type") == "approval" and value.get("stage") == "최종" and state["rejected"] < rejections:
+            state["rejected"] += 1
+            return {"approved": False, "feedback": "더 간결하게 다듬어 주세요"}
+        return AUTO_RESPONSE
+
+    return respond
+
+
+def _db_bytes(db_path: Path) -> int:
+    return sum(p.stat().st_size for p in db_path.parent.glob(db_path.name + "*"))
+
+
+def run_benchmark(args) -> Dict:
+    """설정대로 워크플로우를 실행하고 측정 결과 반환"""
+    with tempfile.TemporaryDirectory() as tmp, install_fakes(
+        llm_latency=args.llm_latency,
+        search_latency=args.search_latency,
+        response_scale=args.response_scale,
+        result_chars=args.result_chars,
+        seed=args.seed
+    ):
+        tmp = Path(tmp)
+        settings.output_dir = str(tmp / "output")
+        settings.research_dir = str(tmp / "research")
+        db_path = tmp / "checkpoints.sqlite"
+
+        metrics = get_metrics()
+        metrics.reset()
+        graph = create_blog_graph(get_checkpointer(str(db_path)))
+
+        def one(i: int) -> float:
+            start = time.perf_counter()
+            state = initial_state(f"벤치마크 주제 {i}")
+            result = run_workflow(graph, f"bench-{i}", state, _responder(args.rejections, args.answers))
+            if result.get("current_stage") != "complete":
+                raise RuntimeError(f"워크플로우 {i}가 완료되지 않았습니다: {result.get('current_stage')}")
+            return time.perf_counter() - start
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            # 첫 실행의 캐시 준비·지연 초기화 비용은 제외
+            one(-1)
+            metrics.reset()
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+                durations = list(executor.map(one, range(args.workflows)))
+            wall = time.perf_counter() - start
+            summary = metrics.summary()
+
+            # 메모리는 추적 오버헤드가 시간 측정에 섞이지 않도록 워크플로우 하나를 따로 실행해 측정
+            tracemalloc.start()
+            one(args.workflows)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        close_checkpointers()
+        checkpoint_bytes = _db_bytes(db_path) / (args.workflows + 2)
+
+    llm = summary.get("llm", {}).values()
+    search = summary.get("search", {}).values()
+    return {
+        "config": {
+            "workflows": args.workflows,
+            "concurrency": args.concurrency,
+            "llm_latency": str(args.llm_latency),
+            "search_latency": str(args.search_latency),
+            "response_scale": args.response_scale,
+            "result_chars": args.result_chars,
+            "rejections": args.rejections,
+            "answers": args.answers,
+            "seed": args.seed
+        },
+        "wall_seconds": wall,
+        "workflow_ms": {k: v * 1000 for k, v in _percentiles(durations).items()},
+        "stages": {
+            node: {"count": s["count"], "p50_ms": s["p50_ms"], "p95_ms": s["p95_ms"]}
+            for node, s in summary.get("node", {}).items()
+        },
+        "llm": {
+            "calls": sum(s["count"] for s in llm),
+            "prompt_tokens": sum(s.get("prompt_tokens", 0) for s in llm),
+            "completion_tokens": sum(s.get("completion_tokens", 0) for s in llm)
+        },
+        "search": {
+            "calls": sum(s["count"] for s in search),
+            "bytes": sum(s.get("bytes", 0) for s in search)
+        },
+        "checkpoint_bytes_per_workflow": checkpoint_bytes,
+        "peak_memory_mb": peak / 1024 / 1024
+    }
+
+
+def _tracked(result: Dict) -> Dict[str, tuple]:
+    """기준값과 비교할 항목: 이름 → (값, 단위)"""
+    tracked = {
+        "workflow p50": (result["workflow_ms"]["p50"], "ms"),
+        "workflow p95": (result["workflow_ms"]["p95"], "ms"),
+        "checkpoint bytes/workflow": (result["checkpoint_bytes_per_workflow"], "bytes"),
+        "peak memory": (result["peak_memory_mb"], "mb"),
+        "prompt tokens": (result["llm"]["prompt_tokens"], "tokens")
+    }
+    for node, stats in result["stages"].items():
+        tracked[f"stage {node} p50"] = (stats["p50_ms"], "ms")
+    return tracked
+
+
+def compare_to_baseline(
+    result: Dict,
+    baseline: Dict,
+    tolerance: float = 0.5,
+    size_tolerance: float = 0.05
+) -> List[str]:
+    """기준값보다 (1 + 허용 비율)배 넘게, 잡음 하한보다 크게 나빠진 항목 목록
+
+    시간/메모리는 tolerance, 체크포인트 크기/토큰 수는 size_tolerance를 쓴다.
+    """
+    current = _tracked(result)
+    regressions = []
+    for name, (base_value, unit) in _tracked(baseline).items():
+        if name not in current:
+            continue
+        value = current[name][0]
+        allowed = size_tolerance if unit in _SIZE_UNITS else tolerance
+        if value > base_value * (1 + allowed) and value - base_value > _ABSOLUTE_FLOOR[unit]:
+            change = (value / base_value - 1) * 100 if base_value else float("inf")
+            regressions.append(f"{name}: {base_value:,.1f} → {value:,.1f} {unit} (+{change:.0f}%)")
+    return regressions
+
+
+def _print_report(result: Dict) -> None:
+    config = result["config"]
+    print(
+        f"📊 워크플로우 {config['workflows']}개 (동시 {config['concurrency']}, "
+        f"LLM {config['llm_latency']}s, 검색 {config['search_latency']}s): wall {result['wall_seconds']:.2f}s"
+    )
+    wf = result["workflow_ms"]
+    print(f"  워크플로우      p50 {wf['p50']:9.1f}ms  p95 {wf['p95']:9.1f}ms  max {wf['max']:9.1f}ms")
+    for node, stats in result["stages"].items():
+        print(f"  {node:<30} {stats['count']:>4}회  p50 {stats['p50_ms']:8.1f}ms  p95 {stats['p95_ms']:8.1f}ms")
+    print(
+        f"  LLM {result['llm']['calls']}회 (입력 {result['llm']['prompt_tokens']:,} / 출력 "
+        f"{result['llm']['completion_tokens']:,} 토큰), 검색 {result['search']['calls']}회 "
+        f"({result['search']['bytes'] / 1024:.0f}KB)"
+    )
+    print(
+        f"  체크포인트 {result['checkpoint_bytes_per_workflow'] / 1024:.1f}KB/워크플로우, "
+        f"워크플로우 하나의 최대 메모리 {result['peak_memory_mb']:.1f}MB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workflows", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--llm-latency", default="0", help="LLM 호출당 지연 (초 또는 uniform:a,b / lognormal:중앙값,sigma)")
+    parser.add_argument("--search-latency", default="0", help="검색 호출당 지연 (LLM과 같은 형식)")
+    parser.add_argument("--response-scale", type=float, default=1.0, help="초안/최종본 응답 길이 배수")
+    parser.add_argument("--result-chars", type=int, default=600, help="검색 결과 하나의 본문 길이")
+    parser.add_argument("--rejections", type=int, default=1, help="워크플로우마다 최종 승인 거부 횟수")
+    parser.add_argument("--answers", action="store_true", help="질문을 건너뛰지 않고 답변")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="기준값 JSON 경로")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준값으로 저장")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="시간/메모리 허용 악화 비율 (0.5 = 50%%)")
+    parser.add_argument("--size-tolerance", type=float, default=0.05, help="체크포인트 크기/토큰 수 허용 악화 비율")
+    parser.add_argument("--json", help="결과를 JSON으로 저장할 경로")
+    args = parser.parse_args()
+
+    settings.google_api_key = settings.google_api_key or "benchmark-key"
+    result = run_benchmark(args)
+    _print_report(result)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(result, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"💾 기준값 저장: {baseline_path}")
+        return
+
+    if not baseline_path.exists():
+        print("ℹ️ 기준값 없음 (--save-baseline으로 저장)")
+        return
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    if baseline["config"] != result["config"]:
+        print("ℹ️ 기준값과 설정이 달라 비교하지 않음")
+        return
+
+    regressions = compare_to_baseline(result, baseline, args.tolerance, args.size_tolerance)
+    if regressions:
+        print(f"❌ 기준값 대비 회귀 {len(regressions)}건")
+        for line in regressions:
+            print(f"  - {line}")
+        sys.exit(1)
+    print(f"✅ 기준값 대비 회귀 없음 (시간/메모리 {args.tolerance:.0%}, 크기 {args.size_tolerance:.0%} 이내)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""LLM 스케줄러 벤치마크: 서버 한도(429)가 있는 가짜 Gemini로 동시 워크플로우 실행
+
+세 가지 설정을 비교한다.
+- off:    스케줄러 없음 (429가 나면 그대로 실패)
+- aimd:   스케줄러는 켜지만 한도를 모름 (429를 보고 동시 호출 수를 줄이고 재시도)
+- bucket: 스케줄러에 서버 한도를 알려줌 (토큰 버킷으로 429 전에 속도 조절)
+
+실행 시간을 줄이려고 "분당 한도"의 구간을 --window초로 줄여서 센다 (서버와 스케줄러 모두).
+
+    python -m benchmarks.bench_scheduler --workflows 6 --pro-limit 10 --window 10 --llm-latency 0.2
+"""
+
+import argparse
+import contextlib
+import io
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from langgraph.checkpoint.memory import MemorySaver
+
+from benchmarks.fakes import FakeQuota, initial_state, install_fakes, run_workflow
+from blog_writer.config import settings
+from blog_writer.graph import create_blog_graph
+from blog_writer.metrics import get_metrics
+from blog_writer.scheduler import LLMScheduler, get_llm_scheduler
+
+
+def run(mode: str, args) -> dict:
+    """설정 하나로 워크플로우를 동시에 실행하고 결과 집계"""
+    settings.llm_scheduler_enabled = mode != "off"
+    quota = FakeQuota(args.pro_limit, window=args.window)
+    limits = {settings.model_name: (args.pro_limit, 0)} if mode == "bucket" else {}
+    shared = LLMScheduler(limits=limits, default_limits=(0, 0), window_seconds=args.window)
+    metrics = get_metrics()
+    metrics.reset()
+
+    with install_fakes(
+        llm_latency=args.llm_latency,
+        search_latency=0.0,
+        llm_scheduler=shared,
+        quotas={settings.model_name: quota}
+    ):
+        graph = create_blog_graph(MemorySaver())
+
+        def one(i: int) -> bool:
+            try:
+                run_workflow(graph, f"{mode}-{i}", initial_state(f"주제 {i}"))
+                return True
+            except Exception:
+                return False
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()), ThreadPoolExecutor(max_workers=args.workflows) as executor:
+            ok = list(executor.map(one, range(args.workflows)))
+        wall = time.perf_counter() - start
+        lanes = get_llm_scheduler().stats() if mode != "off" else {}
+
+    queue = metrics.summary().get("llm_queue", {})
+    return {
+        "mode": mode,
+        "wall": wall,
+        "failed": ok.count(False),
+        "rejected": quota.rejected,
+        "limit": lanes.get(settings.model_name, {}).get("limit"),
+        "queue": {name: (s["count"], s["p95_ms"]) for name, s in queue.items()}
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workflows", type=int, default=6, help="동시에 실행할 워크플로우 수")
+    parser.add_argument("--pro-limit", type=int, default=10, help="가짜 서버의 Pro 모델 구간당 요청 한도")
+    parser.add_argument("--window", type=float, default=10.0, help="한도를 세는 구간 (초, 실제로는 60)")
+    parser.add_argument("--llm-latency", default="0.2")
+    parser.add_argument("--modes", default="off,aimd,bucket")
+    args = parser.parse_args()
+
+    settings.google_api_key = settings.google_api_key or "benchmark-key"
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.output_dir = str(Path(tmp) / "output")
+        settings.research_dir = str(Path(tmp) / "research")
+        results = [run(mode, args) for mode in args.modes.split(",")]
+
+    print(
+        f"워크플로우 {args.workflows}개 동시, Pro 한도 {args.window:g}초당 {args.pro_limit}회, "
+        f"LLM 지연 {args.llm_latency}s"
+    )
+    for r in results:
+        limit = f"  동시 한도 {r['limit']}" if r["limit"] is not None else ""
+        print(f"  {r['mode']:<7} {r['wall']:7.2f}s  실패 {r['failed']}  429 {r['rejected']:>3}회{limit}")
+        for name, (count, p95) in sorted(r["queue"].items()):
+            print(f"    대기 {name:<32} {count:>4}회  p95 {p95:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""SEO 분석기 스케일링 벤치마크
+
+본문 길이와 키워드 수를 늘려 가며 기존 다중 스캔 방식과 단일 스캔
+analyze_seo의 처리 시간을 비교한다. 단일 스캔은 본문 길이에 선형,
+키워드 수에는 거의 무관해야 한다.
+
+    python -m benchmarks.bench_seo --repeat 5
+"""
+
+import argparse
+import random
+import time
+
+from blog_writer.tools.seo_analyzer import analyze_seo
+
+_WORDS = [
+    "열성", "경련은", "생후", "6개월에서", "5세", "사이", "아이에게", "흔하게", "나타납니다",
+    "응급처치", "방법을", "알아두면", "부모가", "침착하게", "대응할", "수", "있습니다",
+    "AI", "GPT-4", "블로그", "글쓰기", "SEO", "키워드", "밀도", "구조화", "가독성",
+]
+
+
+def _make_document(paragraphs: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    lines = []
+    for p in range(paragraphs):
+        if p % 4 == 0:
+            lines.append(f"## 섹션 {p // 4}")
+        elif p % 4 == 2:
+            lines.append(f"### 소제목 {p}")
+        for _ in range(5):
+            lines.append(" ".join(rng.choice(_WORDS) for _ in range(18)) + ".")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def _make_keywords(count: int) -> list:
+    base = ["열성 경련", "응급처치", "SEO", "블로그 글쓰기", "키워드 밀도"]
+    return [base[i] if i < len(base) else f"키워드{i}" for i in range(count)]
+
+
+def _legacy_seo(content: str, keywords: list) -> None:
+    """기존 구현의 스캔 패턴 (키워드마다 lower + count, 부호/헤더별 count)"""
+    word_count = len(content.split())
+    {kw: content.lower().count(kw.lower()) for kw in keywords}
+    content.count('.') + content.count('!') + content.count('?')
+    content.count('## ')
+    content.count('### ')
+    return word_count
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print("본문 길이 스케일링 (키워드 5개)")
+    print(f"{'chars':>9} {'legacy ms':>10} {'single ms':>10} {'us/char':>8}")
+    for paragraphs in (10, 20, 40, 80, 160, 320):
+        doc = _make_document(paragraphs)
+        keywords = _make_keywords(5)
+        legacy = _time(lambda: _legacy_seo(doc, keywords), args.repeat)
+        single = _time(lambda: analyze_seo(doc, keywords), args.repeat)
+        print(f"{len(doc):>9} {legacy * 1000:>10.2f} {single * 1000:>10.2f} {single / len(doc) * 1e6:>8.3f}")
+
+    print()
+    print("키워드 수 스케일링 (본문 고정)")
+    doc = _make_document(80)
+    print(f"{'keywords':>9} {'legacy ms':>10} {'single ms':>10}")
+    for count in (1, 4, 16, 64, 256):
+        keywords = _make_keywords(count)
+        legacy = _time(lambda: _legacy_seo(doc, keywords), args.repeat)
+        single = _time(lambda: analyze_seo(doc, keywords), args.repeat)
+        print(f"{count:>9} {legacy * 1000:>10.2f} {single * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
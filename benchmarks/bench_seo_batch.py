@@ -0,0 +1,39 @@
+"""일괄 SEO 채점 처리량 벤치마크 (프로세스 수별 docs/s)
+
+합성 문서 N개를 score_many로 1..max-workers 프로세스에서 채점해
+처리량을 비교한다.
+
+    python -m benchmarks.bench_seo_batch --docs 400 --max-workers 4
+"""
+
+import argparse
+import os
+import time
+
+from benchmarks.bench_seo import _make_document, _make_keywords
+from blog_writer.tools.seo_analyzer import score_many
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=400)
+    parser.add_argument("--paragraphs", type=int, default=40, help="문서당 문단 수 (약 380자/문단)")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunksize", type=int, default=None)
+    args = parser.parse_args()
+
+    documents = [_make_document(args.paragraphs, seed=i) for i in range(args.docs)]
+    keywords = _make_keywords(5)
+
+    print(f"{'workers':>8} {'wall s':>8} {'docs/s':>9} {'speedup':>8}")
+    baseline = None
+    for workers in range(1, args.max_workers + 1):
+        start = time.perf_counter()
+        count = sum(1 for _ in score_many(documents, keywords, workers=workers, chunksize=args.chunksize))
+        wall = time.perf_counter() - start
+        baseline = baseline or wall
+        print(f"{workers:>8} {wall:>8.2f} {count / wall:>9.1f} {baseline / wall:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
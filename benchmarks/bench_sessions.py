@@ -0,0 +1,86 @@
+"""Streamlit 세션 시뮬레이션: 세션마다 그래프 컴파일 vs 프로세스 공용 그래프
+
+세션 하나 = 그래프 준비 + 첫 interrupt까지 실행 + 세션 상태 보관.
+기존 방식은 세션마다 create_blog_graph()를 호출하고 StateSnapshot을 세션에 보관했고,
+공용 방식은 get_blog_graph() 하나를 쓰고 세션에는 스레드 ID만 보관한다.
+가짜 LLM/검색 백엔드(지연 0)로 실행하며 세션 시작 시간과 남는 메모리를 비교한다.
+
+    python -m benchmarks.bench_sessions --sessions 1 50
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import statistics
+import tempfile
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+
+from benchmarks.fakes import initial_state, install_fakes
+from blog_writer.config import settings
+from blog_writer.graph import close_blog_graphs, create_blog_graph, get_blog_graph
+from blog_writer.persistence import get_checkpointer
+
+
+def _per_session_graph(db_path: str):
+    graph = create_blog_graph(get_checkpointer(db_path))
+    return graph, lambda config: {"graph": graph, "current_state": graph.get_state(config)}
+
+
+def _shared_graph(db_path: str):
+    graph = get_blog_graph(db_path)
+    return graph, lambda config: {"thread_id": config["configurable"]["thread_id"]}
+
+
+def _simulate(mode: str, db_path: str, sessions: int) -> dict:
+    acquire = _per_session_graph if mode == "per-session" else _shared_graph
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    session_states = []
+    startup = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(sessions):
+            start = time.perf_counter()
+            graph, session_state = acquire(db_path)
+            startup.append(time.perf_counter() - start)
+
+            config = {"configurable": {"thread_id": str(uuid.uuid4())}}
+            graph.invoke(initial_state("세션 주제"), config)
+            session_states.append(session_state(config))
+
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    close_blog_graphs()
+    return {
+        "startup_ms": statistics.mean(startup) * 1000,
+        "cold_ms": startup[0] * 1000,
+        "retained_kb": retained / 1024
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 50])
+    args = parser.parse_args()
+
+    settings.google_api_key = settings.google_api_key or "benchmark-key"
+    with tempfile.TemporaryDirectory() as tmp, install_fakes(llm_latency=0, search_latency=0):
+        settings.research_dir = str(Path(tmp) / "research")
+        for n in args.sessions:
+            for mode in ("per-session", "shared"):
+                result = _simulate(mode, str(Path(tmp) / f"{mode}-{n}.sqlite"), n)
+                print(
+                    f"{mode:<12} 세션 {n:>3}개  첫 세션 {result['cold_ms']:7.2f}ms  "
+                    f"평균 그래프 준비 {result['startup_ms']:7.2f}ms  "
+                    f"남는 메모리 {result['retained_kb']:9.1f}KB ({result['retained_kb'] / n:7.1f}KB/세션)"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Tavily 클라이언트 연결 재사용 벤치마크 (로컬 대역 HTTP 서버 사용)
+
+호출마다 새 TavilyClient를 만드는 기존 방식과 공용 풀 클라이언트
+(get_tavily_client / deep_research_many)의 쿼리당 지연 시간을 비교한다.
+
+    python -m benchmarks.bench_tavily_pool --queries 200 --latency-ms 5
+"""
+
+import argparse
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from tavily import TavilyClient
+
+from blog_writer.config import settings
+from blog_writer.tools import tavily_search
+
+
+def _make_handler(latency_ms: float):
+    body = json.dumps({
+        "answer": "stand-in answer",
+        "results": [
+            {"title": f"T{i}", "url": f"https://example.com/{i}", "content": "C" * 500, "score": 0.5}
+            for i in range(10)
+        ]
+    }).encode("utf-8")
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive 허용
+        disable_nagle_algorithm = True  # 헤더/본문 분할 전송 시 delayed ACK 대기 방지
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            time.sleep(latency_ms / 1000)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def _summary(label: str, latencies: list, wall: float) -> None:
+    latencies_ms = sorted(x * 1000 for x in latencies)
+    p95 = latencies_ms[int(len(latencies_ms) * 0.95) - 1]
+    print(
+        f"{label:<28} mean {statistics.mean(latencies_ms):7.2f}ms  "
+        f"p50 {statistics.median(latencies_ms):7.2f}ms  p95 {p95:7.2f}ms  "
+        f"wall {wall:6.2f}s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(args.latency_ms))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    settings.tavily_api_base_url = base_url
+    settings.search_cache_enabled = False
+    tavily_search.reset_tavily_client()
+    queries = [f"query {i}" for i in range(args.queries)]
+
+    # 1) 기존 방식: 호출마다 클라이언트 생성 + 새 연결
+    latencies = []
+    start = time.perf_counter()
+    for q in queries:
+        t0 = time.perf_counter()
+        TavilyClient(api_key="bench", api_base_url=base_url).search(query=q)
+        latencies.append(time.perf_counter() - t0)
+    _summary("new client per call", latencies, time.perf_counter() - start)
+
+    # 2) 공용 풀 클라이언트 (순차)
+    latencies = []
+    start = time.perf_counter()
+    for q in queries:
+        t0 = time.perf_counter()
+        tavily_search.deep_research.invoke({"query": q})
+        latencies.append(time.perf_counter() - t0)
+    _summary("pooled client", latencies, time.perf_counter() - start)
+
+    # 3) 공용 풀 + deep_research_many
+    start = time.perf_counter()
+    tavily_search.deep_research_many(queries)
+    wall = time.perf_counter() - start
+    print(
+        f"{'deep_research_many':<28} {args.queries / wall:7.1f} queries/s  "
+        f"(concurrency {settings.research_max_concurrency})  wall {wall:6.2f}s"
+    )
+
+    tavily_search.reset_tavily_client()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
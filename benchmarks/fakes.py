@@ -0,0 +1,343 @@
+"""벤치마크용 가짜 LLM/검색 백엔드 (네트워크 없음, 시드 고정으로 결정적)
+
+install_fakes()는 에이전트 모듈의 get_llm, 질문 생성 모델,
+동기/비동기 Tavily 클라이언트를 가짜로 바꾸고 검색 캐시를 끈다.
+가짜 채팅 모델은 LangChain BaseChatModel이라 계측 콜백(토큰/비용)과
+토큰 스트리밍 경로가 실제 모델과 같이 동작한다.
+
+지연 시간은 초 단위 숫자(고정) 또는 분포 문자열로 지정한다.
+    "0.2"                 고정 0.2초
+    "uniform:0.1,0.4"     0.1~0.4초 균등 분포
+    "lognormal:0.3,0.5"   중앙값 0.3초, sigma 0.5 로그정규 분포 (긴 꼬리)
+
+    with install_fakes(llm_latency="lognormal:0.3,0.5", search_latency=0.1, response_scale=2):
+        graph = create_blog_graph(checkpointer)
+        run_workflow(graph, "thread-1", initial_state("주제"))
+"""
+
+import asyncio
+import json
+import math
+import random
+import threading
+import time
+import zlib
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Union
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.exceptions import ModelRateLimitError
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langgraph.types import Command
+from pydantic import ConfigDict
+
+from blog_writer.agents import clarification_agent, editing_agent, research_agent, writing_agent
+from blog_writer.cassette import wrap_llm
+from blog_writer.config import settings
+from blog_writer import scheduler
+from blog_writer.metrics import get_metrics_callback
+from blog_writer.prompts import estimate_tokens
+from blog_writer.scheduler import PRIORITY_INTERACTIVE, PRIORITY_NORMAL, LLMScheduler, schedule_llm
+from blog_writer.tools import tavily_search
+
+# interrupt 종류와 상관없이 통과시키는 응답 (승인 + 질문 건너뛰기)
+AUTO_RESPONSE = {"approved": True, "feedback": "", "skipped": True, "answers": []}
+
+_QUESTIONS = json.dumps({
+    "questions": [
+        {"text": "주요 독자층은 누구인가요?", "category": "audience", "placeholder": "예: 초보 부모"},
+        {"text": "강조하고 싶은 내용은?", "category": "direction", "placeholder": "예: 실전 경험"},
+        {"text": "피해야 할 표현은?", "category": "constraint", "placeholder": "예: 전문용어"}
+    ]
+}, ensure_ascii=False)
+
+_OUTLINE = "\n".join(
+    ["# 제목", "도입부 계획"]
+    + [f"## 섹션 {i}\n- 요점 {i}" for i in range(1, 4)]
+)
+
+
+class LatencyModel:
+    """시드 고정 지연 시간 분포 (fixed / uniform / lognormal)"""
+
+    def __init__(self, spec: Union[float, str] = 0.0, seed: int = 0):
+        self.spec = str(spec)
+        kind, _, params = self.spec.partition(":")
+        if not params:
+            kind, params = "fixed", kind
+        values = [float(v) for v in params.split(",")]
+        if kind not in ("fixed", "uniform", "lognormal") or len(values) != (1 if kind == "fixed" else 2):
+            raise ValueError(f"알 수 없는 지연 시간 분포: {spec}")
+        self.kind = kind
+        self.values = values
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self) -> float:
+        if self.kind == "fixed":
+            return self.values[0]
+        with self._lock:
+            if self.kind == "uniform":
+                return self._random.uniform(*self.values)
+            median, sigma = self.values
+            return self._random.lognormvariate(math.log(median), sigma) if median > 0 else 0.0
+
+
+class FakeQuota:
+    """서버 쪽 요청 한도 흉내 (최근 window초 동안 limit개를 넘으면 429)"""
+
+    def __init__(self, limit: int, window: float = 60.0):
+        self.window = window
+        self.allowed = max(1, limit)
+        self.rejected = 0
+        self._calls: deque = deque()
+        self._lock = threading.Lock()
+
+    def check(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            while self._calls and now - self._calls[0] > self.window:
+                self._calls.popleft()
+            if len(self._calls) >= self.allowed:
+                self.rejected += 1
+                raise ModelRateLimitError("429 RESOURCE_EXHAUSTED (fake quota)")
+            self._calls.append(now)
+
+
+def _reply(prompt: str, scale: float = 1.0) -> str:
+    """프롬프트 종류에 맞는 그럴듯한 응답 (본문 길이는 scale배)"""
+    if "JSON 형식만 출력하세요" in prompt:
+        return _QUESTIONS
+    if "상세한 개요" in prompt:
+        return _OUTLINE
+    if "연결 문장" in prompt:
+        return "없음"
+    repeat = max(1, round(20 * scale))
+    return "\n\n".join(
+        f"## 섹션 {i}\n\n" + "열이 나면 먼저 체온을 잰다. 그리고 병원에 간다. " * repeat
+        for i in range(1, 4)
+    )
+
+
+class FakeChatModel(BaseChatModel):
+    """호출마다 latency 분포에서 뽑은 시간만큼 대기 후 고정 응답을 주는 채팅 모델
+
+    usage_metadata(추정 토큰)를 채우고, 스트리밍은 chunk_chars 글자 단위로 나눠 보낸다.
+    quota를 주면 한도를 넘은 호출은 바로 ModelRateLimitError(429)로 실패한다.
+    failures를 주면 처음 그 횟수만큼의 호출이 429로 실패한다 (재시도 테스트용).
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    latency: Any = 0.05
+    model_name: str = "gemini-2.5-pro"
+    response_scale: float = 1.0
+    chunk_chars: int = 40
+    quota: Optional[FakeQuota] = None
+    failures: int = 0
+    calls: int = 0
+
+    def model_post_init(self, __context) -> None:
+        if not isinstance(self.latency, LatencyModel):
+            self.latency = LatencyModel(self.latency)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-gemini"
+
+    def _get_ls_params(self, stop=None, **kwargs) -> Dict:
+        return {**super()._get_ls_params(stop=stop, **kwargs), "ls_model_name": self.model_name}
+
+    def _admit(self) -> None:
+        if self.failures > 0:
+            self.failures -= 1
+            raise ModelRateLimitError("429 RESOURCE_EXHAUSTED")
+        if self.quota is not None:
+            self.quota.check()
+
+    def _respond(self, messages: List[BaseMessage]) -> AIMessage:
+        self.calls += 1
+        prompt = "\n".join(str(m.content) for m in messages)
+        text = _reply(prompt, self.response_scale)
+        prompt_tokens, completion_tokens = estimate_tokens(prompt), estimate_tokens(text)
+        return AIMessage(content=text, usage_metadata={
+            "input_tokens": prompt_tokens,
+            "output_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens
+        })
+
+    def _chunks(self, message: AIMessage) -> Iterator[ChatGenerationChunk]:
+        text = message.content
+        pieces = [text[i:i + self.chunk_chars] for i in range(0, len(text), self.chunk_chars)] or [""]
+        for i, piece in enumerate(pieces):
+            # 사용량은 마지막 청크에만 (Gemini 스트리밍과 같은 방식)
+            usage = message.usage_metadata if i == len(pieces) - 1 else None
+            yield ChatGenerationChunk(message=AIMessageChunk(content=piece, usage_metadata=usage))
+
+    def _generate(self, messages, stop=None, run_manager: Optional[CallbackManagerForLLMRun] = None,
+                  **kwargs) -> ChatResult:
+        self._admit()
+        time.sleep(self.latency.sample())
+        return ChatResult(generations=[ChatGeneration(message=self._respond(messages))])
+
+    async def _agenerate(self, messages, stop=None,
+                         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None, **kwargs) -> ChatResult:
+        self._admit()
+        await asyncio.sleep(self.latency.sample())
+        return ChatResult(generations=[ChatGeneration(message=self._respond(messages))])
+
+    def _stream(self, messages, stop=None, run_manager: Optional[CallbackManagerForLLMRun] = None,
+                **kwargs) -> Iterator[ChatGenerationChunk]:
+        self._admit()
+        time.sleep(self.latency.sample())
+        for chunk in self._chunks(self._respond(messages)):
+            if run_manager:
+                run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+
+    async def _astream(self, messages, stop=None,
+                       run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                       **kwargs) -> AsyncIterator[ChatGenerationChunk]:
+        self._admit()
+        await asyncio.sleep(self.latency.sample())
+        for chunk in self._chunks(self._respond(messages)):
+            if run_manager:
+                await run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+
+
+def _search_response(query: str, max_results: int, result_chars: int = 600) -> Dict:
+    sentence = f"{query} 관련 본문. "
+    return {
+        "answer": f"{query}에 대한 요약",
+        "results": [
+            {
+                "title": f"{query} 결과 {i}",
+                "url": f"https://example.com/{zlib.crc32(query.encode('utf-8')) % 10000}/{i}",
+                "content": (f"{i}번 " + sentence * (result_chars // len(sentence) + 1))[:result_chars],
+                "score": 1.0 - i / max_results
+            }
+            for i in range(max_results)
+        ]
+    }
+
+
+class FakeSearchClient:
+    """TavilyClient.search 대역 (결과 하나당 본문 result_chars자)"""
+
+    def __init__(self, latency: Union[float, str, LatencyModel] = 0.1, result_chars: int = 600):
+        self.latency = latency if isinstance(latency, LatencyModel) else LatencyModel(latency)
+        self.result_chars = result_chars
+
+    def search(self, query: str, max_results: int = 10, **kwargs) -> Dict:
+        time.sleep(self.latency.sample())
+        response = _search_response(query, max_results, self.result_chars)
+        # 실제 클라이언트의 response hook처럼 응답 본문 크기 기록
+        tavily_search._response_info.bytes = len(json.dumps(response, ensure_ascii=False).encode("utf-8"))
+        return response
+
+
+class FakeAsyncSearchClient(FakeSearchClient):
+    """AsyncTavilyClient.search 대역"""
+
+    async def search(self, query: str, max_results: int = 10, **kwargs) -> Dict:
+        await asyncio.sleep(self.latency.sample())
+        return _search_response(query, max_results, self.result_chars)
+
+
+@contextmanager
+def install_fakes(
+    llm_latency: Union[float, str] = 0.05,
+    search_latency: Union[float, str] = 0.1,
+    response_scale: float = 1.0,
+    result_chars: int = 600,
+    seed: int = 0,
+    llm_scheduler: Optional[LLMScheduler] = None,
+    quotas: Optional[Dict[str, FakeQuota]] = None
+):
+    """에이전트/검색 모듈을 가짜 백엔드로 바꾸고 블록이 끝나면 되돌림
+
+    LLM 스케줄러는 블록 동안 llm_scheduler(없으면 속도 제한 없는 새 인스턴스)로 바꾼다.
+
+    Args:
+        llm_latency: LLM 호출당 지연 (초 또는 분포 문자열)
+        search_latency: 검색 호출당 지연 (초 또는 분포 문자열)
+        response_scale: 초안/최종본 응답 길이 배수
+        result_chars: 검색 결과 하나의 본문 길이
+        seed: 지연 시간 분포 시드
+        llm_scheduler: 블록 동안 쓸 LLM 스케줄러
+        quotas: 모델 → 서버 쪽 요청 한도 (넘으면 429)
+    """
+    llm_latency_model = LatencyModel(llm_latency, seed)
+    search_latency_model = LatencyModel(search_latency, seed + 1)
+    sync_search = FakeSearchClient(search_latency_model, result_chars)
+    async_search = FakeAsyncSearchClient(search_latency_model, result_chars)
+
+    def fake_model(model: Optional[str] = None, temperature: Optional[float] = None,
+                   max_retries: Optional[int] = None, priority: int = PRIORITY_NORMAL) -> BaseChatModel:
+        # get_llm과 같이 스케줄러 → 녹화/재생 래퍼 순으로 감쌈
+        llm = FakeChatModel(
+            latency=llm_latency_model,
+            model_name=model or settings.model_name,
+            response_scale=response_scale,
+            quota=(quotas or {}).get(model or settings.model_name),
+            callbacks=[get_metrics_callback()] if settings.metrics_enabled else None
+        )
+        llm = schedule_llm(llm, settings.max_retries if max_retries is None else max_retries, priority)
+        return wrap_llm(llm)
+
+    patches = [
+        (research_agent, "get_llm", fake_model),
+        (writing_agent, "get_llm", fake_model),
+        (editing_agent, "get_llm", fake_model),
+        (clarification_agent, "_get_gemini_model",
+         lambda: fake_model("gemini-2.5-flash", priority=PRIORITY_INTERACTIVE)),
+        (tavily_search, "get_tavily_client", lambda: sync_search),
+        (tavily_search, "get_async_tavily_client", lambda: async_search),
+        (settings, "search_cache_enabled", False),
+        (scheduler, "_scheduler", llm_scheduler or LLMScheduler(limits={}, default_limits=(0, 0)))
+    ]
+    originals = [(target, name, getattr(target, name)) for target, name, _ in patches]
+    try:
+        for target, name, value in patches:
+            setattr(target, name, value)
+        yield
+    finally:
+        for target, name, value in originals:
+            setattr(target, name, value)
+
+
+def initial_state(topic: str, keywords: List[str] = None) -> Dict:
+    return {
+        "topic": topic,
+        "keywords": keywords if keywords is not None else ["체온", "병원"],
+        "target_length": 2000,
+        "messages": [],
+        "current_stage": "initialized"
+    }
+
+
+Responder = Callable[[Dict], Dict]
+
+
+def run_workflow(graph, thread_id: str, state: Dict, respond: Optional[Responder] = None) -> Dict:
+    """interrupt마다 AUTO_RESPONSE(또는 respond(interrupt 값))로 재개하며 워크플로우를 끝까지 실행"""
+    config = {"configurable": {"thread_id": thread_id}}
+    result = graph.invoke(state, config)
+    while "__interrupt__" in result:
+        value = result["__interrupt__"][0].value
+        result = graph.invoke(Command(resume=respond(value) if respond else AUTO_RESPONSE), config)
+    return result
+
+
+async def arun_workflow(graph, thread_id: str, state: Dict, respond: Optional[Responder] = None) -> Dict:
+    """run_workflow의 비동기 버전"""
+    config = {"configurable": {"thread_id": thread_id}}
+    result = await graph.ainvoke(state, config)
+    while "__interrupt__" in result:
+        value = result["__interrupt__"][0].value
+        result = await graph.ainvoke(Command(resume=respond(value) if respond else AUTO_RESPONSE), config)
+    return result
@@ -1,5 +1,5 @@
-from blog_writer.graph import create_blog_graph
+from blog_writer.graph import create_blog_graph, get_blog_graph
 from blog_writer.config import settings
 from blog_writer.state import BlogState
 
-__all__ = ["create_blog_graph", "settings", "BlogState"]
+__all__ = ["create_blog_graph", "get_blog_graph", "settings", "BlogState"]
@@ -3,9 +3,10 @@
 import json
 from typing import List, Literal
 
-from langchain_google_genai import ChatGoogleGenerativeAI
-
+from blog_writer.llm import get_llm
+from blog_writer.metrics import get_metrics
 from blog_writer.models.clarification import ClarificationQuestion
+from blog_writer.scheduler import PRIORITY_INTERACTIVE
 from blog_writer.state import BlogState
 from blog_writer.config import settings
 
@@ -16,11 +17,10 @@ def _get_gemini_model():
     if not settings.google_api_key:
         raise ValueError("GOOGLE_API_KEY environment variable is not set")
 
-    return ChatGoogleGenerativeAI(
-        model="gemini-2.5-flash",
-        google_api_key=settings.google_api_key,
-        temperature=0.7
-    )
+    # Shared instance from the process-wide registry (no client setup per call);
+    # max_retries keeps the ChatGoogleGenerativeAI default. The user is waiting on
+    # these questions, so they go ahead of drafts in the LLM scheduler queue.
+    return get_llm("gemini-2.5-flash", temperature=0.7, max_retries=6, priority=PRIORITY_INTERACTIVE)
 
 
 def _build_context_for_stage(
@@ -132,26 +132,23 @@ def _get_default_questions(
     return defaults[stage]
 
 
-def generate_clarification_questions(
+def _build_question_prompt(
     state: BlogState,
     stage: Literal["research", "writing", "editing"]
-) -> List[ClarificationQuestion]:
-    """Generate 3-5 clarification questions using Gemini 2.5 Pro.
+) -> str:
+    """Build the question-generation prompt for a stage.
 
     Args:
         state: Current workflow state
         stage: The stage for which to generate questions
 
     Returns:
-        List of 3-5 context-aware clarification questions
-
-    Note:
-        Falls back to default questions if Gemini API fails
+        Prompt asking for 3-5 questions as JSON
     """
     # Build context for this stage
     context = _build_context_for_stage(state, stage)
 
-    prompt = f"""당신은 블로그 작성 도우미입니다.
+    return f"""당신은 블로그 작성 도우미입니다.
 사용자가 더 나은 블로그 글을 작성할 수 있도록 **{stage} 단계 시작 전** 필요한 정보를 물어봐야 합니다.
 
 ## 현재 컨텍스트
@@ -186,36 +183,110 @@ def generate_clarification_questions(
 **중요**: 정확히 3-5개의 질문을 생성하세요. JSON 형식만 출력하세요.
 """
 
+
+def _parse_questions(
+    response_text: str,
+    stage: Literal["research", "writing", "editing"]
+) -> List[ClarificationQuestion]:
+    """Parse the model's JSON answer into questions.
+
+    Args:
+        response_text: Raw model output
+        stage: The workflow stage (used for the fallback)
+
+    Returns:
+        Parsed questions, or the default questions if the count is out of range
+
+    Raises:
+        ValueError: If the output is not valid question JSON
+    """
+    # Extract JSON from response
+    response_text = response_text.strip()
+
+    # Remove markdown code blocks if present
+    if response_text.startswith("```"):
+        # Remove first line (```json or ```)
+        lines = response_text.split('\n')
+        response_text = '\n'.join(lines[1:-1])  # Remove first and last line
+
+    # Parse JSON
+    questions_data = json.loads(response_text)
+
+    questions = [
+        ClarificationQuestion(**q)
+        for q in questions_data["questions"]
+    ]
+
+    # Validate question count
+    if len(questions) < 3 or len(questions) > 5:
+        get_metrics().event(
+            "clarify.invalid_count", f"⚠️ 질문 수가 부적절합니다: {len(questions)}개. 기본 질문 사용",
+            stage=stage, questions=len(questions)
+        )
+        return _get_default_questions(stage)
+
+    get_metrics().event(
+        "clarify.questions", f"✅ {len(questions)}개의 질문 생성 완료 (Gemini 2.5 Flash)",
+        stage=stage, questions=len(questions)
+    )
+    return questions
+
+
+def generate_clarification_questions(
+    state: BlogState,
+    stage: Literal["research", "writing", "editing"]
+) -> List[ClarificationQuestion]:
+    """Generate 3-5 clarification questions using Gemini 2.5 Pro.
+
+    Args:
+        state: Current workflow state
+        stage: The stage for which to generate questions
+
+    Returns:
+        List of 3-5 context-aware clarification questions
+
+    Note:
+        Falls back to default questions if Gemini API fails
+    """
+    prompt = _build_question_prompt(state, stage)
+
     try:
         model = _get_gemini_model()
         response = model.invoke(prompt)
+        return _parse_questions(response.content, stage)
 
-        # Extract JSON from response
-        response_text = response.content.strip()
+    except Exception as e:
+        # Fallback to default questions
+        get_metrics().event(
+            "clarify.failed", f"⚠️ 질문 생성 실패 (Gemini API): {str(e)}. 기본 질문 사용",
+            stage=stage, error=str(e)
+        )
+        return _get_default_questions(stage)
 
-        # Remove markdown code blocks if present
-        if response_text.startswith("```"):
-            # Remove first line (```json or ```)
-            lines = response_text.split('\n')
-            response_text = '\n'.join(lines[1:-1])  # Remove first and last line
 
-        # Parse JSON
-        questions_data = json.loads(response_text)
+async def agenerate_clarification_questions(
+    state: BlogState,
+    stage: Literal["research", "writing", "editing"]
+) -> List[ClarificationQuestion]:
+    """Async version of generate_clarification_questions.
 
-        questions = [
-            ClarificationQuestion(**q)
-            for q in questions_data["questions"]
-        ]
+    Args:
+        state: Current workflow state
+        stage: The stage for which to generate questions
 
-        # Validate question count
-        if len(questions) < 3 or len(questions) > 5:
-            print(f"⚠️ 질문 수가 부적절합니다: {len(questions)}개. 기본 질문 사용")
-            return _get_default_questions(stage)
+    Returns:
+        List of 3-5 context-aware clarification questions
+    """
+    prompt = _build_question_prompt(state, stage)
 
-        print(f"✅ {len(questions)}개의 질문 생성 완료 (Gemini 2.5 Flash)")
-        return questions
+    try:
+        model = _get_gemini_model()
+        response = await model.ainvoke(prompt)
+        return _parse_questions(response.content, stage)
 
     except Exception as e:
-        # Fallback to default questions
-        print(f"⚠️ 질문 생성 실패 (Gemini API): {str(e)}. 기본 질문 사용")
+        get_metrics().event(
+            "clarify.failed", f"⚠️ 질문 생성 실패 (Gemini API): {str(e)}. 기본 질문 사용",
+            stage=stage, error=str(e)
+        )
         return _get_default_questions(stage)
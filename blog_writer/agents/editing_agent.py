@@ -1,110 +1,145 @@
-from langchain_google_genai import ChatGoogleGenerativeAI
 from blog_writer.config import settings
+from blog_writer.llm import get_llm
+from blog_writer.metrics import get_metrics
 from blog_writer.state import BlogState
+from blog_writer.prompts import PromptBuilder
+from blog_writer.agents.streaming import astream_llm, stream_llm
 from blog_writer.tools.seo_analyzer import calculate_seo_score
 from typing import Dict
 
 
-def create_editing_agent():
-    """SEO 최적화 및 퇴고 Agent"""
+def _clarification_context(state: BlogState) -> str:
+    """퇴고 단계 되묻기 응답을 프롬프트 컨텍스트로 변환"""
+    clarification_context = ""
+    if "clarifications" in state and state.get("clarifications"):
+        clarifications = state["clarifications"]
+        if "editing" in clarifications:
+            editing_clarif = clarifications["editing"]
+            # Reconstruct ClarificationResponse to use to_prompt_context
+            from blog_writer.models.clarification import ClarificationResponse, ClarificationQuestion
+            from datetime import datetime
+
+            clarif_obj = ClarificationResponse(
+                questions=[ClarificationQuestion(**q) for q in editing_clarif["questions"]],
+                answers=editing_clarif["answers"],
+                skipped=editing_clarif["skipped"],
+                timestamp=datetime.fromisoformat(editing_clarif["timestamp"]),
+                stage=editing_clarif["stage"]
+            )
+            clarification_context = clarif_obj.to_prompt_context()
+    return clarification_context
+
+
+def _edit_prompt(draft: str, initial_seo: Dict, clarification_context: str) -> str:
+    """퇴고 프롬프트"""
+    # 초안은 퇴고 대상이므로 줄이지 않고, 권장사항·요구사항 컨텍스트부터 줄임
+    return (
+        PromptBuilder("editing.edit")
+        .fixed("""당신은 전문 에디터이자 SEO 전문가입니다.
+
+아래 블로그 초안을 검토하고 개선하세요.""", name="instruction")
+        .add(clarification_context, name="clarification", priority=90)
+        .fixed(f"## 초안\n\n{draft}", name="draft")
+        .fixed(f"""## 현재 SEO 분석
 
-    llm = ChatGoogleGenerativeAI(
-        model=settings.model_name,
-        temperature=0.5,  # 퇴고는 중간 온도
-        google_api_key=settings.google_api_key,
-        max_retries=settings.max_retries
+- **점수**: {initial_seo['score']}/100
+- **글자 수**: {initial_seo['word_count']}자
+- **키워드 밀도**: {initial_seo['keyword_density']}
+- **평균 문장 길이**: {initial_seo['avg_sentence_length']}단어
+- **헤더 수**: H2 {initial_seo['h2_count']}개, H3 {initial_seo['h3_count']}개""", name="seo_analysis")
+        .add(
+            "## 개선 권장사항\n\n" + chr(10).join('- ' + rec for rec in initial_seo['recommendations']),
+            name="recommendations",
+            priority=60
+        )
+        .fixed("""## 퇴고 작업
+
+다음 사항을 개선하여 최종 버전을 작성하세요:
+
+1. **문법 및 맞춤법**: 오류 수정
+2. **가독성**: 문장 길이와 흐름 개선
+3. **SEO 최적화**:
+   - 키워드 자연스럽게 배치 (과도하지 않게)
+   - H2, H3 헤더 적절히 추가
+   - 메타 설명에 적합한 도입부 작성
+4. **구조**: 마크다운 형식 유지 및 개선
+5. **내용**: 명확성과 깊이 향상
+
+네이버 블로그 SEO를 고려하여 최종 버전을 작성하세요.
+마크다운 형식을 유지하고, 한국어로 작성하세요.""", name="task")
+        .build()
     )
 
-    def editing_node(state: BlogState) -> Dict:
-        """초안을 퇴고하고 SEO 최적화"""
-        draft = state["draft_content"]
-        keywords = state.get("keywords", [])
-        topic = state["topic"]
 
-        print(f"🎨 퇴고 및 SEO 최적화 중...")
+def _score(content: str, keywords) -> Dict:
+    with get_metrics().timed("step", "seo_score"):
+        return calculate_seo_score.invoke({"content": content, "keywords": keywords})
 
-        # 1. 초기 SEO 점수 계산
-        initial_seo = calculate_seo_score.invoke({
-            "content": draft,
-            "keywords": keywords
-        })
 
-        print(f"📊 초기 SEO 점수: {initial_seo['score']}/100")
+def _editing_result(final_content: str, initial_seo: Dict, keywords) -> Dict:
+    # 최종 SEO 점수 계산 (초안에서 바뀌지 않은 섹션은 캐시된 지표 재사용)
+    final_seo = _score(final_content, keywords)
 
-        # 2. 🆕 Clarification 컨텍스트 추출
-        clarification_context = ""
-        if "clarifications" in state and state.get("clarifications"):
-            clarifications = state["clarifications"]
-            if "editing" in clarifications:
-                editing_clarif = clarifications["editing"]
-                # Reconstruct ClarificationResponse to use to_prompt_context
-                from blog_writer.models.clarification import ClarificationResponse, ClarificationQuestion
-                from datetime import datetime
-
-                clarif_obj = ClarificationResponse(
-                    questions=[ClarificationQuestion(**q) for q in editing_clarif["questions"]],
-                    answers=editing_clarif["answers"],
-                    skipped=editing_clarif["skipped"],
-                    timestamp=datetime.fromisoformat(editing_clarif["timestamp"]),
-                    stage=editing_clarif["stage"]
-                )
-                clarification_context = clarif_obj.to_prompt_context()
+    get_metrics().event(
+        "edit.done",
+        f"📊 최종 SEO 점수: {final_seo['score']}/100 (개선: +{final_seo['score'] - initial_seo['score']}점)",
+        seo_score=final_seo["score"],
+        initial_seo_score=initial_seo["score"]
+    )
 
-        # 3. 퇴고 및 개선
-        edit_prompt = f"""당신은 전문 에디터이자 SEO 전문가입니다.
+    return {
+        "final_content": final_content,
+        "seo_score": final_seo["score"],
+        "seo_report": final_seo,
+        "current_stage": "editing_complete"
+    }
 
-아래 블로그 초안을 검토하고 개선하세요.
 
-{clarification_context}
+def create_editing_agent(async_mode: bool = False):
+    """SEO 최적화 및 퇴고 Agent (async_mode=True면 비동기 노드 반환)"""
 
-## 초안
+    llm = get_llm(settings.model_name, temperature=0.5)  # 퇴고는 중간 온도
 
-{draft}
+    def editing_node(state: BlogState) -> Dict:
+        """초안을 퇴고하고 SEO 최적화"""
+        draft = state["draft_content"]
+        keywords = state.get("keywords", [])
 
-## 현재 SEO 분석
+        get_metrics().event("edit.start", "🎨 퇴고 및 SEO 최적화 중...")
 
-- **점수**: {initial_seo['score']}/100
-- **글자 수**: {initial_seo['word_count']}자
-- **키워드 밀도**: {initial_seo['keyword_density']}
-- **평균 문장 길이**: {initial_seo['avg_sentence_length']}단어
-- **헤더 수**: H2 {initial_seo['h2_count']}개, H3 {initial_seo['h3_count']}개
+        # 1. 초기 SEO 점수 계산 (최종 승인 거부 후 재퇴고 시 같은 초안은 캐시에서 재사용)
+        initial_seo = _score(draft, keywords)
 
-## 개선 권장사항
+        get_metrics().event(
+            "edit.seo_initial", f"📊 초기 SEO 점수: {initial_seo['score']}/100", seo_score=initial_seo["score"]
+        )
 
-{chr(10).join('- ' + rec for rec in initial_seo['recommendations'])}
+        # 2. 🆕 Clarification 컨텍스트 추출
+        clarification_context = _clarification_context(state)
 
-## 퇴고 작업
+        # 3. 퇴고 및 개선
+        edit_prompt = _edit_prompt(draft, initial_seo, clarification_context)
+        final_content = stream_llm(llm, edit_prompt, node="edit", label="퇴고")
 
-다음 사항을 개선하여 최종 버전을 작성하세요:
+        # 4. 최종 SEO 점수 계산
+        return _editing_result(final_content, initial_seo, keywords)
 
-1. **문법 및 맞춤법**: 오류 수정
-2. **가독성**: 문장 길이와 흐름 개선
-3. **SEO 최적화**:
-   - 키워드 자연스럽게 배치 (과도하지 않게)
-   - H2, H3 헤더 적절히 추가
-   - 메타 설명에 적합한 도입부 작성
-4. **구조**: 마크다운 형식 유지 및 개선
-5. **내용**: 명확성과 깊이 향상
+    async def aediting_node(state: BlogState) -> Dict:
+        """editing_node의 비동기 버전 (SEO 점수 계산은 CPU 작업이라 그대로 실행)"""
+        draft = state["draft_content"]
+        keywords = state.get("keywords", [])
 
-네이버 블로그 SEO를 고려하여 최종 버전을 작성하세요.
-마크다운 형식을 유지하고, 한국어로 작성하세요.
-"""
+        get_metrics().event("edit.start", "🎨 퇴고 및 SEO 최적화 중...")
 
-        edited_response = llm.invoke(edit_prompt)
-        final_content = edited_response.content
+        initial_seo = _score(draft, keywords)
 
-        # 4. 최종 SEO 점수 계산
-        final_seo = calculate_seo_score.invoke({
-            "content": final_content,
-            "keywords": keywords
-        })
+        get_metrics().event(
+            "edit.seo_initial", f"📊 초기 SEO 점수: {initial_seo['score']}/100", seo_score=initial_seo["score"]
+        )
 
-        print(f"📊 최종 SEO 점수: {final_seo['score']}/100 (개선: +{final_seo['score'] - initial_seo['score']}점)")
+        edit_prompt = _edit_prompt(draft, initial_seo, _clarification_context(state))
+        final_content = await astream_llm(llm, edit_prompt, node="edit", label="퇴고")
 
-        return {
-            "final_content": final_content,
-            "seo_score": final_seo["score"],
-            "current_stage": "editing_complete"
-        }
+        return _editing_result(final_content, initial_seo, keywords)
 
-    return editing_node
+    return aediting_node if async_mode else editing_node
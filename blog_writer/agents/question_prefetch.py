@@ -0,0 +1,171 @@
+"""Speculative generation of clarification questions.
+
+The clarify-and-approve node shows the previous stage's content for approval
+before it asks the next stage's questions. Question generation does not depend
+on the approval, so it is started as soon as the node runs and overlaps with the
+human review. On approval the node picks up the finished result; on rejection the
+pending result is discarded.
+
+The node function re-executes from the top on every resume, so the same cache also
+keeps the questions stable between the clarification interrupt and the answer.
+"""
+
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, List, Literal, Optional, Tuple, Union
+
+from langchain_core.runnables.config import ContextThreadPoolExecutor
+from langgraph.config import get_config
+
+from blog_writer.agents import clarification_agent
+from blog_writer.config import settings
+from blog_writer.models.clarification import ClarificationQuestion
+from blog_writer.state import BlogState
+
+Stage = Literal["research", "writing", "editing"]
+PrefetchKey = Tuple[str, str, str]
+
+
+def _current_thread_id() -> str:
+    """Thread id of the running graph, or "" outside a graph."""
+    try:
+        return str(get_config().get("configurable", {}).get("thread_id", ""))
+    except RuntimeError:
+        return ""
+
+
+class QuestionPrefetcher:
+    """Cache of in-flight and finished question generations.
+
+    Entries are keyed by (thread_id, stage, prompt hash), so a changed draft or
+    research result never reuses questions generated for older content.
+
+    Args:
+        max_entries: Oldest entries are dropped beyond this many
+        max_workers: Background threads for the sync graph
+    """
+
+    def __init__(self, max_entries: int = 256, max_workers: int = 4):
+        self.max_entries = max_entries
+        self.max_workers = max_workers
+        self._entries: "OrderedDict[PrefetchKey, Union[Future, asyncio.Task]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: Optional[ContextThreadPoolExecutor] = None
+        self._stats = {"started": 0, "ready": 0, "waited": 0, "discarded": 0}
+
+    @staticmethod
+    def make_key(state: BlogState, stage: Stage, thread_id: Optional[str] = None) -> PrefetchKey:
+        """Build the cache key for a stage's questions."""
+        if thread_id is None:
+            thread_id = _current_thread_id()
+        prompt = clarification_agent._build_question_prompt(state, stage)
+        return (thread_id, stage, hashlib.sha256(prompt.encode("utf-8")).hexdigest())
+
+    def _store(self, key: PrefetchKey, entry: Union[Future, asyncio.Task]) -> None:
+        self._entries[key] = entry
+        self._stats["started"] += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def start(self, key: PrefetchKey, state: BlogState, stage: Stage) -> None:
+        """Start generating in a background thread unless already started.
+
+        The call runs in a copy of the caller's context, so the graph config
+        (thread_id for metrics) and the LLM priority carry over.
+        """
+        with self._lock:
+            if key in self._entries:
+                return
+            if self._executor is None:
+                self._executor = ContextThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="question-prefetch"
+                )
+            future = self._executor.submit(
+                clarification_agent.generate_clarification_questions, dict(state), stage
+            )
+            self._store(key, future)
+
+    def astart(self, key: PrefetchKey, state: BlogState, stage: Stage) -> None:
+        """Start generating as a task on the running loop unless already started."""
+        with self._lock:
+            if key in self._entries:
+                return
+            task = asyncio.get_running_loop().create_task(
+                clarification_agent.agenerate_clarification_questions(dict(state), stage)
+            )
+            self._store(key, task)
+
+    def _lookup(self, key: PrefetchKey) -> Optional[Union[Future, asyncio.Task]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats["ready" if entry.done() else "waited"] += 1
+            return entry
+
+    def get(self, key: PrefetchKey, state: BlogState, stage: Stage) -> List[ClarificationQuestion]:
+        """Return the questions for key, waiting for or starting the generation."""
+        entry = self._lookup(key)
+        if isinstance(entry, asyncio.Task):
+            # Started by the async graph on another loop; generate here instead
+            self.discard(key)
+            entry = None
+        if entry is None:
+            self.start(key, state, stage)
+            entry = self._lookup(key)
+        return entry.result()
+
+    async def aget(self, key: PrefetchKey, state: BlogState, stage: Stage) -> List[ClarificationQuestion]:
+        """Async version of get."""
+        entry = self._lookup(key)
+        if isinstance(entry, asyncio.Task) and entry.get_loop() is not asyncio.get_running_loop():
+            self.discard(key)
+            entry = None
+        if entry is None:
+            self.astart(key, state, stage)
+            entry = self._lookup(key)
+        if isinstance(entry, Future):
+            return await asyncio.wrap_future(entry)
+        # shield: a cancelled node run must not cancel the shared generation
+        return await asyncio.shield(entry)
+
+    def discard(self, key: PrefetchKey) -> None:
+        """Drop an entry (content rejected or questions answered)."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._stats["discarded"] += 1
+                if not entry.done():
+                    entry.cancel()
+
+    def stats(self) -> Dict:
+        """Counts of started generations and how lookups were served."""
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries)}
+
+    def clear(self) -> None:
+        with self._lock:
+            for entry in self._entries.values():
+                if not entry.done():
+                    entry.cancel()
+            self._entries.clear()
+
+
+_prefetcher: Optional[QuestionPrefetcher] = None
+_prefetcher_lock = threading.Lock()
+
+
+def get_question_prefetcher() -> QuestionPrefetcher:
+    """Process-wide prefetcher."""
+    global _prefetcher
+
+    with _prefetcher_lock:
+        if _prefetcher is None:
+            _prefetcher = QuestionPrefetcher(
+                max_entries=settings.clarification_prefetch_max_entries,
+                max_workers=settings.clarification_prefetch_workers
+            )
+    return _prefetcher
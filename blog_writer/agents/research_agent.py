@@ -1,99 +1,232 @@
-from langchain_google_genai import ChatGoogleGenerativeAI
 from blog_writer.config import settings
+from blog_writer.llm import get_llm
+from blog_writer.metrics import get_metrics
 from blog_writer.state import BlogState
-from blog_writer.tools.tavily_search import deep_research
-from typing import Dict
+from blog_writer.prompts import PromptBuilder, estimate_tokens
+from blog_writer.tools.tavily_search import adeep_research_many, deep_research_many, summarize_search_stats
+from blog_writer.tools.result_merger import rank_search_results, select_within_budget
+from langchain_core.runnables.config import ContextThreadPoolExecutor
+from typing import Dict, List, Tuple
+import asyncio
 
 
-def create_research_agent():
-    """Tavily 검색 + Gemini 요약 기반 조사 Agent"""
+def _format_result(index: int, result: Dict) -> str:
+    """검색 결과 한 건을 프롬프트용 마크다운으로 변환"""
+    covered = ', '.join(result.get('keywords', [])) or '-'
+    return f"""
+### {index}. {result['title']}
+- **출처**: {result['url']}
+- **관련도**: {result.get('score', 0):.2f}
+- **관련 키워드**: {covered}
+
+{result['content']}
+
+---
+"""
+
+
+def _group_by_query(
+    labels: List[str],
+    search_results: List[Dict],
+    merged_results: List[Dict]
+) -> List[Dict]:
+    """중복 제거된 결과를 처음 발견된 쿼리 기준으로 묶기 (map 단계 입력)"""
+    groups = [
+        {"label": label, "answer": search.get("answer", "N/A"), "results": []}
+        for label, search in zip(labels, search_results)
+    ]
+    index_by_query = {search.get("query", ""): i for i, search in enumerate(search_results)}
+
+    for result in merged_results:
+        index = index_by_query.get(result["queries"][0], 0)
+        groups[index]["results"].append(result)
 
-    llm = ChatGoogleGenerativeAI(
-        model=settings.model_name,
-        temperature=0.3,  # 팩트 기반 조사는 낮은 온도
-        google_api_key=settings.google_api_key,
-        max_retries=settings.max_retries
+    return groups
+
+
+def _map_prompt(topic: str, group: Dict) -> str:
+    """쿼리 그룹 부분 요약(map) 프롬프트"""
+    group_data = f"**요약**: {group['answer']}\n\n" + "".join(
+        _format_result(i, r) for i, r in enumerate(group["results"], 1)
     )
+    return (
+        PromptBuilder(f"research.map[{group['label']}]")
+        .fixed(f"""당신은 조사 보조원입니다.
 
-    def research_node(state: BlogState) -> Dict:
-        """주제에 대한 심층 조사 수행"""
-        topic = state["topic"]
-        keywords = state.get("keywords", [])
+아래는 "{topic}"에 대한 "{group['label']}" 검색 결과입니다.
+블로그 글 작성에 필요한 핵심 사실, 통계, 사례, 전문가 의견만 출처 URL과 함께 간결한 목록으로 정리하세요.
+검색 결과에 없는 내용은 추가하지 마세요.""", name="instruction")
+        .add(f"## 검색 결과\n\n{group_data}", name="search_results", priority=40, min_tokens=500)
+        .build()
+    )
+
+
+def _summarize_groups(summary_llm, topic: str, groups: List[Dict]) -> List[str]:
+    """쿼리 그룹별 부분 요약을 동시에 생성 (map)"""
 
-        print(f"🔍 주제 조사 중: {topic}")
+    def summarize(group: Dict) -> str:
+        prompt = _map_prompt(topic, group)
+        try:
+            return summary_llm.invoke(prompt).content
+        except Exception as e:
+            # 부분 요약 실패 시 Tavily 요약으로 대체
+            get_metrics().event(
+                "research.map_failed", f"⚠️ 부분 요약 실패 ({group['label']}): {str(e)}",
+                group=group["label"], error=str(e)
+            )
+            return f"**요약**: {group['answer']}"
 
-        # 1. 메인 주제 검색
-        main_query = f"{topic} 최신 정보 2025"
-        main_results = deep_research.invoke({"query": main_query})
+    max_workers = max(1, min(settings.research_max_concurrency, len(groups)))
+    with ContextThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(summarize, groups))
 
-        # 2. 각 키워드별 검색
-        keyword_results = []
-        for keyword in keywords:
-            query = f"{topic} {keyword} 상세 정보"
-            results = deep_research.invoke({"query": query})
-            keyword_results.append({
-                "keyword": keyword,
-                "results": results
-            })
 
-        # 3. 검색 결과 통합
-        all_search_data = f"""# 메인 조사 결과
+async def _asummarize_groups(summary_llm, topic: str, groups: List[Dict]) -> List[str]:
+    """_summarize_groups의 비동기 버전 (동시 호출 수는 research_max_concurrency로 제한)"""
+    semaphore = asyncio.Semaphore(max(1, settings.research_max_concurrency))
+
+    async def summarize(group: Dict) -> str:
+        prompt = _map_prompt(topic, group)
+        async with semaphore:
+            try:
+                return (await summary_llm.ainvoke(prompt)).content
+            except Exception as e:
+                get_metrics().event(
+                    "research.map_failed", f"⚠️ 부분 요약 실패 ({group['label']}): {str(e)}",
+                    group=group["label"], error=str(e)
+                )
+                return f"**요약**: {group['answer']}"
+
+    return list(await asyncio.gather(*(summarize(g) for g in groups)))
+
+
+def _build_queries(topic: str, keywords: List[str]) -> Tuple[str, List[str]]:
+    """메인 주제 + 키워드별 검색 쿼리 구성"""
+    main_query = f"{topic} 최신 정보 2025"
+    queries = [main_query] + [f"{topic} {keyword} 상세 정보" for keyword in keywords]
+    return main_query, queries
+
+
+def _compose_search_data(
+    main_query: str,
+    keywords: List[str],
+    search_results: List[Dict]
+) -> Tuple[str, List[Dict], List[Dict]]:
+    """검색 결과를 중복 제거·병합해 (합성 프롬프트용 텍스트, 예산 내 병합 결과, 예산 적용 전 전체 결과) 반환"""
+    search_stats = summarize_search_stats(search_results)
+    get_metrics().event(
+        "research.search",
+        f"📦 검색 응답 {search_stats['response_bytes'] / 1024:.1f}KB, "
+        f"파싱 {search_stats['parse_ms']:.1f}ms "
+        f"(캐시 {search_stats['cache_hits']}/{search_stats['queries']})",
+        **search_stats
+    )
+    main_results = search_results[0]
+    keyword_results = [
+        {"keyword": keyword, "results": results}
+        for keyword, results in zip(keywords, search_results[1:])
+    ]
+
+    # 전체 쿼리 결과 중복 제거 + 관련도 정렬 후 예산 내 상위 결과만 유지
+    candidates = rank_search_results(
+        search_results,
+        keywords=keywords,
+        dedup_threshold=settings.research_dedup_threshold
+    )
+    merged_results = select_within_budget(
+        candidates,
+        top_k=settings.research_top_k,
+        char_budget=settings.research_char_budget
+    )
+    total_results = sum(len(r.get('results', [])) for r in search_results)
+    get_metrics().event(
+        "research.merge",
+        f"🧹 검색 결과 병합: {total_results}개 → {len(merged_results)}개",
+        results_in=total_results,
+        results_out=len(merged_results)
+    )
+
+    # 검색 결과 통합
+    all_search_data = f"""# 메인 조사 결과
 
 **쿼리**: {main_query}
 **요약**: {main_results.get('answer', 'N/A')}
 
-## 상세 결과
-
 """
-        for i, result in enumerate(main_results.get('results', []), 1):
-            all_search_data += f"""
-### {i}. {result['title']}
-- **출처**: {result['url']}
-- **관련도**: {result.get('score', 0):.2f}
 
-{result['content']}
+    # 키워드별 요약 추가
+    for kw_data in keyword_results:
+        kw = kw_data['keyword']
+        kw_results = kw_data['results']
+        all_search_data += f"# 키워드 조사: {kw}\n\n"
+        all_search_data += f"**요약**: {kw_results.get('answer', 'N/A')}\n\n"
 
----
-"""
+    all_search_data += "# 상세 결과 (중복 제거, 관련도순)\n\n"
+    for i, result in enumerate(merged_results, 1):
+        all_search_data += _format_result(i, result)
 
-        # 키워드별 결과 추가
-        for kw_data in keyword_results:
-            kw = kw_data['keyword']
-            kw_results = kw_data['results']
-            all_search_data += f"\n# 키워드 조사: {kw}\n\n"
-            all_search_data += f"**요약**: {kw_results.get('answer', 'N/A')}\n\n"
-
-        # 4. 🆕 Clarification 컨텍스트 추출
-        clarification_context = ""
-        if "clarifications" in state and state.get("clarifications"):
-            clarifications = state["clarifications"]
-            if "research" in clarifications:
-                research_clarif = clarifications["research"]
-                # Reconstruct ClarificationResponse to use to_prompt_context
-                from blog_writer.models.clarification import ClarificationResponse, ClarificationQuestion
-                from datetime import datetime
-
-                clarif_obj = ClarificationResponse(
-                    questions=[ClarificationQuestion(**q) for q in research_clarif["questions"]],
-                    answers=research_clarif["answers"],
-                    skipped=research_clarif["skipped"],
-                    timestamp=datetime.fromisoformat(research_clarif["timestamp"]),
-                    stage=research_clarif["stage"]
-                )
-                clarification_context = clarif_obj.to_prompt_context()
+    return all_search_data, merged_results, candidates
+
+
+def _needs_map_reduce(candidates: List[Dict]) -> bool:
+    """중복 제거된 전체 검색 결과(글자 수 예산 적용 전)가 크면 map-reduce로 합성"""
+    corpus_tokens = estimate_tokens("".join(result.get("content", "") for result in candidates))
+    return corpus_tokens > settings.research_map_reduce_threshold
+
+
+def _map_groups(keywords: List[str], search_results: List[Dict], candidates: List[Dict]) -> List[Dict]:
+    """map 단계 그룹 구성 (예산으로 잘리기 전 결과를 쿼리별로 요약)"""
+    labels = ["메인 조사"] + [f"키워드 조사: {kw}" for kw in keywords]
+    groups = _group_by_query(labels, search_results, candidates)
+    get_metrics().event(
+        "research.map_reduce",
+        f"🗺️ map-reduce 합성: {len(groups)}개 그룹 부분 요약 중 ({settings.summary_model_name})",
+        groups=len(groups),
+        results=len(candidates)
+    )
+    return groups
+
+
+def _partial_summaries_section(groups: List[Dict], partial_summaries: List[str]) -> str:
+    """부분 요약을 reduce 프롬프트 섹션으로 합치기"""
+    return "## 쿼리별 부분 요약\n\n" + "\n\n".join(
+        f"### {group['label']}\n\n{summary}"
+        for group, summary in zip(groups, partial_summaries)
+    )
 
-        # 5. LLM으로 종합 정리
-        synthesis_prompt = f"""당신은 블로그 글을 작성하기 위한 조사 전문가입니다.
 
-아래 검색 결과를 바탕으로 "{topic}"에 대한 블로그 글 작성을 위한 종합 조사 보고서를 작성하세요.
+def _clarification_context(state: BlogState) -> str:
+    """조사 단계 되묻기 응답을 프롬프트 컨텍스트로 변환"""
+    clarification_context = ""
+    if "clarifications" in state and state.get("clarifications"):
+        clarifications = state["clarifications"]
+        if "research" in clarifications:
+            research_clarif = clarifications["research"]
+            # Reconstruct ClarificationResponse to use to_prompt_context
+            from blog_writer.models.clarification import ClarificationResponse, ClarificationQuestion
+            from datetime import datetime
 
-{clarification_context}
+            clarif_obj = ClarificationResponse(
+                questions=[ClarificationQuestion(**q) for q in research_clarif["questions"]],
+                answers=research_clarif["answers"],
+                skipped=research_clarif["skipped"],
+                timestamp=datetime.fromisoformat(research_clarif["timestamp"]),
+                stage=research_clarif["stage"]
+            )
+            clarification_context = clarif_obj.to_prompt_context()
+    return clarification_context
 
-## 검색 결과
 
-{all_search_data}
+def _synthesis_prompt(topic: str, clarification_context: str, search_section: str) -> str:
+    """최종 합성(reduce) 프롬프트"""
+    return (
+        PromptBuilder("research.synthesis")
+        .fixed(f"""당신은 블로그 글을 작성하기 위한 조사 전문가입니다.
 
-## 요구사항
+아래 검색 결과를 바탕으로 "{topic}"에 대한 블로그 글 작성을 위한 종합 조사 보고서를 작성하세요.""", name="instruction")
+        .add(clarification_context, name="clarification", priority=90)
+        .add(search_section, name="search_results", priority=40, min_tokens=1000)
+        .fixed("""## 요구사항
 
 다음 항목을 포함하여 구조화된 조사 보고서를 작성하세요:
 
@@ -105,24 +238,91 @@ def create_research_agent():
 6. **독자가 알아야 할 핵심 포인트**
 
 보고서는 한글로 작성하고, 블로그 글 작성 시 직접 활용할 수 있도록 명확하고 구조화되어야 합니다.
-**위의 사용자 요구사항을 반드시 고려하세요.**
-"""
+**위의 사용자 요구사항을 반드시 고려하세요.**""", name="requirements")
+        .build()
+    )
+
+
+def _research_result(synthesized_research: str, merged_results: List[Dict]) -> Dict:
+    """출처 목록 추출 (키워드 쿼리 출처 포함) 후 노드 반환값 구성"""
+    sources = []
+    for result in merged_results:
+        source = f"[{result['title']}]({result['url']})"
+        sources.append(source)
+
+    get_metrics().event("research.done", f"✅ 조사 완료: {len(sources)}개 출처 발견", sources=len(sources))
+
+    return {
+        "research_data": synthesized_research,
+        "sources": sources,
+        "current_stage": "research_complete"
+    }
+
+
+def create_research_agent(async_mode: bool = False):
+    """Tavily 검색 + Gemini 요약 기반 조사 Agent (async_mode=True면 비동기 노드 반환)"""
+
+    llm = get_llm(settings.model_name, temperature=0.3)  # 팩트 기반 조사는 낮은 온도
+
+    # map 단계 부분 요약용 경량 모델
+    summary_llm = get_llm(settings.summary_model_name, temperature=0.3)
+
+    def research_node(state: BlogState) -> Dict:
+        """주제에 대한 심층 조사 수행"""
+        topic = state["topic"]
+        keywords = state.get("keywords", [])
+
+        get_metrics().event("research.start", f"🔍 주제 조사 중: {topic}", topic=topic)
+
+        # 1. 메인 주제 + 키워드별 검색 쿼리 구성
+        main_query, queries = _build_queries(topic, keywords)
+
+        # 2. 모든 검색을 동시에 실행 (결과는 쿼리 순서대로 병합)
+        # 키워드 쿼리 결과도 병합 대상이므로 모두 snippets 프로필 사용
+        search_results = deep_research_many(queries, profiles=["snippets"] * len(queries))
+
+        # 3. 중복 제거·병합 후 검색 결과 통합
+        all_search_data, merged_results, candidates = _compose_search_data(main_query, keywords, search_results)
+
+        # 4. 검색 결과가 크면 map-reduce: 쿼리 그룹별 부분 요약(map)을 동시에 만든 뒤 최종 합성(reduce)
+        if _needs_map_reduce(candidates):
+            groups = _map_groups(keywords, search_results, candidates)
+            partial_summaries = _summarize_groups(summary_llm, topic, groups)
+            search_section = _partial_summaries_section(groups, partial_summaries)
+        else:
+            search_section = f"## 검색 결과\n\n{all_search_data}"
+
+        # 5. 🆕 Clarification 컨텍스트 추출
+        clarification_context = _clarification_context(state)
+
+        # 6. LLM으로 종합 정리
+        synthesis_prompt = _synthesis_prompt(topic, clarification_context, search_section)
+        synthesized_research = llm.invoke(synthesis_prompt).content
+
+        # 7. 출처 목록 추출
+        return _research_result(synthesized_research, merged_results)
+
+    async def aresearch_node(state: BlogState) -> Dict:
+        """research_node의 비동기 버전 (검색·LLM 호출을 이벤트 루프에서 대기)"""
+        topic = state["topic"]
+        keywords = state.get("keywords", [])
+
+        get_metrics().event("research.start", f"🔍 주제 조사 중: {topic}", topic=topic)
 
-        synthesis_response = llm.invoke(synthesis_prompt)
-        synthesized_research = synthesis_response.content
+        main_query, queries = _build_queries(topic, keywords)
+        search_results = await adeep_research_many(queries, profiles=["snippets"] * len(queries))
+        all_search_data, merged_results, candidates = _compose_search_data(main_query, keywords, search_results)
 
-        # 6. 출처 목록 추출
-        sources = []
-        for result in main_results.get('results', []):
-            source = f"[{result['title']}]({result['url']})"
-            sources.append(source)
+        if _needs_map_reduce(candidates):
+            groups = _map_groups(keywords, search_results, candidates)
+            partial_summaries = await _asummarize_groups(summary_llm, topic, groups)
+            search_section = _partial_summaries_section(groups, partial_summaries)
+        else:
+            search_section = f"## 검색 결과\n\n{all_search_data}"
 
-        print(f"✅ 조사 완료: {len(sources)}개 출처 발견")
+        synthesis_prompt = _synthesis_prompt(topic, _clarification_context(state), search_section)
+        synthesized_research = (await llm.ainvoke(synthesis_prompt)).content
 
-        return {
-            "research_data": synthesized_research,
-            "sources": sources,
-            "current_stage": "research_complete"
-        }
+        return _research_result(synthesized_research, merged_results)
 
-    return research_node
+    return aresearch_node if async_mode else research_node
@@ -0,0 +1,97 @@
+"""LLM token streaming helpers for graph nodes."""
+
+from typing import Any, Callable, Iterable, Optional
+
+from langgraph.config import get_stream_writer
+
+
+def _get_writer() -> Optional[Callable[[Any], None]]:
+    """그래프 실행 중이면 custom 스트림 writer, 아니면 None"""
+    try:
+        return get_stream_writer()
+    except RuntimeError:
+        # 그래프 밖에서 직접 호출된 경우 (테스트, 스크립트 등)
+        return None
+
+
+def _chunk_text(chunk) -> str:
+    """스트리밍 청크에서 텍스트만 추출"""
+    content = chunk.content
+    if isinstance(content, str):
+        return content
+    return chunk.text
+
+
+def stream_llm(llm, prompt: str, node: str, label: str) -> str:
+    """LLM 응답을 custom 스트림으로 토큰 단위 전송하고 전체 텍스트 반환.
+
+    그래프 안에서는 llm.stream으로 받은 청크를
+    {"type": "token", "node", "label", "text"} 이벤트로 내보내고,
+    시작/종료 시 "llm_start"/"llm_end" 이벤트를 보낸다.
+    그래프 밖에서는 llm.invoke로 대체한다. 반환 텍스트는 두 경로 모두 동일하다.
+
+    Args:
+        llm: LangChain 채팅 모델
+        prompt: 프롬프트
+        node: 이벤트를 보낸 그래프 노드 이름 (예: "write")
+        label: UI에 표시할 생성 단계 이름 (예: "초안")
+
+    Returns:
+        생성된 전체 텍스트
+    """
+    writer = _get_writer()
+    if writer is None:
+        return llm.invoke(prompt).content
+
+    writer({"type": "llm_start", "node": node, "label": label})
+    parts = []
+    for chunk in llm.stream(prompt):
+        text = _chunk_text(chunk)
+        if text:
+            parts.append(text)
+            writer({"type": "token", "node": node, "label": label, "text": text})
+    writer({"type": "llm_end", "node": node, "label": label})
+
+    return "".join(parts)
+
+
+async def astream_llm(llm, prompt: str, node: str, label: str) -> str:
+    """stream_llm의 비동기 버전 (llm.astream / llm.ainvoke 사용, 이벤트 형식 동일)"""
+    writer = _get_writer()
+    if writer is None:
+        return (await llm.ainvoke(prompt)).content
+
+    writer({"type": "llm_start", "node": node, "label": label})
+    parts = []
+    async for chunk in llm.astream(prompt):
+        text = _chunk_text(chunk)
+        if text:
+            parts.append(text)
+            writer({"type": "token", "node": node, "label": label, "text": text})
+    writer({"type": "llm_end", "node": node, "label": label})
+
+    return "".join(parts)
+
+
+def stream_texts(texts: Iterable[str], node: str, label: str, separator: str = "\n\n") -> str:
+    """이미 생성된 텍스트 조각을 순서대로 custom 스트림에 보내고 이어 붙인 결과 반환.
+
+    병렬로 생성한 섹션처럼 토큰 단위 스트리밍이 어려운 경우,
+    조각이 완성되는 대로 하나의 "token" 이벤트로 보낸다.
+    """
+    writer = _get_writer()
+    if writer is not None:
+        writer({"type": "llm_start", "node": node, "label": label})
+
+    parts = []
+    for text in texts:
+        if parts and writer is not None:
+            writer({"type": "token", "node": node, "label": label, "text": separator})
+        parts.append(text)
+        if writer is not None:
+            writer({"type": "token", "node": node, "label": label, "text": text})
+
+    if writer is not None:
+        writer({"type": "llm_end", "node": node, "label": label})
+
+    return separator.join(parts)
@@ -1,105 +1,386 @@
-from langchain_google_genai import ChatGoogleGenerativeAI
 from blog_writer.config import settings
+from blog_writer.llm import get_llm
+from blog_writer.metrics import get_metrics
 from blog_writer.state import BlogState
-from typing import Dict
+from blog_writer.prompts import PromptBuilder
+from blog_writer.agents.streaming import astream_llm, stream_llm, stream_texts
+from langchain_core.runnables.config import ContextThreadPoolExecutor
+from typing import Dict, List, Optional, Set
+import asyncio
+import re
+
+
+def _split_outline_sections(outline: str) -> List[Dict]:
+    """개요를 H2(## ) 기준 섹션으로 분리
+
+    첫 H2 이전 내용(제목, 도입부 계획)이 있으면 "도입부" 섹션으로 둔다.
+    반환 항목: title, plan(개요 원문), is_intro
+    """
+    sections: List[Dict] = []
+    preamble: List[str] = []
+    current = None
+
+    for line in outline.splitlines():
+        if re.match(r"^##\s+\S", line) and not line.startswith("###"):
+            current = {"title": line[2:].strip(), "plan": [line], "is_intro": False}
+            sections.append(current)
+        elif current is None:
+            preamble.append(line)
+        else:
+            current["plan"].append(line)
+
+    for section in sections:
+        section["plan"] = "\n".join(section["plan"]).strip()
+
+    intro_plan = "\n".join(preamble).strip()
+    if intro_plan:
+        sections.insert(0, {"title": "도입부", "plan": intro_plan, "is_intro": True})
+
+    return sections
+
+
+def _bigrams(text: str) -> Set[str]:
+    """한글·영문 단어의 문자 bigram 집합 (조사가 붙어도 겹치도록)"""
+    grams = set()
+    for word in re.findall(r"[가-힣A-Za-z0-9]+", text.lower()):
+        if len(word) == 1:
+            grams.add(word)
+        grams.update(word[i:i + 2] for i in range(len(word) - 1))
+    return grams
+
+
+def _research_slice(research: str, query: str, max_chars: int) -> str:
+    """섹션 계획과 겹치는 조사 자료 문단만 원래 순서대로 골라내기"""
+    paragraphs = [p.strip() for p in re.split(r"\n\s*\n", research) if p.strip()]
+    query_grams = _bigrams(query)
+
+    scored = sorted(
+        range(len(paragraphs)),
+        key=lambda i: len(query_grams & _bigrams(paragraphs[i])),
+        reverse=True
+    )
 
+    picked = set()
+    used = 0
+    for i in scored:
+        if used + len(paragraphs[i]) > max_chars:
+            continue
+        picked.add(i)
+        used += len(paragraphs[i])
 
-def create_writing_agent():
-    """조사 결과 기반 블로그 초안 작성 Agent"""
+    return "\n\n".join(paragraphs[i] for i in sorted(picked))
 
-    llm = ChatGoogleGenerativeAI(
-        model=settings.model_name,
-        temperature=0.7,  # 창의적 글쓰기는 중간 온도
-        google_api_key=settings.google_api_key,
-        max_retries=settings.max_retries
-    )
 
-    def writing_node(state: BlogState) -> Dict:
-        """조사 데이터를 바탕으로 블로그 초안 작성"""
-        topic = state["topic"]
-        research = state["research_data"]
-        keywords = state.get("keywords", [])
-        target_length = state.get("target_length", 2000)
+def _bridge_prompt(texts: List[str], i: int) -> str:
+    """i번째와 i+1번째 섹션 경계의 연결 문장 프롬프트"""
+    prev_tail = texts[i].strip().split("\n\n")[-1]
+    next_head = texts[i + 1].strip().split("\n\n")[0]
+    return f"""아래는 블로그 글의 연속된 두 섹션 중 앞 섹션의 마지막 문단과 다음 섹션의 첫 부분입니다.
 
-        print(f"✍️ 블로그 초안 작성 중: {topic}")
+## 앞 섹션 마지막 문단
 
-        # 커스텀 작성 스타일 가져오기
-        custom_style = settings.writing_style
+{prev_tail}
 
-        # 🆕 Clarification 컨텍스트 추출
-        clarification_context = ""
-        if "clarifications" in state and state.get("clarifications"):
-            clarifications = state["clarifications"]
-            if "writing" in clarifications:
-                writing_clarif = clarifications["writing"]
-                # Reconstruct ClarificationResponse to use to_prompt_context
-                from blog_writer.models.clarification import ClarificationResponse, ClarificationQuestion
-                from datetime import datetime
-
-                clarif_obj = ClarificationResponse(
-                    questions=[ClarificationQuestion(**q) for q in writing_clarif["questions"]],
-                    answers=writing_clarif["answers"],
-                    skipped=writing_clarif["skipped"],
-                    timestamp=datetime.fromisoformat(writing_clarif["timestamp"]),
-                    stage=writing_clarif["stage"]
-                )
-                clarification_context = clarif_obj.to_prompt_context()
+## 다음 섹션 첫 부분
 
-        # 1. 개요(Outline) 작성
-        outline_prompt = f"""당신은 전문 블로그 작가입니다.
+{next_head}
 
-아래 조사 결과를 바탕으로 "{topic}"에 대한 블로그 글의 상세한 개요를 작성하세요.
+두 섹션을 자연스럽게 잇는 연결 문장을 1-2문장으로 작성하세요.
+평어체(~했다, ~다)를 쓰고, 새로운 사실은 추가하지 마세요.
+이미 자연스럽게 이어진다면 "없음"만 출력하세요. 연결 문장만 출력하세요."""
 
-{clarification_context}
 
-## 조사 자료
+def _clean_bridge(sentence: str) -> str:
+    sentence = sentence.strip()
+    return "" if sentence in ("", "없음") else sentence
 
-{research}
 
-## 작성 스타일 가이드
+def _attach_bridges(texts: List[str], bridges: List[str]) -> List[str]:
+    """연결 문장을 앞 섹션 끝에 붙임"""
+    return [
+        f"{text.rstrip()}\n\n{bridges[i]}" if i < len(bridges) and bridges[i] else text
+        for i, text in enumerate(texts)
+    ]
 
-{custom_style}
 
-## 요구사항
+# 실패한 섹션만 다시 작성하는 최대 시도 횟수 (성공한 섹션은 그대로 둠)
+_SECTION_ATTEMPTS = 2
 
-1. **매력적인 제목** (위 스타일 가이드의 제목 패턴 참고)
-2. **도입부 구성** (생생한 일화나 충격적 장면으로 시작)
-3. **본문 섹션** (개인 경험 + 전문 지식 결합)
-   - 각 섹션마다 구체적인 숫자/통계 포함
-   - 실패 경험과 공감 표현
-4. **결론 구성** (실용적인 액션 아이템 + 격려 메시지)
 
-목표 길이: 약 {target_length}자
-키워드: {', '.join(keywords)}
+def _section_failed(index: int, sections: List[Dict], error: Exception, attempt: int) -> None:
+    next_step = "다시 작성" if attempt < _SECTION_ATTEMPTS else "한 번에 작성으로 전환"
+    get_metrics().event(
+        "write.section_failed",
+        f"⚠️ 섹션 작성 실패 ({index + 1}번째 '{sections[index]['title']}'): {str(error)}. {next_step}",
+        section=index + 1, attempt=attempt, error=str(error)
+    )
 
-**반드시 위의 작성 스타일을 따라주세요.**
-"""
 
-        outline_response = llm.invoke(outline_prompt)
-        outline = outline_response.content
+def _smooth_transitions(smoothing_llm, texts: List[str]) -> List[str]:
+    """인접 섹션 경계마다 연결 문장을 동시에 생성해 앞 섹션 끝에 붙임"""
 
-        print(f"📝 개요 작성 완료")
+    def bridge(i: int) -> str:
+        try:
+            return _clean_bridge(smoothing_llm.invoke(_bridge_prompt(texts, i)).content)
+        except Exception as e:
+            get_metrics().event(
+                "write.bridge_failed", f"⚠️ 전환 문장 생성 실패 ({i + 1}번째 경계): {str(e)}",
+                boundary=i + 1, error=str(e)
+            )
+            return ""
 
-        # 2. 전체 초안 작성
-        draft_prompt = f"""당신은 전문 블로그 작가입니다.
+    boundaries = range(len(texts) - 1)
+    max_workers = max(1, min(settings.draft_max_concurrency, len(texts) - 1))
+    with ContextThreadPoolExecutor(max_workers=max_workers) as executor:
+        bridges = list(executor.map(bridge, boundaries))
 
-아래 개요와 조사 자료를 바탕으로 완성된 블로그 글을 작성하세요.
+    return _attach_bridges(texts, bridges)
 
-{clarification_context}
 
-## 개요
+async def _asmooth_transitions(smoothing_llm, texts: List[str]) -> List[str]:
+    """_smooth_transitions의 비동기 버전"""
+    semaphore = asyncio.Semaphore(max(1, settings.draft_max_concurrency))
 
-{outline}
+    async def bridge(i: int) -> str:
+        async with semaphore:
+            try:
+                return _clean_bridge((await smoothing_llm.ainvoke(_bridge_prompt(texts, i))).content)
+            except Exception as e:
+                get_metrics().event(
+                    "write.bridge_failed", f"⚠️ 전환 문장 생성 실패 ({i + 1}번째 경계): {str(e)}",
+                    boundary=i + 1, error=str(e)
+                )
+                return ""
+
+    bridges = await asyncio.gather(*(bridge(i) for i in range(len(texts) - 1)))
+    return _attach_bridges(texts, list(bridges))
+
+
+def _section_prompt(
+    index: int,
+    sections: List[Dict],
+    outline: str,
+    research: str,
+    custom_style: str,
+    clarification_context: str,
+    keywords: List[str],
+    target_length: int
+) -> str:
+    """섹션 하나를 작성하는 프롬프트"""
+    section_length = max(target_length // len(sections), 200)
+    slice_chars = max(settings.research_char_budget // len(sections), 2000)
+
+    section = sections[index]
+    if section["is_intro"]:
+        task = "글의 제목(# 제목)과 도입부만 작성하세요. H2 섹션은 쓰지 마세요."
+    else:
+        task = (
+            f'"{section["title"]}" 섹션만 작성하세요. '
+            f'"## {section["title"]}" 헤더로 시작하고, 다른 섹션 내용은 쓰지 마세요.'
+        )
+
+    return (
+        PromptBuilder(f"writing.section[{index + 1}/{len(sections)}]")
+        .fixed(f"""당신은 전문 블로그 작가입니다.
+
+아래 전체 개요 중 {len(sections)}개 섹션의 {index + 1}번째를 작성합니다. {task}""", name="instruction")
+        .add(clarification_context, name="clarification", priority=90)
+        .add(f"## 전체 개요 (참고용)\n\n{outline}", name="outline", priority=60, min_tokens=300)
+        .fixed(f"## 이번 섹션 계획\n\n{section['plan']}", name="section_plan")
+        .add(
+            f"## 이 섹션 관련 조사 자료\n\n{_research_slice(research, section['plan'], slice_chars)}",
+            name="research",
+            priority=40,
+            min_tokens=300
+        )
+        .add(f"## 작성 스타일 가이드 (엄격히 준수)\n\n{custom_style}", name="style", priority=70, min_tokens=300)
+        .fixed(f"""## 작성 요구사항
+
+1. **길이**: 약 {section_length}자
+2. **형식**: 마크다운, 필요하면 ### 소제목 사용
+3. **키워드**: 자연스럽게 포함 - {', '.join(keywords)}
+4. **스타일**: 평어체, 대화형 질문, 솔직한 표현, 스토리텔링 중심
+
+한국어로 작성하세요. 섹션 본문만 출력하세요.""", name="requirements")
+        .build()
+    )
 
-## 조사 자료
 
-{research}
+def _write_sections(
+    llm,
+    smoothing_llm,
+    sections: List[Dict],
+    outline: str,
+    research: str,
+    custom_style: str,
+    clarification_context: str,
+    keywords: List[str],
+    target_length: int
+) -> Optional[str]:
+    """개요의 섹션을 동시에 작성한 뒤 전환 문장을 다듬어 이어 붙임 (다시 써도 실패한 섹션이 있으면 None)"""
+
+    def write_section(index: int, attempt: int) -> Optional[str]:
+        prompt = _section_prompt(
+            index, sections, outline, research, custom_style,
+            clarification_context, keywords, target_length
+        )
+        try:
+            return llm.invoke(prompt).content.strip()
+        except Exception as e:
+            _section_failed(index, sections, e, attempt)
+            return None
+
+    get_metrics().event(
+        "write.sections",
+        f"🧩 섹션 병렬 작성: {len(sections)}개 섹션 (동시 {settings.draft_max_concurrency}개)",
+        sections=len(sections),
+        concurrency=settings.draft_max_concurrency
+    )
+    max_workers = max(1, min(settings.draft_max_concurrency, len(sections)))
+    texts: List[Optional[str]] = [None] * len(sections)
+    with ContextThreadPoolExecutor(max_workers=max_workers) as executor:
+        for attempt in range(1, _SECTION_ATTEMPTS + 1):
+            # 첫 시도는 모든 섹션, 이후에는 실패한 섹션만 다시 작성
+            pending = [i for i, text in enumerate(texts) if text is None]
+            if not pending:
+                break
+            for i, text in zip(pending, executor.map(lambda i: write_section(i, attempt), pending)):
+                texts[i] = text
+
+    # 다시 써도 실패하면 호출부가 한 번에 작성으로 대체
+    if any(text is None for text in texts):
+        return None
+
+    texts = _smooth_transitions(smoothing_llm, texts)
+
+    return stream_texts(texts, node="write", label="초안")
+
+
+async def _awrite_sections(
+    llm,
+    smoothing_llm,
+    sections: List[Dict],
+    outline: str,
+    research: str,
+    custom_style: str,
+    clarification_context: str,
+    keywords: List[str],
+    target_length: int
+) -> Optional[str]:
+    """_write_sections의 비동기 버전"""
+    semaphore = asyncio.Semaphore(max(1, settings.draft_max_concurrency))
+
+    async def write_section(index: int, attempt: int) -> Optional[str]:
+        prompt = _section_prompt(
+            index, sections, outline, research, custom_style,
+            clarification_context, keywords, target_length
+        )
+        async with semaphore:
+            try:
+                return (await llm.ainvoke(prompt)).content.strip()
+            except Exception as e:
+                _section_failed(index, sections, e, attempt)
+                return None
+
+    get_metrics().event(
+        "write.sections",
+        f"🧩 섹션 병렬 작성: {len(sections)}개 섹션 (동시 {settings.draft_max_concurrency}개)",
+        sections=len(sections),
+        concurrency=settings.draft_max_concurrency
+    )
+    texts: List[Optional[str]] = [None] * len(sections)
+    for attempt in range(1, _SECTION_ATTEMPTS + 1):
+        pending = [i for i, text in enumerate(texts) if text is None]
+        if not pending:
+            break
+        written = await asyncio.gather(*(write_section(i, attempt) for i in pending))
+        for i, text in zip(pending, written):
+            texts[i] = text
+
+    if any(text is None for text in texts):
+        return None
+
+    texts = await _asmooth_transitions(smoothing_llm, texts)
+
+    return stream_texts(texts, node="write", label="초안")
+
+
+def _clarification_context(state: BlogState) -> str:
+    """작성 단계 되묻기 응답을 프롬프트 컨텍스트로 변환"""
+    clarification_context = ""
+    if "clarifications" in state and state.get("clarifications"):
+        clarifications = state["clarifications"]
+        if "writing" in clarifications:
+            writing_clarif = clarifications["writing"]
+            # Reconstruct ClarificationResponse to use to_prompt_context
+            from blog_writer.models.clarification import ClarificationResponse, ClarificationQuestion
+            from datetime import datetime
+
+            clarif_obj = ClarificationResponse(
+                questions=[ClarificationQuestion(**q) for q in writing_clarif["questions"]],
+                answers=writing_clarif["answers"],
+                skipped=writing_clarif["skipped"],
+                timestamp=datetime.fromisoformat(writing_clarif["timestamp"]),
+                stage=writing_clarif["stage"]
+            )
+            clarification_context = clarif_obj.to_prompt_context()
+    return clarification_context
+
+
+def _outline_prompt(
+    topic: str,
+    research: str,
+    custom_style: str,
+    clarification_context: str,
+    keywords: List[str],
+    target_length: int
+) -> str:
+    """개요(Outline) 작성 프롬프트"""
+    return (
+        PromptBuilder("writing.outline")
+        .fixed(f"""당신은 전문 블로그 작가입니다.
+
+아래 조사 결과를 바탕으로 "{topic}"에 대한 블로그 글의 상세한 개요를 작성하세요.""", name="instruction")
+        .add(clarification_context, name="clarification", priority=90)
+        .add(f"## 조사 자료\n\n{research}", name="research", priority=50, min_tokens=1000)
+        .add(f"## 작성 스타일 가이드\n\n{custom_style}", name="style", priority=70, min_tokens=300)
+        .fixed(f"""## 요구사항
 
-## 작성 스타일 가이드 (엄격히 준수)
+1. **매력적인 제목** (위 스타일 가이드의 제목 패턴 참고)
+2. **도입부 구성** (생생한 일화나 충격적 장면으로 시작)
+3. **본문 섹션** (개인 경험 + 전문 지식 결합)
+   - 각 섹션마다 구체적인 숫자/통계 포함
+   - 실패 경험과 공감 표현
+4. **결론 구성** (실용적인 액션 아이템 + 격려 메시지)
 
-{custom_style}
+목표 길이: 약 {target_length}자
+키워드: {', '.join(keywords)}
+
+**반드시 위의 작성 스타일을 따라주세요.**""", name="requirements")
+        .build()
+    )
 
-## 작성 요구사항
+
+def _draft_prompt(
+    outline: str,
+    research: str,
+    custom_style: str,
+    clarification_context: str,
+    keywords: List[str],
+    target_length: int
+) -> str:
+    """한 번에 작성하는 초안 프롬프트"""
+    # 개요가 조사 자료를 이미 요약하므로 초안 프롬프트에서는 조사 자료를 먼저 줄임
+    return (
+        PromptBuilder("writing.draft")
+        .fixed("""당신은 전문 블로그 작가입니다.
+
+아래 개요와 조사 자료를 바탕으로 완성된 블로그 글을 작성하세요.""", name="instruction")
+        .add(clarification_context, name="clarification", priority=90)
+        .add(f"## 개요\n\n{outline}", name="outline", priority=80, min_tokens=500)
+        .add(f"## 조사 자료\n\n{research}", name="research", priority=40, min_tokens=500)
+        .add(f"## 작성 스타일 가이드 (엄격히 준수)\n\n{custom_style}", name="style", priority=70, min_tokens=300)
+        .fixed(f"""## 작성 요구사항
 
 1. **길이**: 약 {target_length}자
 2. **구조**:
@@ -117,18 +398,114 @@ def create_writing_agent():
    - 솔직한 표현 사용
    - 리스트 최소화, 스토리텔링 중심
 
-한국어로 작성하세요.
-"""
+한국어로 작성하세요.""", name="requirements")
+        .build()
+    )
+
+
+def _writing_result(outline: str, draft: str) -> Dict:
+    get_metrics().event("write.done", f"✅ 초안 작성 완료 ({len(draft.split())}단어)", words=len(draft.split()))
 
-        draft_response = llm.invoke(draft_prompt)
-        draft = draft_response.content
+    return {
+        "outline": outline,
+        "draft_content": draft,
+        "current_stage": "draft_complete"
+    }
 
-        print(f"✅ 초안 작성 완료 ({len(draft.split())}단어)")
 
-        return {
-            "outline": outline,
-            "draft_content": draft,
-            "current_stage": "draft_complete"
-        }
+def create_writing_agent(async_mode: bool = False):
+    """조사 결과 기반 블로그 초안 작성 Agent (async_mode=True면 비동기 노드 반환)"""
 
-    return writing_node
+    llm = get_llm(settings.model_name, temperature=0.7)  # 창의적 글쓰기는 중간 온도
+
+    # 섹션 병렬 모드의 전환 문장 다듬기용 경량 모델
+    smoothing_llm = get_llm(settings.summary_model_name, temperature=0.5)
+
+    def writing_node(state: BlogState) -> Dict:
+        """조사 데이터를 바탕으로 블로그 초안 작성"""
+        topic = state["topic"]
+        research = state["research_data"]
+        keywords = state.get("keywords", [])
+        target_length = state.get("target_length", 2000)
+
+        get_metrics().event("write.start", f"✍️ 블로그 초안 작성 중: {topic}", topic=topic)
+
+        # 커스텀 작성 스타일 가져오기
+        custom_style = settings.writing_style
+
+        # 🆕 Clarification 컨텍스트 추출
+        clarification_context = _clarification_context(state)
+
+        # 1. 개요(Outline) 작성
+        outline_prompt = _outline_prompt(
+            topic, research, custom_style, clarification_context, keywords, target_length
+        )
+        outline = stream_llm(llm, outline_prompt, node="write", label="개요")
+
+        get_metrics().event("write.outline", "📝 개요 작성 완료", outline_chars=len(outline))
+
+        # 2. 초안 작성: 섹션 병렬 모드면 H2 섹션별로 동시에 작성, 아니면(또는 섹션 실패 시) 한 번에 작성
+        sections = _split_outline_sections(outline) if settings.draft_mode == "sections" else []
+        draft = None
+        if len(sections) >= 2:
+            draft = _write_sections(
+                llm,
+                smoothing_llm,
+                sections=sections,
+                outline=outline,
+                research=research,
+                custom_style=custom_style,
+                clarification_context=clarification_context,
+                keywords=keywords,
+                target_length=target_length
+            )
+        if draft is None:
+            draft_prompt = _draft_prompt(
+                outline, research, custom_style, clarification_context, keywords, target_length
+            )
+            draft = stream_llm(llm, draft_prompt, node="write", label="초안")
+
+        return _writing_result(outline, draft)
+
+    async def awriting_node(state: BlogState) -> Dict:
+        """writing_node의 비동기 버전"""
+        topic = state["topic"]
+        research = state["research_data"]
+        keywords = state.get("keywords", [])
+        target_length = state.get("target_length", 2000)
+
+        get_metrics().event("write.start", f"✍️ 블로그 초안 작성 중: {topic}", topic=topic)
+
+        custom_style = settings.writing_style
+        clarification_context = _clarification_context(state)
+
+        outline_prompt = _outline_prompt(
+            topic, research, custom_style, clarification_context, keywords, target_length
+        )
+        outline = await astream_llm(llm, outline_prompt, node="write", label="개요")
+
+        get_metrics().event("write.outline", "📝 개요 작성 완료", outline_chars=len(outline))
+
+        sections = _split_outline_sections(outline) if settings.draft_mode == "sections" else []
+        draft = None
+        if len(sections) >= 2:
+            draft = await _awrite_sections(
+                llm,
+                smoothing_llm,
+                sections=sections,
+                outline=outline,
+                research=research,
+                custom_style=custom_style,
+                clarification_context=clarification_context,
+                keywords=keywords,
+                target_length=target_length
+            )
+        if draft is None:
+            draft_prompt = _draft_prompt(
+                outline, research, custom_style, clarification_context, keywords, target_length
+            )
+            draft = await astream_llm(llm, draft_prompt, node="write", label="초안")
+
+        return _writing_result(outline, draft)
+
+    return awriting_node if async_mode else writing_node
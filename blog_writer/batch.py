@@ -0,0 +1,299 @@
+"""UI 없이 여러 블로그 글을 한 번에 생성하는 배치 실행기
+
+입력 JSONL 한 줄이 글 하나다. interrupt마다 승인은 자동으로 하고, 질문은
+건너뛰거나(--clarification skip) 입력 파일에 미리 적어둔 답변을 쓴다(answers).
+
+    {"topic": "아이 열성 경련", "keywords": ["열성 경련", "응급처치"], "target_length": 2000,
+     "answers": {"research": ["초보 부모"], "writing": ["친근하게"]}}
+
+    python -m blog_writer.batch topics.jsonl --manifest manifest.jsonl --concurrency 8
+
+비동기 그래프 하나를 이벤트 루프 하나에서 동시에 최대 concurrency개 돌린다.
+스레드 ID는 입력 내용으로 정해지므로, 중단된 뒤 같은 명령을 다시 실행하면
+완료된 글은 건너뛰고 진행 중이던 글은 마지막 체크포인트부터 이어서 실행한다.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from langgraph.types import Command
+
+from blog_writer.config import settings
+from blog_writer.graph import create_blog_graph
+from blog_writer.metrics import get_metrics
+from blog_writer.persistence import aclose_checkpointers
+from blog_writer.scheduler import PRIORITY_BATCH, llm_priority
+
+CLARIFICATION_POLICIES = ("skip", "answers")
+
+# 자동 승인 정책에서는 되돌아가는 경로가 없으므로 이 이상이면 루프로 보고 중단
+_MAX_INTERRUPTS = 20
+
+
+def _default_job_id(job: Dict) -> str:
+    """입력 내용으로 정해지는 기본 작업 ID (앞에 줄을 추가·삭제해도 바뀌지 않음)"""
+    key = json.dumps([job["topic"], job["keywords"], job["target_length"]], ensure_ascii=False)
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:8]
+
+
+def load_jobs(path: str) -> List[Dict]:
+    """입력 JSONL 로드 (빈 줄, # 주석 무시)"""
+    jobs = []
+    seen: Dict[str, int] = {}
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            job = json.loads(line)
+            if not job.get("topic"):
+                raise ValueError(f"{path}:{line_no}: topic이 없습니다")
+
+            keywords = job.get("keywords", [])
+            if isinstance(keywords, str):
+                keywords = [k.strip() for k in keywords.split(",") if k.strip()]
+            job["keywords"] = keywords
+            job["target_length"] = int(job.get("target_length", 2000))
+            if "id" not in job:
+                # 내용이 같은 줄은 등장 순서로 구분해 서로 다른 스레드로 실행
+                job_id = _default_job_id(job)
+                seen[job_id] = seen.get(job_id, 0) + 1
+                job["id"] = job_id if seen[job_id] == 1 else f"{job_id}-{seen[job_id]}"
+            jobs.append(job)
+    return jobs
+
+
+def job_thread_id(job: Dict) -> str:
+    """입력 내용으로 정해지는 스레드 ID (재실행 시 같은 체크포인트로 이어짐)"""
+    key = json.dumps(
+        [job["id"], job["topic"], job["keywords"], job["target_length"]],
+        ensure_ascii=False
+    )
+    return "batch-" + hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+def respond_to_interrupt(value: Dict, job: Dict, clarification_policy: str = "skip") -> Dict:
+    """interrupt 값에 대한 자동 응답
+
+    - approval: 항상 승인
+    - clarification: answers 정책이고 입력에 해당 단계 답변이 있으면 그 답변, 아니면 건너뛰기
+    """
+    if value.get("type") == "clarification":
+        answers = (job.get("answers") or {}).get(value.get("stage"))
+        if clarification_policy == "answers" and answers:
+            if isinstance(answers, str):
+                answers = [answers]
+            return {"skipped": False, "answers": [str(a).strip() for a in answers]}
+        return {"skipped": True, "answers": []}
+
+    return {"approved": True, "feedback": ""}
+
+
+def _pending_interrupts(snapshot) -> List:
+    return [i for task in snapshot.tasks for i in task.interrupts]
+
+
+async def _run_job(graph, job: Dict, clarification_policy: str) -> Dict:
+    """글 하나를 끝까지 실행하고 매니페스트 레코드 반환"""
+    thread_id = job_thread_id(job)
+    config = {"configurable": {"thread_id": thread_id}}
+    record = {
+        "id": job["id"],
+        "topic": job["topic"],
+        "thread_id": thread_id,
+        "status": "running",
+        "resumed": False,
+        "interrupts": 0,
+        "stage_seconds": {},
+        "output_file": None,
+        "seo_score": None,
+        "error": None,
+        "usage": {}
+    }
+    start = time.perf_counter()
+
+    try:
+        # 1. 기존 체크포인트 확인: 완료됐으면 건너뛰고, 진행 중이면 이어서 실행
+        snapshot = await graph.aget_state(config)
+        if snapshot.values.get("current_stage") == "complete":
+            record.update(
+                status="complete",
+                resumed=True,
+                output_file=snapshot.values.get("output_file"),
+                seo_score=snapshot.values.get("seo_score")
+            )
+            record["total_seconds"] = 0.0
+            return record
+
+        if snapshot.next:
+            record["resumed"] = True
+            interrupts = _pending_interrupts(snapshot)
+            # 대기 중인 interrupt가 있으면 응답으로, 노드 실행 중 중단됐으면 None으로 재개
+            graph_input = (
+                Command(resume=respond_to_interrupt(interrupts[0].value, job, clarification_policy))
+                if interrupts else None
+            )
+            record["interrupts"] += bool(interrupts)
+        else:
+            graph_input = {
+                "topic": job["topic"],
+                "keywords": job["keywords"],
+                "target_length": job["target_length"],
+                "messages": [],
+                "current_stage": "initialized"
+            }
+
+        # 2. interrupt가 없을 때까지 실행 → 자동 응답 → 재개 반복
+        while True:
+            mark = time.perf_counter()
+            async for update in graph.astream(graph_input, config, stream_mode="updates"):
+                now = time.perf_counter()
+                for node in update:
+                    if node != "__interrupt__":
+                        record["stage_seconds"][node] = round(
+                            record["stage_seconds"].get(node, 0.0) + now - mark, 3
+                        )
+                mark = now
+
+            snapshot = await graph.aget_state(config)
+            interrupts = _pending_interrupts(snapshot)
+            if not interrupts:
+                break
+            if record["interrupts"] >= _MAX_INTERRUPTS:
+                raise RuntimeError(f"interrupt가 {_MAX_INTERRUPTS}회를 넘었습니다")
+
+            record["interrupts"] += 1
+            graph_input = Command(
+                resume=respond_to_interrupt(interrupts[0].value, job, clarification_policy)
+            )
+
+        record.update(
+            status="complete" if snapshot.values.get("current_stage") == "complete" else "incomplete",
+            output_file=snapshot.values.get("output_file"),
+            seo_score=snapshot.values.get("seo_score")
+        )
+    except Exception as e:
+        record.update(status="failed", error=f"{type(e).__name__}: {e}")
+
+    record["total_seconds"] = round(time.perf_counter() - start, 3)
+    # 이 실행에서 기록된 LLM/검색 호출 수, 토큰, 비용
+    record["usage"] = {k: round(v, 6) for k, v in get_metrics().thread_summary(thread_id).items()}
+    return record
+
+
+def _completed_thread_ids(manifest_path: Optional[str]) -> Set[str]:
+    """이전 실행 매니페스트에서 완료된 스레드 ID (체크포인트가 정리된 뒤에도 재생성 방지)"""
+    if not manifest_path or not Path(manifest_path).exists():
+        return set()
+    done = set()
+    with open(manifest_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # 중단 시 마지막 줄이 잘렸을 수 있음
+            if record.get("status") == "complete":
+                done.add(record.get("thread_id"))
+    return done
+
+
+async def arun_batch(
+    jobs: List[Dict],
+    concurrency: Optional[int] = None,
+    clarification_policy: str = "skip",
+    manifest_path: Optional[str] = None,
+    graph=None
+) -> List[Dict]:
+    """배치 실행 (최대 concurrency개 동시). 입력 순서대로 매니페스트 레코드 반환.
+
+    manifest_path를 주면 글이 끝날 때마다 레코드를 한 줄씩 덧붙이고,
+    거기에 이미 완료로 기록된 글은 다시 실행하지 않는다.
+    graph를 주지 않으면 비동기 그래프와 공용 비동기 체크포인터를 만든다.
+    """
+    if clarification_policy not in CLARIFICATION_POLICIES:
+        raise ValueError(f"알 수 없는 질문 정책: {clarification_policy}")
+    concurrency = max(1, concurrency or settings.batch_max_concurrency)
+
+    owns_graph = graph is None
+    if owns_graph:
+        graph = create_blog_graph(async_mode=True)
+
+    done = _completed_thread_ids(manifest_path)
+    manifest = open(manifest_path, "a", encoding="utf-8") if manifest_path else None
+    semaphore = asyncio.Semaphore(concurrency)
+    finished = 0
+
+    async def run(job: Dict) -> Dict:
+        nonlocal finished
+        if job_thread_id(job) in done:
+            return {"id": job["id"], "topic": job["topic"], "thread_id": job_thread_id(job),
+                    "status": "skipped"}
+
+        async with semaphore:
+            record = await _run_job(graph, job, clarification_policy)
+
+        finished += 1
+        icon = {"complete": "✅", "failed": "❌"}.get(record["status"], "⚠️")
+        print(
+            f"{icon} [{finished}/{len(jobs)}] {job['topic']} "
+            f"({record['status']}, {record['total_seconds']:.1f}s)",
+            file=sys.stderr
+        )
+        if manifest is not None:
+            manifest.write(json.dumps(record, ensure_ascii=False) + "\n")
+            manifest.flush()
+        return record
+
+    try:
+        # 같은 프로세스의 UI 호출(특히 되묻기 질문)이 배치 초안 뒤에 밀리지 않도록 배치 우선순위
+        with llm_priority(PRIORITY_BATCH):
+            return list(await asyncio.gather(*(run(job) for job in jobs)))
+    finally:
+        if manifest is not None:
+            manifest.close()
+        if owns_graph:
+            await aclose_checkpointers()
+
+
+def run_batch(jobs: List[Dict], **kwargs) -> List[Dict]:
+    """arun_batch의 동기 진입점 (새 이벤트 루프에서 실행)"""
+    return asyncio.run(arun_batch(jobs, **kwargs))
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("jobs", help="입력 JSONL (topic, keywords, target_length, answers)")
+    parser.add_argument("--manifest", default="batch_manifest.jsonl", help="결과 매니페스트 JSONL")
+    parser.add_argument("--concurrency", type=int, default=settings.batch_max_concurrency,
+                        help="동시에 실행할 워크플로우 수")
+    parser.add_argument("--clarification", choices=CLARIFICATION_POLICIES, default="answers",
+                        help="질문 처리: skip(항상 건너뛰기) / answers(입력 답변 사용, 없으면 건너뛰기)")
+    args = parser.parse_args(argv)
+
+    jobs = load_jobs(args.jobs)
+    start = time.perf_counter()
+    records = run_batch(
+        jobs,
+        concurrency=args.concurrency,
+        clarification_policy=args.clarification,
+        manifest_path=args.manifest
+    )
+    elapsed = time.perf_counter() - start
+
+    counts: Dict[str, int] = {}
+    for record in records:
+        counts[record["status"]] = counts.get(record["status"], 0) + 1
+    summary = ", ".join(f"{status} {n}" for status, n in sorted(counts.items()))
+    print(f"📊 {len(jobs)}개 글 처리 ({summary}): {elapsed:.1f}s → {args.manifest}", file=sys.stderr)
+    if counts.get("failed"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,384 @@
+"""LLM/검색 호출 녹화·재생 (프롬프트 튜닝, 회귀/성능 테스트용)
+
+같은 주제를 여러 번 돌릴 때 Gemini/Tavily 응답을 SQLite 파일(zlib 압축)에 녹화해 두고
+다음 실행에서는 네트워크 없이 재생한다. 요청은 모델/프로필, 파라미터, 정규화한
+프롬프트로 지문(fingerprint)을 만들기 때문에 들여쓰기·줄 끝 공백·빈 줄 수만 다른
+프롬프트는 같은 요청으로 본다.
+
+    CASSETTE_MODE=record   # 모든 호출을 실제로 보내고 응답을 녹화 (기존 항목 덮어씀)
+    CASSETTE_MODE=replay   # 녹화된 응답만 사용, 없으면 CassetteMissError
+    CASSETTE_MODE=auto     # 녹화된 응답이 있으면 재생, 없으면 호출 후 녹화
+    python -m blog_writer.cassette_report   # 녹화 항목/재생 적중/미스 요청 보고서
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+import zlib
+from collections import Counter
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import ConfigDict
+
+from blog_writer.config import settings
+
+CASSETTE_MODES = ("off", "record", "replay", "auto")
+
+# 지문 형식이 바뀌면 올려서 이전 녹화와 섞이지 않게 함
+_FINGERPRINT_VERSION = 1
+
+# 보고서에 남기는 요청 앞부분 길이
+_PREVIEW_CHARS = 120
+
+
+class CassetteMissError(RuntimeError):
+    """replay 모드에서 녹화되지 않은 요청"""
+
+
+def normalize_prompt(text: str) -> str:
+    """지문용 프롬프트 정규화 (줄별 앞뒤 공백 제거, 연속 공백·빈 줄을 하나로)"""
+    text = unicodedata.normalize("NFC", text)
+    lines = [re.sub(r"[ \t\u3000]+", " ", line).strip() for line in text.splitlines()]
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+def make_fingerprint(kind: str, name: str, request: Dict) -> str:
+    """요청 종류/이름/내용으로 지문 생성"""
+    payload = json.dumps(
+        {"v": _FINGERPRINT_VERSION, "kind": kind, "name": name, "request": request},
+        sort_keys=True,
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+class Cassette:
+    """녹화된 응답 저장소 (SQLite, 응답은 zlib 압축 JSON)
+
+    Args:
+        db_path: SQLite 파일 경로 (":memory:" 가능)
+        mode: "record" / "replay" / "auto"
+    """
+
+    def __init__(self, db_path: str, mode: str):
+        if mode not in CASSETTE_MODES or mode == "off":
+            raise ValueError(f"알 수 없는 녹화 모드: {mode}")
+        self.db_path = db_path
+        self.mode = mode
+        self.hits: Counter = Counter()      # 종류별 재생 수 (이 프로세스)
+        self.misses: Counter = Counter()    # 종류별 미스 수 (이 프로세스)
+        self.recorded: Counter = Counter()  # 종류별 녹화 수 (이 프로세스)
+        self._lock = threading.Lock()
+
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS cassette (
+                fingerprint TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                name TEXT NOT NULL,
+                preview TEXT NOT NULL,
+                response BLOB NOT NULL,
+                created_at REAL NOT NULL,
+                replays INTEGER NOT NULL DEFAULT 0,
+                last_replayed REAL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS cassette_misses (
+                fingerprint TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                name TEXT NOT NULL,
+                preview TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                last_seen REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def lookup(self, fingerprint: str, kind: str, name: str, preview: str = "") -> Optional[Any]:
+        """녹화된 응답 반환 (record 모드이거나 없으면 None, replay 모드에서 없으면 예외)"""
+        if self.mode == "record":
+            return None
+
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM cassette WHERE fingerprint = ?", (fingerprint,)
+            ).fetchone()
+            if row is not None:
+                self._conn.execute(
+                    "UPDATE cassette SET replays = replays + 1, last_replayed = ? WHERE fingerprint = ?",
+                    (now, fingerprint)
+                )
+                self._conn.commit()
+                self.hits[kind] += 1
+                return json.loads(zlib.decompress(row[0]))
+
+            # 미스는 보고서에서 어떤 요청이 빠졌는지 볼 수 있게 남김
+            self._conn.execute(
+                "INSERT INTO cassette_misses (fingerprint, kind, name, preview, count, last_seen) "
+                "VALUES (?, ?, ?, ?, 1, ?) "
+                "ON CONFLICT(fingerprint) DO UPDATE SET count = count + 1, last_seen = excluded.last_seen",
+                (fingerprint, kind, name, preview[:_PREVIEW_CHARS], now)
+            )
+            self._conn.commit()
+            self.misses[kind] += 1
+
+        if self.mode == "replay":
+            raise CassetteMissError(f"녹화되지 않은 {kind} 요청 ({name}): {preview[:_PREVIEW_CHARS]!r}")
+        return None
+
+    def save(self, fingerprint: str, kind: str, name: str, value: Any, preview: str = "") -> None:
+        """응답 녹화 (같은 지문이면 덮어씀)"""
+        blob = zlib.compress(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cassette "
+                "(fingerprint, kind, name, preview, response, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (fingerprint, kind, name, preview[:_PREVIEW_CHARS], blob, time.time())
+            )
+            self._conn.execute("DELETE FROM cassette_misses WHERE fingerprint = ?", (fingerprint,))
+            self._conn.commit()
+            self.recorded[kind] += 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """이 프로세스의 종류별 재생/미스/녹화 수"""
+        with self._lock:
+            kinds = set(self.hits) | set(self.misses) | set(self.recorded)
+            return {
+                kind: {"hits": self.hits[kind], "misses": self.misses[kind], "recorded": self.recorded[kind]}
+                for kind in sorted(kinds)
+            }
+
+    def coverage(self, max_misses: int = 20) -> Dict:
+        """저장소 전체 기준 녹화 항목, 재생된 항목, 미스 요청 (종류/이름별)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT kind, name, COUNT(*), SUM(replays > 0), SUM(replays), SUM(LENGTH(response)) "
+                "FROM cassette GROUP BY kind, name"
+            ).fetchall()
+            miss_rows = self._conn.execute(
+                "SELECT kind, name, COUNT(*), SUM(count) FROM cassette_misses GROUP BY kind, name"
+            ).fetchall()
+            recent = self._conn.execute(
+                "SELECT kind, name, preview, count FROM cassette_misses ORDER BY last_seen DESC LIMIT ?",
+                (max_misses,)
+            ).fetchall()
+
+        series: Dict[Tuple[str, str], Dict] = {}
+        for kind, name, entries, replayed, replays, size in rows:
+            series[(kind, name)] = {
+                "entries": entries, "replayed": replayed or 0, "replays": replays or 0,
+                "bytes": size or 0, "missing": 0, "misses": 0
+            }
+        for kind, name, missing, misses in miss_rows:
+            stats = series.setdefault((kind, name), {
+                "entries": 0, "replayed": 0, "replays": 0, "bytes": 0, "missing": 0, "misses": 0
+            })
+            stats.update(missing=missing, misses=misses)
+
+        for stats in series.values():
+            # 재생을 시도한 요청 중 녹화돼 있던 비율
+            requested = stats["replayed"] + stats["missing"]
+            stats["coverage"] = stats["replayed"] / requested if requested else 0.0
+
+        return {
+            "series": {f"{kind}/{name}": stats for (kind, name), stats in sorted(series.items())},
+            "misses": [
+                {"kind": kind, "name": name, "preview": preview, "count": count}
+                for kind, name, preview, count in recent
+            ]
+        }
+
+    def reset_counters(self) -> None:
+        """재생 횟수와 미스 기록 초기화 (새 커버리지 측정 시작, 녹화 항목은 유지)"""
+        with self._lock:
+            self._conn.execute("UPDATE cassette SET replays = 0, last_replayed = NULL")
+            self._conn.execute("DELETE FROM cassette_misses")
+            self._conn.commit()
+            self.hits.clear()
+            self.misses.clear()
+            self.recorded.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_cassettes: Dict[Tuple[str, str], Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_cassette() -> Optional[Cassette]:
+    """현재 설정의 프로세스 공용 저장소 (CASSETTE_MODE=off면 None)"""
+    mode = settings.cassette_mode
+    if mode == "off":
+        return None
+
+    key = (settings.cassette_db, mode)
+    with _cassettes_lock:
+        cassette = _cassettes.get(key)
+        if cassette is None:
+            cassette = Cassette(settings.cassette_db, mode)
+            _cassettes[key] = cassette
+    return cassette
+
+
+def close_cassettes() -> None:
+    """열린 저장소 연결 종료 (테스트 정리, 설정 변경용)"""
+    with _cassettes_lock:
+        for cassette in _cassettes.values():
+            cassette.close()
+        _cassettes.clear()
+
+
+def _content_text(content: Any) -> str:
+    return content if isinstance(content, str) else json.dumps(content, ensure_ascii=False, sort_keys=True)
+
+
+class CassetteChatModel(BaseChatModel):
+    """실제 호출은 inner에 위임하고 응답을 녹화/재생하는 채팅 모델
+
+    get_llm()이 녹화 모드일 때 모델을 감싼다. 재생한 응답도 콜백(계측)에는
+    일반 호출처럼 보고되며, 사용량은 녹화 당시의 usage_metadata를 그대로 쓴다.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    inner: BaseChatModel
+
+    @property
+    def _llm_type(self) -> str:
+        return f"cassette-{self.inner._llm_type}"
+
+    @property
+    def model_name(self) -> str:
+        name = getattr(self.inner, "model", None) or getattr(self.inner, "model_name", None) or ""
+        return str(name).removeprefix("models/")
+
+    def _get_ls_params(self, stop=None, **kwargs) -> Dict:
+        return self.inner._get_ls_params(stop=stop, **kwargs)
+
+    def _lookup(self, messages: List[BaseMessage], stop) -> Tuple[Optional[Cassette], str, str, Optional[Dict]]:
+        """(저장소, 지문, 미리보기, 녹화된 응답) 반환"""
+        cassette = get_cassette()
+        if cassette is None:
+            return None, "", "", None
+        prompts = [normalize_prompt(_content_text(m.content)) for m in messages]
+        request = {
+            "temperature": getattr(self.inner, "temperature", None),
+            "stop": stop,
+            "messages": [[m.type, prompt] for m, prompt in zip(messages, prompts)]
+        }
+        fingerprint = make_fingerprint("llm", self.model_name, request)
+        preview = prompts[-1] if prompts else ""
+        return cassette, fingerprint, preview, cassette.lookup(fingerprint, "llm", self.model_name, preview)
+
+    def _save(self, cassette: Optional[Cassette], fingerprint: str, preview: str, message: BaseMessage) -> None:
+        if cassette is None:
+            return
+        cassette.save(fingerprint, "llm", self.model_name, {
+            "content": message.content,
+            "usage_metadata": getattr(message, "usage_metadata", None),
+            "response_metadata": message.response_metadata
+        }, preview)
+
+    @staticmethod
+    def _message(stored: Dict) -> AIMessage:
+        return AIMessage(
+            content=stored["content"],
+            usage_metadata=stored.get("usage_metadata"),
+            response_metadata={**stored.get("response_metadata", {}), "cassette": "replay"}
+        )
+
+    @classmethod
+    def _chunk(cls, stored: Dict) -> ChatGenerationChunk:
+        """재생 응답을 청크 하나로 스트리밍"""
+        message = cls._message(stored)
+        return ChatGenerationChunk(message=AIMessageChunk(
+            content=message.content,
+            usage_metadata=message.usage_metadata,
+            response_metadata=message.response_metadata
+        ))
+
+    @staticmethod
+    def _merge(chunks: List[ChatGenerationChunk]) -> AIMessageChunk:
+        message = chunks[0].message
+        for chunk in chunks[1:]:
+            message = message + chunk.message
+        return message
+
+    def _generate(self, messages, stop=None, run_manager: Optional[CallbackManagerForLLMRun] = None,
+                  **kwargs) -> ChatResult:
+        cassette, fingerprint, preview, stored = self._lookup(messages, stop)
+        if stored is not None:
+            return ChatResult(generations=[ChatGeneration(message=self._message(stored))])
+        result = self.inner._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        self._save(cassette, fingerprint, preview, result.generations[0].message)
+        return result
+
+    async def _agenerate(self, messages, stop=None,
+                         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None, **kwargs) -> ChatResult:
+        cassette, fingerprint, preview, stored = self._lookup(messages, stop)
+        if stored is not None:
+            return ChatResult(generations=[ChatGeneration(message=self._message(stored))])
+        result = await self.inner._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        self._save(cassette, fingerprint, preview, result.generations[0].message)
+        return result
+
+    def _stream(self, messages, stop=None, run_manager: Optional[CallbackManagerForLLMRun] = None,
+                **kwargs) -> Iterator[ChatGenerationChunk]:
+        cassette, fingerprint, preview, stored = self._lookup(messages, stop)
+        if stored is not None:
+            chunk = self._chunk(stored)
+            if run_manager:
+                run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+            return
+
+        chunks = []
+        for chunk in self.inner._stream(messages, stop=stop, run_manager=run_manager, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+        if chunks:
+            self._save(cassette, fingerprint, preview, self._merge(chunks))
+
+    async def _astream(self, messages, stop=None,
+                       run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                       **kwargs) -> AsyncIterator[ChatGenerationChunk]:
+        cassette, fingerprint, preview, stored = self._lookup(messages, stop)
+        if stored is not None:
+            chunk = self._chunk(stored)
+            if run_manager:
+                await run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+            return
+
+        chunks = []
+        async for chunk in self.inner._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+        if chunks:
+            self._save(cassette, fingerprint, preview, self._merge(chunks))
+
+
+def wrap_llm(llm: BaseChatModel) -> BaseChatModel:
+    """녹화 모드면 모델을 CassetteChatModel로 감싸서 반환 (off면 그대로)"""
+    if settings.cassette_mode == "off":
+        return llm
+    if settings.cassette_mode not in CASSETTE_MODES:
+        raise ValueError(f"알 수 없는 녹화 모드: {settings.cassette_mode}")
+    # inner의 _generate를 직접 부르므로 inner의 콜백은 호출되지 않음 → 같은 콜백을 바깥에 지정
+    return CassetteChatModel(inner=llm, callbacks=llm.callbacks)
@@ -0,0 +1,45 @@
+"""녹화 저장소의 커버리지(녹화 항목, 재생 적중, 미스 요청) 출력
+
+    python -m blog_writer.cassette_report
+    python -m blog_writer.cassette_report --db checkpoints/cassettes.sqlite --misses 50
+    python -m blog_writer.cassette_report --reset   # 재생 횟수/미스 기록 초기화
+"""
+
+import argparse
+from pathlib import Path
+
+from blog_writer.cassette import Cassette
+from blog_writer.config import settings
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", default=settings.cassette_db, help="녹화 SQLite 경로")
+    parser.add_argument("--misses", type=int, default=20, help="출력할 최근 미스 요청 수")
+    parser.add_argument("--reset", action="store_true", help="재생 횟수와 미스 기록 초기화 (녹화는 유지)")
+    args = parser.parse_args(argv)
+    if not Path(args.db).exists():
+        parser.error(f"녹화 파일이 없습니다: {args.db}")
+
+    cassette = Cassette(args.db, "auto")
+    if args.reset:
+        cassette.reset_counters()
+        print(f"🧹 재생/미스 기록 초기화: {args.db}")
+        return
+
+    report = cassette.coverage(max_misses=args.misses)
+    for name, stats in report["series"].items():
+        print(
+            f"  {name:<32} 녹화 {stats['entries']:>5}개 ({stats['bytes'] / 1024:7.1f}KB)  "
+            f"재생된 항목 {stats['replayed']:>5}  재생 {stats['replays']:>6}회  "
+            f"미스 {stats['missing']:>4}개  커버리지 {stats['coverage']:.0%}"
+        )
+    if report["misses"]:
+        print("[최근 미스 요청]")
+        for miss in report["misses"]:
+            print(f"  {miss['kind']}/{miss['name']} ×{miss['count']}: {miss['preview']}")
+    cassette.close()
+
+
+if __name__ == "__main__":
+    main()
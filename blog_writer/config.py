@@ -1,6 +1,12 @@
+from pydantic import field_validator
 from pydantic_settings import BaseSettings
 from typing import Optional
 
+# 재사용된 체크포인트 blob의 last_used 갱신 간격 (초)
+CHECKPOINT_BLOB_TOUCH_SECONDS = 60
+# blob GC 유예 시간 최솟값. 갱신을 건너뛴 blob이 새 체크포인트 커밋 전에 지워지지 않도록 갱신 간격보다 길게
+MIN_CHECKPOINT_BLOB_GRACE_SECONDS = 2 * CHECKPOINT_BLOB_TOUCH_SECONDS
+
 
 class Settings(BaseSettings):
     """애플리케이션 설정 (환경 변수에서 자동 로드)"""
@@ -18,10 +24,87 @@ class Settings(BaseSettings):
 
     # 애플리케이션 설정
     checkpoint_db: str = "checkpoints/blog_workflows.sqlite"
+    checkpoint_busy_timeout_ms: int = 5000   # 다른 연결이 쓰기 잠금을 쥐고 있을 때 대기할 최대 시간
+    checkpoint_blob_offload: bool = True     # 긴 문자열 필드를 압축·중복 제거된 blob으로 따로 저장
+    checkpoint_blob_min_chars: int = 2048    # 이 길이 이상인 문자열만 blob으로 저장
+
+    # 체크포인트 보존 정책 (python -m blog_writer.persistence.retention)
+    checkpoint_keep_last: int = 10                          # 스레드별로 남길 최근 체크포인트 수
+    checkpoint_thread_ttl_seconds: int = 7 * 24 * 60 * 60   # 마지막 체크포인트 이후 이 시간이 지나면 스레드 삭제
+    checkpoint_complete_grace_seconds: int = 60 * 60        # 완료된 스레드는 이 시간이 지나면 삭제
+    checkpoint_blob_grace_seconds: int = 60 * 60            # 최근 사용된 blob은 참조가 없어도 보존 (최소 120초)
+    checkpoint_retention_interval_seconds: int = 0          # 0보다 크면 앱에서 주기적으로 자동 정리
     output_dir: str = "output"
     research_dir: str = "output/research"
     log_level: str = "INFO"
 
+    # 조사 설정
+    research_max_concurrency: int = 4   # 동시에 실행할 Tavily 검색 수 (메인 + 키워드), 연결 풀 크기
+    tavily_api_base_url: Optional[str] = None   # 기본값: https://api.tavily.com
+    research_top_k: int = 15                    # 중복 제거 후 합성 프롬프트에 넣을 최대 결과 수
+    research_char_budget: int = 20000           # 합성 프롬프트에 넣을 검색 결과 본문 글자 수 상한
+    research_dedup_threshold: float = 0.8       # 본문 유사도(MinHash) 이상이면 중복으로 간주
+    research_map_reduce_threshold: int = 16000  # 중복 제거된 전체 검색 결과(예산 적용 전) 추정 토큰이 이보다 크면 map-reduce 합성 (research_char_budget 분량보다 크게)
+    summary_model_name: str = "gemini-2.5-flash"  # map 단계 부분 요약용 경량 모델
+
+    # 초안 작성 설정
+    draft_mode: str = "single"          # "single": 한 번에 작성, "sections": H2 섹션별 병렬 작성
+    draft_max_concurrency: int = 4      # 섹션 병렬 작성 시 동시 LLM 호출 수
+
+    # 되묻기 질문 선생성 (내용 검토 중에 다음 단계 질문을 미리 생성)
+    clarification_prefetch: bool = True
+    clarification_prefetch_max_entries: int = 256   # 보관할 선생성 결과 수 (초과 시 오래된 것부터 삭제)
+    clarification_prefetch_workers: int = 4         # 동기 그래프용 백그라운드 스레드 수
+
+    # 배치 실행 설정 (python -m blog_writer.batch)
+    batch_max_concurrency: int = 8      # 동시에 실행할 워크플로우 수
+
+    # 계측 설정 (blog_writer.metrics)
+    metrics_enabled: bool = True        # 노드/LLM/검색 호출 지연 시간·토큰·비용 기록
+    metrics_jsonl_path: str = ""        # 이벤트를 한 줄씩 덧붙일 JSONL 파일 (비우면 기록 안 함)
+    metrics_port: int = 0               # 0보다 크면 http://127.0.0.1:<port>/metrics 노출 (Prometheus)
+    metrics_window: int = 1000          # 백분위 계산에 쓰는 최근 표본 수 (종류/이름별)
+
+    # LLM 호출 스케줄러 (blog_writer.scheduler)
+    llm_scheduler_enabled: bool = True  # 모든 에이전트의 LLM 호출을 모델별 속도 제한·우선순위 대기열로 보냄
+    llm_rate_limits: str = ""           # "모델=RPM:TPM,..." 기본 한도 덮어쓰기 (예: gemini-2.5-pro=5:250000)
+    llm_initial_concurrency: int = 4    # 모델별 시작 동시 호출 한도
+    llm_max_concurrency: int = 8        # 모델별 동시 호출 한도 최댓값 (지연/오류에 따라 1까지 줄어듦)
+    llm_latency_tolerance: float = 2.0  # 최근 지연이 기준 지연의 이 배수를 넘으면 동시 호출 한도를 줄임
+    llm_queue_aging_seconds: float = 30.0   # 이만큼 기다린 호출은 우선순위를 한 단계 올림
+
+    # LLM/검색 녹화·재생 (blog_writer.cassette)
+    cassette_mode: str = "off"          # off / record / replay / auto (있으면 재생, 없으면 호출 후 녹화)
+    cassette_db: str = "checkpoints/cassettes.sqlite"
+
+    # UI 백그라운드 작업 설정 (blog_writer.jobs)
+    job_workers: int = 4                # 동시에 그래프를 실행할 작업자 스레드 수
+    job_history: int = 200              # 보관할 끝난 작업 수 (초과 시 오래된 것부터 삭제)
+    job_poll_interval_seconds: float = 1.0   # UI 진행 상황 갱신 주기
+
+    # 프롬프트 설정
+    prompt_token_budget: int = 32000   # LLM 호출당 프롬프트 토큰 상한 (추정치 기준)
+
+    # 검색 캐시 설정
+    search_cache_enabled: bool = True
+    search_cache_db: str = "checkpoints/search_cache.sqlite"
+    search_cache_ttl_seconds: int = 24 * 60 * 60   # 항목별 유효 기간 (기본 1일)
+    search_cache_max_entries: int = 1000           # 초과 시 가장 오래 사용되지 않은 항목부터 삭제
+
+    # SEO 분석 캐시 설정 (프로세스 메모리, LRU)
+    seo_cache_max_entries: int = 256               # 문서 단위 리포트 캐시 크기
+    seo_section_cache_max_entries: int = 2048      # 섹션 단위 지표 캐시 크기 (부분 재채점용)
+
+    @field_validator("checkpoint_blob_grace_seconds")
+    @classmethod
+    def _check_blob_grace(cls, value: int) -> int:
+        if value < MIN_CHECKPOINT_BLOB_GRACE_SECONDS:
+            raise ValueError(
+                f"CHECKPOINT_BLOB_GRACE_SECONDS는 {MIN_CHECKPOINT_BLOB_GRACE_SECONDS}초 이상이어야 합니다 "
+                f"(blob 사용 시각 갱신 간격 {CHECKPOINT_BLOB_TOUCH_SECONDS}초보다 길어야 함)"
+            )
+        return value
+
     # 커스텀 작성 스타일
     writing_style: str = """
 **내 작성 스타일 DNA:**
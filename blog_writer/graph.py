@@ -1,8 +1,9 @@
-from langgraph.graph import StateGraph, END
-from langgraph.checkpoint.sqlite import SqliteSaver
-from pathlib import Path
-import sqlite3
+import asyncio
+import atexit
+import threading
+from typing import Dict, Optional
 
+from langgraph.graph import StateGraph, END
 from langgraph.types import interrupt, Command
 
 from blog_writer.state import BlogState
@@ -10,74 +11,112 @@ from blog_writer.config import settings
 from blog_writer.agents.research_agent import create_research_agent
 from blog_writer.agents.writing_agent import create_writing_agent
 from blog_writer.agents.editing_agent import create_editing_agent
+from blog_writer.metrics import get_metrics, instrument_node
+from blog_writer.persistence import close_checkpointers, get_async_checkpointer, get_checkpointer
 from blog_writer.nodes.clarification_nodes import create_clarify_and_approve_node
 from blog_writer.tools.markdown_writer import save_blog_to_markdown, save_research_notes
 
 
-def create_blog_graph(checkpointer=None):
-    """블로그 작성 LangGraph 워크플로우 생성"""
+def _banner(stage: str, title: str) -> None:
+    """단계 시작 배너 (구조화 이벤트로 기록하고 콘솔에도 출력)"""
+    get_metrics().event("stage.start", "\n" + "="*60 + f"\n{title}\n" + "="*60, stage=stage)
+
+
+def _save_research_notes(state: BlogState, result: dict) -> None:
+    """조사 노트 저장"""
+    save_research_notes.invoke({
+        "research_data": result["research_data"],
+        "sources": result["sources"],
+        "topic": state["topic"],
+        "output_dir": settings.research_dir
+    })
+
+
+def _save_blog(state: BlogState) -> dict:
+    """최종 원고 저장"""
+    filepath = save_blog_to_markdown.invoke({
+        "content": state["final_content"],
+        "topic": state["topic"],
+        "metadata": {
+            "keywords": state.get("keywords", []),
+            "seo_score": state.get("seo_score", 0),
+            "word_count": (state.get("seo_report") or {}).get(
+                "word_count", len(state["final_content"].split())
+            )
+        },
+        "output_dir": settings.output_dir
+    })
+
+    get_metrics().event("stage.saved", f"✅ 저장 완료: {filepath}\n" + "="*60 + "\n", output_file=filepath)
+
+    return {
+        "current_stage": "complete",
+        "output_file": filepath
+    }
+
+
+def create_blog_graph(checkpointer=None, async_mode: bool = False):
+    """블로그 작성 LangGraph 워크플로우 생성
+
+    async_mode=True면 조사·작성·퇴고·질문 생성 노드가 ainvoke/비동기 검색을 쓰는
+    코루틴 노드가 되고, 파일 저장은 스레드로 넘긴다. 이 그래프는 ainvoke/astream으로
+    실행해야 하며, 하나의 이벤트 루프에서 여러 워크플로우를 동시에 돌릴 수 있다.
+    checkpointer를 주지 않으면 실행 중인 이벤트 루프 안에서 생성해야 한다.
+    """
 
     # Agent 초기화
-    research_agent = create_research_agent()
-    writing_agent = create_writing_agent()
-    editing_agent = create_editing_agent()
+    research_agent = create_research_agent(async_mode=async_mode)
+    writing_agent = create_writing_agent(async_mode=async_mode)
+    editing_agent = create_editing_agent(async_mode=async_mode)
 
     # 노드 정의
     def research_node(state: BlogState) -> dict:
         """조사 단계"""
-        print("\n" + "="*60)
-        print("🔍 1단계: 주제 조사 시작")
-        print("="*60)
+        _banner("research", "🔍 1단계: 주제 조사 시작")
         result = research_agent(state)
 
         # 조사 노트 저장
-        save_research_notes.invoke({
-            "research_data": result["research_data"],
-            "sources": result["sources"],
-            "topic": state["topic"],
-            "output_dir": settings.research_dir
-        })
+        _save_research_notes(state, result)
 
         return result
 
     def writing_node(state: BlogState) -> dict:
         """작성 단계"""
-        print("\n" + "="*60)
-        print("✍️ 2단계: 블로그 초안 작성 시작")
-        print("="*60)
+        _banner("write", "✍️ 2단계: 블로그 초안 작성 시작")
         return writing_agent(state)
 
     def editing_node(state: BlogState) -> dict:
         """퇴고 단계"""
-        print("\n" + "="*60)
-        print("🎨 3단계: 퇴고 및 SEO 최적화 시작")
-        print("="*60)
+        _banner("edit", "🎨 3단계: 퇴고 및 SEO 최적화 시작")
         return editing_agent(state)
 
     def save_node(state: BlogState) -> dict:
         """최종 저장"""
-        print("\n" + "="*60)
-        print("💾 최종 단계: 블로그 저장")
-        print("="*60)
-
-        filepath = save_blog_to_markdown.invoke({
-            "content": state["final_content"],
-            "topic": state["topic"],
-            "metadata": {
-                "keywords": state.get("keywords", []),
-                "seo_score": state.get("seo_score", 0),
-                "word_count": len(state["final_content"].split())
-            },
-            "output_dir": settings.output_dir
-        })
-
-        print(f"✅ 저장 완료: {filepath}")
-        print("="*60 + "\n")
-
-        return {
-            "current_stage": "complete",
-            "output_file": filepath
-        }
+        _banner("save", "💾 최종 단계: 블로그 저장")
+        return _save_blog(state)
+
+    # 비동기 노드: LLM/검색은 await, 파일 쓰기는 이벤트 루프를 막지 않도록 스레드에서 실행
+    async def aresearch_node(state: BlogState) -> dict:
+        """조사 단계 (비동기)"""
+        _banner("research", "🔍 1단계: 주제 조사 시작")
+        result = await research_agent(state)
+        await asyncio.to_thread(_save_research_notes, state, result)
+        return result
+
+    async def awriting_node(state: BlogState) -> dict:
+        """작성 단계 (비동기)"""
+        _banner("write", "✍️ 2단계: 블로그 초안 작성 시작")
+        return await writing_agent(state)
+
+    async def aediting_node(state: BlogState) -> dict:
+        """퇴고 단계 (비동기)"""
+        _banner("edit", "🎨 3단계: 퇴고 및 SEO 최적화 시작")
+        return await editing_agent(state)
+
+    async def asave_node(state: BlogState) -> dict:
+        """최종 저장 (비동기)"""
+        _banner("save", "💾 최종 단계: 블로그 저장")
+        return await asyncio.to_thread(_save_blog, state)
 
     # 🆕 통합 Clarification + Approval 노드 생성
     # 총 4개의 interrupt:
@@ -89,21 +128,24 @@ def create_blog_graph(checkpointer=None):
         stage="research",
         content_key=None,  # 연구 전이므로 검토할 콘텐츠 없음
         next_on_approve="research",
-        next_on_reject="research_clarify_and_approve"  # 재질문
+        next_on_reject="research_clarify_and_approve",  # 재질문
+        async_mode=async_mode
     )
 
     writing_clarify_and_approve = create_clarify_and_approve_node(
         stage="writing",
         content_key="research_data",  # 조사 결과 검토 + writing 질문
         next_on_approve="write",
-        next_on_reject="research"
+        next_on_reject="research",
+        async_mode=async_mode
     )
 
     editing_clarify_and_approve = create_clarify_and_approve_node(
         stage="editing",
         content_key="draft_content",  # 초안 검토 + editing 질문
         next_on_approve="edit",
-        next_on_reject="write"
+        next_on_reject="write",
+        async_mode=async_mode
     )
 
     # 최종 승인 노드 (질문 없이 승인만)
@@ -114,6 +156,7 @@ def create_blog_graph(checkpointer=None):
             "stage": "최종",
             "content": state.get("final_content", ""),
             "seo_score": state.get("seo_score", 0),
+            "seo_report": state.get("seo_report"),  # 퇴고 단계에서 계산된 리포트 (재계산 없음)
             "message": "최종 콘텐츠를 검토해주세요."
         }
 
@@ -134,15 +177,19 @@ def create_blog_graph(checkpointer=None):
     # 그래프 구성
     builder = StateGraph(BlogState)
 
-    # 노드 추가
-    builder.add_node("research_clarify_and_approve", research_clarify_and_approve)
-    builder.add_node("research", research_node)
-    builder.add_node("writing_clarify_and_approve", writing_clarify_and_approve)
-    builder.add_node("write", writing_node)
-    builder.add_node("editing_clarify_and_approve", editing_clarify_and_approve)
-    builder.add_node("edit", editing_node)
-    builder.add_node("final_approval", final_approval_node)
-    builder.add_node("save", save_node)
+    # 노드 추가 (노드별 실행 시간 계측)
+    nodes = {
+        "research_clarify_and_approve": research_clarify_and_approve,
+        "research": aresearch_node if async_mode else research_node,
+        "writing_clarify_and_approve": writing_clarify_and_approve,
+        "write": awriting_node if async_mode else writing_node,
+        "editing_clarify_and_approve": editing_clarify_and_approve,
+        "edit": aediting_node if async_mode else editing_node,
+        "final_approval": final_approval_node,
+        "save": asave_node if async_mode else save_node
+    }
+    for name, node in nodes.items():
+        builder.add_node(name, instrument_node(name, node))
 
     # 엣지 추가
     builder.set_entry_point("research_clarify_and_approve")
@@ -157,13 +204,47 @@ def create_blog_graph(checkpointer=None):
 
     # 체크포인터 설정
     if checkpointer is None:
-        # SQLite 저장소 생성
-        Path("checkpoints").mkdir(exist_ok=True)
-        # SqliteSaver 직접 생성 (context manager가 아닌 인스턴스)
-        conn = sqlite3.connect(settings.checkpoint_db, check_same_thread=False)
-        checkpointer = SqliteSaver(conn)
+        if async_mode:
+            # 이벤트 루프 공용 aiosqlite 체크포인터 (동기 경로와 같은 PRAGMA 튜닝)
+            checkpointer = get_async_checkpointer(settings.checkpoint_db)
+        else:
+            # 프로세스 공용 SQLite 체크포인터 (WAL + busy timeout, 세션 간 연결 공유)
+            checkpointer = get_checkpointer(settings.checkpoint_db)
 
     # 컴파일
     graph = builder.compile(checkpointer=checkpointer)
 
     return graph
+
+
+# 프로세스 공용 컴파일 그래프 (DB 경로별). 컴파일된 그래프는 상태가 없고
+# 스레드별 상태는 체크포인터에 있으므로 모든 세션이 하나를 공유해도 된다.
+_graphs: Dict[str, object] = {}
+_graphs_lock = threading.Lock()
+_atexit_registered = False
+
+
+def get_blog_graph(db_path: Optional[str] = None):
+    """DB 경로별 프로세스 공용 동기 그래프 반환 (없으면 생성).
+
+    처음 만들 때 프로세스 종료 시 체크포인터 연결을 닫도록 등록한다.
+    """
+    global _atexit_registered
+
+    db_path = db_path or settings.checkpoint_db
+    with _graphs_lock:
+        graph = _graphs.get(db_path)
+        if graph is None:
+            graph = create_blog_graph(get_checkpointer(db_path))
+            _graphs[db_path] = graph
+            if not _atexit_registered:
+                atexit.register(close_blog_graphs)
+                _atexit_registered = True
+    return graph
+
+
+def close_blog_graphs() -> None:
+    """공용 그래프를 버리고 체크포인터 연결 닫기 (프로세스 종료, 테스트 정리용)"""
+    with _graphs_lock:
+        _graphs.clear()
+    close_checkpointers()
@@ -0,0 +1,258 @@
+"""그래프 실행을 UI 스크립트 밖의 작업자 스레드에서 돌리는 작업 큐
+
+Streamlit 버튼 핸들러는 그래프를 직접 실행하지 않고 submit()으로 작업을 넣은 뒤
+바로 반환한다. 작업자는 그래프를 다음 interrupt(또는 종료)까지 실행하면서
+단계·경과 시간·실시간 생성 텍스트를 Job에 기록하고, UI는 snapshot()을 주기적으로 읽는다.
+
+    runner = get_job_runner()
+    runner.submit(thread_id, Command(resume={"approved": True, "feedback": ""}))
+    runner.latest(thread_id).snapshot()   # {"status": "running", "node": "write", ...}
+
+같은 thread_id의 작업은 제출 순서대로 하나씩 실행된다(동시 재개로 체크포인트가
+엇갈리지 않도록). 작업 상태는 프로세스에 남으므로 페이지를 새로 고쳐도
+thread_id만 알면 진행 중인 작업을 다시 찾을 수 있다.
+"""
+
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from blog_writer.config import settings
+from blog_writer.graph import get_blog_graph
+from blog_writer.metrics import get_metrics
+from blog_writer.prompts import estimate_tokens
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+# 작업별로 보관하는 진행 이벤트 수
+_MAX_EVENTS = 100
+
+
+class Job:
+    """그래프 실행 한 번(다음 interrupt까지)의 진행 상태"""
+
+    def __init__(self, thread_id: str, graph_input: Any, graph):
+        self.id = uuid.uuid4().hex
+        self.thread_id = thread_id
+        self.graph_input = graph_input
+        self.graph = graph
+        self.status = JOB_QUEUED
+        self.node: Optional[str] = None           # 실행 중(또는 마지막으로 실행한) 노드
+        self.error: Optional[str] = None
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.events: Deque[Dict] = deque(maxlen=_MAX_EVENTS)
+        self.stage_seconds: Dict[str, float] = {}
+        self._node_started: Dict[str, float] = {}
+        self.live = {"label": "", "text": "", "started_at": None, "first_token_at": None, "ended_at": None}
+        self._lock = threading.Lock()
+        self._finished = threading.Event()
+
+    @property
+    def active(self) -> bool:
+        return self.status in (JOB_QUEUED, JOB_RUNNING)
+
+    def _event(self, kind: str, **data) -> None:
+        self.events.append({"type": kind, "time": time.time(), **data})
+
+    def _handle(self, mode: str, event: Dict) -> None:
+        """그래프 스트림 이벤트 반영 (작업자 스레드)"""
+        with self._lock:
+            if mode == "custom":
+                kind = event.get("type")
+                now = time.perf_counter()
+                if kind == "llm_start":
+                    self.live = {"label": event.get("label", ""), "text": "", "started_at": now,
+                                 "first_token_at": None, "ended_at": None}
+                elif kind == "token":
+                    if self.live["first_token_at"] is None:
+                        self.live["first_token_at"] = now
+                    self.live["text"] += event.get("text", "")
+                elif kind == "llm_end":
+                    self.live["ended_at"] = now
+                return
+
+            # tasks 모드: 노드 시작(input)과 끝(result) 이벤트
+            name = event.get("name")
+            if "input" in event:
+                self.node = name
+                self._node_started[event.get("id")] = time.time()
+                self._event("node_start", node=name)
+            else:
+                started = self._node_started.pop(event.get("id"), None)
+                seconds = time.time() - started if started is not None else 0.0
+                self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + seconds
+                self._event("node_end", node=name, seconds=seconds, error=event.get("error"))
+
+    def _set_status(self, status: str, error: Optional[str] = None) -> None:
+        with self._lock:
+            self.status = status
+            now = time.time()
+            if status == JOB_RUNNING:
+                self.started_at = now
+            else:
+                self.finished_at = now
+                self.error = error
+            self._event(status, **({"error": error} if error else {}))
+        if status in (JOB_DONE, JOB_FAILED):
+            self._finished.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """작업이 끝날 때까지 대기 (끝났으면 True)"""
+        return self._finished.wait(timeout)
+
+    def snapshot(self) -> Dict:
+        """UI 표시용 복사본 (경과 시간, 실시간 텍스트 지표 포함)"""
+        with self._lock:
+            end = self.finished_at or time.time()
+            live = dict(self.live)
+            if live["first_token_at"] is not None:
+                elapsed = max((live["ended_at"] or time.perf_counter()) - live["first_token_at"], 1e-6)
+                live["tokens"] = estimate_tokens(live["text"])
+                live["tokens_per_second"] = live["tokens"] / elapsed
+                live["ttft"] = live["first_token_at"] - live["started_at"]
+            return {
+                "id": self.id,
+                "thread_id": self.thread_id,
+                "status": self.status,
+                "node": self.node,
+                "error": self.error,
+                "queued_seconds": (self.started_at or end) - self.submitted_at,
+                "elapsed_seconds": end - (self.started_at or end),
+                "stage_seconds": dict(self.stage_seconds),
+                "events": list(self.events),
+                "live": live
+            }
+
+
+class JobRunner:
+    """thread_id별로 직렬화되는 그래프 실행 작업자 풀
+
+    Args:
+        graph_factory: 작업에 graph를 주지 않았을 때 쓸 그래프를 반환하는 함수
+        max_workers: 동시에 실행할 작업 수
+        max_history: 끝난 작업을 보관할 개수 (초과 시 오래된 것부터 삭제)
+    """
+
+    def __init__(self, graph_factory: Optional[Callable] = None, max_workers: int = 4, max_history: int = 200):
+        self.graph_factory = graph_factory
+        self.max_workers = max_workers
+        self.max_history = max_history
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="graph-job")
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._latest: Dict[str, Job] = {}
+        self._pending: Dict[str, Deque[Job]] = {}   # thread_id별 실행 대기 (맨 앞이 실행 중)
+        self._queued = 0                             # 작업자를 기다리는 작업 수
+
+    def submit(self, thread_id: str, graph_input: Any, graph=None) -> Job:
+        """다음 interrupt까지 실행할 작업 추가 (바로 반환)"""
+        if graph is None:
+            graph = self.graph_factory()
+        job = Job(thread_id, graph_input, graph)
+
+        with self._lock:
+            self._jobs[job.id] = job
+            self._latest[thread_id] = job
+            self._trim()
+            pending = self._pending.setdefault(thread_id, deque())
+            pending.append(job)
+            self._queued += 1
+            # 같은 스레드에 실행 중/대기 중인 작업이 있으면 그 작업이 끝난 뒤 이어서 실행
+            if len(pending) == 1:
+                self._executor.submit(self._run, job)
+        return job
+
+    def _trim(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if not job.active]
+        for job_id in finished[:max(0, len(self._jobs) - self.max_history)]:
+            job = self._jobs.pop(job_id)
+            if self._latest.get(job.thread_id) is job:
+                del self._latest[job.thread_id]
+
+    def _run(self, job: Job) -> None:
+        with self._lock:
+            self._queued -= 1
+        job._set_status(JOB_RUNNING)
+        config = {"configurable": {"thread_id": job.thread_id}}
+        try:
+            for mode, event in job.graph.stream(job.graph_input, config, stream_mode=["tasks", "custom"]):
+                job._handle(mode, event)
+            job._set_status(JOB_DONE)
+        except Exception as e:
+            get_metrics().event(
+                "job.failed", f"❌ 작업 실패 ({job.thread_id}): {e}", thread_id=job.thread_id, error=str(e)
+            )
+            job._set_status(JOB_FAILED, f"{type(e).__name__}: {e}")
+
+        # 같은 스레드의 다음 작업 시작
+        with self._lock:
+            pending = self._pending[job.thread_id]
+            pending.popleft()
+            if pending:
+                self._executor.submit(self._run, pending[0])
+            else:
+                del self._pending[job.thread_id]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def latest(self, thread_id: str) -> Optional[Job]:
+        """thread_id로 마지막에 제출된 작업"""
+        with self._lock:
+            return self._latest.get(thread_id)
+
+    def queue_position(self, job: Job) -> int:
+        """작업자를 기다리는 작업 중 이 작업보다 먼저 제출된 수 (실행 중이거나 끝났으면 0)"""
+        with self._lock:
+            if job.status != JOB_QUEUED:
+                return 0
+            return sum(
+                1 for other in self._jobs.values()
+                if other.status == JOB_QUEUED and other.submitted_at < job.submitted_at
+            )
+
+    def stats(self) -> Dict[str, int]:
+        """대기/실행 중 작업 수와 보관 중인 작업 수"""
+        with self._lock:
+            running = sum(1 for job in self._jobs.values() if job.status == JOB_RUNNING)
+            return {
+                "queued": self._queued,
+                "running": running,
+                "workers": self.max_workers,
+                "threads": len(self._pending),
+                "jobs": len(self._jobs)
+            }
+
+    def active_jobs(self) -> List[Job]:
+        with self._lock:
+            return [job for job in self._jobs.values() if job.active]
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+_runner: Optional[JobRunner] = None
+_runner_lock = threading.Lock()
+
+
+def get_job_runner() -> JobRunner:
+    """프로세스 공용 작업자 풀 (공용 그래프로 실행)"""
+    global _runner
+
+    with _runner_lock:
+        if _runner is None:
+            _runner = JobRunner(
+                graph_factory=get_blog_graph,
+                max_workers=settings.job_workers,
+                max_history=settings.job_history
+            )
+    return _runner
@@ -0,0 +1,96 @@
+"""프로세스 공용 LLM 클라이언트 레지스트리
+
+ChatGoogleGenerativeAI를 만들 때마다 google-genai Client(HTTP 클라이언트 포함)를
+새로 만들기 때문에 생성 비용이 크다. 모델 이름과 HTTP 재시도 횟수별로 한 번만 완전히
+생성하고, temperature만 다른 변형은 같은 Client를 공유하는 얕은 복사본으로 만든다.
+(재시도 설정은 Client를 만들 때 정해지므로 재시도 횟수가 다르면 Client도 따로 만든다.)
+스케줄러가 켜져 있으면 호출을 공용 스케줄러(blog_writer.scheduler)로 보내고,
+녹화 모드(CASSETTE_MODE)가 켜져 있으면 맨 바깥을 녹화/재생 래퍼로 감싼다.
+"""
+
+import threading
+from typing import Dict, Optional, Tuple
+
+from langchain_core.language_models import BaseChatModel
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+from blog_writer.cassette import wrap_llm
+from blog_writer.config import settings
+from blog_writer.metrics import get_metrics_callback
+from blog_writer.scheduler import PRIORITY_NORMAL, schedule_llm
+
+_base_models: Dict[Tuple[str, str, int], ChatGoogleGenerativeAI] = {}
+_models: Dict[Tuple, BaseChatModel] = {}
+_lock = threading.Lock()
+_stats = {"instantiations": 0, "variants": 0, "hits": 0}
+
+
+def get_llm(
+    model: Optional[str] = None,
+    temperature: Optional[float] = None,
+    max_retries: Optional[int] = None,
+    priority: int = PRIORITY_NORMAL
+) -> BaseChatModel:
+    """모델/파라미터별 공용 채팅 모델 반환 (없으면 생성)
+
+    Args:
+        model: 모델 이름 (기본: settings.model_name)
+        temperature: 샘플링 온도 (기본: settings.temperature)
+        max_retries: 재시도 횟수 (기본: settings.max_retries)
+        priority: 스케줄러 대기열 우선순위 (blog_writer.scheduler.PRIORITY_*)
+    """
+    model = model or settings.model_name
+    temperature = settings.temperature if temperature is None else temperature
+    max_retries = settings.max_retries if max_retries is None else max_retries
+    api_key = settings.google_api_key
+    scheduled = settings.llm_scheduler_enabled
+    key = (model, temperature, max_retries, priority, api_key, scheduled, settings.cassette_mode)
+    # 스케줄러를 쓰면 재시도는 스케줄러가 맡으므로 HTTP 재시도는 끔 (시도 1회)
+    client_retries = 1 if scheduled else max_retries
+
+    with _lock:
+        llm = _models.get(key)
+        if llm is not None:
+            _stats["hits"] += 1
+            return llm
+
+        # 1. 모델 이름/재시도 횟수별 기본 인스턴스 (Client 생성은 여기서만)
+        base = _base_models.get((model, api_key, client_retries))
+        if base is None:
+            base = ChatGoogleGenerativeAI(
+                model=model,
+                temperature=temperature,
+                google_api_key=api_key,
+                max_retries=client_retries,
+                # 호출별 지연 시간/토큰/비용 기록 (변형도 같은 콜백을 공유)
+                callbacks=[get_metrics_callback()] if settings.metrics_enabled else None
+            )
+            _base_models[(model, api_key, client_retries)] = base
+            _stats["instantiations"] += 1
+            llm = base
+        else:
+            # 2. temperature만 다른 변형은 Client를 공유하는 복사본 (검증/Client 생성 생략)
+            llm = base.model_copy(update={"temperature": temperature})
+            _stats["variants"] += 1
+
+        # 3. 스케줄러 경유 (재생된 응답은 대기열을 거치지 않도록 녹화 래퍼 안쪽에 둠)
+        llm = schedule_llm(llm, max_retries, priority)
+        # 4. 녹화 모드면 녹화/재생 래퍼로 감쌈 (off면 그대로)
+        llm = wrap_llm(llm)
+        _models[key] = llm
+    return llm
+
+
+def llm_stats() -> Dict[str, int]:
+    """Client 생성 수, 변형 생성 수, 재사용 수"""
+    with _lock:
+        return {**_stats, "models": len(_models)}
+
+
+def clear_llm_registry() -> None:
+    """등록된 모델과 통계 초기화 (API 키 변경, 테스트 정리용)"""
+    with _lock:
+        _base_models.clear()
+        _models.clear()
+        for name in _stats:
+            _stats[name] = 0
@@ -0,0 +1,448 @@
+"""노드·LLM·검색 호출 계측 (지연 시간, 토큰, 비용, 응답 크기, 캐시 적중)
+
+세 지점에서 기록한다.
+- 노드: create_blog_graph가 모든 노드를 instrument_node()로 감싼다
+- LLM: get_llm()이 만드는 모델에 MetricsCallbackHandler를 붙인다 (토큰은 usage_metadata, 없으면 추정)
+- 검색: deep_research_many/adeep_research_many가 쿼리마다 기록한다
+
+기록은 (종류, 이름)별 최근 지연 시간 백분위와 합계, thread_id별 합계로 집계되고,
+METRICS_JSONL_PATH를 주면 이벤트마다 한 줄씩 덧붙인다. METRICS_PORT > 0이면
+start_metrics_server()가 Prometheus 텍스트 형식으로 /metrics를 노출한다.
+
+    python -m blog_writer.metrics_report --jsonl metrics.jsonl   # JSONL을 다시 집계해 출력
+"""
+
+import asyncio
+import functools
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langgraph.config import get_config
+from langgraph.errors import GraphBubbleUp
+
+from blog_writer.config import settings
+from blog_writer.prompts import estimate_tokens
+
+# 모델별 100만 토큰당 가격 (USD, 입력/출력). 목록에 없는 모델은 비용 0으로 기록
+MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    "gemini-2.5-pro": (1.25, 10.0),
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-2.5-flash-lite": (0.10, 0.40),
+    "gemini-2.0-flash": (0.10, 0.40)
+}
+
+# thread_id별 합계를 보관할 스레드 수 (초과 시 오래된 것부터 삭제)
+_MAX_THREADS = 1000
+
+_QUANTILES = (0.5, 0.95, 0.99)
+
+
+def current_thread_id() -> str:
+    """실행 중인 그래프의 thread_id (그래프 밖이면 "")"""
+    try:
+        return str(get_config().get("configurable", {}).get("thread_id", ""))
+    except RuntimeError:
+        return ""
+
+
+def llm_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    """토큰 수로 계산한 호출 비용 (USD)"""
+    input_price, output_price = MODEL_PRICES.get(model.removeprefix("models/"), (0.0, 0.0))
+    return (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))] if ordered else 0.0
+
+
+class MetricsRegistry:
+    """계측 이벤트 집계기
+
+    Args:
+        window: (종류, 이름)별로 백분위 계산에 쓰는 최근 표본 수
+        jsonl_path: 이벤트를 한 줄씩 덧붙일 파일 (None이면 기록 안 함)
+    """
+
+    def __init__(self, window: int = 1000, jsonl_path: Optional[str] = None):
+        self.window = window
+        self.jsonl_path = jsonl_path
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, str], Dict] = {}
+        self._threads: "OrderedDict[str, Dict[str, float]]" = OrderedDict()
+
+    def record(
+        self,
+        kind: str,
+        name: str,
+        seconds: float,
+        thread_id: Optional[str] = None,
+        error: bool = False,
+        **fields
+    ) -> Dict:
+        """호출 한 번 기록. 숫자 필드는 합산하고 True인 bool 필드는 횟수로 센다."""
+        if thread_id is None:
+            thread_id = current_thread_id()
+        event = {
+            "ts": time.time(),
+            "kind": kind,
+            "name": name,
+            "thread_id": thread_id,
+            "seconds": round(seconds, 6),
+            "error": error,
+            **fields
+        }
+
+        with self._lock:
+            series = self._series.get((kind, name))
+            if series is None:
+                series = {"count": 0, "errors": 0, "seconds": 0.0, "totals": {},
+                          "samples": deque(maxlen=self.window)}
+                self._series[(kind, name)] = series
+            series["count"] += 1
+            series["errors"] += int(error)
+            series["seconds"] += seconds
+            series["samples"].append(seconds)
+            _add_fields(series["totals"], fields)
+
+            if thread_id:
+                totals = self._threads.setdefault(thread_id, {})
+                self._threads.move_to_end(thread_id)
+                totals[f"{kind}_calls"] = totals.get(f"{kind}_calls", 0) + 1
+                totals[f"{kind}_seconds"] = totals.get(f"{kind}_seconds", 0.0) + seconds
+                _add_fields(totals, fields)
+                while len(self._threads) > _MAX_THREADS:
+                    self._threads.popitem(last=False)
+
+        self._write(event)
+        return event
+
+    def event(self, name: str, message: Optional[str] = None, **fields) -> Dict:
+        """집계하지 않는 구조화 로그 이벤트 (message가 있으면 콘솔에도 출력)"""
+        event = {"ts": time.time(), "kind": "event", "name": name,
+                 "thread_id": current_thread_id(), **fields}
+        if message:
+            print(message)
+        self._write(event)
+        return event
+
+    def _write(self, event: Dict) -> None:
+        if not self.jsonl_path:
+            return
+        line = json.dumps(event, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            with open(self.jsonl_path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+    @contextmanager
+    def timed(self, kind: str, name: str, **fields):
+        """블록 실행 시간 기록 (예외가 나면 error=True로 기록 후 다시 발생)"""
+        start = time.perf_counter()
+        error = False
+        try:
+            yield fields
+        except Exception:
+            error = True
+            raise
+        finally:
+            self.record(kind, name, time.perf_counter() - start, error=error, **fields)
+
+    def summary(self) -> Dict[str, Dict[str, Dict]]:
+        """종류 → 이름별 호출 수, 오류 수, 지연 시간 백분위(ms), 필드 합계"""
+        result: Dict[str, Dict[str, Dict]] = {}
+        with self._lock:
+            for (kind, name), series in sorted(self._series.items()):
+                ordered = sorted(series["samples"])
+                result.setdefault(kind, {})[name] = {
+                    "count": series["count"],
+                    "errors": series["errors"],
+                    "total_seconds": series["seconds"],
+                    **{f"p{int(q * 100)}_ms": _percentile(ordered, q) * 1000 for q in _QUANTILES},
+                    "max_ms": (ordered[-1] if ordered else 0.0) * 1000,
+                    **series["totals"]
+                }
+        return result
+
+    def thread_summary(self, thread_id: str) -> Dict[str, float]:
+        """thread_id의 종류별 호출 수·시간과 토큰/비용/바이트 합계"""
+        with self._lock:
+            return dict(self._threads.get(thread_id, {}))
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 형식 (지연 시간은 summary, 필드 합계는 counter)"""
+        lines = []
+        summary = self.summary()
+        for kind, series in summary.items():
+            metric = f"blog_writer_{kind}_seconds"
+            lines.append(f"# TYPE {metric} summary")
+            for name, stats in series.items():
+                label = f'{_label_key(kind)}="{_escape(name)}"'
+                for q in _QUANTILES:
+                    value = stats[f"p{int(q * 100)}_ms"] / 1000
+                    lines.append(f'{metric}{{{label},quantile="{q}"}} {value:.6f}')
+                lines.append(f"{metric}_sum{{{label}}} {stats['total_seconds']:.6f}")
+                lines.append(f"{metric}_count{{{label}}} {stats['count']}")
+
+            lines.append(f"# TYPE blog_writer_{kind}_errors_total counter")
+            for name, stats in series.items():
+                lines.append(
+                    f'blog_writer_{kind}_errors_total{{{_label_key(kind)}="{_escape(name)}"}} {stats["errors"]}'
+                )
+
+            fields = sorted({f for stats in series.values() for f in stats if f in _COUNTER_FIELDS})
+            for field in fields:
+                metric = f"blog_writer_{kind}_{field}_total"
+                lines.append(f"# TYPE {metric} counter")
+                for name, stats in series.items():
+                    if field in stats:
+                        lines.append(f'{metric}{{{_label_key(kind)}="{_escape(name)}"}} {stats[field]:g}')
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+            self._threads.clear()
+
+
+# Prometheus로 내보내는 합계 필드
+_COUNTER_FIELDS = {
+    "prompt_tokens", "completion_tokens", "cost_usd", "retries",
+    "bytes", "results", "cached", "estimated", "interrupted", "retry"
+}
+
+
+def _add_fields(totals: Dict[str, float], fields: Dict[str, Any]) -> None:
+    for key, value in fields.items():
+        if isinstance(value, bool):
+            if value:
+                totals[key] = totals.get(key, 0) + 1
+        elif isinstance(value, (int, float)):
+            totals[key] = totals.get(key, 0) + value
+
+
+def _label_key(kind: str) -> str:
+    return {"node": "node", "llm": "model", "llm_queue": "model", "search": "profile"}.get(kind, "name")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsCallbackHandler(BaseCallbackHandler):
+    """LLM 호출마다 지연 시간, 입력/출력 토큰, 비용, 재시도 수를 기록하는 콜백"""
+
+    def __init__(self, registry: "MetricsRegistry"):
+        self.registry = registry
+        self._runs: Dict[uuid.UUID, Dict] = {}
+        self._lock = threading.Lock()
+
+    def _start(self, run_id: uuid.UUID, prompt_text: str, metadata: Optional[Dict], kwargs: Dict) -> None:
+        metadata = metadata or {}
+        model = (
+            metadata.get("ls_model_name")
+            or (kwargs.get("invocation_params") or {}).get("model")
+            or "unknown"
+        )
+        with self._lock:
+            self._runs[run_id] = {
+                "start": time.perf_counter(),
+                "model": str(model).removeprefix("models/"),
+                "thread_id": str(metadata.get("thread_id") or current_thread_id()),
+                "prompt_estimate": estimate_tokens(prompt_text),
+                "retries": 0
+            }
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, metadata=None, **kwargs) -> None:
+        text = "\n".join(str(m.content) for batch in messages for m in batch)
+        self._start(run_id, text, metadata, kwargs)
+
+    def on_llm_start(self, serialized, prompts, *, run_id, metadata=None, **kwargs) -> None:
+        self._start(run_id, "\n".join(prompts), metadata, kwargs)
+
+    def on_retry(self, retry_state, *, run_id, **kwargs) -> None:
+        # Gemini 재시도는 ScheduledChatModel이 보냄 (스케줄러를 끄면 HTTP 계층 재시도라 집계되지 않음)
+        with self._lock:
+            if run_id in self._runs:
+                self._runs[run_id]["retries"] += 1
+
+    def on_llm_end(self, response, *, run_id, **kwargs) -> None:
+        with self._lock:
+            run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+
+        prompt_tokens = completion_tokens = 0
+        estimated = True
+        text = ""
+        for generations in response.generations:
+            for generation in generations:
+                text += generation.text
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if usage:
+                    prompt_tokens += usage.get("input_tokens", 0)
+                    completion_tokens += usage.get("output_tokens", 0)
+                    estimated = False
+        if estimated:
+            prompt_tokens = run["prompt_estimate"]
+            completion_tokens = estimate_tokens(text)
+
+        self.registry.record(
+            "llm",
+            run["model"],
+            time.perf_counter() - run["start"],
+            thread_id=run["thread_id"],
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            cost_usd=llm_cost(run["model"], prompt_tokens, completion_tokens),
+            retries=run["retries"],
+            estimated=estimated
+        )
+
+    def on_llm_error(self, error, *, run_id, **kwargs) -> None:
+        with self._lock:
+            run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+        self.registry.record(
+            "llm",
+            run["model"],
+            time.perf_counter() - run["start"],
+            thread_id=run["thread_id"],
+            error=True,
+            retries=run["retries"]
+        )
+
+
+def instrument_node(name: str, fn: Callable) -> Callable:
+    """노드 실행 시간 기록 래퍼 (동기/비동기 노드 모두 지원)
+
+    interrupt로 멈춘 실행은 오류가 아니라 interrupted=True로 기록한다.
+    """
+    if not settings.metrics_enabled:
+        return fn
+
+    def record(start: float, error: bool = False, interrupted: bool = False) -> None:
+        get_metrics().record("node", name, time.perf_counter() - start, error=error, interrupted=interrupted)
+
+    if asyncio.iscoroutinefunction(fn):
+        @functools.wraps(fn)
+        async def async_wrapper(state):
+            start = time.perf_counter()
+            try:
+                result = await fn(state)
+            except GraphBubbleUp:
+                record(start, interrupted=True)
+                raise
+            except Exception:
+                record(start, error=True)
+                raise
+            record(start)
+            return result
+
+        return async_wrapper
+
+    @functools.wraps(fn)
+    def wrapper(state):
+        start = time.perf_counter()
+        try:
+            result = fn(state)
+        except GraphBubbleUp:
+            record(start, interrupted=True)
+            raise
+        except Exception:
+            record(start, error=True)
+            raise
+        record(start)
+        return result
+
+    return wrapper
+
+
+_metrics: Optional[MetricsRegistry] = None
+_callback: Optional[MetricsCallbackHandler] = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics() -> MetricsRegistry:
+    """프로세스 공용 집계기"""
+    global _metrics
+
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = MetricsRegistry(
+                window=settings.metrics_window,
+                jsonl_path=settings.metrics_jsonl_path or None
+            )
+    return _metrics
+
+
+def get_metrics_callback() -> MetricsCallbackHandler:
+    """공용 집계기에 기록하는 LLM 콜백"""
+    global _callback
+
+    registry = get_metrics()
+    with _metrics_lock:
+        if _callback is None:
+            _callback = MetricsCallbackHandler(registry)
+    return _callback
+
+
+_server: Optional[ThreadingHTTPServer] = None
+
+
+def start_metrics_server(port: Optional[int] = None) -> Optional[ThreadingHTTPServer]:
+    """/metrics를 Prometheus 텍스트로 제공하는 데몬 스레드 시작 (프로세스당 하나).
+
+    port가 0 이하이면 시작하지 않고 None 반환.
+    """
+    global _server
+
+    port = settings.metrics_port if port is None else port
+    if port <= 0:
+        return None
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = get_metrics().render_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    with _metrics_lock:
+        if _server is None:
+            _server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+            threading.Thread(target=_server.serve_forever, name="metrics-server", daemon=True).start()
+            print(f"📈 메트릭 노출: http://127.0.0.1:{_server.server_address[1]}/metrics")
+    return _server
+
+
+def load_jsonl(path: str) -> MetricsRegistry:
+    """JSONL 이벤트 파일을 다시 집계 (구조화 로그 이벤트는 제외)"""
+    registry = MetricsRegistry()
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if event.get("kind") == "event":
+                continue
+            fields = {k: v for k, v in event.items()
+                      if k not in ("ts", "kind", "name", "thread_id", "seconds", "error")}
+            registry.record(event["kind"], event["name"], event["seconds"],
+                            thread_id=event.get("thread_id", ""), error=event.get("error", False), **fields)
+    return registry
@@ -0,0 +1,42 @@
+"""계측 JSONL을 다시 집계해 단계별 지연 시간/토큰/비용 출력
+
+    python -m blog_writer.metrics_report --jsonl metrics.jsonl
+    python -m blog_writer.metrics_report --jsonl metrics.jsonl --prometheus
+"""
+
+import argparse
+
+from blog_writer.config import settings
+from blog_writer.metrics import load_jsonl
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jsonl", default=settings.metrics_jsonl_path, help="이벤트 JSONL 경로")
+    parser.add_argument("--prometheus", action="store_true", help="Prometheus 텍스트 형식으로 출력")
+    args = parser.parse_args(argv)
+    if not args.jsonl:
+        parser.error("--jsonl 또는 METRICS_JSONL_PATH가 필요합니다")
+
+    registry = load_jsonl(args.jsonl)
+    if args.prometheus:
+        print(registry.render_prometheus(), end="")
+        return
+
+    for kind, series in registry.summary().items():
+        print(f"[{kind}]")
+        for name, stats in series.items():
+            extra = ""
+            if "prompt_tokens" in stats:
+                extra = (f"  토큰 {stats['prompt_tokens']:,}/{stats.get('completion_tokens', 0):,}"
+                         f"  ${stats.get('cost_usd', 0):.4f}")
+            elif "bytes" in stats:
+                extra = f"  {stats['bytes'] / 1024:.0f}KB  캐시 {stats.get('cached', 0)}"
+            print(
+                f"  {name:<32} {stats['count']:>5}회  오류 {stats['errors']:>3}  "
+                f"p50 {stats['p50_ms']:8.1f}ms  p95 {stats['p95_ms']:8.1f}ms{extra}"
+            )
+
+
+if __name__ == "__main__":
+    main()
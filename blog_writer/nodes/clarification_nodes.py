@@ -1,20 +1,136 @@
 """Unified clarification and approval nodes for workflow stages."""
 
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 from datetime import datetime
 
 from langgraph.types import interrupt, Command
 
 from blog_writer.state import BlogState
-from blog_writer.agents.clarification_agent import generate_clarification_questions
-from blog_writer.models.clarification import ClarificationResponse
+from blog_writer.agents.clarification_agent import (
+    agenerate_clarification_questions,
+    generate_clarification_questions
+)
+from blog_writer.agents.question_prefetch import get_question_prefetcher
+from blog_writer.config import settings
+from blog_writer.metrics import get_metrics
+from blog_writer.models.clarification import ClarificationQuestion, ClarificationResponse
+
+
+def _has_content(state: BlogState, content_key: Optional[str]) -> bool:
+    return bool(content_key and content_key in state and state.get(content_key))
+
+
+def _review_content(
+    state: BlogState,
+    stage: Literal["research", "writing", "editing"],
+    content_key: Optional[str],
+    next_on_reject: str
+) -> Optional[Command]:
+    """Show the stage's content for approval if it exists.
+
+    Returns:
+        A rejection Command, or None to continue with clarification
+    """
+    if not _has_content(state, content_key):
+        return None
+
+    # Content exists, request approval first
+    approval_data = {
+        "type": "approval",
+        "stage": stage,
+        "content": state[content_key],
+        "message": f"{stage} 단계 결과를 검토해주세요."
+    }
+
+    # Add stage-specific data
+    if stage == "research":
+        approval_data["sources"] = state.get("sources", [])
+    elif stage == "writing":
+        approval_data["outline"] = state.get("outline", "")
+    elif stage == "editing":
+        approval_data["seo_score"] = state.get("seo_score", 0)
+
+    approval_response = interrupt(approval_data)
+
+    # Check approval
+    if not approval_response.get("approved", False):
+        # Rejected - go back to previous stage
+        feedback = approval_response.get("feedback", "")
+        return Command(
+            goto=next_on_reject,
+            update={
+                "approval_status": "rejected",
+                "user_feedback": feedback
+            }
+        )
+    return None
+
+
+def _ask_questions(
+    state: BlogState,
+    stage: Literal["research", "writing", "editing"],
+    questions: List[ClarificationQuestion],
+    next_on_approve: str
+) -> Command:
+    """Interrupt with the generated questions and store the answers.
+
+    Returns:
+        Command with the updated clarifications, routed to the next stage
+    """
+    clarification_data = {
+        "type": "clarification",
+        "stage": stage,
+        "questions": [q.model_dump() for q in questions],
+        "message": f"{stage} 단계를 시작하기 전 몇 가지 질문드립니다."
+    }
+
+    clarification_response = interrupt(clarification_data)
+
+    # Process clarification response
+    answers = clarification_response.get("answers", [])
+    skipped = clarification_response.get("skipped", False)
+
+    # Create clarification response object
+    clarification = ClarificationResponse(
+        questions=questions,
+        answers=answers,
+        skipped=skipped,
+        timestamp=datetime.now(),
+        stage=stage
+    )
+
+    # Update state
+    clarifications = state.get("clarifications", {})
+    if clarifications is None:
+        clarifications = {}
+
+    # Convert ClarificationResponse to dict for state storage
+    clarifications[stage] = {
+        "questions": [q.model_dump() for q in clarification.questions],
+        "answers": clarification.answers,
+        "skipped": clarification.skipped,
+        "timestamp": clarification.timestamp.isoformat(),
+        "stage": clarification.stage
+    }
+
+    get_metrics().event("clarify.saved", f"✅ 질문 응답 저장 완료 (skipped: {skipped})", stage=stage, skipped=skipped)
+
+    # Proceed to next stage
+    return Command(
+        goto=next_on_approve,
+        update={
+            "clarifications": clarifications,
+            "approval_status": "approved"
+        }
+    )
 
 
 def create_clarify_and_approve_node(
     stage: Literal["research", "writing", "editing"],
     content_key: Optional[str],
     next_on_approve: str,
-    next_on_reject: str
+    next_on_reject: str,
+    async_mode: bool = False
 ):
     """Create a unified clarification + approval node for a workflow stage.
 
@@ -27,6 +143,7 @@ def create_clarify_and_approve_node(
         content_key: State key containing content to review (None for research)
         next_on_approve: Next node to goto on approval
         next_on_reject: Next node to goto on rejection
+        async_mode: Return a coroutine node that generates questions with ainvoke
 
     Returns:
         A node function that handles both approval and clarification
@@ -38,89 +155,63 @@ def create_clarify_and_approve_node(
         Returns:
             Command with state updates and routing information
         """
-        # Step 1: Content Review (skip for research stage)
-        if content_key and content_key in state and state.get(content_key):
-            # Content exists, request approval first
-            approval_data = {
-                "type": "approval",
-                "stage": stage,
-                "content": state[content_key],
-                "message": f"{stage} 단계 결과를 검토해주세요."
-            }
+        if not settings.clarification_prefetch:
+            rejected = _review_content(state, stage, content_key, next_on_reject)
+            if rejected is not None:
+                return rejected
+            get_metrics().event("clarify.start", f"\n🤔 {stage.upper()} 단계 질문 생성 중...", stage=stage)
+            questions = generate_clarification_questions(state, stage)
+            return _ask_questions(state, stage, questions, next_on_approve)
+
+        # Start the next stage's questions while the user reviews the content
+        prefetcher = get_question_prefetcher()
+        key = prefetcher.make_key(state, stage)
+        if _has_content(state, content_key):
+            prefetcher.start(key, state, stage)
 
-            # Add stage-specific data
-            if stage == "research":
-                approval_data["sources"] = state.get("sources", [])
-            elif stage == "writing":
-                approval_data["outline"] = state.get("outline", "")
-            elif stage == "editing":
-                approval_data["seo_score"] = state.get("seo_score", 0)
-
-            approval_response = interrupt(approval_data)
-
-            # Check approval
-            if not approval_response.get("approved", False):
-                # Rejected - go back to previous stage
-                feedback = approval_response.get("feedback", "")
-                return Command(
-                    goto=next_on_reject,
-                    update={
-                        "approval_status": "rejected",
-                        "user_feedback": feedback
-                    }
-                )
-
-        # Step 2: Clarification Questions
-        print(f"\n🤔 {stage.upper()} 단계 질문 생성 중...")
-
-        # Generate questions using Gemini
-        questions = generate_clarification_questions(state, stage)
-
-        clarification_data = {
-            "type": "clarification",
-            "stage": stage,
-            "questions": [q.model_dump() for q in questions],
-            "message": f"{stage} 단계를 시작하기 전 몇 가지 질문드립니다."
-        }
-
-        clarification_response = interrupt(clarification_data)
-
-        # Process clarification response
-        answers = clarification_response.get("answers", [])
-        skipped = clarification_response.get("skipped", False)
-
-        # Create clarification response object
-        clarification = ClarificationResponse(
-            questions=questions,
-            answers=answers,
-            skipped=skipped,
-            timestamp=datetime.now(),
-            stage=stage
-        )
+        # Step 1: Content Review (skip for research stage)
+        rejected = _review_content(state, stage, content_key, next_on_reject)
+        if rejected is not None:
+            prefetcher.discard(key)
+            return rejected
 
-        # Update state
-        clarifications = state.get("clarifications", {})
-        if clarifications is None:
-            clarifications = {}
-
-        # Convert ClarificationResponse to dict for state storage
-        clarifications[stage] = {
-            "questions": [q.model_dump() for q in clarification.questions],
-            "answers": clarification.answers,
-            "skipped": clarification.skipped,
-            "timestamp": clarification.timestamp.isoformat(),
-            "stage": clarification.stage
-        }
+        # Step 2: Clarification Questions (prefetched, or generated now)
+        get_metrics().event("clarify.start", f"\n🤔 {stage.upper()} 단계 질문 생성 중...", stage=stage)
+        questions = prefetcher.get(key, state, stage)
 
-        print(f"✅ 질문 응답 저장 완료 (skipped: {skipped})")
+        command = _ask_questions(state, stage, questions, next_on_approve)
+        prefetcher.discard(key)
+        return command
 
-        # Proceed to next stage
-        return Command(
-            goto=next_on_approve,
-            update={
-                "clarifications": clarifications,
-                "approval_status": "approved"
-            }
-        )
+    async def aclarify_and_approve_node(state: BlogState) -> Command:
+        """Async variant of clarify_and_approve_node.
 
-    return clarify_and_approve_node
+        Returns:
+            Command with state updates and routing information
+        """
+        if not settings.clarification_prefetch:
+            rejected = _review_content(state, stage, content_key, next_on_reject)
+            if rejected is not None:
+                return rejected
+            get_metrics().event("clarify.start", f"\n🤔 {stage.upper()} 단계 질문 생성 중...", stage=stage)
+            questions = await agenerate_clarification_questions(state, stage)
+            return _ask_questions(state, stage, questions, next_on_approve)
+
+        prefetcher = get_question_prefetcher()
+        key = prefetcher.make_key(state, stage)
+        if _has_content(state, content_key):
+            prefetcher.astart(key, state, stage)
+
+        rejected = _review_content(state, stage, content_key, next_on_reject)
+        if rejected is not None:
+            prefetcher.discard(key)
+            return rejected
+
+        get_metrics().event("clarify.start", f"\n🤔 {stage.upper()} 단계 질문 생성 중...", stage=stage)
+        questions = await prefetcher.aget(key, state, stage)
+
+        command = _ask_questions(state, stage, questions, next_on_approve)
+        prefetcher.discard(key)
+        return command
+
+    return aclarify_and_approve_node if async_mode else clarify_and_approve_node
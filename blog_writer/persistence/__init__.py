@@ -0,0 +1,24 @@
+"""Checkpoint persistence for blog writer workflows."""
+
+from blog_writer.persistence.blobs import BlobOffloadSerializer, BlobStore
+from blog_writer.persistence.checkpointer import (
+    InstrumentedAsyncSqliteSaver,
+    InstrumentedSqliteSaver,
+    aclose_checkpointers,
+    close_checkpointers,
+    connect_checkpoint_db,
+    get_async_checkpointer,
+    get_checkpointer
+)
+
+__all__ = [
+    "BlobOffloadSerializer",
+    "BlobStore",
+    "InstrumentedAsyncSqliteSaver",
+    "InstrumentedSqliteSaver",
+    "aclose_checkpointers",
+    "close_checkpointers",
+    "connect_checkpoint_db",
+    "get_async_checkpointer",
+    "get_checkpointer"
+]
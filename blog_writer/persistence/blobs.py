@@ -0,0 +1,194 @@
+"""Content-addressed storage for large checkpoint strings."""
+
+import hashlib
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from blog_writer.config import CHECKPOINT_BLOB_TOUCH_SECONDS, settings
+
+# 체크포인트 안에서 blob 참조를 나타내는 문자열 접두어
+BLOB_REF_PREFIX = "\x00blob:"
+
+# 최근에 읽은 blob 본문 캐시 크기 (get_state 반복 조회용)
+_READ_CACHE_SIZE = 128
+# 이미 저장된 것으로 확인된 해시 기억 개수 (중복 INSERT 생략용)
+_KNOWN_HASHES_SIZE = 4096
+# 재사용된 blob의 last_used를 갱신하는 최소 간격 (초). GC 유예 시간은 이 두 배 이상으로 강제됨
+_TOUCH_INTERVAL_SECONDS = CHECKPOINT_BLOB_TOUCH_SECONDS
+
+
+class BlobStore:
+    """체크포인트 DB 안의 텍스트 blob 테이블 (sha256 중복 제거 + zlib 압축).
+
+    체크포인터와 같은 파일을 쓰지만 연결은 따로 연다. SqliteSaver는
+    put_writes에서 자기 lock을 쥔 채 직렬화하므로 같은 연결/lock을 쓰면 교착된다.
+    blob은 참조하는 체크포인트 행보다 먼저 커밋된다.
+
+    last_used는 blob이 새 체크포인트에서 참조될 때마다(최대 1분 간격) 갱신된다.
+    GC는 참조가 없고 last_used가 유예 시간보다 오래된 blob만 지우므로,
+    직렬화는 끝났지만 아직 체크포인트 행이 커밋되지 않은 blob을 지우지 않는다.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+        self._lock = threading.Lock()
+        self._known: "OrderedDict[str, float]" = OrderedDict()
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+
+        with self._lock:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS checkpoint_blobs (
+                    hash TEXT PRIMARY KEY,
+                    data BLOB NOT NULL,
+                    raw_size INTEGER NOT NULL,
+                    last_used REAL NOT NULL
+                )
+                """
+            )
+            # 이전 버전 DB는 같은 열을 created_at으로 만들었음
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(checkpoint_blobs)")}
+            if "last_used" not in columns:
+                self._conn.execute("ALTER TABLE checkpoint_blobs RENAME COLUMN created_at TO last_used")
+            self._conn.commit()
+
+    @staticmethod
+    def _remember(store: OrderedDict, key: str, value: Any, limit: int) -> None:
+        store[key] = value
+        store.move_to_end(key)
+        while len(store) > limit:
+            store.popitem(last=False)
+
+    def put(self, text: str) -> str:
+        """텍스트를 저장하고 해시 반환 (이미 있으면 last_used만 갱신)"""
+        raw = text.encode("utf-8")
+        digest = hashlib.sha256(raw).hexdigest()
+        now = time.time()
+
+        with self._lock:
+            touched = self._known.get(digest)
+            if touched is not None and now - touched < _TOUCH_INTERVAL_SECONDS:
+                self._known.move_to_end(digest)
+                return digest
+
+            updated = self._conn.execute(
+                "UPDATE checkpoint_blobs SET last_used = ? WHERE hash = ?", (now, digest)
+            ).rowcount
+            if not updated:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO checkpoint_blobs (hash, data, raw_size, last_used) "
+                    "VALUES (?, ?, ?, ?)",
+                    (digest, zlib.compress(raw, 6), len(raw), now)
+                )
+            self._conn.commit()
+            self._remember(self._known, digest, now, _KNOWN_HASHES_SIZE)
+        return digest
+
+    def get(self, digest: str) -> str:
+        """해시로 텍스트 조회"""
+        with self._lock:
+            text = self._cache.get(digest)
+            if text is not None:
+                self._cache.move_to_end(digest)
+                return text
+            row = self._conn.execute(
+                "SELECT data FROM checkpoint_blobs WHERE hash = ?", (digest,)
+            ).fetchone()
+            if row is None:
+                raise LookupError(f"checkpoint blob {digest} not found")
+            text = zlib.decompress(row[0]).decode("utf-8")
+            self._remember(self._cache, digest, text, _READ_CACHE_SIZE)
+        return text
+
+    def delete_unreferenced(self, referenced: Set[str], unused_for_seconds: float) -> int:
+        """참조 목록에 없고 일정 시간 이상 쓰이지 않은 blob 삭제, 삭제 개수 반환"""
+        cutoff = time.time() - unused_for_seconds
+        with self._lock:
+            candidates = [
+                digest for (digest,) in self._conn.execute(
+                    "SELECT hash FROM checkpoint_blobs WHERE last_used < ?", (cutoff,)
+                )
+                if digest not in referenced
+            ]
+            # 조회와 삭제 사이에 재사용된 blob은 last_used 조건으로 다시 걸러냄
+            self._conn.executemany(
+                "DELETE FROM checkpoint_blobs WHERE hash = ? AND last_used < ?",
+                [(digest, cutoff) for digest in candidates]
+            )
+            self._conn.commit()
+            for digest in candidates:
+                self._known.pop(digest, None)
+                self._cache.pop(digest, None)
+        return len(candidates)
+
+    def stats(self) -> Dict:
+        """blob 개수와 원본/압축 바이트 합계"""
+        with self._lock:
+            count, raw_bytes, stored_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(raw_size), 0), COALESCE(SUM(LENGTH(data)), 0) "
+                "FROM checkpoint_blobs"
+            ).fetchone()
+        return {"blobs": count, "raw_bytes": raw_bytes, "stored_bytes": stored_bytes}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class BlobOffloadSerializer(JsonPlusSerializer):
+    """긴 문자열을 BlobStore로 빼내고 참조만 남기는 체크포인트 직렬화기.
+
+    dict/list/tuple 안의 min_chars 이상 문자열을 "\\x00blob:<sha256>" 참조로 바꿔
+    직렬화하고, 역직렬화할 때 다시 원문으로 바꾼다. 그래프 입장에서는
+    graph.get_state 결과가 기존과 같다.
+    """
+
+    def __init__(self, store: BlobStore, min_chars: int = 2048, **kwargs):
+        super().__init__(**kwargs)
+        self.store = store
+        self.min_chars = min_chars
+
+    def _offload(self, obj: Any) -> Any:
+        if isinstance(obj, str):
+            if len(obj) >= self.min_chars:
+                return BLOB_REF_PREFIX + self.store.put(obj)
+            return obj
+        if isinstance(obj, dict):
+            return {k: self._offload(v) for k, v in obj.items()}
+        if isinstance(obj, list):
+            return [self._offload(v) for v in obj]
+        if isinstance(obj, tuple) and type(obj) is tuple:
+            return tuple(self._offload(v) for v in obj)
+        return obj
+
+    def _resolve(self, obj: Any) -> Any:
+        if isinstance(obj, str):
+            if obj.startswith(BLOB_REF_PREFIX):
+                return self.store.get(obj[len(BLOB_REF_PREFIX):])
+            return obj
+        if isinstance(obj, dict):
+            return {k: self._resolve(v) for k, v in obj.items()}
+        if isinstance(obj, list):
+            return [self._resolve(v) for v in obj]
+        if isinstance(obj, tuple) and type(obj) is tuple:
+            return tuple(self._resolve(v) for v in obj)
+        return obj
+
+    def dumps_typed(self, obj: Any) -> tuple:
+        return super().dumps_typed(self._offload(obj))
+
+    def loads_typed(self, data: tuple) -> Any:
+        return self._resolve(super().loads_typed(data))
+
+
+def make_blob_serializer(conn: sqlite3.Connection, min_chars: Optional[int] = None) -> BlobOffloadSerializer:
+    """연결을 받아 BlobStore + 직렬화기 구성"""
+    if min_chars is None:
+        min_chars = settings.checkpoint_blob_min_chars
+    return BlobOffloadSerializer(BlobStore(conn), min_chars=min_chars)
@@ -0,0 +1,245 @@
+"""Process-wide SQLite checkpointer management."""
+
+import asyncio
+import sqlite3
+import threading
+import time
+import weakref
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, List, Optional
+
+import aiosqlite
+from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+from blog_writer.config import settings
+from blog_writer.persistence.blobs import BlobOffloadSerializer, make_blob_serializer
+
+# 쓰기 지연 시간 샘플 보관 개수 (작업별)
+_LATENCY_WINDOW = 1000
+
+
+def connect_checkpoint_db(db_path: str, busy_timeout_ms: Optional[int] = None) -> sqlite3.Connection:
+    """동시 워크플로우에 맞게 튜닝된 SQLite 연결 생성.
+
+    - journal_mode=WAL: 쓰는 동안에도 다른 연결/프로세스가 읽을 수 있음
+    - synchronous=NORMAL: WAL에서는 커밋마다 fsync하지 않아도 손상 위험 없음
+    - busy_timeout: 다른 프로세스가 쓰기 잠금을 쥐고 있으면 즉시 실패하지 않고 대기
+    - auto_vacuum=INCREMENTAL: 삭제된 페이지를 incremental_vacuum으로 회수 가능 (새 DB에만 적용)
+    """
+    if busy_timeout_ms is None:
+        busy_timeout_ms = settings.checkpoint_busy_timeout_ms
+
+    if db_path != ":memory:":
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+    # check_same_thread=False: SqliteSaver가 자체 lock으로 접근을 직렬화
+    conn = sqlite3.connect(db_path, check_same_thread=False, timeout=busy_timeout_ms / 1000)
+    for pragma in _tuning_pragmas(busy_timeout_ms):
+        conn.execute(pragma)
+    return conn
+
+
+def _tuning_pragmas(busy_timeout_ms: int) -> List[str]:
+    return [
+        f"PRAGMA busy_timeout={int(busy_timeout_ms)}",
+        "PRAGMA auto_vacuum=INCREMENTAL",
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL"
+    ]
+
+
+class _WriteMetricsMixin:
+    """체크포인트 쓰기 지연 시간 기록 (동기/비동기 saver 공용)"""
+
+    def _init_metrics(self, serde) -> None:
+        # 큰 문자열을 blob 테이블로 빼내는 직렬화기를 쓰는 경우의 저장소
+        self.blob_store = serde.store if isinstance(serde, BlobOffloadSerializer) else None
+        self._latencies: Dict[str, Deque[float]] = {
+            "put": deque(maxlen=_LATENCY_WINDOW),
+            "put_writes": deque(maxlen=_LATENCY_WINDOW)
+        }
+        self._counts = {"put": 0, "put_writes": 0}
+        self._metrics_lock = threading.Lock()
+
+    def _record(self, op: str, seconds: float) -> None:
+        with self._metrics_lock:
+            self._latencies[op].append(seconds)
+            self._counts[op] += 1
+
+    def write_stats(self) -> Dict[str, Dict]:
+        """작업별 쓰기 횟수와 최근 지연 시간 통계 (ms)"""
+        stats = {}
+        with self._metrics_lock:
+            for op, samples in self._latencies.items():
+                ordered = sorted(samples)
+                if ordered:
+                    stats[op] = {
+                        "count": self._counts[op],
+                        "mean_ms": sum(ordered) / len(ordered) * 1000,
+                        "p50_ms": ordered[len(ordered) // 2] * 1000,
+                        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+                        "max_ms": ordered[-1] * 1000
+                    }
+                else:
+                    stats[op] = {"count": 0, "mean_ms": 0.0, "p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        return stats
+
+
+class InstrumentedSqliteSaver(_WriteMetricsMixin, SqliteSaver):
+    """put/put_writes 지연 시간을 기록하는 SqliteSaver"""
+
+    def __init__(self, conn: sqlite3.Connection, *, serde=None):
+        super().__init__(conn, serde=serde)
+        self._init_metrics(serde)
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        start = time.perf_counter()
+        try:
+            return super().put(config, checkpoint, metadata, new_versions)
+        finally:
+            self._record("put", time.perf_counter() - start)
+
+    def put_writes(self, config, writes, task_id, task_path=""):
+        start = time.perf_counter()
+        try:
+            return super().put_writes(config, writes, task_id, task_path)
+        finally:
+            self._record("put_writes", time.perf_counter() - start)
+
+
+class InstrumentedAsyncSqliteSaver(_WriteMetricsMixin, AsyncSqliteSaver):
+    """aput/aput_writes 지연 시간을 기록하는 AsyncSqliteSaver.
+
+    생성 시점에 아직 열리지 않은 aiosqlite 연결(started=False)을 받으면
+    첫 setup()에서 연결을 열고 동기 연결과 같은 PRAGMA 튜닝을 적용한다.
+    """
+
+    def __init__(self, conn: aiosqlite.Connection, *, serde=None, started: bool = True,
+                 busy_timeout_ms: Optional[int] = None):
+        super().__init__(conn, serde=serde)
+        self._init_metrics(serde)
+        self._started = started
+        self._tuned = False
+        self._tuning_lock = asyncio.Lock()
+        self._busy_timeout_ms = (
+            busy_timeout_ms if busy_timeout_ms is not None else settings.checkpoint_busy_timeout_ms
+        )
+
+    async def setup(self) -> None:
+        # 기본 구현은 모든 읽기/쓰기마다 saver 전체 lock을 잡고 설정 여부를 확인하므로,
+        # 동시 워크플로우가 많으면 lock 대기가 길어진다. 설정이 끝났으면 바로 반환
+        if self.is_setup:
+            return
+        if not self._tuned:
+            async with self._tuning_lock:
+                if not self._tuned:
+                    if not self._started:
+                        await self.conn
+                        self._started = True
+                    for pragma in _tuning_pragmas(self._busy_timeout_ms):
+                        await self.conn.execute(pragma)
+                    self._tuned = True
+        await super().setup()
+
+    async def aput(self, config, checkpoint, metadata, new_versions):
+        start = time.perf_counter()
+        try:
+            return await super().aput(config, checkpoint, metadata, new_versions)
+        finally:
+            self._record("put", time.perf_counter() - start)
+
+    async def aput_writes(self, config, writes, task_id, task_path=""):
+        start = time.perf_counter()
+        try:
+            return await super().aput_writes(config, writes, task_id, task_path)
+        finally:
+            self._record("put_writes", time.perf_counter() - start)
+
+
+_checkpointers: Dict[str, InstrumentedSqliteSaver] = {}
+_checkpointers_lock = threading.Lock()
+
+
+def _registry_key(db_path: str) -> str:
+    return db_path if db_path == ":memory:" else str(Path(db_path).resolve())
+
+
+def get_checkpointer(db_path: Optional[str] = None) -> InstrumentedSqliteSaver:
+    """DB 경로별 프로세스 공용 체크포인터 반환 (없으면 생성).
+
+    같은 파일에 연결을 여러 개 열면 쓰기끼리 잠금 경쟁이 생기므로,
+    프로세스 안의 모든 그래프/세션이 경로당 하나의 연결을 공유한다.
+    """
+    db_path = db_path or settings.checkpoint_db
+    key = _registry_key(db_path)
+
+    with _checkpointers_lock:
+        saver = _checkpointers.get(key)
+        if saver is None:
+            serde = None
+            if settings.checkpoint_blob_offload and db_path != ":memory:":
+                # blob 저장소는 같은 파일에 별도 연결 사용 (:memory:는 연결마다 다른 DB라 제외)
+                serde = make_blob_serializer(connect_checkpoint_db(db_path))
+            saver = InstrumentedSqliteSaver(connect_checkpoint_db(db_path), serde=serde)
+            saver.setup()
+            _checkpointers[key] = saver
+    return saver
+
+
+# aiosqlite 연결과 asyncio.Lock은 만든 이벤트 루프에 묶이므로 루프별로 공유
+_async_checkpointers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, InstrumentedAsyncSqliteSaver]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_checkpointer(db_path: Optional[str] = None) -> InstrumentedAsyncSqliteSaver:
+    """현재 이벤트 루프에서 DB 경로별로 공유하는 비동기 체크포인터 반환.
+
+    실행 중인 이벤트 루프 안에서 호출해야 한다.
+    연결은 첫 체크포인트 읽기/쓰기 때 열리고 튜닝된다.
+    aiosqlite 작업 스레드가 남아 있으면 프로세스가 끝나지 않으므로
+    루프를 닫기 전에 aclose_checkpointers()를 호출한다.
+    """
+    db_path = db_path or settings.checkpoint_db
+    key = _registry_key(db_path)
+    loop = asyncio.get_running_loop()
+
+    savers = _async_checkpointers.setdefault(loop, {})
+    saver = savers.get(key)
+    if saver is None:
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        serde = None
+        if settings.checkpoint_blob_offload and db_path != ":memory:":
+            # blob 저장소는 동기 연결을 그대로 사용 (짧은 로컬 쓰기, 자체 lock으로 스레드 안전)
+            serde = make_blob_serializer(connect_checkpoint_db(db_path))
+        busy_timeout_ms = settings.checkpoint_busy_timeout_ms
+        conn = aiosqlite.connect(db_path, timeout=busy_timeout_ms / 1000)
+        saver = InstrumentedAsyncSqliteSaver(
+            conn, serde=serde, started=False, busy_timeout_ms=busy_timeout_ms
+        )
+        savers[key] = saver
+    return saver
+
+
+async def aclose_checkpointers() -> None:
+    """현재 이벤트 루프의 비동기 체크포인터 연결 모두 닫기"""
+    savers = _async_checkpointers.pop(asyncio.get_running_loop(), {})
+    for saver in savers.values():
+        if saver._started:
+            await saver.conn.close()
+        if saver.blob_store is not None:
+            saver.blob_store.close()
+
+
+def close_checkpointers() -> None:
+    """공용 체크포인터 연결 모두 닫기 (프로세스 종료, 테스트 정리용)"""
+    with _checkpointers_lock:
+        for saver in _checkpointers.values():
+            with saver.lock:
+                saver.conn.close()
+            if saver.blob_store is not None:
+                saver.blob_store.close()
+        _checkpointers.clear()
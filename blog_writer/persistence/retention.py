@@ -0,0 +1,273 @@
+"""Checkpoint retention, blob garbage collection and compaction.
+
+    python -m blog_writer.persistence.retention --keep-last 10 --ttl-days 7
+    python -m blog_writer.persistence.retention --dry-run
+"""
+
+import argparse
+import os
+import re
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Optional, Set
+
+from blog_writer.config import MIN_CHECKPOINT_BLOB_GRACE_SECONDS, settings
+from blog_writer.metrics import get_metrics
+from blog_writer.persistence.checkpointer import InstrumentedSqliteSaver, get_checkpointer
+
+# 체크포인트/쓰기 행의 직렬화 바이트에서 blob 참조를 찾는 패턴 (msgpack 문자열은 원문 UTF-8)
+_BLOB_REF_RE = re.compile(rb"\x00blob:([0-9a-f]{64})")
+
+
+def _db_file_bytes(db_path: str) -> int:
+    """DB 파일 + WAL 파일 크기"""
+    total = 0
+    for path in (db_path, db_path + "-wal"):
+        if os.path.exists(path):
+            total += os.path.getsize(path)
+    return total
+
+
+def _idle_seconds(ts: str, now: datetime) -> float:
+    """체크포인트 ts(ISO 8601)로부터 경과 시간"""
+    last = datetime.fromisoformat(ts)
+    if last.tzinfo is None:
+        last = last.replace(tzinfo=timezone.utc)
+    return (now - last).total_seconds()
+
+
+def _referenced_blobs(saver: InstrumentedSqliteSaver) -> Set[str]:
+    """남아 있는 체크포인트/쓰기 행이 참조하는 blob 해시 목록"""
+    referenced = set()
+    with saver.cursor(transaction=False) as cur:
+        for query in ("SELECT checkpoint FROM checkpoints", "SELECT value FROM writes"):
+            for (data,) in cur.execute(query):
+                if data:
+                    referenced.update(m.decode("ascii") for m in _BLOB_REF_RE.findall(data))
+    return referenced
+
+
+def run_retention(
+    db_path: Optional[str] = None,
+    keep_last: Optional[int] = None,
+    ttl_seconds: Optional[int] = None,
+    complete_grace_seconds: Optional[int] = None,
+    blob_grace_seconds: Optional[int] = None,
+    full_vacuum: bool = False,
+    dry_run: bool = False
+) -> Dict:
+    """체크포인트 보존 정책 적용.
+
+    1. 완료(current_stage == "complete") 후 complete_grace_seconds 지난 스레드,
+       마지막 체크포인트 이후 ttl_seconds 이상 방치된 스레드를 삭제
+    2. 남은 스레드는 네임스페이스별 최근 keep_last개 체크포인트만 유지
+    3. 어떤 행도 참조하지 않는 blob 삭제 (blob_grace_seconds 이내 사용된 blob은 보존,
+       blob_grace_seconds는 최소 MIN_CHECKPOINT_BLOB_GRACE_SECONDS)
+    4. incremental VACUUM(또는 full_vacuum 시 VACUUM)으로 빈 페이지 회수
+
+    Returns:
+        삭제 건수와 회수한 바이트 수 리포트
+    """
+    db_path = db_path or settings.checkpoint_db
+    keep_last = keep_last if keep_last is not None else settings.checkpoint_keep_last
+    keep_last = max(1, keep_last)  # 마지막 체크포인트는 interrupt 재개에 필요
+    ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.checkpoint_thread_ttl_seconds
+    if complete_grace_seconds is None:
+        complete_grace_seconds = settings.checkpoint_complete_grace_seconds
+    if blob_grace_seconds is None:
+        blob_grace_seconds = settings.checkpoint_blob_grace_seconds
+    if blob_grace_seconds < MIN_CHECKPOINT_BLOB_GRACE_SECONDS:
+        # 재사용된 blob은 사용 시각을 매번 갱신하지 않으므로, 더 짧으면 새 체크포인트가 참조할 blob을 지울 수 있음
+        get_metrics().event(
+            "retention.blob_grace_clamped",
+            f"⚠️ blob 유예 시간 {blob_grace_seconds}초 → {MIN_CHECKPOINT_BLOB_GRACE_SECONDS}초로 조정",
+            requested=blob_grace_seconds,
+            applied=MIN_CHECKPOINT_BLOB_GRACE_SECONDS
+        )
+        blob_grace_seconds = MIN_CHECKPOINT_BLOB_GRACE_SECONDS
+
+    saver = get_checkpointer(db_path)
+    bytes_before = _db_file_bytes(db_path)
+    now = datetime.now(timezone.utc)
+    report = {
+        "threads_scanned": 0,
+        "threads_deleted": 0,
+        "checkpoints_deleted": 0,
+        "writes_deleted": 0,
+        "blobs_deleted": 0,
+        "bytes_before": bytes_before,
+        "bytes_after": bytes_before,
+        "reclaimed_bytes": 0,
+        "dry_run": dry_run
+    }
+
+    with saver.cursor(transaction=False) as cur:
+        thread_ids = [row[0] for row in cur.execute("SELECT DISTINCT thread_id FROM checkpoints")]
+    report["threads_scanned"] = len(thread_ids)
+
+    # 1. 완료/방치 스레드 삭제
+    remaining = []
+    for thread_id in thread_ids:
+        latest = saver.get_tuple({"configurable": {"thread_id": thread_id, "checkpoint_ns": ""}})
+        if latest is None:
+            remaining.append(thread_id)
+            continue
+
+        idle = _idle_seconds(latest.checkpoint["ts"], now)
+        stage = latest.checkpoint.get("channel_values", {}).get("current_stage")
+        expired = idle > ttl_seconds or (stage == "complete" and idle > complete_grace_seconds)
+
+        if not expired:
+            remaining.append(thread_id)
+            continue
+
+        report["threads_deleted"] += 1
+        with saver.cursor(transaction=False) as cur:
+            (checkpoints,) = cur.execute(
+                "SELECT COUNT(*) FROM checkpoints WHERE thread_id = ?", (thread_id,)
+            ).fetchone()
+            (writes,) = cur.execute(
+                "SELECT COUNT(*) FROM writes WHERE thread_id = ?", (thread_id,)
+            ).fetchone()
+        report["checkpoints_deleted"] += checkpoints
+        report["writes_deleted"] += writes
+        if not dry_run:
+            saver.delete_thread(thread_id)
+
+    # 2. 남은 스레드는 최근 keep_last개 체크포인트만 유지
+    for thread_id in remaining:
+        with saver.cursor(transaction=not dry_run) as cur:
+            rows = cur.execute(
+                "SELECT checkpoint_ns, checkpoint_id FROM checkpoints "
+                "WHERE thread_id = ? ORDER BY checkpoint_ns, checkpoint_id DESC",
+                (thread_id,)
+            ).fetchall()
+
+            kept: Dict[str, int] = {}
+            stale = []
+            for checkpoint_ns, checkpoint_id in rows:
+                kept[checkpoint_ns] = kept.get(checkpoint_ns, 0) + 1
+                if kept[checkpoint_ns] > keep_last:
+                    stale.append((thread_id, checkpoint_ns, checkpoint_id))
+
+            report["checkpoints_deleted"] += len(stale)
+            for key in stale:
+                (writes,) = cur.execute(
+                    "SELECT COUNT(*) FROM writes WHERE thread_id = ? AND checkpoint_ns = ? "
+                    "AND checkpoint_id = ?", key
+                ).fetchone()
+                report["writes_deleted"] += writes
+
+            if stale and not dry_run:
+                cur.executemany(
+                    "DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    stale
+                )
+                cur.executemany(
+                    "DELETE FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    stale
+                )
+
+    if dry_run:
+        return report
+
+    # 3. 참조 없는 blob 삭제
+    if saver.blob_store is not None:
+        report["blobs_deleted"] = saver.blob_store.delete_unreferenced(
+            _referenced_blobs(saver), unused_for_seconds=blob_grace_seconds
+        )
+
+    # 4. 빈 페이지 회수 + WAL 정리
+    with saver.cursor(transaction=False) as cur:
+        if full_vacuum:
+            # auto_vacuum 모드 전환은 VACUUM을 거쳐야 기존 DB에 적용됨
+            cur.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            cur.execute("VACUUM")
+        else:
+            cur.execute("PRAGMA incremental_vacuum").fetchall()
+        cur.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+
+    report["bytes_after"] = _db_file_bytes(db_path)
+    report["reclaimed_bytes"] = max(0, bytes_before - report["bytes_after"])
+    return report
+
+
+_background: Dict[str, threading.Event] = {}
+_background_lock = threading.Lock()
+
+
+def start_background_retention(
+    db_path: Optional[str] = None,
+    interval_seconds: Optional[int] = None
+) -> Optional[threading.Event]:
+    """주기적으로 run_retention을 실행하는 데몬 스레드 시작 (DB 경로당 하나).
+
+    interval_seconds가 0 이하이면 시작하지 않고 None 반환.
+    반환된 Event를 set()하면 스레드가 종료된다.
+    """
+    db_path = db_path or settings.checkpoint_db
+    if interval_seconds is None:
+        interval_seconds = settings.checkpoint_retention_interval_seconds
+    if interval_seconds <= 0:
+        return None
+
+    with _background_lock:
+        stop = _background.get(db_path)
+        if stop is not None and not stop.is_set():
+            return stop
+        stop = threading.Event()
+        _background[db_path] = stop
+
+    def loop() -> None:
+        while not stop.wait(interval_seconds):
+            try:
+                report = run_retention(db_path)
+                get_metrics().event(
+                    "retention.run",
+                    f"🧹 체크포인트 정리: 스레드 {report['threads_deleted']}개, "
+                    f"체크포인트 {report['checkpoints_deleted']}개 삭제, "
+                    f"{report['reclaimed_bytes'] / 1024:.0f}KB 회수",
+                    **report
+                )
+            except Exception as e:
+                get_metrics().event("retention.failed", f"⚠️ 체크포인트 정리 실패: {e}", error=str(e))
+
+    threading.Thread(target=loop, name="checkpoint-retention", daemon=True).start()
+    return stop
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="체크포인트 보존 정책 적용 및 DB 압축")
+    parser.add_argument("--db", default=settings.checkpoint_db)
+    parser.add_argument("--keep-last", type=int, default=settings.checkpoint_keep_last,
+                        help="스레드별로 남길 최근 체크포인트 수")
+    parser.add_argument("--ttl-days", type=float, default=settings.checkpoint_thread_ttl_seconds / 86400,
+                        help="마지막 체크포인트 이후 이 기간이 지난 스레드 삭제")
+    parser.add_argument("--full-vacuum", action="store_true",
+                        help="VACUUM 전체 실행 (기존 DB를 auto_vacuum=INCREMENTAL로 전환)")
+    parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상만 집계")
+    args = parser.parse_args(argv)
+
+    report = run_retention(
+        db_path=args.db,
+        keep_last=args.keep_last,
+        ttl_seconds=int(args.ttl_days * 86400),
+        full_vacuum=args.full_vacuum,
+        dry_run=args.dry_run
+    )
+
+    prefix = "🔎 [dry-run] 삭제 대상" if args.dry_run else "🧹 삭제"
+    print(f"📊 스레드 {report['threads_scanned']}개 검사")
+    print(
+        f"{prefix}: 스레드 {report['threads_deleted']}개, 체크포인트 {report['checkpoints_deleted']}개, "
+        f"쓰기 {report['writes_deleted']}개, blob {report['blobs_deleted']}개"
+    )
+    if not args.dry_run:
+        print(
+            f"✅ {report['bytes_before'] / 1024:.0f}KB → {report['bytes_after'] / 1024:.0f}KB "
+            f"({report['reclaimed_bytes'] / 1024:.0f}KB 회수)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,15 @@
+"""Prompt assembly utilities for blog writer agents."""
+
+from blog_writer.prompts.builder import (
+    PromptBuilder,
+    PromptSection,
+    estimate_tokens,
+    truncate_to_tokens
+)
+
+__all__ = [
+    "PromptBuilder",
+    "PromptSection",
+    "estimate_tokens",
+    "truncate_to_tokens"
+]
@@ -0,0 +1,172 @@
+"""Token-budgeted prompt assembly shared by the research, writing and editing agents."""
+
+from typing import Callable, List, Optional
+
+from pydantic import BaseModel, Field
+
+from blog_writer.config import settings
+
+
+# 토큰 추정 비율 (Gemini 기준 대략값): 영문/숫자 ≈ 4자당 1토큰, 한글 등 비ASCII ≈ 1.5자당 1토큰
+_ASCII_CHARS_PER_TOKEN = 4.0
+_NON_ASCII_CHARS_PER_TOKEN = 1.5
+
+TRUNCATION_MARKER = "\n\n...(분량 제한으로 이하 생략)"
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트의 토큰 수 추정 (API 호출 없이 문자 종류별 비율로 계산)"""
+    if not text:
+        return 0
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    non_ascii_chars = len(text) - ascii_chars
+    return int(
+        ascii_chars / _ASCII_CHARS_PER_TOKEN
+        + non_ascii_chars / _NON_ASCII_CHARS_PER_TOKEN
+    ) + 1
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """토큰 예산에 맞게 문단 경계에서 자르기"""
+    if max_tokens <= 0:
+        return ""
+    tokens = estimate_tokens(text)
+    if tokens <= max_tokens:
+        return text
+
+    marker_tokens = estimate_tokens(TRUNCATION_MARKER)
+    keep_chars = int(len(text) * max(max_tokens - marker_tokens, 0) / tokens)
+    cut = text[:keep_chars]
+
+    # 가능하면 문단/줄 경계에서 자름 (절반 이상은 유지)
+    boundary = max(cut.rfind("\n\n"), cut.rfind("\n"))
+    if boundary > keep_chars // 2:
+        cut = cut[:boundary]
+
+    return cut.rstrip() + TRUNCATION_MARKER
+
+
+class PromptSection(BaseModel):
+    """프롬프트를 구성하는 한 구역.
+
+    Attributes:
+        name: 로그에 표시할 구역 이름
+        text: 구역 내용
+        priority: 높을수록 끝까지 보존 (예산 초과 시 낮은 우선순위부터 줄임)
+        min_tokens: 줄이더라도 남길 최소 토큰 수 (0이면 통째로 제거 가능)
+        truncatable: False면 예산과 관계없이 그대로 유지
+    """
+    name: str
+    text: str
+    priority: int = 50
+    min_tokens: int = Field(0, ge=0)
+    truncatable: bool = True
+
+
+class PromptBuilder:
+    """우선순위 기반 토큰 예산 프롬프트 조립기.
+
+    구역은 추가된 순서대로 이어 붙이고, 예산을 넘으면 우선순위가 낮은 구역부터
+    요약(summarizer 지정 시) 또는 문단 경계 절단으로 줄인다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        budget: Optional[int] = None,
+        summarizer: Optional[Callable[[str, int], str]] = None
+    ):
+        self.name = name
+        self.budget = budget if budget is not None else settings.prompt_token_budget
+        self.summarizer = summarizer
+        self.sections: List[PromptSection] = []
+
+    def add(
+        self,
+        text: str,
+        name: str = "",
+        priority: int = 50,
+        min_tokens: int = 0,
+        truncatable: bool = True
+    ) -> "PromptBuilder":
+        """구역 추가 (빈 텍스트는 무시)"""
+        if text and text.strip():
+            self.sections.append(PromptSection(
+                name=name or f"section_{len(self.sections)}",
+                text=text.strip("\n"),
+                priority=priority,
+                min_tokens=min_tokens,
+                truncatable=truncatable
+            ))
+        return self
+
+    def fixed(self, text: str, name: str = "") -> "PromptBuilder":
+        """줄이지 않는 고정 구역 (지시문, 요구사항 등)"""
+        return self.add(text, name=name, priority=100, truncatable=False)
+
+    def _shrink(self, section: PromptSection, target_tokens: int) -> str:
+        if self.summarizer is not None and target_tokens > 0:
+            try:
+                summary = self.summarizer(section.text, target_tokens)
+                if estimate_tokens(summary) <= target_tokens:
+                    return summary
+            except Exception as e:
+                # blog_writer.metrics가 이 모듈의 estimate_tokens를 쓰므로 지연 import
+                from blog_writer.metrics import get_metrics
+
+                get_metrics().event(
+                    "prompt.summarize_failed",
+                    f"⚠️ [{self.name}] '{section.name}' 요약 실패, 절단으로 대체: {str(e)}",
+                    prompt=self.name,
+                    section=section.name,
+                    error=str(e)
+                )
+        return truncate_to_tokens(section.text, target_tokens)
+
+    def build(self) -> str:
+        """예산 내로 조립한 최종 프롬프트 반환"""
+        texts = {id(s): s.text for s in self.sections}
+        counts = {id(s): estimate_tokens(s.text) for s in self.sections}
+        total = sum(counts.values())
+        original_total = total
+        reduced = []
+
+        # 낮은 우선순위부터, 같은 우선순위면 나중에 추가된 구역부터 줄임
+        order = sorted(
+            (s for s in self.sections if s.truncatable),
+            key=lambda s: (s.priority, -self.sections.index(s))
+        )
+        for section in order:
+            over = total - self.budget
+            if over <= 0:
+                break
+            key = id(section)
+            target = max(section.min_tokens, counts[key] - over)
+            if target >= counts[key]:
+                continue
+
+            texts[key] = self._shrink(section, target)
+            new_count = estimate_tokens(texts[key])
+            total += new_count - counts[key]
+            counts[key] = new_count
+            reduced.append(section.name)
+
+        prompt = "\n\n".join(texts[id(s)] for s in self.sections if texts[id(s)])
+
+        # blog_writer.metrics가 이 모듈의 estimate_tokens를 쓰므로 지연 import
+        from blog_writer.metrics import get_metrics
+
+        message = f"📏 [{self.name}] 프롬프트 {total:,} 토큰 (예산 {self.budget:,})"
+        if reduced:
+            message += f" - {original_total:,}에서 축소: {', '.join(reduced)}"
+        get_metrics().event(
+            "prompt",
+            message,
+            prompt=self.name,
+            tokens=total,
+            original_tokens=original_total,
+            budget=self.budget,
+            reduced=reduced
+        )
+
+        return prompt
@@ -0,0 +1,573 @@
+"""모든 에이전트의 LLM 호출을 거치게 하는 프로세스 공용 스케줄러
+
+여러 워크플로우가 동시에 돌면 에이전트마다 Gemini를 따로 호출하다가 한도(RPM/TPM)를
+넘는 순간 429가 몰리고, 모델 내부 재시도가 다시 한꺼번에 몰린다. 스케줄러는 모델별로
+- 토큰 버킷 두 개(분당 요청 수, 분당 토큰 수)로 보내는 속도를 제한하고
+- 우선순위 대기열에서 대화형 호출(되묻기 질문)을 배치 초안 같은 호출보다 먼저 보내며
+  (오래 기다린 요청은 llm_queue_aging_seconds마다 한 단계씩 앞당김)
+- 동시 호출 한도를 AIMD로 조절한다: 성공하면 +1/한도, 최근 지연(1k 토큰당)이 기준 지연의
+  llm_latency_tolerance배를 넘으면 ×0.9, 429면 ×0.5 + 잠시 그 모델 전체 멈춤.
+
+재시도도 스케줄러가 맡는다(모델의 HTTP 재시도는 끈다). 재시도 요청은 다시 대기열을 거치므로
+429 직후 재시도가 한꺼번에 몰리지 않는다. 대기 시간은 계측에 ("llm_queue", "모델:우선순위")로
+기록되고, get_llm_scheduler().stats()로 모델별 한도·대기 수를 볼 수 있다.
+
+    with llm_priority(PRIORITY_BATCH):   # 이 블록(과 여기서 만든 태스크/스레드)의 호출은 배치 우선순위
+        await graph.ainvoke(...)
+"""
+
+import asyncio
+import itertools
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.exceptions import (
+    ModelAPIError,
+    ModelConnectionError,
+    ModelRateLimitError,
+    ModelTimeoutError
+)
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from pydantic import ConfigDict
+from tenacity import RetryCallState
+
+from blog_writer.config import settings
+from blog_writer.metrics import get_metrics
+from blog_writer.prompts import estimate_tokens
+
+PRIORITY_INTERACTIVE = 0   # 사용자가 화면에서 기다리는 호출 (되묻기 질문)
+PRIORITY_NORMAL = 1
+PRIORITY_BATCH = 2         # 배치 실행 (python -m blog_writer.batch)
+PRIORITY_NAMES = {PRIORITY_INTERACTIVE: "interactive", PRIORITY_NORMAL: "normal", PRIORITY_BATCH: "batch"}
+
+# 모델별 기본 한도 (분당 요청 수, 분당 토큰 수). 0은 제한 없음. LLM_RATE_LIMITS로 덮어씀
+MODEL_LIMITS: Dict[str, Tuple[int, int]] = {
+    "gemini-2.5-pro": (150, 2_000_000),
+    "gemini-2.5-flash": (1000, 1_000_000),
+    "gemini-2.5-flash-lite": (4000, 4_000_000),
+    "gemini-2.0-flash": (2000, 4_000_000)
+}
+_DEFAULT_LIMITS = (60, 1_000_000)
+
+# 버킷 용량 = 한도의 이 비율 (순간적으로 몰아서 보낼 수 있는 양)
+_BURST_FRACTION = 1 / 6
+
+# 지연 시간 이동 평균 가중치 (최근 / 기준)
+_FAST_ALPHA = 0.3
+_BASE_ALPHA = 0.05
+
+# 다시 시도할 수 있는 오류 (나머지는 바로 호출자에게 전달)
+_RETRYABLE = (ModelRateLimitError, ModelAPIError, ModelConnectionError, ModelTimeoutError)
+
+_priority: ContextVar[Optional[int]] = ContextVar("llm_priority", default=None)
+
+
+@contextmanager
+def llm_priority(priority: int):
+    """블록 안의 LLM 호출 우선순위 지정 (모델별 기본 우선순위보다 우선)"""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def parse_rate_limits(spec: str) -> Dict[str, Tuple[int, int]]:
+    """"모델=RPM:TPM,모델=RPM:TPM" 형식의 한도 설정 파싱 (TPM 생략 시 토큰 제한 없음)"""
+    limits = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        model, _, values = item.partition("=")
+        rpm, _, tpm = values.partition(":")
+        try:
+            limits[model.strip()] = (int(rpm), int(tpm or 0))
+        except ValueError:
+            raise ValueError(f"잘못된 LLM 한도 설정: {item} (예: gemini-2.5-pro=150:2000000)") from None
+    return limits
+
+
+class TokenBucket:
+    """window초마다 limit개를 넘지 않는 버킷 (limit 0이면 제한 없음)
+
+    용량(한 번에 몰아서 보낼 수 있는 양)과 채워지는 속도의 합이 어느 window 구간에서도
+    limit을 넘지 않도록, 용량만큼 속도를 낮춘다(서버의 분당 한도는 이동 구간으로 센다).
+    잔량은 음수가 될 수 있다. 호출 전에는 추정 토큰만 빼고, 끝난 뒤 실제 사용량과의
+    차이를 정산하기 때문이다.
+    """
+
+    def __init__(self, limit: float, window: float = 60.0, burst_fraction: float = _BURST_FRACTION):
+        self.capacity = max(1.0, limit * burst_fraction)
+        self.rate = max(limit - self.capacity, limit / 2) / window if limit else 0.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """amount를 꺼낼 수 있을 때까지 남은 시간 (초)"""
+        if not self.rate:
+            return 0.0
+        self._refill(now)
+        amount = min(amount, self.capacity)  # 용량보다 큰 요청은 가득 찼을 때 통과
+        return 0.0 if self.level >= amount else (amount - self.level) / self.rate
+
+    def take(self, amount: float, now: float) -> None:
+        if self.rate:
+            self._refill(now)
+            self.level -= amount
+
+
+class _Waiter:
+    """대기열의 호출 하나 (동기 호출은 Event, 비동기 호출은 Future로 깨움)"""
+
+    def __init__(self, lane: "_Lane", priority: int, tokens: int, seq: int, attempt: int,
+                 loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.lane = lane
+        self.priority = priority
+        self.tokens = tokens
+        self.seq = seq
+        self.attempt = attempt
+        self.enqueued = time.monotonic()
+        self.granted_at: Optional[float] = None
+        self.released = False
+        self.loop = loop
+        self.event = threading.Event() if loop is None else None
+        self.future = loop.create_future() if loop is not None else None
+
+    def grant(self, now: float) -> None:
+        self.granted_at = now
+        if self.future is not None:
+            self.loop.call_soon_threadsafe(self._resolve)
+        else:
+            self.event.set()
+
+    def _resolve(self) -> None:
+        if not self.future.done():
+            self.future.set_result(None)
+
+
+class _Lane:
+    """모델 하나의 버킷, 적응형 동시 호출 한도, 대기열"""
+
+    def __init__(self, model: str, limits: Tuple[int, int], initial: float, window: float):
+        self.model = model
+        self.requests = TokenBucket(limits[0], window)
+        self.tokens = TokenBucket(limits[1], window)
+        self.limit = initial
+        self.in_flight = 0
+        self.waiters: List[_Waiter] = []
+        self.cooldown_until = 0.0
+        self.rate_limited_streak = 0
+        self.fast_latency: Optional[float] = None
+        self.base_latency: Optional[float] = None
+        self.timer: Optional[threading.Timer] = None
+        self.timer_at = 0.0
+        self.counts = {"completed": 0, "errors": 0, "rate_limited": 0, "latency_backoffs": 0}
+
+
+class LLMScheduler:
+    """모델별 토큰 버킷 + 우선순위 대기열 + AIMD 동시 호출 한도
+
+    Args:
+        limits: 모델 → (분당 요청 수, 분당 토큰 수)
+        default_limits: limits에 없는 모델의 한도
+        initial_concurrency: 모델별 시작 동시 호출 한도
+        max_concurrency: 모델별 동시 호출 한도의 최댓값
+        latency_tolerance: 최근 지연이 기준 지연의 이 배수를 넘으면 한도를 줄임
+        aging_seconds: 이만큼 기다린 요청은 우선순위를 한 단계 올림
+        backoff_seconds: 429 뒤 멈춤/재시도 대기의 기본 시간 (연속될수록 두 배)
+        window_seconds: 한도를 세는 구간 (분당 한도면 60, 벤치마크에서 시간을 줄일 때만 변경)
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Tuple[int, int]]] = None,
+        default_limits: Tuple[int, int] = _DEFAULT_LIMITS,
+        initial_concurrency: int = 4,
+        max_concurrency: int = 8,
+        latency_tolerance: float = 2.0,
+        aging_seconds: float = 30.0,
+        backoff_seconds: float = 2.0,
+        window_seconds: float = 60.0
+    ):
+        self.limits = dict(MODEL_LIMITS if limits is None else limits)
+        self.default_limits = default_limits
+        self.initial_concurrency = max(1, min(initial_concurrency, max_concurrency))
+        self.max_concurrency = max(1, max_concurrency)
+        self.latency_tolerance = latency_tolerance
+        self.aging_seconds = aging_seconds
+        self.backoff_seconds = backoff_seconds
+        self.window_seconds = window_seconds
+        self._lanes: Dict[str, _Lane] = {}
+        self._lock = threading.Lock()
+        self._seq = itertools.count()
+
+    def _lane(self, model: str) -> _Lane:
+        lane = self._lanes.get(model)
+        if lane is None:
+            lane = _Lane(
+                model, self.limits.get(model, self.default_limits), float(self.initial_concurrency), self.window_seconds
+            )
+            self._lanes[model] = lane
+        return lane
+
+    # ---- 대기열 ----
+
+    def _enqueue(self, model: str, tokens: int, priority: int, attempt: int,
+                 loop: Optional[asyncio.AbstractEventLoop] = None) -> _Waiter:
+        with self._lock:
+            lane = self._lane(model)
+            waiter = _Waiter(lane, priority, tokens, next(self._seq), attempt, loop)
+            lane.waiters.append(waiter)
+            self._dispatch(lane)
+        return waiter
+
+    def _dispatch(self, lane: _Lane) -> None:
+        """한도와 버킷이 허락하는 만큼 우선순위 순으로 대기 호출 시작 (락 보유 상태)"""
+        now = time.monotonic()
+        wait = 0.0
+        while lane.waiters and lane.in_flight < max(1, int(lane.limit)):
+            if now < lane.cooldown_until:
+                wait = lane.cooldown_until - now
+                break
+            # 오래 기다릴수록 우선순위 값이 작아져(앞당겨져) 굶지 않음
+            waiter = min(
+                lane.waiters,
+                key=lambda w: (w.priority - (now - w.enqueued) / self.aging_seconds, w.seq)
+            )
+            wait = max(lane.requests.wait_time(1, now), lane.tokens.wait_time(waiter.tokens, now))
+            if wait > 0:
+                break
+            lane.waiters.remove(waiter)
+            lane.requests.take(1, now)
+            lane.tokens.take(waiter.tokens, now)
+            lane.in_flight += 1
+            waiter.grant(now)
+
+        if wait > 0 and lane.waiters:
+            self._wake_later(lane, now + wait)
+
+    def _wake_later(self, lane: _Lane, at: float) -> None:
+        if lane.timer is not None and lane.timer_at <= at:
+            return
+        if lane.timer is not None:
+            lane.timer.cancel()
+        lane.timer = threading.Timer(max(0.0, at - time.monotonic()), self._wake, (lane,))
+        lane.timer.daemon = True
+        lane.timer_at = at
+        lane.timer.start()
+
+    def _wake(self, lane: _Lane) -> None:
+        with self._lock:
+            lane.timer = None
+            self._dispatch(lane)
+
+    def _record_wait(self, waiter: _Waiter) -> None:
+        priority = PRIORITY_NAMES.get(waiter.priority, str(waiter.priority))
+        get_metrics().record(
+            "llm_queue",
+            f"{waiter.lane.model}:{priority}",
+            waiter.granted_at - waiter.enqueued,
+            retry=waiter.attempt > 0
+        )
+
+    def acquire(self, model: str, tokens: int, priority: int = PRIORITY_NORMAL, attempt: int = 0) -> _Waiter:
+        """호출을 보낼 차례가 될 때까지 대기 (끝나면 release 필수)"""
+        waiter = self._enqueue(model, tokens, priority, attempt)
+        waiter.event.wait()
+        self._record_wait(waiter)
+        return waiter
+
+    async def aacquire(self, model: str, tokens: int, priority: int = PRIORITY_NORMAL,
+                       attempt: int = 0) -> _Waiter:
+        """acquire의 비동기 버전 (이벤트 루프를 막지 않음)"""
+        waiter = self._enqueue(model, tokens, priority, attempt, loop=asyncio.get_running_loop())
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            self.release(waiter, cancelled=True)
+            raise
+        self._record_wait(waiter)
+        return waiter
+
+    def release(
+        self,
+        waiter: _Waiter,
+        seconds: float = 0.0,
+        tokens_used: Optional[int] = None,
+        error: Optional[BaseException] = None,
+        cancelled: bool = False
+    ) -> None:
+        """호출 종료 보고 (지연/오류로 한도 조정 후 다음 대기 호출 시작)"""
+        lane = waiter.lane
+        with self._lock:
+            if waiter.released:
+                return
+            waiter.released = True
+            if waiter.granted_at is None:
+                # 차례가 오기 전에 취소됨
+                if waiter in lane.waiters:
+                    lane.waiters.remove(waiter)
+                return
+
+            lane.in_flight -= 1
+            now = time.monotonic()
+            if cancelled:
+                pass
+            elif error is None:
+                self._on_success(lane, seconds, waiter.tokens, tokens_used, now)
+            elif isinstance(error, ModelRateLimitError):
+                lane.counts["rate_limited"] += 1
+                lane.limit = max(1.0, lane.limit / 2)
+                lane.cooldown_until = max(lane.cooldown_until, now + self._backoff(lane.rate_limited_streak))
+                lane.rate_limited_streak += 1
+            elif isinstance(error, _RETRYABLE):
+                lane.counts["errors"] += 1
+                lane.limit = max(1.0, lane.limit * 0.75)
+            else:
+                lane.counts["errors"] += 1
+            self._dispatch(lane)
+
+    def _on_success(self, lane: _Lane, seconds: float, estimated: int, tokens_used: Optional[int],
+                    now: float) -> None:
+        lane.counts["completed"] += 1
+        lane.rate_limited_streak = 0
+        if tokens_used:
+            # 추정치로 뺀 토큰과 실제 사용량(입력+출력)의 차이 정산
+            lane.tokens.take(tokens_used - estimated, now)
+
+        sample = seconds / max(1.0, (tokens_used or estimated) / 1000)
+        if lane.base_latency is None:
+            lane.fast_latency = lane.base_latency = sample
+        else:
+            lane.fast_latency += _FAST_ALPHA * (sample - lane.fast_latency)
+            lane.base_latency += _BASE_ALPHA * (sample - lane.base_latency)
+
+        if lane.fast_latency > self.latency_tolerance * lane.base_latency:
+            lane.limit = max(1.0, lane.limit * 0.9)
+            lane.counts["latency_backoffs"] += 1
+        else:
+            lane.limit = min(float(self.max_concurrency), lane.limit + 1 / lane.limit)
+
+    def _backoff(self, attempt: int) -> float:
+        return min(60.0, self.backoff_seconds * 2 ** min(attempt, 5))
+
+    def retry_delay(self, attempt: int) -> float:
+        """attempt번째 실패 뒤 다시 대기열에 넣기 전 대기 시간 (지터 포함)"""
+        return self._backoff(attempt) * random.uniform(0.5, 1.5)
+
+    def stats(self) -> Dict[str, Dict]:
+        """모델별 동시 호출 한도, 실행/대기 수, 429·오류 수, 남은 멈춤 시간"""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                model: {
+                    "limit": round(lane.limit, 2),
+                    "in_flight": lane.in_flight,
+                    "queued": len(lane.waiters),
+                    "queued_by_priority": {
+                        PRIORITY_NAMES.get(p, str(p)): sum(1 for w in lane.waiters if w.priority == p)
+                        for p in sorted({w.priority for w in lane.waiters})
+                    },
+                    "cooldown_seconds": max(0.0, lane.cooldown_until - now),
+                    **lane.counts
+                }
+                for model, lane in sorted(self._lanes.items())
+            }
+
+
+_scheduler: Optional[LLMScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """프로세스 공용 스케줄러 (기본 한도 + LLM_RATE_LIMITS)"""
+    global _scheduler
+
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = LLMScheduler(
+                limits={**MODEL_LIMITS, **parse_rate_limits(settings.llm_rate_limits)},
+                initial_concurrency=settings.llm_initial_concurrency,
+                max_concurrency=settings.llm_max_concurrency,
+                latency_tolerance=settings.llm_latency_tolerance,
+                aging_seconds=settings.llm_queue_aging_seconds
+            )
+    return _scheduler
+
+
+def _retry_state(attempt: int, error: BaseException, delay: float) -> RetryCallState:
+    """on_retry 콜백에 넘길 재시도 상태 (계측의 retries, LangSmith 트레이스에 기록됨)"""
+    state = RetryCallState(retry_object=None, fn=None, args=(), kwargs={})
+    state.attempt_number = attempt + 1
+    state.idle_for = delay
+    state.set_exception((type(error), error, error.__traceback__))
+    return state
+
+
+def _usage_tokens(message: BaseMessage) -> Optional[int]:
+    usage = getattr(message, "usage_metadata", None)
+    return usage.get("total_tokens") if usage else None
+
+
+class ScheduledChatModel(BaseChatModel):
+    """호출마다 스케줄러의 차례를 받아 inner에 위임하는 채팅 모델
+
+    재시도는 inner가 아니라 여기서 한다(max_retries번까지 시도). 재시도마다 on_retry 콜백을
+    보내므로 계측의 LLM 호출 기록에 재시도 수가 남는다. 스트리밍은 첫 청크를 받기 전에
+    실패한 경우에만 다시 시도한다.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    inner: BaseChatModel
+    priority: int = PRIORITY_NORMAL
+    max_retries: int = 6
+
+    @property
+    def _llm_type(self) -> str:
+        return f"scheduled-{self.inner._llm_type}"
+
+    @property
+    def model_name(self) -> str:
+        name = getattr(self.inner, "model", None) or getattr(self.inner, "model_name", None) or ""
+        return str(name).removeprefix("models/")
+
+    @property
+    def temperature(self) -> Optional[float]:
+        return getattr(self.inner, "temperature", None)
+
+    def _get_ls_params(self, stop=None, **kwargs) -> Dict:
+        return self.inner._get_ls_params(stop=stop, **kwargs)
+
+    def _request(self, messages: List[BaseMessage]) -> Tuple[LLMScheduler, int, int]:
+        """(스케줄러, 추정 입력 토큰, 우선순위)"""
+        tokens = sum(estimate_tokens(str(m.content)) for m in messages)
+        priority = _priority.get()
+        return get_llm_scheduler(), tokens, self.priority if priority is None else priority
+
+    def _attempts(self) -> int:
+        return max(1, self.max_retries)
+
+    def _generate(self, messages, stop=None, run_manager: Optional[CallbackManagerForLLMRun] = None,
+                  **kwargs) -> ChatResult:
+        scheduler, tokens, priority = self._request(messages)
+        for attempt in range(self._attempts()):
+            slot = scheduler.acquire(self.model_name, tokens, priority, attempt)
+            start = time.perf_counter()
+            try:
+                result = self.inner._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            except Exception as e:
+                scheduler.release(slot, time.perf_counter() - start, error=e)
+                if not isinstance(e, _RETRYABLE) or attempt == self._attempts() - 1:
+                    raise
+                delay = scheduler.retry_delay(attempt)
+                if run_manager:
+                    run_manager.on_retry(_retry_state(attempt, e, delay))
+                time.sleep(delay)
+                continue
+            except BaseException:
+                scheduler.release(slot, cancelled=True)
+                raise
+            scheduler.release(slot, time.perf_counter() - start, _usage_tokens(result.generations[0].message))
+            return result
+
+    async def _agenerate(self, messages, stop=None,
+                         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None, **kwargs) -> ChatResult:
+        scheduler, tokens, priority = self._request(messages)
+        for attempt in range(self._attempts()):
+            slot = await scheduler.aacquire(self.model_name, tokens, priority, attempt)
+            start = time.perf_counter()
+            try:
+                result = await self.inner._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            except Exception as e:
+                scheduler.release(slot, time.perf_counter() - start, error=e)
+                if not isinstance(e, _RETRYABLE) or attempt == self._attempts() - 1:
+                    raise
+                delay = scheduler.retry_delay(attempt)
+                if run_manager:
+                    await run_manager.on_retry(_retry_state(attempt, e, delay))
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                scheduler.release(slot, cancelled=True)
+                raise
+            scheduler.release(slot, time.perf_counter() - start, _usage_tokens(result.generations[0].message))
+            return result
+
+    def _stream(self, messages, stop=None, run_manager: Optional[CallbackManagerForLLMRun] = None,
+                **kwargs) -> Iterator[ChatGenerationChunk]:
+        scheduler, tokens, priority = self._request(messages)
+        for attempt in range(self._attempts()):
+            slot = scheduler.acquire(self.model_name, tokens, priority, attempt)
+            start = time.perf_counter()
+            usage = None
+            streamed = False
+            try:
+                for chunk in self.inner._stream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                    streamed = True
+                    usage = _usage_tokens(chunk.message) or usage
+                    yield chunk
+            except Exception as e:
+                scheduler.release(slot, time.perf_counter() - start, error=e)
+                if streamed or not isinstance(e, _RETRYABLE) or attempt == self._attempts() - 1:
+                    raise
+                delay = scheduler.retry_delay(attempt)
+                if run_manager:
+                    run_manager.on_retry(_retry_state(attempt, e, delay))
+                time.sleep(delay)
+                continue
+            except BaseException:
+                # 소비자가 스트림을 중간에 닫은 경우 (GeneratorExit)
+                scheduler.release(slot, cancelled=True)
+                raise
+            scheduler.release(slot, time.perf_counter() - start, usage)
+            return
+
+    async def _astream(self, messages, stop=None,
+                       run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                       **kwargs) -> AsyncIterator[ChatGenerationChunk]:
+        scheduler, tokens, priority = self._request(messages)
+        for attempt in range(self._attempts()):
+            slot = await scheduler.aacquire(self.model_name, tokens, priority, attempt)
+            start = time.perf_counter()
+            usage = None
+            streamed = False
+            try:
+                async for chunk in self.inner._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                    streamed = True
+                    usage = _usage_tokens(chunk.message) or usage
+                    yield chunk
+            except Exception as e:
+                scheduler.release(slot, time.perf_counter() - start, error=e)
+                if streamed or not isinstance(e, _RETRYABLE) or attempt == self._attempts() - 1:
+                    raise
+                delay = scheduler.retry_delay(attempt)
+                if run_manager:
+                    await run_manager.on_retry(_retry_state(attempt, e, delay))
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                scheduler.release(slot, cancelled=True)
+                raise
+            scheduler.release(slot, time.perf_counter() - start, usage)
+            return
+
+
+def schedule_llm(llm: BaseChatModel, max_retries: int, priority: int = PRIORITY_NORMAL) -> BaseChatModel:
+    """스케줄러가 켜져 있으면 모델을 ScheduledChatModel로 감싸서 반환 (꺼져 있으면 그대로)
+
+    llm은 자체 재시도를 끈 상태여야 한다(get_llm이 max_retries=1로 만든다).
+    """
+    if not settings.llm_scheduler_enabled:
+        return llm
+    # inner의 _generate를 직접 부르므로 inner의 콜백은 호출되지 않음 → 같은 콜백을 바깥에 지정
+    return ScheduledChatModel(inner=llm, priority=priority, max_retries=max_retries, callbacks=llm.callbacks)
@@ -20,6 +20,7 @@ class BlogState(TypedDict):
     # 퇴고 단계
     final_content: Optional[str]        # 최종 콘텐츠
     seo_score: Optional[float]          # SEO 점수
+    seo_report: Optional[Dict[str, Any]]  # 최종 콘텐츠의 SEO 리포트 (calculate_seo_score 결과)
 
     # 워크플로우 제어
     messages: Annotated[list, add_messages]  # 메시지 히스토리
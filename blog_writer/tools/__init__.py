@@ -1,11 +1,15 @@
-from blog_writer.tools.tavily_search import tavily_tool, deep_research
-from blog_writer.tools.seo_analyzer import calculate_seo_score
+from blog_writer.tools.tavily_search import tavily_tool, deep_research, deep_research_many
+from blog_writer.tools.result_merger import merge_search_results
+from blog_writer.tools.seo_analyzer import calculate_seo_score, score_many
 from blog_writer.tools.markdown_writer import save_blog_to_markdown, save_research_notes
 
 __all__ = [
     "tavily_tool",
     "deep_research",
+    "deep_research_many",
+    "merge_search_results",
     "calculate_seo_score",
+    "score_many",
     "save_blog_to_markdown",
     "save_research_notes"
 ]
@@ -0,0 +1,152 @@
+import hashlib
+import heapq
+import re
+from typing import Dict, List, Optional, Set
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+# 추적용 쿼리 파라미터 (정규화 시 제거). ref/source처럼 사이트에 따라 내용을 고르는
+# 일반 이름은 넣지 않음 (다른 페이지가 하나로 합쳐질 수 있음)
+_TRACKING_PREFIXES = ("utm_",)
+_TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "msclkid", "igshid", "mc_cid", "mc_eid"}
+
+# MinHash 설정: 단일 해시 bottom-k 스케치 (고정 해시 → 실행마다 동일한 중복 판정)
+_SKETCH_SIZE = 64
+_SHINGLE_SIZE = 5
+
+
+def canonicalize_url(url: str) -> str:
+    """URL 정규화 (스킴/호스트 소문자, fragment·추적 파라미터·끝 슬래시 제거)
+
+    스킴과 www./m. 같은 호스트는 바꾸지 않는다. 같은 페이지라는 보장이 없기 때문이다.
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith(_TRACKING_PREFIXES) and k.lower() not in _TRACKING_PARAMS
+    ))
+    path = parts.path.rstrip("/") or "/"
+
+    return urlunsplit((parts.scheme.lower(), host, path, query, ""))
+
+
+def _shingles(text: str) -> Set[str]:
+    """공백·구두점을 제거한 문자 단위 shingle (한글에도 동작)"""
+    normalized = re.sub(r"[\W_]+", "", text.lower())
+    if len(normalized) <= _SHINGLE_SIZE:
+        return {normalized} if normalized else set()
+    return {
+        normalized[i:i + _SHINGLE_SIZE]
+        for i in range(len(normalized) - _SHINGLE_SIZE + 1)
+    }
+
+
+def minhash_signature(text: str) -> Set[int]:
+    """문자 shingle 해시 중 가장 작은 k개 (bottom-k MinHash 스케치)"""
+    hashes = (
+        int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big")
+        for s in _shingles(text)
+    )
+    return set(heapq.nsmallest(_SKETCH_SIZE, hashes))
+
+
+def estimate_similarity(sig_a: Set[int], sig_b: Set[int]) -> float:
+    """두 bottom-k 스케치로 Jaccard 유사도 추정"""
+    union = heapq.nsmallest(_SKETCH_SIZE, sig_a | sig_b)
+    if not union:
+        return 0.0
+    shared = sum(1 for h in union if h in sig_a and h in sig_b)
+    return shared / len(union)
+
+
+def _keyword_coverage(item: Dict, keywords: List[str]) -> List[str]:
+    """결과 제목·본문에 등장하는 키워드 목록"""
+    text = f"{item.get('title', '')} {item.get('content', '')}".lower()
+    return [kw for kw in keywords if kw.lower() in text]
+
+
+def rank_search_results(
+    search_results: List[Dict],
+    keywords: List[str],
+    dedup_threshold: float = 0.8,
+    coverage_weight: float = 0.5
+) -> List[Dict]:
+    """여러 쿼리의 검색 결과를 중복 제거하고 관련도순으로 정렬 (개수/글자 수 제한 없음)
+
+    1. 정규화 URL이 같거나 본문이 거의 같은(MinHash 유사도 ≥ dedup_threshold) 결과를 하나로 합침
+    2. Tavily score + 키워드 커버리지로 정렬
+
+    반환 항목: title, url, content, score, queries(발견된 쿼리 목록), keywords(커버 키워드)
+    """
+    merged: List[Dict] = []
+    signatures: List[Set[int]] = []
+    by_url: Dict[str, int] = {}
+
+    for search in search_results:
+        query = search.get("query", "")
+        for result in search.get("results", []):
+            canonical = canonicalize_url(result["url"])
+            signature = minhash_signature(result.get("content", ""))
+
+            index: Optional[int] = by_url.get(canonical)
+            if index is None:
+                for i, other in enumerate(signatures):
+                    if estimate_similarity(signature, other) >= dedup_threshold:
+                        index = i
+                        break
+
+            if index is None:
+                by_url[canonical] = len(merged)
+                merged.append({**result, "queries": [query]})
+                signatures.append(signature)
+                continue
+
+            # 중복: 점수가 더 높은 쪽의 내용을 유지하고 쿼리 목록은 합침
+            existing = merged[index]
+            if query not in existing["queries"]:
+                existing["queries"].append(query)
+            if result.get("score", 0) > existing.get("score", 0):
+                merged[index] = {**result, "queries": existing["queries"]}
+                signatures[index] = signature
+            by_url.setdefault(canonical, index)
+
+    for item in merged:
+        item["keywords"] = _keyword_coverage(item, keywords)
+
+    def rank(item: Dict) -> float:
+        coverage = len(item["keywords"]) / len(keywords) if keywords else 0.0
+        return item.get("score", 0) + coverage_weight * coverage
+
+    # sorted는 안정 정렬이므로 동점이면 원래 (쿼리) 순서 유지
+    return sorted(merged, key=rank, reverse=True)
+
+
+def select_within_budget(ranked: List[Dict], top_k: int, char_budget: int) -> List[Dict]:
+    """정렬된 결과 중 본문 글자 수 합계가 char_budget 이내인 상위 top_k개만 유지"""
+    selected = []
+    used_chars = 0
+    for item in ranked:
+        if len(selected) >= top_k:
+            break
+        size = len(item.get("content", ""))
+        if used_chars + size > char_budget:
+            continue
+        selected.append(item)
+        used_chars += size
+
+    return selected
+
+
+def merge_search_results(
+    search_results: List[Dict],
+    keywords: List[str],
+    top_k: int,
+    char_budget: int,
+    dedup_threshold: float = 0.8,
+    coverage_weight: float = 0.5
+) -> List[Dict]:
+    """여러 쿼리의 검색 결과를 병합 (rank_search_results + select_within_budget)"""
+    ranked = rank_search_results(search_results, keywords, dedup_threshold, coverage_weight)
+    return select_within_budget(ranked, top_k, char_budget)
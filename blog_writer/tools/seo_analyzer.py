@@ -1,29 +1,129 @@
 from langchain_core.tools import tool
-from typing import List, Dict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+import copy
+import hashlib
+import os
+import re
+import threading
 
+from blog_writer.config import settings
 
-@tool
-def calculate_seo_score(content: str, keywords: List[str]) -> Dict:
-    """SEO 점수 계산"""
-    word_count = len(content.split())
 
-    # 키워드 밀도 계산
-    keyword_counts = {
-        kw: content.lower().count(kw.lower())
-        for kw in keywords
+# 단어 + 문장 종결부호를 한 번의 스캔으로 토큰화
+# - word: 한글 어절/영문/숫자 (마크다운 기호 #, -, **, | 등은 제외), "3.5" "don't" 같은 형태는 한 단어
+# - end: 공백이나 줄 끝 앞의 . ! ? (소수점, URL 안의 점은 문장 끝으로 세지 않음)
+_TOKEN_RE = re.compile(r"(?P<word>\w+(?:[.,'’]\w+)*)|(?P<end>[.!?。]+(?=\s|$))")
+_HEADER_RE = re.compile(r"^(#{1,6})\s")
+
+
+class KeywordMatcher:
+    """Aho-Corasick 기반 다중 키워드 매처 (대소문자 무시, 한 번의 스캔으로 모든 키워드 카운트)"""
+
+    def __init__(self, keywords: List[str]):
+        self.keywords = keywords
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        self._lengths = [len(keyword.lower()) for keyword in keywords]
+
+        for index, keyword in enumerate(keywords):
+            pattern = keyword.lower()
+            if not pattern:
+                continue
+            node = 0
+            for ch in pattern:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = nxt
+            self._out[node].append(index)
+
+        # BFS로 실패 링크 구성 (루트의 자식은 실패 링크가 루트)
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def count(self, text: str, counts: List[int]) -> None:
+        """text(소문자 변환된 것)에서 키워드 등장 횟수를 counts에 누적 (str.count처럼 겹치는 등장은 제외)"""
+        goto, fail, out, lengths = self._goto, self._fail, self._out, self._lengths
+        # 키워드별로 다음 등장이 시작될 수 있는 가장 이른 위치
+        next_start = [0] * len(lengths)
+        node = 0
+        for pos, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                for index in out[node]:
+                    if pos - lengths[index] + 1 >= next_start[index]:
+                        counts[index] += 1
+                        next_start[index] = pos + 1
+
+
+def scan_content(content: str, matcher: KeywordMatcher) -> Dict:
+    """본문을 줄 단위로 한 번 훑어 SEO 지표 수집 (합산 가능한 원시 카운트)"""
+    word_count = 0
+    sentences = 0
+    h2_count = 0
+    h3_count = 0
+    keyword_counts = [0] * len(matcher.keywords)
+
+    for line in content.lower().splitlines():
+        header = _HEADER_RE.match(line)
+        if header:
+            level = len(header.group(1))
+            if level == 2:
+                h2_count += 1
+            elif level == 3:
+                h3_count += 1
+
+        for match in _TOKEN_RE.finditer(line):
+            if match.lastgroup == "word":
+                word_count += 1
+            else:
+                sentences += 1
+
+        matcher.count(line, keyword_counts)
+
+    return {
+        "word_count": word_count,
+        "sentences": sentences,
+        "h2_count": h2_count,
+        "h3_count": h3_count,
+        "keyword_counts": keyword_counts
     }
+
+
+def build_seo_report(metrics: Dict, keywords: List[str]) -> Dict:
+    """수집한 지표로 점수와 권장사항 계산"""
+    word_count = metrics["word_count"]
+    sentences = metrics["sentences"]
+    h2_count = metrics["h2_count"]
+    h3_count = metrics["h3_count"]
+
+    # 키워드 밀도 계산
     keyword_density = {
         kw: (count / word_count) * 100 if word_count > 0 else 0
-        for kw, count in keyword_counts.items()
+        for kw, count in zip(keywords, metrics["keyword_counts"])
     }
 
     # 가독성 계산
-    sentences = content.count('.') + content.count('!') + content.count('?')
     avg_sentence_length = word_count / max(sentences, 1)
 
     # 헤더 개수
-    h2_count = content.count('## ')
-    h3_count = content.count('### ')
     total_headers = h2_count + h3_count
 
     # 점수 계산 (100점 만점)
@@ -76,3 +176,202 @@ def calculate_seo_score(content: str, keywords: List[str]) -> Dict:
         "h3_count": h3_count,
         "recommendations": recommendations
     }
+
+
+def analyze_seo(content: str, keywords: List[str]) -> Dict:
+    """한 번의 스캔으로 SEO 분석 (calculate_seo_score와 동일한 결과 형태)"""
+    return build_seo_report(scan_content(content, KeywordMatcher(keywords)), keywords)
+
+
+def content_hash(content: str) -> str:
+    """캐시 키용 콘텐츠 해시"""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def split_sections(content: str) -> List[str]:
+    """H2 헤더 기준으로 본문을 섹션 단위로 분할.
+
+    지표가 모두 줄 단위로 집계되므로 섹션별 지표의 합은 전체 지표와 같다.
+    """
+    sections = []
+    current = []
+    for line in content.splitlines(keepends=True):
+        header = _HEADER_RE.match(line)
+        if header and len(header.group(1)) == 2 and current:
+            sections.append("".join(current))
+            current = []
+        current.append(line)
+    if current:
+        sections.append("".join(current))
+    return sections
+
+
+def merge_metrics(metrics_list: List[Dict], keyword_count: int) -> Dict:
+    """섹션별 scan_content 결과를 하나로 합산"""
+    merged = {
+        "word_count": 0,
+        "sentences": 0,
+        "h2_count": 0,
+        "h3_count": 0,
+        "keyword_counts": [0] * keyword_count
+    }
+    for metrics in metrics_list:
+        for key in ("word_count", "sentences", "h2_count", "h3_count"):
+            merged[key] += metrics[key]
+        merged["keyword_counts"] = [
+            a + b for a, b in zip(merged["keyword_counts"], metrics["keyword_counts"])
+        ]
+    return merged
+
+
+class SEOReportCache:
+    """SEO 리포트 LRU 캐시 (콘텐츠 해시 + 키워드 키).
+
+    문서 전체 리포트와 H2 섹션별 지표를 따로 캐시한다. 퇴고처럼 일부 섹션만
+    바뀐 문서는 바뀐 섹션만 다시 스캔하고 나머지는 캐시된 지표를 합산한다.
+    """
+
+    def __init__(self, max_entries: int, max_sections: int):
+        self.max_entries = max_entries
+        self.max_sections = max_sections
+        self.hits = 0
+        self.misses = 0
+        self.sections_reused = 0
+        self.sections_scanned = 0
+        self._reports: "OrderedDict[Tuple, Dict]" = OrderedDict()
+        self._sections: "OrderedDict[Tuple, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _put(store: OrderedDict, key: Tuple, value: Dict, limit: int) -> None:
+        store[key] = value
+        store.move_to_end(key)
+        while len(store) > limit:
+            store.popitem(last=False)
+
+    def score(self, content: str, keywords: List[str]) -> Dict:
+        """캐시를 거쳐 SEO 리포트 반환 (analyze_seo와 동일한 결과)"""
+        keyword_key = tuple(keywords)
+        report_key = (content_hash(content), keyword_key)
+
+        with self._lock:
+            report = self._reports.get(report_key)
+            if report is not None:
+                self._reports.move_to_end(report_key)
+                self.hits += 1
+                return copy.deepcopy(report)
+            self.misses += 1
+
+        # 섹션 단위 부분 재채점: 바뀐 섹션만 스캔
+        matcher: Optional[KeywordMatcher] = None
+        metrics_list = []
+        for section in split_sections(content):
+            section_key = (content_hash(section), keyword_key)
+            with self._lock:
+                metrics = self._sections.get(section_key)
+                if metrics is not None:
+                    self._sections.move_to_end(section_key)
+                    self.sections_reused += 1
+            if metrics is None:
+                if matcher is None:
+                    matcher = KeywordMatcher(keywords)
+                metrics = scan_content(section, matcher)
+                with self._lock:
+                    self._put(self._sections, section_key, metrics, self.max_sections)
+                    self.sections_scanned += 1
+            metrics_list.append(metrics)
+
+        report = build_seo_report(merge_metrics(metrics_list, len(keywords)), keywords)
+        with self._lock:
+            self._put(self._reports, report_key, report, self.max_entries)
+        return copy.deepcopy(report)
+
+    def clear(self) -> None:
+        """모든 항목 및 카운터 초기화"""
+        with self._lock:
+            self._reports.clear()
+            self._sections.clear()
+            self.hits = 0
+            self.misses = 0
+            self.sections_reused = 0
+            self.sections_scanned = 0
+
+    def stats(self) -> Dict:
+        """hit/miss 및 섹션 재사용 카운터"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "sections_reused": self.sections_reused,
+                "sections_scanned": self.sections_scanned,
+                "entries": len(self._reports)
+            }
+
+
+_seo_cache: Optional[SEOReportCache] = None
+_seo_cache_lock = threading.Lock()
+
+
+def get_seo_cache() -> SEOReportCache:
+    """프로세스 공용 SEO 리포트 캐시 반환"""
+    global _seo_cache
+
+    with _seo_cache_lock:
+        if _seo_cache is None:
+            _seo_cache = SEOReportCache(
+                max_entries=settings.seo_cache_max_entries,
+                max_sections=settings.seo_section_cache_max_entries
+            )
+    return _seo_cache
+
+
+def _score_document(item: Tuple[str, List[str]]) -> Dict:
+    """프로세스 풀 작업 단위 (모듈 수준 함수여야 pickle 가능)"""
+    content, keywords = item
+    return analyze_seo(content, keywords)
+
+
+def score_many(
+    documents: Iterable[Union[str, Tuple[str, List[str]]]],
+    keywords: Optional[List[str]] = None,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None
+) -> Iterator[Dict]:
+    """여러 문서를 프로세스 풀에서 채점하고 입력 순서대로 리포트를 내보냄.
+
+    Args:
+        documents: 본문 문자열, 또는 문서별 키워드가 있으면 (본문, 키워드) 튜플
+        keywords: 모든 문서에 적용할 키워드 (지정 시 문서별 키워드보다 우선)
+        workers: 프로세스 수 (기본: CPU 수, 1이면 현재 프로세스에서 순차 처리)
+        chunksize: 프로세스에 한 번에 넘길 문서 수 (기본: 프로세스당 약 4청크)
+
+    Yields:
+        문서별 calculate_seo_score 결과 (완료되는 대로, 입력 순서 유지)
+    """
+    items = []
+    for doc in documents:
+        if isinstance(doc, str):
+            items.append((doc, keywords or []))
+        else:
+            content, doc_keywords = doc
+            items.append((content, keywords if keywords is not None else list(doc_keywords)))
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(items) <= 1:
+        for item in items:
+            yield _score_document(item)
+        return
+
+    if chunksize is None:
+        chunksize = max(1, len(items) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_score_document, items, chunksize=chunksize)
+
+
+@tool
+def calculate_seo_score(content: str, keywords: List[str]) -> Dict:
+    """SEO 점수 계산"""
+    return get_seo_cache().score(content, keywords)
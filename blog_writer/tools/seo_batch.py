@@ -0,0 +1,120 @@
+"""저장된 블로그 글 일괄 SEO 재채점 CLI
+
+output/ 아래 마크다운 파일의 frontmatter(keywords)를 읽어 score_many로
+프로세스 풀에서 채점하고, 결과를 한 줄씩 JSONL로 내보낸다.
+
+    python -m blog_writer.tools.seo_batch output --out seo_scores.jsonl --workers 4
+    python -m blog_writer.tools.seo_batch output --keywords "열성 경련,응급처치"
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from blog_writer.tools.seo_analyzer import score_many
+
+
+def _parse_value(raw: str):
+    """frontmatter 값 파싱 (따옴표 문자열, [a, b] 리스트, 숫자)"""
+    raw = raw.strip()
+    if raw.startswith("[") and raw.endswith("]"):
+        return [item.strip().strip("\"'") for item in raw[1:-1].split(",") if item.strip()]
+    if len(raw) >= 2 and raw[0] == raw[-1] and raw[0] in "\"'":
+        return raw[1:-1]
+    try:
+        return int(raw)
+    except ValueError:
+        pass
+    try:
+        return float(raw)
+    except ValueError:
+        return raw
+
+
+def parse_frontmatter(text: str) -> Tuple[Dict, str]:
+    """save_blog_to_markdown 형식의 frontmatter와 본문 분리"""
+    if not text.startswith("---"):
+        return {}, text
+
+    lines = text.splitlines(keepends=True)
+    for end in range(1, len(lines)):
+        if lines[end].strip() == "---":
+            break
+    else:
+        return {}, text
+
+    meta = {}
+    for line in lines[1:end]:
+        if ":" in line:
+            key, value = line.split(":", 1)
+            meta[key.strip()] = _parse_value(value)
+
+    return meta, "".join(lines[end + 1:]).lstrip("\n")
+
+
+def collect_documents(paths: List[str]) -> List[Dict]:
+    """경로(파일/디렉토리)에서 마크다운 파일을 모아 frontmatter와 본문 로드"""
+    files = []
+    for path in paths:
+        p = Path(path)
+        if p.is_dir():
+            # 조사 노트는 채점 대상이 아님
+            files.extend(f for f in sorted(p.rglob("*.md")) if not f.name.endswith("_research.md"))
+        elif p.suffix == ".md":
+            files.append(p)
+
+    documents = []
+    for f in files:
+        meta, body = parse_frontmatter(f.read_text(encoding="utf-8"))
+        keywords = meta.get("keywords", [])
+        if isinstance(keywords, str):
+            keywords = [k.strip() for k in keywords.split(",") if k.strip()]
+        documents.append({"path": str(f), "meta": meta, "body": body, "keywords": keywords})
+    return documents
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", default=["output"], help="마크다운 파일 또는 디렉토리")
+    parser.add_argument("--out", default="-", help="JSONL 출력 경로 (기본: stdout)")
+    parser.add_argument("--keywords", help="모든 글에 적용할 키워드 (쉼표 구분, frontmatter보다 우선)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--chunksize", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    documents = collect_documents(args.paths)
+    keywords = [k.strip() for k in args.keywords.split(",")] if args.keywords else None
+
+    out = sys.stdout if args.out == "-" else open(args.out, "w", encoding="utf-8")
+    start = time.perf_counter()
+    try:
+        reports = score_many(
+            [(doc["body"], doc["keywords"]) for doc in documents],
+            keywords=keywords,
+            workers=args.workers,
+            chunksize=args.chunksize
+        )
+        for doc, report in zip(documents, reports):
+            record = {
+                "path": doc["path"],
+                "title": doc["meta"].get("title", ""),
+                "keywords": keywords if keywords is not None else doc["keywords"],
+                "previous_score": doc["meta"].get("seo_score"),
+                **report
+            }
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - start
+    rate = len(documents) / elapsed if elapsed > 0 else 0.0
+    print(f"📊 {len(documents)}개 문서 채점 완료: {elapsed:.2f}s ({rate:.1f} docs/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
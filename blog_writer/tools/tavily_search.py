@@ -1,16 +1,32 @@
 from langchain_community.tools.tavily_search import TavilySearchResults
 from langchain_core.tools import tool
-from tavily import TavilyClient
-from typing import Dict
+from tavily import AsyncTavilyClient, TavilyClient
+from requests.adapters import HTTPAdapter
+from langchain_core.runnables.config import ContextThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Literal, Optional, Tuple
+import asyncio
+import httpx
+import json
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+import weakref
+import requests
+
+from blog_writer.cassette import get_cassette, make_fingerprint
+from blog_writer.config import settings
+from blog_writer.metrics import get_metrics
 
 
 def get_tavily_tool():
     """Lazy initialization of Tavily tool"""
-    from blog_writer.config import settings
     return TavilySearchResults(
         max_results=10,
         include_answer=True,
-        include_raw_content=True,
+        include_raw_content=False,  # 원문 전체는 사용하지 않음
         include_images=False,
         api_key=settings.tavily_api_key
     )
@@ -20,34 +36,531 @@ def get_tavily_tool():
 tavily_tool = None
 
 
-# 커스텀 심층 조사 도구
-@tool
-def deep_research(query: str, max_results: int = 10) -> Dict:
-    """주제에 대한 심층 조사 수행"""
-    from blog_writer.config import settings
-    client = TavilyClient(api_key=settings.tavily_api_key)
+# 검색 필드 프로필
+# - full: 요약 + 결과 + 원문 전체(raw_content) → 원문이 필요한 소비자만 요청
+# - snippets: 요약 + 결과(title/url/content/score)
+# - answer-only: 요약만 요청 (max_results=0, 결과 목록을 받지 않음)
+SearchProfile = Literal["full", "snippets", "answer-only"]
+SEARCH_PROFILES = ("full", "snippets", "answer-only")
 
-    response = client.search(
-        query=query,
-        search_depth="advanced",  # 심층 검색
-        max_results=max_results,
-        include_answer=True,
-        include_raw_content=True
+
+def normalize_query(query: str) -> str:
+    """캐시 키용 쿼리 정규화 (유니코드 정규화, 소문자, 공백 정리)"""
+    query = unicodedata.normalize("NFKC", query)
+    return re.sub(r"\s+", " ", query).strip().lower()
+
+
+class SearchCache:
+    """Tavily 검색 결과 영구 캐시 (SQLite, 항목별 TTL + LRU 삭제)"""
+
+    def __init__(self, db_path: str, ttl_seconds: int, max_entries: int):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if db_path != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS search_cache (
+                key TEXT PRIMARY KEY,
+                query TEXT NOT NULL,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_search_cache_last_access "
+            "ON search_cache (last_access)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(query: str, **params) -> str:
+        """정규화된 쿼리 + 검색 파라미터로 캐시 키 생성"""
+        return json.dumps(
+            {"query": normalize_query(query), **params},
+            sort_keys=True,
+            ensure_ascii=False
+        )
+
+    def get(self, key: str) -> Optional[Dict]:
+        """캐시 조회 (만료된 항목은 삭제 후 miss 처리)"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM search_cache WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            value, created_at = row
+            if now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE search_cache SET last_access = ? WHERE key = ?",
+                (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+
+        return json.loads(value)
+
+    def set(self, key: str, query: str, value: Dict) -> None:
+        """캐시 저장 후 최대 항목 수를 넘으면 LRU 순으로 삭제"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache "
+                "(key, query, value, created_at, last_access) VALUES (?, ?, ?, ?, ?)",
+                (key, query, json.dumps(value, ensure_ascii=False), now, now)
+            )
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()
+            overflow = count - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM search_cache WHERE key IN ("
+                    "SELECT key FROM search_cache ORDER BY last_access ASC LIMIT ?)",
+                    (overflow,)
+                )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """모든 캐시 항목 및 카운터 초기화"""
+        with self._lock:
+            self._conn.execute("DELETE FROM search_cache")
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict:
+        """hit/miss 카운터 및 현재 항목 수"""
+        with self._lock:
+            (entries,) = self._conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": entries
+        }
+
+
+_search_cache: Optional[SearchCache] = None
+_search_cache_lock = threading.Lock()
+
+
+def get_search_cache() -> Optional[SearchCache]:
+    """프로세스 공용 검색 캐시 반환 (비활성화 시 None)"""
+    global _search_cache
+
+    if not settings.search_cache_enabled:
+        return None
+
+    with _search_cache_lock:
+        if _search_cache is None:
+            _search_cache = SearchCache(
+                db_path=settings.search_cache_db,
+                ttl_seconds=settings.search_cache_ttl_seconds,
+                max_entries=settings.search_cache_max_entries
+            )
+    return _search_cache
+
+
+_tavily_client: Optional[TavilyClient] = None
+_tavily_client_lock = threading.Lock()
+
+# 요청 스레드별 마지막 응답 크기/수신 시각 (공용 세션의 response hook에서 기록)
+_response_info = threading.local()
+
+
+def _record_response(response, *args, **kwargs):
+    """응답 본문 크기와 헤더 수신 시간 기록"""
+    _response_info.bytes = len(response.content)
+    _response_info.elapsed = response.elapsed.total_seconds()
+
+
+# 연결 풀 주입(TavilyClient session= / AsyncTavilyClient client=)을 지원하는 최소 버전
+_MIN_TAVILY_VERSION = "0.7.23"
+
+
+def _client_unsupported(error: TypeError) -> None:
+    """설치된 tavily-python이 연결 풀 주입을 지원하지 않을 때 원인을 기록 (N/A 결과에 묻히지 않도록)"""
+    get_metrics().event(
+        "search.client_unsupported",
+        f"❌ Tavily 클라이언트 생성 실패: tavily-python {_MIN_TAVILY_VERSION} 이상이 필요합니다 ({str(error)})",
+        error=str(error),
+        required=_MIN_TAVILY_VERSION
     )
 
-    # 결과 포맷팅
-    formatted_results = {
-        "answer": response.get("answer", ""),
-        "results": [
-            {
+
+def get_tavily_client() -> TavilyClient:
+    """프로세스 공용 Tavily 클라이언트 반환 (keep-alive 연결 풀 재사용)"""
+    global _tavily_client
+
+    with _tavily_client_lock:
+        if _tavily_client is None:
+            # 연결 풀 크기 = 조사 동시 실행 수 (초과 요청은 풀이 빌 때까지 대기)
+            pool_size = max(1, settings.research_max_concurrency)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.hooks["response"].append(_record_response)
+
+            try:
+                _tavily_client = TavilyClient(
+                    api_key=settings.tavily_api_key,
+                    api_base_url=settings.tavily_api_base_url,
+                    session=session
+                )
+            except TypeError as e:
+                session.close()
+                _client_unsupported(e)
+                raise
+    return _tavily_client
+
+
+def reset_tavily_client() -> None:
+    """공용 클라이언트 연결 종료 (설정 변경 후 재생성용)"""
+    global _tavily_client
+
+    with _tavily_client_lock:
+        if _tavily_client is not None:
+            _tavily_client.session.close()
+            _tavily_client = None
+
+
+# 이벤트 루프별 비동기 클라이언트 (httpx 연결 풀은 생성된 루프에 묶임)
+_async_tavily_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncTavilyClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_tavily_client() -> AsyncTavilyClient:
+    """현재 이벤트 루프 공용 비동기 Tavily 클라이언트 반환 (keep-alive 연결 풀 재사용)"""
+    loop = asyncio.get_running_loop()
+    client = _async_tavily_clients.get(loop)
+    if client is None:
+        pool_size = max(1, settings.research_max_concurrency)
+        http_client = httpx.AsyncClient(
+            base_url=settings.tavily_api_base_url or "https://api.tavily.com",
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        )
+        try:
+            client = AsyncTavilyClient(api_key=settings.tavily_api_key, client=http_client)
+        except TypeError as e:
+            _client_unsupported(e)
+            raise
+        _async_tavily_clients[loop] = client
+    return client
+
+
+def _format_response(response: Dict, query: str, profile: str) -> Dict:
+    """프로필에 맞는 필드만 남겨 결과 포맷팅"""
+    results = []
+    if profile != "answer-only":
+        for r in response.get("results", []):
+            item = {
                 "title": r["title"],
                 "url": r["url"],
                 "content": r["content"],
                 "score": r.get("score", 0)
             }
-            for r in response.get("results", [])
-        ],
+            if profile == "full":
+                item["raw_content"] = r.get("raw_content") or ""
+            results.append(item)
+
+    return {
+        "answer": response.get("answer", ""),
+        "results": results,
         "query": query
     }
 
-    return formatted_results
+
+# 커스텀 심층 조사 도구
+@tool
+def deep_research(
+    query: str,
+    max_results: int = 10,
+    force_refresh: bool = False,
+    profile: SearchProfile = "snippets"
+) -> Dict:
+    """주제에 대한 심층 조사 수행 (force_refresh=True면 캐시를 무시하고 다시 검색)
+
+    profile: "full" (원문 포함) / "snippets" (기본) / "answer-only" (요약만)
+    반환값의 "stats"에는 응답 크기(bytes), 파싱 시간(ms), 캐시 여부가 담긴다.
+    """
+    search_params = _search_params(max_results, profile)
+
+    # 녹화 재생 (CASSETTE_MODE가 켜져 있을 때)
+    fingerprint, replayed = _replay_search(query, profile, search_params)
+    if replayed is not None:
+        return replayed
+
+    # 캐시 조회
+    cache = get_search_cache()
+    cache_key = SearchCache.make_key(query, profile=profile, **search_params)
+    cached = _cached_result(cache, cache_key, query, force_refresh)
+    if cached is not None:
+        _save_search(fingerprint, query, profile, cached)
+        return cached
+
+    _response_info.bytes = 0
+    _response_info.elapsed = 0.0
+    start = time.perf_counter()
+
+    response = get_tavily_client().search(
+        query=query,
+        include_answer=True,
+        **search_params
+    )
+
+    # 결과 포맷팅
+    formatted_results = _format_response(response, query, profile)
+
+    # 파싱 시간 = 응답 헤더 수신 이후 (본문 수신 + JSON 파싱 + 포맷팅)
+    total = time.perf_counter() - start
+    stats = {
+        "response_bytes": getattr(_response_info, "bytes", 0),
+        "parse_ms": max(total - getattr(_response_info, "elapsed", 0.0), 0.0) * 1000,
+        "cached": False
+    }
+
+    if cache is not None:
+        cache.set(cache_key, query, formatted_results)
+    _save_search(fingerprint, query, profile, formatted_results)
+
+    return {**formatted_results, "stats": stats}
+
+
+async def adeep_research(
+    query: str,
+    max_results: int = 10,
+    force_refresh: bool = False,
+    profile: SearchProfile = "snippets"
+) -> Dict:
+    """deep_research의 비동기 버전 (이벤트 루프 공용 AsyncTavilyClient 사용)
+
+    캐시는 동기 버전과 공유한다. 통계의 response_bytes는 JSON 재직렬화 크기 기준이다.
+    """
+    search_params = _search_params(max_results, profile)
+
+    fingerprint, replayed = _replay_search(query, profile, search_params)
+    if replayed is not None:
+        return replayed
+
+    cache = get_search_cache()
+    cache_key = SearchCache.make_key(query, profile=profile, **search_params)
+    cached = _cached_result(cache, cache_key, query, force_refresh)
+    if cached is not None:
+        _save_search(fingerprint, query, profile, cached)
+        return cached
+
+    response = await get_async_tavily_client().search(
+        query=query,
+        include_answer=True,
+        **search_params
+    )
+
+    start = time.perf_counter()
+    formatted_results = _format_response(response, query, profile)
+    stats = {
+        "response_bytes": len(json.dumps(response, ensure_ascii=False).encode("utf-8")),
+        "parse_ms": (time.perf_counter() - start) * 1000,
+        "cached": False
+    }
+
+    if cache is not None:
+        cache.set(cache_key, query, formatted_results)
+    _save_search(fingerprint, query, profile, formatted_results)
+
+    return {**formatted_results, "stats": stats}
+
+
+def _search_params(max_results: int, profile: str) -> Dict:
+    """프로필 검증 후 Tavily 검색 파라미터 구성"""
+    if profile not in SEARCH_PROFILES:
+        raise ValueError(f"알 수 없는 검색 프로필: {profile}")
+
+    return {
+        "search_depth": "advanced",  # 심층 검색
+        # answer-only는 결과 목록을 내려받지 않음 (요약은 서버에서 검색 결과로 생성)
+        "max_results": 0 if profile == "answer-only" else max_results,
+        "include_raw_content": profile == "full"
+    }
+
+
+def _cached_result(cache, cache_key: str, query: str, force_refresh: bool) -> Optional[Dict]:
+    """캐시 적중 시 stats를 붙인 결과, 아니면 None"""
+    if cache is None or force_refresh:
+        return None
+    cached = cache.get(cache_key)
+    if cached is None:
+        return None
+    return {
+        **cached,
+        "query": query,
+        "stats": {"response_bytes": 0, "parse_ms": 0.0, "cached": True}
+    }
+
+
+def _replay_search(query: str, profile: str, search_params: Dict) -> Tuple[Optional[str], Optional[Dict]]:
+    """녹화 모드면 (지문, 재생 결과) 반환 (녹화가 꺼져 있으면 지문도 None)
+
+    지문은 캐시 키와 같은 정규화 쿼리 기준이고, 재생 결과는 캐시 적중처럼 stats를 붙인다.
+    """
+    cassette = get_cassette()
+    if cassette is None:
+        return None, None
+    fingerprint = make_fingerprint("search", profile, {"query": normalize_query(query), **search_params})
+    stored = cassette.lookup(fingerprint, "search", profile, query)
+    if stored is None:
+        return fingerprint, None
+    return fingerprint, {
+        **stored,
+        "query": query,
+        "stats": {"response_bytes": 0, "parse_ms": 0.0, "cached": True, "replayed": True}
+    }
+
+
+def _save_search(fingerprint: Optional[str], query: str, profile: str, result: Dict) -> None:
+    """녹화 모드면 검색 결과(stats 제외) 녹화"""
+    cassette = get_cassette()
+    if fingerprint is None or cassette is None:
+        return
+    value = {k: v for k, v in result.items() if k != "stats"}
+    cassette.save(fingerprint, "search", profile, value, query)
+
+
+def _failed_result(query: str) -> Dict:
+    """검색 실패 시 대체 결과 (N/A)"""
+    return {
+        "answer": "N/A",
+        "results": [],
+        "query": query,
+        "stats": {"response_bytes": 0, "parse_ms": 0.0, "cached": False}
+    }
+
+
+def _safe_deep_research(
+    query: str,
+    max_results: int,
+    force_refresh: bool,
+    profile: str
+) -> Dict:
+    """검색 실패 시 예외 대신 빈 결과로 대체"""
+    start = time.perf_counter()
+    try:
+        result = deep_research.invoke({
+            "query": query,
+            "max_results": max_results,
+            "force_refresh": force_refresh,
+            "profile": profile
+        })
+    except Exception as e:
+        get_metrics().event("search.failed", f"⚠️ 검색 실패 ({query}): {str(e)}", query=query, error=str(e))
+        result = _failed_result(query)
+        _record_search(profile, result, time.perf_counter() - start, error=True)
+        return result
+    _record_search(profile, result, time.perf_counter() - start)
+    return result
+
+
+def _record_search(profile: str, result: Dict, seconds: float, error: bool = False) -> None:
+    """검색 한 번의 지연 시간·응답 크기·캐시 적중 기록"""
+    stats = result.get("stats", {})
+    get_metrics().record(
+        "search",
+        profile,
+        seconds,
+        error=error,
+        bytes=stats.get("response_bytes", 0),
+        parse_ms=stats.get("parse_ms", 0.0),
+        cached=bool(stats.get("cached")),
+        results=len(result.get("results", []))
+    )
+
+
+def deep_research_many(
+    queries: List[str],
+    max_results: int = 10,
+    force_refresh: bool = False,
+    profiles: Optional[List[SearchProfile]] = None
+) -> List[Dict]:
+    """여러 쿼리를 공용 연결 풀로 동시 검색 (결과는 입력 순서 유지, 실패는 N/A)
+
+    profiles를 주면 쿼리별 필드 프로필을 지정한다 (기본: 모두 "snippets").
+    """
+    if not queries:
+        return []
+    if profiles is None:
+        profiles = ["snippets"] * len(queries)
+    if len(profiles) != len(queries):
+        raise ValueError("profiles 길이는 queries와 같아야 합니다")
+
+    max_workers = max(1, min(settings.research_max_concurrency, len(queries)))
+    with ContextThreadPoolExecutor(max_workers=max_workers) as executor:
+        # map은 입력 순서대로 결과를 돌려주므로 병합 순서가 항상 동일
+        return list(executor.map(
+            lambda args: _safe_deep_research(args[0], max_results, force_refresh, args[1]),
+            list(zip(queries, profiles))
+        ))
+
+
+async def adeep_research_many(
+    queries: List[str],
+    max_results: int = 10,
+    force_refresh: bool = False,
+    profiles: Optional[List[SearchProfile]] = None
+) -> List[Dict]:
+    """deep_research_many의 비동기 버전 (동시 요청 수는 research_max_concurrency로 제한)"""
+    if not queries:
+        return []
+    if profiles is None:
+        profiles = ["snippets"] * len(queries)
+    if len(profiles) != len(queries):
+        raise ValueError("profiles 길이는 queries와 같아야 합니다")
+
+    semaphore = asyncio.Semaphore(max(1, settings.research_max_concurrency))
+
+    async def search(query: str, profile: str) -> Dict:
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                result = await adeep_research(query, max_results, force_refresh, profile)
+            except Exception as e:
+                get_metrics().event(
+                    "search.failed", f"⚠️ 검색 실패 ({query}): {str(e)}", query=query, error=str(e)
+                )
+                result = _failed_result(query)
+                _record_search(profile, result, time.perf_counter() - start, error=True)
+                return result
+            _record_search(profile, result, time.perf_counter() - start)
+            return result
+
+    # gather는 입력 순서대로 결과를 돌려주므로 병합 순서가 항상 동일
+    return list(await asyncio.gather(*(search(q, p) for q, p in zip(queries, profiles))))
+
+
+def summarize_search_stats(results: List[Dict]) -> Dict:
+    """검색 결과 목록의 응답 크기/파싱 시간/캐시 적중 합계"""
+    stats = [r.get("stats", {}) for r in results]
+    return {
+        "queries": len(results),
+        "response_bytes": sum(s.get("response_bytes", 0) for s in stats),
+        "parse_ms": sum(s.get("parse_ms", 0.0) for s in stats),
+        "cache_hits": sum(1 for s in stats if s.get("cached"))
+    }
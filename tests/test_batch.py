@@ -0,0 +1,176 @@
+"""Unit tests for the headless batch runner."""
+
+import asyncio
+import json
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+
+from benchmarks.fakes import install_fakes
+from blog_writer import batch
+from blog_writer.config import settings
+from blog_writer.graph import create_blog_graph
+
+
+def _job(topic, **extra):
+    return {"id": topic, "topic": topic, "keywords": ["체온"], "target_length": 1000, **extra}
+
+
+@pytest.fixture
+def fakes(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "output_dir", str(tmp_path / "output"))
+    monkeypatch.setattr(settings, "research_dir", str(tmp_path / "research"))
+    with install_fakes(llm_latency=0.0, search_latency=0.0):
+        yield
+
+
+class TestLoadJobs:
+    """Test input parsing."""
+
+    def test_defaults_and_keyword_string(self, tmp_path):
+        path = tmp_path / "jobs.jsonl"
+        path.write_text(
+            '# comment\n'
+            '{"topic": "열성 경련", "keywords": "열, 경련"}\n'
+            '\n'
+            '{"topic": "수족구", "target_length": "1500", "id": "hfmd"}\n',
+            encoding="utf-8"
+        )
+
+        jobs = batch.load_jobs(str(path))
+
+        assert jobs[0]["id"] != "hfmd"
+        assert jobs[1]["id"] == "hfmd"
+        assert jobs[0]["keywords"] == ["열", "경련"]
+        assert jobs[0]["target_length"] == 2000
+        assert jobs[1]["target_length"] == 1500
+
+    def test_default_id_follows_content_not_position(self, tmp_path):
+        path = tmp_path / "jobs.jsonl"
+        path.write_text('{"topic": "열성 경련"}\n{"topic": "수족구"}\n', encoding="utf-8")
+        before = {j["topic"]: j["id"] for j in batch.load_jobs(str(path))}
+
+        # 앞에 줄을 끼워 넣어도 기존 글의 ID(스레드)는 그대로
+        path.write_text('{"topic": "중이염"}\n{"topic": "열성 경련"}\n{"topic": "수족구"}\n', encoding="utf-8")
+        after = {j["topic"]: j["id"] for j in batch.load_jobs(str(path))}
+
+        assert after["열성 경련"] == before["열성 경련"]
+        assert after["수족구"] == before["수족구"]
+
+    def test_identical_lines_get_distinct_ids(self, tmp_path):
+        path = tmp_path / "jobs.jsonl"
+        path.write_text('{"topic": "열성 경련"}\n{"topic": "열성 경련"}\n', encoding="utf-8")
+
+        first, second = batch.load_jobs(str(path))
+
+        assert batch.job_thread_id(first) != batch.job_thread_id(second)
+
+    def test_missing_topic_is_rejected(self, tmp_path):
+        path = tmp_path / "jobs.jsonl"
+        path.write_text('{"keywords": ["a"]}\n', encoding="utf-8")
+
+        with pytest.raises(ValueError, match="topic"):
+            batch.load_jobs(str(path))
+
+    def test_thread_id_is_deterministic(self):
+        assert batch.job_thread_id(_job("a")) == batch.job_thread_id(_job("a"))
+        assert batch.job_thread_id(_job("a")) != batch.job_thread_id(_job("b"))
+
+
+class TestRespondToInterrupt:
+    """Test auto-approve and clarification policies."""
+
+    def test_approval_is_auto_approved(self):
+        response = batch.respond_to_interrupt({"type": "approval", "stage": "최종"}, _job("a"))
+
+        assert response == {"approved": True, "feedback": ""}
+
+    def test_preloaded_answers_are_used(self):
+        job = _job("a", answers={"writing": ["친근하게", " 짧게 "]})
+        value = {"type": "clarification", "stage": "writing"}
+
+        assert batch.respond_to_interrupt(value, job, "answers") == {
+            "skipped": False, "answers": ["친근하게", "짧게"]
+        }
+        assert batch.respond_to_interrupt(value, job, "skip")["skipped"] is True
+
+    def test_stage_without_answers_is_skipped(self):
+        job = _job("a", answers={"writing": ["친근하게"]})
+        value = {"type": "clarification", "stage": "research"}
+
+        assert batch.respond_to_interrupt(value, job, "answers")["skipped"] is True
+
+
+class TestRunBatch:
+    """Test end-to-end batch execution with fake backends."""
+
+    def test_runs_all_jobs_and_writes_manifest(self, fakes, tmp_path):
+        manifest = tmp_path / "manifest.jsonl"
+        jobs = [_job(f"주제 {i}", answers={"research": ["초보 부모"]}) for i in range(3)]
+
+        records = batch.run_batch(
+            jobs,
+            concurrency=2,
+            clarification_policy="answers",
+            manifest_path=str(manifest),
+            graph=create_blog_graph(MemorySaver(), async_mode=True)
+        )
+
+        assert [r["status"] for r in records] == ["complete"] * 3
+        assert all(r["output_file"] for r in records)
+        assert set(records[0]["stage_seconds"]) >= {"research", "write", "edit", "save"}
+        assert records[0]["interrupts"] == 6  # 질문 3 + 조사·초안 승인 2 + 최종 승인 1
+        lines = [json.loads(line) for line in manifest.read_text(encoding="utf-8").splitlines()]
+        assert sorted(r["id"] for r in lines) == ["주제 0", "주제 1", "주제 2"]
+
+    def test_rerun_skips_completed_and_resumes_interrupted(self, fakes, tmp_path):
+        manifest = tmp_path / "manifest.jsonl"
+        graph = create_blog_graph(MemorySaver(), async_mode=True)
+        done, interrupted = _job("완료"), _job("중단")
+        batch.run_batch([done], manifest_path=str(manifest), graph=graph)
+
+        # 첫 interrupt에서 멈춘 상태 (프로세스가 죽은 경우와 같음)
+        config = {"configurable": {"thread_id": batch.job_thread_id(interrupted)}}
+        asyncio.run(graph.ainvoke(
+            {"topic": "중단", "keywords": ["체온"], "target_length": 1000,
+             "messages": [], "current_stage": "initialized"},
+            config
+        ))
+
+        records = batch.run_batch([done, interrupted], manifest_path=str(manifest), graph=graph)
+
+        assert records[0]["status"] == "skipped"
+        assert records[1]["status"] == "complete"
+        assert records[1]["resumed"] is True
+
+    def test_failures_are_recorded(self, fakes, monkeypatch):
+        graph = create_blog_graph(MemorySaver(), async_mode=True)
+
+        async def broken(*args, **kwargs):
+            raise RuntimeError("quota exceeded")
+            yield
+
+        monkeypatch.setattr(graph, "astream", broken)
+
+        (record,) = batch.run_batch([_job("실패")], graph=graph)
+
+        assert record["status"] == "failed"
+        assert "quota exceeded" in record["error"]
+
+    def test_checkpoint_read_failure_is_recorded(self, fakes, monkeypatch):
+        graph = create_blog_graph(MemorySaver(), async_mode=True)
+
+        async def broken(*args, **kwargs):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr(graph, "aget_state", broken)
+
+        records = batch.run_batch([_job("잠김"), _job("다음")], graph=graph)
+
+        # 한 글의 체크포인트 오류가 배치 전체를 멈추지 않음
+        assert [r["status"] for r in records] == ["failed", "failed"]
+        assert "database is locked" in records[0]["error"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
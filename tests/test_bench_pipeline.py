@@ -0,0 +1,107 @@
+"""Unit tests for the offline pipeline benchmark and its fake backends."""
+
+import argparse
+import os
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.bench_pipeline import compare_to_baseline, run_benchmark
+from benchmarks.fakes import FakeChatModel, LatencyModel
+
+
+def _result(workflow_ms=50.0, checkpoint_bytes=200_000, prompt_tokens=80_000, peak_mb=0.3):
+    return {
+        "workflow_ms": {"p50": workflow_ms, "p95": workflow_ms * 1.2, "max": workflow_ms * 1.5},
+        "stages": {"edit": {"count": 10, "p50_ms": 5.0, "p95_ms": 8.0}},
+        "llm": {"calls": 80, "prompt_tokens": prompt_tokens, "completion_tokens": 40_000},
+        "checkpoint_bytes_per_workflow": checkpoint_bytes,
+        "peak_memory_mb": peak_mb
+    }
+
+
+class TestFakes:
+    """Test latency distributions and the fake chat model."""
+
+    def test_latency_specs(self):
+        assert LatencyModel(0.2).sample() == 0.2
+        uniform = [LatencyModel("uniform:0.1,0.4", seed=3).sample() for _ in range(2)]
+        assert uniform[0] == uniform[1]  # 같은 시드면 같은 값
+        assert 0.1 <= uniform[0] <= 0.4
+        assert LatencyModel("lognormal:0.3,0.5").sample() > 0
+
+        with pytest.raises(ValueError):
+            LatencyModel("gamma:1,2")
+        with pytest.raises(ValueError):
+            LatencyModel("uniform:0.1")
+
+    def test_usage_and_stream_chunks(self):
+        model = FakeChatModel(latency=0, chunk_chars=10)
+
+        reply = model.invoke("본문을 작성하세요")
+        assert reply.usage_metadata["output_tokens"] > 0
+
+        chunks = list(model.stream("본문을 작성하세요"))
+        assert len(chunks) > 1
+        assert "".join(c.content for c in chunks) == reply.content
+        usage = [c.usage_metadata for c in chunks if c.usage_metadata]
+        assert usage == [reply.usage_metadata]
+        assert model.calls == 2
+
+    def test_response_scale(self):
+        short = FakeChatModel(latency=0, response_scale=0.5).invoke("본문")
+        long = FakeChatModel(latency=0, response_scale=2).invoke("본문")
+        assert len(long.content) > 3 * len(short.content)
+
+
+    def test_search_urls_ignore_hash_seed(self):
+        # 문자열 hash()는 PYTHONHASHSEED마다 달라져 체크포인트 크기 기준값이 흔들림
+        script = "from benchmarks.fakes import _search_response; print(_search_response('열성 경련', 2)['results'][0]['url'])"
+        urls = {
+            subprocess.run(
+                [sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                env={**os.environ, "PYTHONHASHSEED": seed, "GOOGLE_API_KEY": "dummy"}
+            ).stdout
+            for seed in ("1", "2")
+        }
+
+        assert len(urls) == 1
+
+
+class TestBaselineComparison:
+    """Test regression detection against a saved baseline."""
+
+    def test_noise_is_not_a_regression(self):
+        assert compare_to_baseline(_result(workflow_ms=50), _result()) == []
+        # 비율로는 두 배지만 절대 차이가 잡음 하한(10ms) 이하
+        assert compare_to_baseline(_result(workflow_ms=4), _result(workflow_ms=2)) == []
+
+    def test_timing_regression(self):
+        regressions = compare_to_baseline(_result(workflow_ms=100), _result(workflow_ms=50))
+        assert any(line.startswith("workflow p50") for line in regressions)
+
+    def test_sizes_use_tighter_tolerance(self):
+        regressions = compare_to_baseline(_result(checkpoint_bytes=220_000), _result())
+        assert [line.split(":")[0] for line in regressions] == ["checkpoint bytes/workflow"]
+        assert compare_to_baseline(_result(checkpoint_bytes=220_000), _result(), size_tolerance=0.2) == []
+
+
+class TestRunBenchmark:
+    """Test a small end-to-end benchmark run."""
+
+    def test_small_run(self):
+        args = argparse.Namespace(
+            workflows=2, concurrency=2, llm_latency="0", search_latency="0", response_scale=1.0,
+            result_chars=200, rejections=1, answers=True, seed=0
+        )
+        result = run_benchmark(args)
+
+        assert result["llm"]["calls"] > 0 and result["search"]["calls"] > 0
+        assert result["stages"]["edit"]["count"] == 4  # 거부 1회 → 워크플로우마다 편집 2번
+        assert result["checkpoint_bytes_per_workflow"] > 0
+        assert compare_to_baseline(result, result) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
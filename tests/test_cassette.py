@@ -0,0 +1,127 @@
+"""Unit tests for LLM/search record-replay cassettes."""
+
+import asyncio
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+
+from benchmarks.fakes import FakeChatModel, initial_state, install_fakes, run_workflow
+from blog_writer import cassette
+from blog_writer.config import settings
+from blog_writer.graph import create_blog_graph
+from blog_writer.tools import tavily_search
+
+
+@pytest.fixture(autouse=True)
+def cassette_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "cassette_db", str(tmp_path / "cassettes.sqlite"))
+    monkeypatch.setattr(settings, "search_cache_enabled", False)
+    yield
+    cassette.close_cassettes()
+
+
+def _use(monkeypatch, mode):
+    monkeypatch.setattr(settings, "cassette_mode", mode)
+
+
+class TestFingerprint:
+    """Test prompt normalization."""
+
+    def test_whitespace_is_irrelevant(self):
+        a = cassette.normalize_prompt("  제목:  열 \n\n\n\n- 요점\t하나  \n")
+        b = cassette.normalize_prompt("제목: 열\n\n- 요점 하나")
+        assert a == b
+        assert cassette.make_fingerprint("llm", "m", {"p": a}) == cassette.make_fingerprint("llm", "m", {"p": b})
+
+    def test_content_and_model_matter(self):
+        base = cassette.make_fingerprint("llm", "gemini-2.5-pro", {"p": "열"})
+        assert cassette.make_fingerprint("llm", "gemini-2.5-pro", {"p": "기침"}) != base
+        assert cassette.make_fingerprint("llm", "gemini-2.5-flash", {"p": "열"}) != base
+
+
+class TestCassetteChatModel:
+    """Test recording and replaying chat model calls."""
+
+    def test_record_then_replay(self, monkeypatch):
+        _use(monkeypatch, "record")
+        inner = FakeChatModel(latency=0)
+        recorder = cassette.wrap_llm(inner)
+        recorded = recorder.invoke("본문을   작성하세요")
+        list(recorder.stream("초안\n\n\n작성"))
+        assert inner.calls == 2
+
+        _use(monkeypatch, "replay")
+        replay = cassette.CassetteChatModel(inner=inner)
+        replayed = replay.invoke("  본문을 작성하세요  ")
+        assert replayed.content == recorded.content
+        assert replayed.usage_metadata == recorded.usage_metadata
+        # 스트리밍으로 녹화한 응답도 invoke/ainvoke로 재생
+        assert asyncio.run(replay.ainvoke("초안\n\n작성")).content
+        assert "".join(c.content for c in replay.stream("본문을 작성하세요")) == recorded.content
+        assert inner.calls == 2
+
+    def test_replay_miss_raises(self, monkeypatch):
+        _use(monkeypatch, "replay")
+        with pytest.raises(cassette.CassetteMissError):
+            cassette.wrap_llm(FakeChatModel(latency=0)).invoke("처음 보는 프롬프트")
+
+        report = cassette.get_cassette().coverage()
+        assert report["series"]["llm/gemini-2.5-pro"]["missing"] == 1
+        assert report["misses"][0]["preview"] == "처음 보는 프롬프트"
+
+    def test_auto_records_misses(self, monkeypatch):
+        _use(monkeypatch, "auto")
+        inner = FakeChatModel(latency=0)
+        model = cassette.wrap_llm(inner)
+        model.invoke("프롬프트")
+        model.invoke("프롬프트")
+
+        assert inner.calls == 1
+        assert cassette.get_cassette().stats()["llm"] == {"hits": 1, "misses": 1, "recorded": 1}
+
+    def test_off_returns_model_unchanged(self, monkeypatch):
+        _use(monkeypatch, "off")
+        inner = FakeChatModel(latency=0)
+        assert cassette.wrap_llm(inner) is inner
+
+
+class TestSearchAndWorkflow:
+    """Test deep_research replay and a full workflow rerun."""
+
+    def test_search_replay(self, monkeypatch):
+        _use(monkeypatch, "record")
+        with install_fakes(llm_latency=0.0, search_latency=0.0):
+            recorded = tavily_search.deep_research.invoke({"query": "아이 열", "max_results": 3})
+
+        def offline():
+            raise AssertionError("재생 모드에서 네트워크 호출")
+
+        _use(monkeypatch, "replay")
+        monkeypatch.setattr(tavily_search, "get_tavily_client", offline)
+        replayed = tavily_search.deep_research.invoke({"query": "  아이   열 ", "max_results": 3})
+
+        assert replayed["results"] == recorded["results"]
+        assert replayed["query"] == "  아이   열 "
+        assert replayed["stats"]["replayed"]
+
+    def test_workflow_replays_without_backend_calls(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(settings, "output_dir", str(tmp_path / "output"))
+        monkeypatch.setattr(settings, "research_dir", str(tmp_path / "research"))
+        _use(monkeypatch, "record")
+        with install_fakes(llm_latency=0.0, search_latency=0.0):
+            recorded = run_workflow(create_blog_graph(MemorySaver()), "record", initial_state("주제"))
+
+        _use(monkeypatch, "replay")
+        with install_fakes(llm_latency=0.0, search_latency=0.0):
+            monkeypatch.setattr(FakeChatModel, "_respond", lambda self, messages: pytest.fail("LLM 호출"))
+            replayed = run_workflow(create_blog_graph(MemorySaver()), "replay", initial_state("주제"))
+
+        assert recorded["final_content"]
+        assert replayed["final_content"] == recorded["final_content"]
+        stats = cassette.get_cassette().stats()
+        assert stats["llm"]["misses"] == stats["search"]["misses"] == 0
+        assert all(s["coverage"] == 1.0 for s in cassette.get_cassette().coverage()["series"].values())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
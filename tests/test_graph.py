@@ -1,9 +1,19 @@
+import asyncio
+
 import pytest
-from blog_writer.graph import create_blog_graph
+from benchmarks.fakes import arun_workflow, initial_state, install_fakes, run_workflow
+from blog_writer.config import settings
+from blog_writer.graph import close_blog_graphs, create_blog_graph, get_blog_graph
 from blog_writer.state import BlogState
 from langgraph.checkpoint.memory import MemorySaver
 
 
+@pytest.fixture(autouse=True)
+def _api_key(monkeypatch):
+    # 그래프 컴파일 시 실제 ChatGoogleGenerativeAI를 만들므로 자격 증명 없이도 돌도록 더미 키
+    monkeypatch.setattr(settings, "google_api_key", settings.google_api_key or "test-key")
+
+
 def test_graph_creation():
     """그래프 생성 테스트"""
     checkpointer = MemorySaver()
@@ -14,6 +24,79 @@ def test_graph_creation():
     assert hasattr(graph, 'invoke')
 
 
+class TestSharedGraph:
+    """Test the process-wide graph shared by UI sessions."""
+
+    @pytest.fixture(autouse=True)
+    def _cleanup(self):
+        yield
+        close_blog_graphs()
+
+    def test_same_db_returns_same_graph(self, tmp_path):
+        db_path = str(tmp_path / "a.sqlite")
+
+        assert get_blog_graph(db_path) is get_blog_graph(db_path)
+        assert get_blog_graph(db_path) is not get_blog_graph(str(tmp_path / "b.sqlite"))
+
+    def test_sessions_share_checkpoints(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "research_dir", str(tmp_path / "research"))
+        db_path = str(tmp_path / "shared.sqlite")
+        config = {"configurable": {"thread_id": "session-1"}}
+
+        with install_fakes(llm_latency=0.0, search_latency=0.0):
+            get_blog_graph(db_path).invoke(initial_state("공유"), config)
+
+        # 다른 세션(같은 공용 그래프)에서 스레드 ID만으로 상태 조회
+        snapshot = get_blog_graph(db_path).get_state(config)
+        assert snapshot.values["topic"] == "공유"
+        assert snapshot.next
+
+    def test_close_drops_graph(self, tmp_path):
+        db_path = str(tmp_path / "a.sqlite")
+        graph = get_blog_graph(db_path)
+        close_blog_graphs()
+
+        assert get_blog_graph(db_path) is not graph
+
+
+class TestAsyncGraph:
+    """Test the async graph against fake LLM/search backends."""
+
+    @pytest.fixture(autouse=True)
+    def _fakes(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "output_dir", str(tmp_path / "output"))
+        monkeypatch.setattr(settings, "research_dir", str(tmp_path / "research"))
+        with install_fakes(llm_latency=0.0, search_latency=0.0):
+            yield
+
+    def test_async_workflow_matches_sync(self):
+        sync_result = run_workflow(create_blog_graph(MemorySaver()), "sync", initial_state("동기"))
+
+        async def run():
+            graph = create_blog_graph(MemorySaver(), async_mode=True)
+            return await arun_workflow(graph, "async", initial_state("비동기"))
+
+        async_result = asyncio.run(run())
+
+        assert async_result["current_stage"] == sync_result["current_stage"] == "complete"
+        assert async_result["final_content"] == sync_result["final_content"]
+        assert async_result["seo_score"] == sync_result["seo_score"]
+        assert len(async_result["sources"]) == len(sync_result["sources"])
+        assert set(async_result["clarifications"]) == {"research", "writing", "editing"}
+
+    def test_concurrent_workflows_on_one_loop(self):
+        async def run():
+            graph = create_blog_graph(MemorySaver(), async_mode=True)
+            return await asyncio.gather(*(
+                arun_workflow(graph, f"wf-{i}", initial_state(f"주제 {i}")) for i in range(5)
+            ))
+
+        results = asyncio.run(run())
+
+        assert [r["current_stage"] for r in results] == ["complete"] * 5
+        assert len({r["output_file"] for r in results}) == 5
+
+
 @pytest.mark.skip(reason="API 키 필요")
 def test_full_workflow():
     """전체 워크플로우 테스트 (API 키 필요)"""
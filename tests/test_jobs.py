@@ -0,0 +1,121 @@
+"""Unit tests for the background graph job runner."""
+
+import threading
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.types import Command
+
+from benchmarks.fakes import AUTO_RESPONSE, initial_state, install_fakes
+from blog_writer.config import settings
+from blog_writer.graph import create_blog_graph
+from blog_writer.jobs import JOB_DONE, JOB_FAILED, JOB_QUEUED, JobRunner
+
+
+class BlockingGraph:
+    """Graph stand-in whose stream blocks until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.order = []
+
+    def stream(self, graph_input, config, stream_mode=None):
+        self.order.append((config["configurable"]["thread_id"], graph_input, "start"))
+        self.started.set()
+        yield "tasks", {"id": "1", "name": "research", "input": {}, "triggers": ()}
+        self.release.wait(5)
+        yield "tasks", {"id": "1", "name": "research", "result": {}, "error": None, "interrupts": []}
+        self.order.append((config["configurable"]["thread_id"], graph_input, "end"))
+
+
+class FailingGraph:
+    def stream(self, graph_input, config, stream_mode=None):
+        raise ValueError("boom")
+        yield
+
+
+@pytest.fixture
+def runner():
+    runner = JobRunner(max_workers=2)
+    yield runner
+    runner.shutdown()
+
+
+class TestJobRunner:
+    """Test job execution, ordering and progress."""
+
+    def test_runs_real_graph_to_interrupt(self, runner, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "research_dir", str(tmp_path / "research"))
+        with install_fakes(llm_latency=0.0, search_latency=0.0):
+            graph = create_blog_graph(MemorySaver())
+            first = runner.submit("t1", initial_state("주제"), graph)
+            assert first.wait(10)
+            second = runner.submit("t1", Command(resume=AUTO_RESPONSE), graph)
+            assert second.wait(10)
+
+        snapshot = second.snapshot()
+        assert snapshot["status"] == JOB_DONE
+        assert snapshot["node"] == "writing_clarify_and_approve"
+        assert "research" in snapshot["stage_seconds"]
+        assert [e["node"] for e in snapshot["events"] if e["type"] == "node_start"][:2] == [
+            "research_clarify_and_approve", "research"
+        ]
+        assert runner.latest("t1") is second
+        assert graph.get_state({"configurable": {"thread_id": "t1"}}).next
+
+    def test_same_thread_runs_in_order(self, runner):
+        graph = BlockingGraph()
+        first = runner.submit("t1", "a", graph)
+        second = runner.submit("t1", "b", graph)
+
+        assert graph.started.wait(5)
+        assert second.status == JOB_QUEUED  # 워커가 남아도 같은 스레드는 대기
+        graph.release.set()
+        assert second.wait(5)
+
+        assert [entry[1:] for entry in graph.order] == [("a", "start"), ("a", "end"), ("b", "start"), ("b", "end")]
+        assert first.finished_at <= second.started_at
+
+    def test_queue_depth_and_position(self):
+        runner = JobRunner(max_workers=1)
+        graph = BlockingGraph()
+        runner.submit("t1", "a", graph)
+        assert graph.started.wait(5)
+        second = runner.submit("t2", "b", graph)
+        third = runner.submit("t3", "c", graph)
+
+        stats = runner.stats()
+        assert (stats["running"], stats["queued"]) == (1, 2)
+        assert runner.queue_position(second) == 0
+        assert runner.queue_position(third) == 1
+
+        graph.release.set()
+        assert third.wait(5)
+        assert runner.stats()["queued"] == 0
+        runner.shutdown()
+
+    def test_failure_is_recorded(self, runner):
+        job = runner.submit("t1", "a", FailingGraph())
+
+        assert job.wait(5)
+        assert job.status == JOB_FAILED
+        assert job.snapshot()["error"] == "ValueError: boom"
+
+    def test_history_is_bounded(self):
+        runner = JobRunner(max_workers=1, max_history=3)
+        graph = BlockingGraph()
+        graph.release.set()
+        jobs = [runner.submit(f"t{i}", i, graph) for i in range(6)]
+        for job in jobs:
+            job.wait(5)
+        runner.submit("t-last", "x", graph).wait(5)
+
+        assert runner.stats()["jobs"] <= 4
+        assert runner.get(jobs[0].id) is None
+        assert runner.latest("t0") is None
+        runner.shutdown()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,86 @@
+"""Unit tests for the process-wide LLM client registry."""
+
+import pytest
+
+from blog_writer import llm
+from blog_writer.agents.clarification_agent import _get_gemini_model
+from blog_writer.scheduler import PRIORITY_INTERACTIVE, ScheduledChatModel
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    monkeypatch.setattr(llm.settings, "google_api_key", "test-key")
+    # 레지스트리 자체를 검사 (스케줄러 래핑은 TestScheduledLLM에서)
+    monkeypatch.setattr(llm.settings, "llm_scheduler_enabled", False)
+    llm.clear_llm_registry()
+    yield
+    llm.clear_llm_registry()
+
+
+class TestGetLLM:
+    """Test lazy creation and sharing."""
+
+    def test_same_parameters_share_instance(self):
+        first = llm.get_llm("gemini-2.5-flash", temperature=0.3)
+
+        assert llm.get_llm("gemini-2.5-flash", temperature=0.3) is first
+        assert llm.llm_stats()["instantiations"] == 1
+        assert llm.llm_stats()["hits"] == 1
+
+    def test_variants_share_client(self):
+        cold = llm.get_llm("gemini-2.5-flash", temperature=0.3)
+        warm = llm.get_llm("gemini-2.5-flash", temperature=0.7)
+
+        assert warm is not cold
+        assert warm.client is cold.client
+        assert warm.temperature == 0.7
+        assert cold.temperature == 0.3
+        assert llm.llm_stats()["instantiations"] == 1
+        assert llm.llm_stats()["variants"] == 1
+
+    def test_retry_variants_get_their_own_client(self):
+        default = llm.get_llm("gemini-2.5-flash", max_retries=2)
+        patient = llm.get_llm("gemini-2.5-flash", max_retries=5)
+
+        # 재시도 설정은 Client 생성 시 정해지므로 공유하면 적용되지 않음
+        assert patient.client is not default.client
+        assert (default.max_retries, patient.max_retries) == (2, 5)
+        assert llm.llm_stats()["instantiations"] == 2
+
+    def test_models_get_their_own_client(self):
+        flash = llm.get_llm("gemini-2.5-flash")
+        pro = llm.get_llm("gemini-2.5-pro")
+
+        assert flash.client is not pro.client
+        assert llm.llm_stats()["instantiations"] == 2
+
+    def test_api_key_change_builds_new_client(self, monkeypatch):
+        first = llm.get_llm("gemini-2.5-flash")
+        monkeypatch.setattr(llm.settings, "google_api_key", "other-key")
+
+        assert llm.get_llm("gemini-2.5-flash") is not first
+
+    def test_clarification_model_is_reused(self):
+        assert _get_gemini_model() is _get_gemini_model()
+        assert llm.llm_stats()["instantiations"] == 1
+
+
+class TestScheduledLLM:
+    """Test wrapping registry models with the LLM scheduler."""
+
+    def test_scheduler_owns_retries(self, monkeypatch):
+        monkeypatch.setattr(llm.settings, "llm_scheduler_enabled", True)
+        model = llm.get_llm("gemini-2.5-flash", temperature=0.3, max_retries=5)
+
+        assert isinstance(model, ScheduledChatModel)
+        assert (model.max_retries, model.inner.max_retries) == (5, 1)
+        assert model.temperature == 0.3
+        assert llm.get_llm("gemini-2.5-flash", temperature=0.3, max_retries=5) is model
+
+    def test_clarification_is_interactive(self, monkeypatch):
+        monkeypatch.setattr(llm.settings, "llm_scheduler_enabled", True)
+        assert _get_gemini_model().priority == PRIORITY_INTERACTIVE
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,158 @@
+"""Unit tests for node/LLM/search instrumentation."""
+
+import json
+from typing import TypedDict
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+from langchain_core.messages import AIMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, StateGraph
+from langgraph.types import interrupt
+
+from benchmarks.fakes import FakeChatModel, initial_state, install_fakes, run_workflow
+from blog_writer import metrics, scheduler
+from blog_writer.config import settings
+from blog_writer.graph import create_blog_graph
+from blog_writer.scheduler import LLMScheduler, ScheduledChatModel
+
+
+class _State(TypedDict):
+    value: str
+
+
+def _single_node_graph(node):
+    builder = StateGraph(_State)
+    builder.add_node("node", metrics.instrument_node("node", node))
+    builder.set_entry_point("node")
+    builder.add_edge("node", END)
+    return builder.compile(checkpointer=MemorySaver())
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = metrics.MetricsRegistry()
+    monkeypatch.setattr(metrics, "_metrics", registry)
+    return registry
+
+
+class TestMetricsRegistry:
+    """Test aggregation and export."""
+
+    def test_percentiles_and_totals(self, registry):
+        for ms in range(1, 101):
+            registry.record("search", "snippets", ms / 1000, thread_id="t1", bytes=100, cached=ms % 2 == 0)
+
+        stats = registry.summary()["search"]["snippets"]
+        assert stats["count"] == 100
+        assert stats["p50_ms"] == pytest.approx(51)
+        assert stats["p95_ms"] == pytest.approx(96)
+        assert stats["bytes"] == 10000
+        assert stats["cached"] == 50
+
+        thread = registry.thread_summary("t1")
+        assert thread["search_calls"] == 100
+        assert thread["bytes"] == 10000
+
+    def test_timed_records_errors(self, registry):
+        with pytest.raises(ValueError):
+            with registry.timed("step", "seo_score"):
+                raise ValueError("boom")
+
+        assert registry.summary()["step"]["seo_score"]["errors"] == 1
+
+    def test_prometheus_text(self, registry):
+        registry.record("llm", "gemini-2.5-pro", 1.5, thread_id="t1", prompt_tokens=100, completion_tokens=20)
+        registry.record("node", 'odd"name', 0.1, thread_id="t1")
+
+        text = registry.render_prometheus()
+        assert 'blog_writer_llm_seconds{model="gemini-2.5-pro",quantile="0.95"} 1.500000' in text
+        assert 'blog_writer_llm_seconds_count{model="gemini-2.5-pro"} 1' in text
+        assert 'blog_writer_llm_prompt_tokens_total{model="gemini-2.5-pro"} 100' in text
+        assert 'blog_writer_node_seconds_sum{node="odd\\"name"}' in text
+
+    def test_jsonl_roundtrip(self, tmp_path):
+        path = tmp_path / "metrics.jsonl"
+        registry = metrics.MetricsRegistry(jsonl_path=str(path))
+        registry.record("llm", "gemini-2.5-flash", 0.2, thread_id="t1", prompt_tokens=7)
+        registry.event("prompt", tokens=7)
+
+        lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert [line["kind"] for line in lines] == ["llm", "event"]
+
+        reloaded = metrics.load_jsonl(str(path)).summary()
+        assert reloaded["llm"]["gemini-2.5-flash"]["prompt_tokens"] == 7
+        assert "event" not in reloaded
+
+    def test_cost(self):
+        assert metrics.llm_cost("models/gemini-2.5-pro", 1_000_000, 100_000) == pytest.approx(2.25)
+        assert metrics.llm_cost("unknown-model", 1000, 1000) == 0.0
+
+
+class TestInstrumentation:
+    """Test the node wrapper and the LLM callback inside a graph."""
+
+    def test_llm_callback_uses_usage_and_thread_id(self, registry):
+        handler = metrics.MetricsCallbackHandler(registry)
+        reply = AIMessage(content="답", usage_metadata={"input_tokens": 10, "output_tokens": 3, "total_tokens": 13})
+        model = FakeMessagesListChatModel(responses=[reply, reply], callbacks=[handler])
+
+        def node(state):
+            model.invoke("프롬프트")
+            list(model.stream("프롬프트"))
+            return {"value": "done"}
+
+        _single_node_graph(node).invoke({"value": ""}, {"configurable": {"thread_id": "t1"}})
+
+        thread = registry.thread_summary("t1")
+        assert thread["llm_calls"] == 2
+        assert (thread["prompt_tokens"], thread["completion_tokens"]) == (20, 6)
+        assert thread["node_calls"] == 1
+
+    def test_scheduler_retries_are_counted(self, registry, monkeypatch):
+        monkeypatch.setattr(scheduler, "_scheduler", LLMScheduler(default_limits=(0, 0), backoff_seconds=0.001))
+        inner = FakeChatModel(latency=0, model_name="gemini-2.5-flash", failures=1)
+        model = ScheduledChatModel(inner=inner, max_retries=3, callbacks=[metrics.MetricsCallbackHandler(registry)])
+
+        model.invoke("질문", config={"metadata": {"thread_id": "t1"}})
+
+        assert registry.summary()["llm"]["gemini-2.5-flash"]["retries"] == 1
+        assert registry.thread_summary("t1")["retries"] == 1
+
+    def test_interrupt_is_not_an_error(self, registry):
+        graph = _single_node_graph(lambda state: {"value": interrupt("승인?")})
+        graph.invoke({"value": ""}, {"configurable": {"thread_id": "t1"}})
+
+        stats = registry.summary()["node"]["node"]
+        assert (stats["errors"], stats["interrupted"]) == (0, 1)
+
+    def test_workflow_records_nodes_and_searches(self, registry, tmp_path, monkeypatch):
+        monkeypatch.setattr(settings, "output_dir", str(tmp_path / "output"))
+        monkeypatch.setattr(settings, "research_dir", str(tmp_path / "research"))
+        with install_fakes(llm_latency=0.0, search_latency=0.0):
+            run_workflow(create_blog_graph(MemorySaver()), "wf", initial_state("주제"))
+
+        summary = registry.summary()
+        assert {"research", "write", "edit", "save", "final_approval"} <= set(summary["node"])
+        assert summary["search"]["snippets"]["count"] >= 1
+        assert summary["step"]["seo_score"]["count"] >= 2
+        assert registry.thread_summary("wf")["search_calls"] >= 1
+
+    def test_workflow_progress_is_structured(self, tmp_path, monkeypatch):
+        path = tmp_path / "metrics.jsonl"
+        monkeypatch.setattr(metrics, "_metrics", metrics.MetricsRegistry(jsonl_path=str(path)))
+        monkeypatch.setattr(settings, "output_dir", str(tmp_path / "output"))
+        monkeypatch.setattr(settings, "research_dir", str(tmp_path / "research"))
+        with install_fakes(llm_latency=0.0, search_latency=0.0):
+            run_workflow(create_blog_graph(MemorySaver()), "wf", initial_state("주제"))
+
+        events = [e for e in map(json.loads, path.read_text(encoding="utf-8").splitlines()) if e["kind"] == "event"]
+        names = {e["name"] for e in events}
+        assert {"stage.start", "research.done", "write.done", "edit.done", "clarify.questions"} <= names
+        stages = [e["stage"] for e in events if e["name"] == "stage.start"]
+        assert stages == ["research", "write", "edit", "save"]
+        assert all(e["thread_id"] == "wf" for e in events if e["name"] == "stage.start")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,273 @@
+"""Unit tests for the managed SQLite checkpointer."""
+
+import asyncio
+import sqlite3
+import threading
+from typing import TypedDict
+
+import pytest
+from langgraph.graph import StateGraph, START, END
+
+from blog_writer.config import Settings
+from blog_writer.persistence import (
+    aclose_checkpointers,
+    close_checkpointers,
+    get_async_checkpointer,
+    get_checkpointer
+)
+from blog_writer.persistence.blobs import BLOB_REF_PREFIX, BlobStore
+from blog_writer.persistence.retention import run_retention
+
+
+class _State(TypedDict):
+    text: str
+
+
+def _build_graph(checkpointer):
+    def step(state: _State) -> dict:
+        return {"text": state["text"] + "가" * 1000}
+
+    builder = StateGraph(_State)
+    builder.add_node("a", step)
+    builder.add_node("b", step)
+    builder.add_edge(START, "a")
+    builder.add_edge("a", "b")
+    builder.add_edge("b", END)
+    return builder.compile(checkpointer=checkpointer)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    yield str(tmp_path / "checkpoints" / "test.sqlite")
+    close_checkpointers()
+
+
+class TestGetCheckpointer:
+    """Test connection tuning and per-process sharing."""
+
+    def test_pragmas(self, db_path):
+        conn = get_checkpointer(db_path).conn
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA busy_timeout").fetchone()[0] > 0
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2  # INCREMENTAL
+
+    def test_shared_per_path(self, db_path, tmp_path):
+        assert get_checkpointer(db_path) is get_checkpointer(db_path)
+        assert get_checkpointer(db_path) is not get_checkpointer(str(tmp_path / "other.sqlite"))
+
+    def test_concurrent_threads_without_lock_errors(self, db_path):
+        errors = []
+
+        def worker(index):
+            graph = _build_graph(get_checkpointer(db_path))
+            try:
+                for run in range(3):
+                    graph.invoke({"text": ""}, {"configurable": {"thread_id": f"{index}-{run}"}})
+            except Exception as e:  # noqa: BLE001 - collect and assert below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+        graph = _build_graph(get_checkpointer(db_path))
+        assert len(graph.get_state({"configurable": {"thread_id": "7-2"}}).values["text"]) == 2000
+
+    def test_write_stats(self, db_path):
+        saver = get_checkpointer(db_path)
+        _build_graph(saver).invoke({"text": ""}, {"configurable": {"thread_id": "t"}})
+
+        stats = saver.write_stats()
+
+        assert stats["put"]["count"] >= 3
+        assert stats["put_writes"]["count"] >= 2
+        assert stats["put"]["max_ms"] >= stats["put"]["p50_ms"] > 0
+
+
+class TestAsyncCheckpointer:
+    """Test the event-loop scoped aiosqlite checkpointer."""
+
+    def test_tuned_and_instrumented(self, db_path):
+        async def scenario():
+            saver = get_async_checkpointer(db_path)
+            assert get_async_checkpointer(db_path) is saver
+
+            graph = _build_graph(saver)
+            config = {"configurable": {"thread_id": "async"}}
+            await asyncio.gather(*(
+                graph.ainvoke({"text": ""}, {"configurable": {"thread_id": f"async-{i}"}})
+                for i in range(4)
+            ))
+            await graph.ainvoke({"text": ""}, config)
+
+            async with saver.conn.execute("PRAGMA journal_mode") as cur:
+                journal_mode = (await cur.fetchone())[0]
+            async with saver.conn.execute("PRAGMA synchronous") as cur:
+                synchronous = (await cur.fetchone())[0]
+            state = await graph.aget_state(config)
+            stats = saver.write_stats()
+            await aclose_checkpointers()
+            return journal_mode, synchronous, state, stats
+
+        journal_mode, synchronous, state, stats = asyncio.run(scenario())
+
+        assert journal_mode == "wal"
+        assert synchronous == 1
+        assert state.values["text"] == "가" * 2000
+        assert stats["put"]["count"] > 0
+
+    def test_one_saver_per_event_loop(self, db_path):
+        async def saver_id():
+            saver = get_async_checkpointer(db_path)
+            await aclose_checkpointers()
+            return id(saver)
+
+        first = asyncio.run(saver_id())
+        second = asyncio.run(saver_id())
+
+        assert first != second
+
+
+class TestBlobOffload:
+    """Test large strings stored as deduplicated blobs."""
+
+    def test_state_round_trips_through_blobs(self, db_path):
+        saver = get_checkpointer(db_path)
+        graph = _build_graph(saver)
+        config = {"configurable": {"thread_id": "blob"}}
+
+        graph.invoke({"text": "나" * 3000}, config)
+
+        assert graph.get_state(config).values["text"] == "나" * 3000 + "가" * 2000
+        history = list(graph.get_state_history(config))
+        assert [len(s.values["text"]) for s in history if s.values] == [5000, 4000, 3000]
+
+    def test_checkpoint_rows_hold_references_only(self, db_path):
+        saver = get_checkpointer(db_path)
+        _build_graph(saver).invoke({"text": "나" * 3000}, {"configurable": {"thread_id": "ref"}})
+
+        raw = b"".join(row[0] for row in saver.conn.execute("SELECT checkpoint FROM checkpoints"))
+
+        assert "나나나나".encode("utf-8") not in raw
+        assert BLOB_REF_PREFIX.encode("utf-8") in raw
+
+    def test_identical_text_is_stored_once(self, db_path):
+        saver = get_checkpointer(db_path)
+        graph = _build_graph(saver)
+
+        for thread_id in ("a", "b"):
+            graph.invoke({"text": "나" * 3000}, {"configurable": {"thread_id": thread_id}})
+
+        stats = saver.blob_store.stats()
+        assert stats["blobs"] == 3  # 3000, 4000, 5000자 상태 각각 하나
+        assert stats["stored_bytes"] < stats["raw_bytes"]
+
+    def test_migrates_created_at_column(self, tmp_path):
+        conn = sqlite3.connect(str(tmp_path / "old.sqlite"), check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE checkpoint_blobs (hash TEXT PRIMARY KEY, data BLOB NOT NULL, "
+            "raw_size INTEGER NOT NULL, created_at REAL NOT NULL)"
+        )
+        store = BlobStore(conn)
+
+        digest = store.put("나" * 3000)
+        store.put("나" * 3000)
+        assert store.get(digest) == "나" * 3000
+        assert store.delete_unreferenced(set(), unused_for_seconds=-1) == 1
+
+    def test_short_strings_stay_inline(self, db_path):
+        saver = get_checkpointer(db_path)
+        _build_graph(saver).invoke({"text": ""}, {"configurable": {"thread_id": "short"}})
+
+        assert saver.blob_store.stats()["blobs"] == 0
+
+
+class TestRetention:
+    """Test pruning, thread expiry and blob garbage collection."""
+
+    def _run_threads(self, db_path, count):
+        graph = _build_graph(get_checkpointer(db_path))
+        for i in range(count):
+            graph.invoke({"text": f"{i}" * 3000}, {"configurable": {"thread_id": f"t{i}"}})
+        return graph
+
+    def _age_blobs(self, db_path, seconds=2 * 60 * 60):
+        """blob의 마지막 사용 시각을 과거로 옮겨 GC 유예 시간이 지난 것처럼 만듦"""
+        conn = get_checkpointer(db_path).blob_store._conn
+        conn.execute("UPDATE checkpoint_blobs SET last_used = last_used - ?", (seconds,))
+        conn.commit()
+
+    def _count(self, db_path, table):
+        with get_checkpointer(db_path).cursor(transaction=False) as cur:
+            return cur.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def test_keeps_last_k_checkpoints_per_thread(self, db_path):
+        graph = self._run_threads(db_path, 2)
+        self._age_blobs(db_path)
+
+        report = run_retention(db_path, keep_last=1)
+
+        assert report["threads_deleted"] == 0
+        assert report["checkpoints_deleted"] == 2 * 3  # 스레드당 4개 중 3개
+        assert self._count(db_path, "checkpoints") == 2
+        assert graph.get_state({"configurable": {"thread_id": "t1"}}).values["text"].endswith("가" * 1000)
+        # 지워진 체크포인트만 참조하던 blob도 함께 삭제
+        assert report["blobs_deleted"] > 0
+        assert get_checkpointer(db_path).blob_store.stats()["blobs"] == 2
+
+    def test_idle_threads_are_deleted(self, db_path):
+        self._run_threads(db_path, 3)
+        self._age_blobs(db_path)
+
+        report = run_retention(db_path, ttl_seconds=-1)
+
+        assert report["threads_deleted"] == 3
+        assert self._count(db_path, "checkpoints") == 0
+        assert self._count(db_path, "writes") == 0
+        assert get_checkpointer(db_path).blob_store.stats()["blobs"] == 0
+
+    def test_recent_blobs_survive_gc(self, db_path):
+        self._run_threads(db_path, 1)
+
+        report = run_retention(db_path, ttl_seconds=-1)
+
+        assert report["threads_deleted"] == 1
+        assert report["blobs_deleted"] == 0
+
+    def test_blob_grace_has_a_floor(self, db_path):
+        self._run_threads(db_path, 1)
+
+        # 갱신 간격보다 짧은 유예 시간은 최솟값으로 올려서 적용
+        report = run_retention(db_path, ttl_seconds=-1, blob_grace_seconds=0)
+
+        assert report["blobs_deleted"] == 0
+        with pytest.raises(ValueError):
+            Settings(checkpoint_blob_grace_seconds=30)
+
+    def test_dry_run_changes_nothing(self, db_path):
+        self._run_threads(db_path, 2)
+
+        report = run_retention(db_path, keep_last=1, ttl_seconds=-1, dry_run=True)
+
+        assert report["threads_deleted"] == 2
+        assert self._count(db_path, "checkpoints") == 8
+
+    def test_reports_reclaimed_bytes(self, db_path):
+        graph = _build_graph(get_checkpointer(db_path))
+        for i in range(20):
+            graph.invoke({"text": str(i) * 50000}, {"configurable": {"thread_id": f"big{i}"}})
+        self._age_blobs(db_path)
+
+        report = run_retention(db_path, ttl_seconds=-1)
+
+        assert report["reclaimed_bytes"] > 0
+        assert report["bytes_after"] < report["bytes_before"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
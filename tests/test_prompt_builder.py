@@ -0,0 +1,91 @@
+"""Unit tests for token-budgeted prompt assembly."""
+
+import pytest
+
+from blog_writer.prompts import PromptBuilder, estimate_tokens, truncate_to_tokens
+from blog_writer.prompts.builder import TRUNCATION_MARKER
+
+
+class TestEstimateTokens:
+    """Test token estimation."""
+
+    def test_empty(self):
+        assert estimate_tokens("") == 0
+
+    def test_korean_costs_more_per_char_than_ascii(self):
+        assert estimate_tokens("가" * 100) > estimate_tokens("a" * 100)
+
+
+class TestTruncate:
+    """Test paragraph-aware truncation."""
+
+    def test_short_text_unchanged(self):
+        assert truncate_to_tokens("짧은 글", 100) == "짧은 글"
+
+    def test_long_text_fits_budget(self):
+        text = "\n\n".join(f"문단 {i}: " + "내용" * 50 for i in range(20))
+        truncated = truncate_to_tokens(text, 200)
+
+        assert estimate_tokens(truncated) <= 200
+        assert truncated.endswith(TRUNCATION_MARKER)
+        assert truncated.startswith("문단 0")
+
+
+class TestPromptBuilder:
+    """Test priority-ordered budget enforcement."""
+
+    def test_under_budget_keeps_everything_in_order(self):
+        prompt = (
+            PromptBuilder("test", budget=10000)
+            .fixed("지시문")
+            .add("조사 자료", priority=40)
+            .add("스타일", priority=70)
+            .build()
+        )
+
+        assert prompt == "지시문\n\n조사 자료\n\n스타일"
+
+    def test_lowest_priority_shrinks_first(self):
+        research = "조사" * 2000
+        style = "스타일" * 100
+        prompt = (
+            PromptBuilder("test", budget=800)
+            .fixed("지시문", name="instruction")
+            .add(research, name="research", priority=40)
+            .add(style, name="style", priority=70)
+            .build()
+        )
+
+        assert style in prompt
+        assert research not in prompt
+        assert estimate_tokens(prompt) <= 800 + 10
+
+    def test_min_tokens_and_fixed_sections_are_respected(self):
+        prompt = (
+            PromptBuilder("test", budget=50)
+            .fixed("고정" * 100, name="draft")
+            .add("조사" * 500, name="research", priority=40, min_tokens=100)
+            .build()
+        )
+
+        draft, research = prompt.split("\n\n", 1)
+        assert draft == "고정" * 100
+        assert estimate_tokens(research) >= 90
+
+    def test_summarizer_is_used_when_given(self):
+        prompt = (
+            PromptBuilder("test", budget=100, summarizer=lambda text, tokens: "요약본")
+            .add("조사" * 500, name="research", priority=40)
+            .build()
+        )
+
+        assert prompt == "요약본"
+
+    def test_blank_sections_are_skipped(self):
+        prompt = PromptBuilder("test", budget=100).fixed("A").add("").add("  \n").build()
+
+        assert prompt == "A"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,170 @@
+"""Unit tests for speculative clarification question generation."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import StateGraph
+from langgraph.types import Command
+
+from blog_writer.agents import clarification_agent
+from blog_writer.agents.question_prefetch import QuestionPrefetcher
+from blog_writer.metrics import current_thread_id
+from blog_writer.models.clarification import ClarificationQuestion
+from blog_writer.nodes import clarification_nodes
+from blog_writer.scheduler import PRIORITY_BATCH, _priority, llm_priority
+from blog_writer.state import BlogState
+
+STATE = {
+    "topic": "아이 열성 경련",
+    "keywords": ["열성 경련"],
+    "target_length": 1000,
+    "messages": [],
+    "current_stage": "research_complete",
+    "research_data": "조사 결과",
+}
+
+
+class _FakeGenerator:
+    """Counts calls and returns numbered questions after a delay."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.calls = 0
+        self.contexts = []
+        self._lock = threading.Lock()
+
+    def _questions(self, stage):
+        with self._lock:
+            self.calls += 1
+            self.contexts.append((current_thread_id(), _priority.get()))
+            n = self.calls
+        return [
+            ClarificationQuestion(text=f"{stage} 질문 {n}-{i}", category="direction")
+            for i in range(3)
+        ]
+
+    def __call__(self, state, stage):
+        time.sleep(self.delay)
+        return self._questions(stage)
+
+    async def agenerate(self, state, stage):
+        await asyncio.sleep(self.delay)
+        return self._questions(stage)
+
+
+@pytest.fixture
+def generator(monkeypatch):
+    fake = _FakeGenerator(delay=0.05)
+    prefetcher = QuestionPrefetcher(max_entries=8, max_workers=2)
+    monkeypatch.setattr(clarification_agent, "generate_clarification_questions", fake)
+    monkeypatch.setattr(clarification_agent, "agenerate_clarification_questions", fake.agenerate)
+    monkeypatch.setattr(clarification_nodes, "get_question_prefetcher", lambda: prefetcher)
+    fake.prefetcher = prefetcher
+    return fake
+
+
+def _build_graph(async_mode=False):
+    node = clarification_nodes.create_clarify_and_approve_node(
+        stage="writing",
+        content_key="research_data",
+        next_on_approve="write",
+        next_on_reject="research",
+        async_mode=async_mode
+    )
+    builder = StateGraph(BlogState)
+    builder.add_node("review", node)
+    builder.add_node("write", lambda state: {"current_stage": "draft_complete"})
+    builder.add_node("research", lambda state: {"current_stage": "research_complete"})
+    builder.set_entry_point("review")
+    builder.set_finish_point("write")
+    builder.set_finish_point("research")
+    return builder.compile(checkpointer=MemorySaver())
+
+
+class TestPrefetch:
+    """Test prefetching in the sync clarify-and-approve node."""
+
+    def test_questions_generated_during_review(self, generator):
+        graph = _build_graph()
+        config = {"configurable": {"thread_id": "review"}}
+
+        result = graph.invoke(dict(STATE), config)
+        assert result["__interrupt__"][0].value["type"] == "approval"
+        time.sleep(0.2)  # the user reads the content meanwhile
+        assert generator.calls == 1
+
+        start = time.perf_counter()
+        result = graph.invoke(Command(resume={"approved": True}), config)
+        assert time.perf_counter() - start < generator.delay
+        assert result["__interrupt__"][0].value["type"] == "clarification"
+        assert generator.prefetcher.stats()["ready"] == 1
+
+    def test_prefetch_keeps_graph_context(self, generator):
+        graph = _build_graph()
+        config = {"configurable": {"thread_id": "context"}}
+
+        with llm_priority(PRIORITY_BATCH):
+            graph.invoke(dict(STATE), config)
+            graph.invoke(Command(resume={"approved": True}), config)
+
+        # 계측의 thread_id와 LLM 우선순위가 백그라운드 스레드까지 전달됨
+        assert generator.contexts == [("context", PRIORITY_BATCH)]
+
+    def test_answered_questions_are_not_regenerated(self, generator):
+        graph = _build_graph()
+        config = {"configurable": {"thread_id": "answer"}}
+
+        graph.invoke(dict(STATE), config)
+        shown = graph.invoke(Command(resume={"approved": True}), config)["__interrupt__"][0].value
+        result = graph.invoke(Command(resume={"answers": ["a", "b", "c"], "skipped": False}), config)
+
+        assert generator.calls == 1
+        stored = result["clarifications"]["writing"]["questions"]
+        assert [q["text"] for q in stored] == [q["text"] for q in shown["questions"]]
+        assert generator.prefetcher.stats()["entries"] == 0
+
+    def test_rejection_discards_prefetched_questions(self, generator):
+        graph = _build_graph()
+        config = {"configurable": {"thread_id": "reject"}}
+
+        graph.invoke(dict(STATE), config)
+        result = graph.invoke(Command(resume={"approved": False, "feedback": "다시"}), config)
+
+        assert result["current_stage"] == "research_complete"
+        assert generator.prefetcher.stats()["discarded"] == 1
+        assert generator.prefetcher.stats()["entries"] == 0
+
+    def test_changed_content_uses_new_key(self):
+        key = QuestionPrefetcher.make_key(dict(STATE), "writing", thread_id="t")
+        changed = QuestionPrefetcher.make_key({**STATE, "research_data": "새 조사"}, "writing", thread_id="t")
+
+        assert key != changed
+        assert key == QuestionPrefetcher.make_key(dict(STATE), "writing", thread_id="t")
+
+
+class TestAsyncPrefetch:
+    """Test prefetching in the async node."""
+
+    def test_async_node_reuses_prefetched_task(self, generator):
+        graph = _build_graph(async_mode=True)
+        config = {"configurable": {"thread_id": "async"}}
+
+        async def scenario():
+            await graph.ainvoke(dict(STATE), config)
+            await asyncio.sleep(0.2)
+            shown = (await graph.ainvoke(Command(resume={"approved": True}), config))["__interrupt__"][0]
+            await graph.ainvoke(Command(resume={"answers": [], "skipped": True}), config)
+            return shown.value
+
+        shown = asyncio.run(scenario())
+
+        assert shown["type"] == "clarification"
+        assert generator.calls == 1
+        assert generator.prefetcher.stats()["ready"] >= 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
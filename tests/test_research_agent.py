@@ -0,0 +1,138 @@
+"""Unit tests for research agent synthesis helpers."""
+
+import re
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from blog_writer.agents import research_agent
+
+
+def _result(url, query, title="T"):
+    return {"title": title, "url": url, "content": "본문", "score": 0.5, "queries": [query], "keywords": []}
+
+
+def _hangul(seed, chars):
+    """Distinct Hangul text so deduplication keeps every result."""
+    return "".join(chr(0xAC00 + (seed * 7919 + j * 131) % 11172) for j in range(chars))
+
+
+class _FakeSummaryLLM:
+    """Returns a canned summary per group, optionally failing on one label."""
+
+    def __init__(self, delay: float = 0.0, fail_on: str = ""):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.prompts = []
+        self._lock = threading.Lock()
+
+    def invoke(self, prompt):
+        with self._lock:
+            self.prompts.append(prompt)
+        time.sleep(self.delay)
+        if self.fail_on and self.fail_on in prompt:
+            raise RuntimeError("model error")
+        return SimpleNamespace(content=f"summary of {len(prompt)} chars")
+
+
+class _LabelEchoLLM:
+    """Echoes the group label; earlier groups answer last."""
+
+    def invoke(self, prompt):
+        label = re.search(r'"(g\d+)" 검색 결과', prompt).group(1)
+        time.sleep(0.05 * (4 - int(label[1:])))
+        return SimpleNamespace(content=label)
+
+
+class TestGroupByQuery:
+    """Test grouping merged results for the map step."""
+
+    def test_results_go_to_first_query(self):
+        searches = [
+            {"query": "main", "answer": "A"},
+            {"query": "kw1", "answer": "B"},
+        ]
+        merged = [_result("https://a.com", "kw1"), _result("https://b.com", "main")]
+
+        groups = research_agent._group_by_query(["메인", "키워드 1"], searches, merged)
+
+        assert [g["label"] for g in groups] == ["메인", "키워드 1"]
+        assert [r["url"] for r in groups[0]["results"]] == ["https://b.com"]
+        assert [r["url"] for r in groups[1]["results"]] == ["https://a.com"]
+        assert groups[1]["answer"] == "B"
+
+
+class TestMapReduceTrigger:
+    """Test the map-reduce decision on the corpus before the char budget."""
+
+    def _searches(self, count, chars):
+        return [
+            {"query": "main", "answer": "A", "results": [
+                {"title": f"T{i}", "url": f"https://s{i}.com", "content": _hangul(i, chars),
+                 "score": 0.5}
+                for i in range(count)
+            ]}
+        ]
+
+    def test_corpus_within_budget_is_single_pass(self, monkeypatch):
+        monkeypatch.setattr(research_agent.settings, "research_char_budget", 20000)
+        searches = self._searches(count=10, chars=1500)
+
+        _, merged, candidates = research_agent._compose_search_data("main", [], searches)
+
+        assert len(merged) == len(candidates) == 10
+        assert not research_agent._needs_map_reduce(candidates)
+
+    def test_map_step_sees_results_cut_by_budget(self, monkeypatch):
+        monkeypatch.setattr(research_agent.settings, "research_char_budget", 20000)
+        searches = self._searches(count=20, chars=1500)
+
+        _, merged, candidates = research_agent._compose_search_data("main", [], searches)
+        groups = research_agent._map_groups([], searches, candidates)
+
+        assert research_agent._needs_map_reduce(candidates)
+        assert len(merged) < len(candidates)
+        assert len(groups[0]["results"]) == 20
+
+
+class TestSummarizeGroups:
+    """Test concurrent map-step summarization."""
+
+    def test_summaries_keep_group_order(self, monkeypatch):
+        monkeypatch.setattr(research_agent.settings, "research_max_concurrency", 4)
+        groups = [
+            {"label": f"g{i}", "answer": "a" * i, "results": []}
+            for i in range(4)
+        ]
+
+        # 나중 그룹이 먼저 끝나도 결과는 그룹 순서대로
+        summaries = research_agent._summarize_groups(_LabelEchoLLM(), "주제", groups)
+
+        assert summaries == ["g0", "g1", "g2", "g3"]
+
+    def test_failed_group_falls_back_to_answer(self):
+        groups = [
+            {"label": "ok", "answer": "A", "results": []},
+            {"label": "broken", "answer": "Tavily 요약", "results": []},
+        ]
+
+        summaries = research_agent._summarize_groups(
+            _FakeSummaryLLM(fail_on="broken"), "주제", groups
+        )
+
+        assert summaries[1] == "**요약**: Tavily 요약"
+
+    def test_groups_run_concurrently(self, monkeypatch):
+        monkeypatch.setattr(research_agent.settings, "research_max_concurrency", 4)
+        groups = [{"label": f"g{i}", "answer": "", "results": []} for i in range(4)]
+
+        start = time.perf_counter()
+        research_agent._summarize_groups(_FakeSummaryLLM(delay=0.2), "주제", groups)
+
+        assert time.perf_counter() - start < 0.2 * 3
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,112 @@
+"""Unit tests for cross-query search result merging."""
+
+import pytest
+
+from blog_writer.tools.result_merger import (
+    canonicalize_url,
+    estimate_similarity,
+    merge_search_results,
+    minhash_signature
+)
+
+
+def _result(url, content, score=0.5, title="T"):
+    return {"title": title, "url": url, "content": content, "score": score}
+
+
+class TestCanonicalUrl:
+    """Test URL canonicalization."""
+
+    def test_strips_tracking_and_fragment(self):
+        assert canonicalize_url("https://www.Example.com/a/?utm_source=x&b=2&fbclid=abc#top") == \
+            canonicalize_url("https://www.example.com/a?b=2")
+
+    def test_keeps_meaningful_query(self):
+        assert canonicalize_url("https://example.com/a?id=1") != \
+            canonicalize_url("https://example.com/a?id=2")
+
+    def test_keeps_generic_params_that_may_select_content(self):
+        assert canonicalize_url("https://example.com/a?source=kr") != \
+            canonicalize_url("https://example.com/a?source=en")
+        assert canonicalize_url("https://example.com/a?ref=main") != \
+            canonicalize_url("https://example.com/a?ref=dev")
+
+    def test_keeps_scheme_and_host(self):
+        assert canonicalize_url("http://example.com/a") != canonicalize_url("https://example.com/a")
+        assert canonicalize_url("https://m.example.com/a") != canonicalize_url("https://example.com/a")
+        assert canonicalize_url("https://www.example.com/a") != canonicalize_url("https://example.com/a")
+
+
+class TestSimilarity:
+    """Test MinHash near-duplicate detection."""
+
+    def test_near_duplicate_korean_text(self):
+        text = (
+            "인공지능이 의료 진단 분야에서 빠르게 확산되고 있다. 영상 판독 보조 도구는 "
+            "폐 결절과 유방암 검출에서 전문의 수준의 정확도를 보였고, 국내 대형 병원 "
+            "열 곳 중 일곱 곳이 이미 시범 도입을 마쳤다. 다만 책임 소재와 데이터 편향 "
+            "문제는 여전히 풀어야 할 숙제로 남아 있다."
+        )
+        similar = text + " 출처: 보건복지부"
+        assert estimate_similarity(minhash_signature(text), minhash_signature(similar)) > 0.8
+
+    def test_distinct_text(self):
+        a = minhash_signature("열성 경련은 생후 6개월에서 5세 사이 소아에게 흔하다.")
+        b = minhash_signature("머신러닝 모델 학습에는 대량의 라벨링 데이터가 필요하다.")
+        assert estimate_similarity(a, b) < 0.2
+
+
+class TestMergeSearchResults:
+    """Test dedup, ranking and budget trimming."""
+
+    def test_dedupes_same_url_across_queries(self):
+        searches = [
+            {"query": "main", "results": [_result("https://a.com/x", "alpha content", 0.5)]},
+            {"query": "kw", "results": [_result("https://www.a.com/x/", "alpha content v2", 0.9)]},
+        ]
+
+        merged = merge_search_results(searches, keywords=[], top_k=10, char_budget=10000)
+
+        assert len(merged) == 1
+        assert merged[0]["score"] == 0.9
+        assert merged[0]["queries"] == ["main", "kw"]
+
+    def test_dedupes_near_duplicate_content(self):
+        body = "소아 열성 경련 발생 시 아이를 옆으로 눕히고 시간을 재야 한다. " * 5
+        searches = [
+            {"query": "main", "results": [_result("https://a.com/1", body)]},
+            {"query": "kw", "results": [_result("https://b.com/2", body + " 추가")]},
+        ]
+
+        merged = merge_search_results(searches, keywords=[], top_k=10, char_budget=10000)
+
+        assert len(merged) == 1
+
+    def test_ranks_by_score_and_keyword_coverage(self):
+        searches = [{"query": "main", "results": [
+            _result("https://a.com", "일반적인 내용", 0.6),
+            _result("https://b.com", "열성 경련 응급처치 방법", 0.5),
+        ]}]
+
+        merged = merge_search_results(
+            searches, keywords=["열성 경련", "응급처치"], top_k=10, char_budget=10000
+        )
+
+        assert [m["url"] for m in merged] == ["https://b.com", "https://a.com"]
+        assert merged[0]["keywords"] == ["열성 경련", "응급처치"]
+
+    def test_top_k_and_char_budget(self):
+        searches = [{"query": "main", "results": [
+            _result(f"https://site{i}.com", f"고유한 본문 {i} " + "가나다라마바사" * i, 1 - i / 10)
+            for i in range(6)
+        ]}]
+
+        merged = merge_search_results(searches, keywords=[], top_k=3, char_budget=10000)
+        assert len(merged) == 3
+
+        merged = merge_search_results(searches, keywords=[], top_k=10, char_budget=30)
+        assert sum(len(m["content"]) for m in merged) <= 30
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,162 @@
+"""Unit tests for the shared LLM rate limiter and priority scheduler."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from langchain_core.exceptions import ModelRateLimitError
+
+from benchmarks.fakes import FakeChatModel
+from blog_writer import metrics, scheduler
+from blog_writer.scheduler import (
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    LLMScheduler,
+    ScheduledChatModel,
+    TokenBucket,
+    llm_priority,
+    parse_rate_limits
+)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = metrics.MetricsRegistry()
+    monkeypatch.setattr(metrics, "_metrics", registry)
+    return registry
+
+
+@pytest.fixture
+def shared(monkeypatch):
+    shared = LLMScheduler(limits={}, default_limits=(0, 0), backoff_seconds=0.001)
+    monkeypatch.setattr(scheduler, "_scheduler", shared)
+    return shared
+
+
+class TestRateLimits:
+    """Test token buckets and limit parsing."""
+
+    def test_bucket_never_exceeds_window_limit(self):
+        bucket = TokenBucket(60, window=60)
+        now = time.monotonic()
+        assert bucket.capacity == 10
+        # 용량 10 + 60초 동안 채워지는 50 = 한 구간 60개
+        assert bucket.rate * 60 + bucket.capacity == pytest.approx(60)
+        bucket.take(10, now)
+        assert bucket.wait_time(1, now) == pytest.approx(1.2, abs=0.01)
+        assert bucket.wait_time(1, now + 1.2) == pytest.approx(0.0, abs=0.01)
+        assert TokenBucket(0).wait_time(10 ** 9, now) == 0.0
+
+    def test_parse_rate_limits(self):
+        assert parse_rate_limits("gemini-2.5-pro=5:250000, gemini-2.5-flash=10") == {
+            "gemini-2.5-pro": (5, 250000),
+            "gemini-2.5-flash": (10, 0)
+        }
+        with pytest.raises(ValueError):
+            parse_rate_limits("gemini-2.5-pro=fast")
+
+    def test_waits_for_request_bucket(self, registry):
+        shared = LLMScheduler(limits={"m": (600, 0)})
+        shared._lane("m").requests.level = 0  # 버킷을 비움 (초당 약 8개 → 0.12초 뒤 하나)
+
+        start = time.perf_counter()
+        slot = shared.acquire("m", tokens=10)
+        assert time.perf_counter() - start >= 0.08
+        shared.release(slot, 0.01, 20)
+        assert registry.summary()["llm_queue"]["m:normal"]["p50_ms"] >= 80
+
+
+class TestPriorityQueue:
+    """Test ordering across priorities."""
+
+    def test_interactive_jumps_ahead_of_batch(self, registry):
+        shared = LLMScheduler(limits={}, default_limits=(0, 0), initial_concurrency=1, max_concurrency=1)
+        running = shared.acquire("m", tokens=1)
+        order = []
+
+        def call(priority, name):
+            slot = shared.acquire("m", tokens=1, priority=priority)
+            order.append(name)
+            shared.release(slot, 0.01, 1)
+
+        threads = [threading.Thread(target=call, args=(PRIORITY_BATCH, f"batch-{i}")) for i in range(3)]
+        threads.append(threading.Thread(target=call, args=(PRIORITY_INTERACTIVE, "interactive")))
+        for thread in threads:
+            thread.start()
+            time.sleep(0.02)  # 제출 순서 고정
+        assert shared.stats()["m"]["queued_by_priority"] == {"interactive": 1, "batch": 3}
+
+        shared.release(running, 0.01, 1)
+        for thread in threads:
+            thread.join(5)
+        assert order[0] == "interactive"
+        assert sorted(order[1:]) == ["batch-0", "batch-1", "batch-2"]
+
+    def test_context_priority_for_async_calls(self, registry, shared):
+        model = ScheduledChatModel(inner=FakeChatModel(latency=0, model_name="m"))
+
+        async def run():
+            with llm_priority(PRIORITY_BATCH):
+                await model.ainvoke("초안")
+            await model.ainvoke("질문")
+
+        asyncio.run(run())
+        assert set(registry.summary()["llm_queue"]) == {"m:batch", "m:normal"}
+
+
+class TestAdaptiveConcurrency:
+    """Test AIMD limits and scheduler-owned retries."""
+
+    def test_rate_limit_halves_and_success_grows(self, registry):
+        shared = LLMScheduler(limits={}, default_limits=(0, 0), initial_concurrency=4, backoff_seconds=0.05)
+        slot = shared.acquire("m", tokens=1)
+        shared.release(slot, 0.5, error=ModelRateLimitError("429"))
+
+        stats = shared.stats()["m"]
+        assert (stats["limit"], stats["rate_limited"]) == (2.0, 1)
+        assert stats["cooldown_seconds"] > 0
+
+        start = time.perf_counter()
+        slot = shared.acquire("m", tokens=1)  # 멈춤 시간이 끝날 때까지 대기
+        assert time.perf_counter() - start >= 0.03
+        shared.release(slot, 0.5, 1000)
+        assert shared.stats()["m"]["limit"] == 2.5
+
+    def test_latency_spike_shrinks_limit(self, registry):
+        shared = LLMScheduler(limits={}, default_limits=(0, 0), initial_concurrency=4, latency_tolerance=2.0)
+        for seconds in (0.1, 0.1, 0.1, 5.0):
+            shared.release(shared.acquire("m", tokens=1), seconds, 1000)
+
+        stats = shared.stats()["m"]
+        assert stats["latency_backoffs"] == 1
+        assert stats["limit"] < 4.7
+
+    def test_model_retries_through_queue(self, registry, shared):
+        inner = FakeChatModel(latency=0, model_name="m", failures=2)
+        model = ScheduledChatModel(inner=inner, max_retries=3)
+
+        assert model.invoke("프롬프트").content
+        assert shared.stats()["m"]["rate_limited"] == 2
+        queue = registry.summary()["llm_queue"]["m:normal"]
+        assert (queue["count"], queue["retry"]) == (3, 2)
+        assert shared.stats()["m"]["in_flight"] == 0
+
+    def test_gives_up_after_max_retries(self, registry, shared):
+        model = ScheduledChatModel(inner=FakeChatModel(latency=0, model_name="m", failures=5), max_retries=2)
+
+        with pytest.raises(ModelRateLimitError):
+            model.invoke("프롬프트")
+        assert shared.stats()["m"]["in_flight"] == 0
+
+    def test_closed_stream_releases_slot(self, registry, shared):
+        model = ScheduledChatModel(inner=FakeChatModel(latency=0, model_name="m", chunk_chars=5))
+
+        stream = model.stream("본문")
+        next(stream)
+        stream.close()
+        assert shared.stats()["m"]["in_flight"] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
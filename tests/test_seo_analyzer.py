@@ -0,0 +1,161 @@
+"""Unit tests for the single-pass SEO analyzer."""
+
+import pytest
+
+from blog_writer.tools.seo_analyzer import (
+    KeywordMatcher,
+    SEOReportCache,
+    analyze_seo,
+    calculate_seo_score,
+    score_many,
+    split_sections,
+)
+
+CONTENT = """# 열성 경련 이야기
+
+## 열성 경련이란?
+
+열성 경련은 생후 6개월~5세 아이에게 나타납니다. 체온 38.5도 이상에서 흔합니다!
+
+### 단순형과 복합형
+
+- **단순형**: 15분 이내
+- **복합형**: 15분 이상
+
+## 응급처치
+
+옆으로 눕히세요. 시간을 재세요? 자세한 내용은 https://example.com/a.b 참고
+"""
+
+
+class TestKeywordMatcher:
+    """Test Aho-Corasick keyword counting."""
+
+    def _count(self, keywords, text):
+        matcher = KeywordMatcher(keywords)
+        counts = [0] * len(keywords)
+        matcher.count(text.lower(), counts)
+        return counts
+
+    def test_nested_and_overlapping_keywords(self):
+        counts = self._count(["열성 경련", "경련", "성 경"], "열성 경련과 경련")
+
+        assert counts == [1, 2, 1]
+
+    def test_case_insensitive(self):
+        assert self._count(["SEO", "Blog"], "seo SEO blog") == [2, 1]
+
+    def test_self_overlapping_matches_are_not_double_counted(self):
+        # str.count와 같이 겹치는 등장은 한 번만 셈
+        assert self._count(["aa", "아아"], "aaa aaaa 아아아") == [3, 1]
+
+    def test_matches_str_count_on_random_text(self):
+        text = "abababcabcab 가나가나다 aaaaa 가나가나가 " * 5
+        keywords = ["ab", "abc", "ca", "가나", "나다", "zz", "aa", "aba", "가나가"]
+
+        assert self._count(keywords, text) == [text.count(k) for k in keywords]
+
+
+class TestAnalyzeSeo:
+    """Test metrics gathered in a single scan."""
+
+    def test_result_shape_is_unchanged(self):
+        result = calculate_seo_score.invoke({"content": CONTENT, "keywords": ["열성 경련"]})
+
+        assert set(result) == {
+            "score", "word_count", "keyword_density", "avg_sentence_length",
+            "header_count", "h2_count", "h3_count", "recommendations",
+        }
+
+    def test_headers_parsed_per_line(self):
+        result = analyze_seo(CONTENT, [])
+
+        assert result["h2_count"] == 2
+        assert result["h3_count"] == 1
+        assert result["header_count"] == 3
+
+    def test_markdown_symbols_are_not_words(self):
+        result = analyze_seo("## 제목\n\n- **굵게** | 표 |", [])
+
+        assert result["word_count"] == 3
+
+    def test_sentence_ends_ignore_decimals_and_urls(self):
+        result = analyze_seo("체온 38.5도입니다. 링크 https://example.com/a.b 참고하세요!", [])
+
+        assert result["word_count"] == 7
+        assert result["avg_sentence_length"] == 3.5
+
+    def test_keyword_density(self):
+        result = analyze_seo("열성 경련 열성 경련 아이", ["열성 경련"])
+
+        assert result["keyword_density"]["열성 경련"] == pytest.approx(2 / 5 * 100)
+
+
+class TestSEOReportCache:
+    """Test content-hash memoization and section-level rescoring."""
+
+    def test_repeat_scoring_hits_cache(self):
+        cache = SEOReportCache(max_entries=4, max_sections=16)
+
+        first = cache.score(CONTENT, ["열성 경련"])
+        first["recommendations"].append("mutated by caller")
+        second = cache.score(CONTENT, ["열성 경련"])
+
+        assert cache.stats()["hits"] == 1
+        assert second == analyze_seo(CONTENT, ["열성 경련"])
+
+    def test_keywords_are_part_of_the_key(self):
+        cache = SEOReportCache(max_entries=4, max_sections=16)
+
+        cache.score(CONTENT, ["열성 경련"])
+        report = cache.score(CONTENT, ["응급처치"])
+
+        assert list(report["keyword_density"]) == ["응급처치"]
+        assert cache.stats()["hits"] == 0
+
+    def test_lru_eviction(self):
+        cache = SEOReportCache(max_entries=2, max_sections=16)
+
+        for text in ("a.", "b.", "c."):
+            cache.score(text, [])
+        cache.score("a.", [])
+
+        assert cache.stats()["entries"] == 2
+        assert cache.stats()["hits"] == 0
+
+    def test_only_changed_sections_are_rescanned(self):
+        cache = SEOReportCache(max_entries=4, max_sections=16)
+        edited = CONTENT.replace("옆으로 눕히세요.", "옆으로 눕히고 열성 경련 시간을 재세요.")
+
+        cache.score(CONTENT, ["열성 경련"])
+        report = cache.score(edited, ["열성 경련"])
+
+        sections = split_sections(CONTENT)
+        assert "".join(sections) == CONTENT
+        assert cache.stats()["sections_reused"] == len(sections) - 1
+        assert report == analyze_seo(edited, ["열성 경련"])
+
+
+class TestScoreMany:
+    """Test batch scoring API."""
+
+    def test_process_pool_matches_single_scoring_in_order(self):
+        documents = [CONTENT, "짧은 글.", CONTENT.replace("## 응급처치", "## 응급처치\n\n## 추가")]
+
+        reports = list(score_many(documents, ["열성 경련"], workers=2, chunksize=1))
+
+        assert reports == [analyze_seo(doc, ["열성 경련"]) for doc in documents]
+
+    def test_per_document_keywords(self):
+        reports = list(score_many([("SEO 글.", ["SEO"]), ("블로그 글.", ["블로그"])], workers=1))
+
+        assert [list(r["keyword_density"]) for r in reports] == [["SEO"], ["블로그"]]
+
+    def test_shared_keywords_override_document_keywords(self):
+        reports = list(score_many([("SEO 글.", ["SEO"])], keywords=["글"], workers=1))
+
+        assert list(reports[0]["keyword_density"]) == ["글"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,57 @@
+"""Unit tests for the batch SEO re-scoring CLI."""
+
+import json
+
+import pytest
+
+from blog_writer.tools import seo_batch
+
+POST = """---
+title: "열성 경련 대처법"
+date: 2025-01-01
+keywords: [열성 경련, 응급처치]
+seo_score: 60
+word_count: 1200
+---
+
+## 열성 경련이란?
+
+열성 경련은 흔합니다. 응급처치를 알아두세요.
+"""
+
+
+class TestParseFrontmatter:
+    """Test frontmatter parsing in the save_blog_to_markdown format."""
+
+    def test_parses_lists_strings_and_numbers(self):
+        meta, body = seo_batch.parse_frontmatter(POST)
+
+        assert meta["title"] == "열성 경련 대처법"
+        assert meta["keywords"] == ["열성 경련", "응급처치"]
+        assert meta["seo_score"] == 60
+        assert body.startswith("## 열성 경련이란?")
+
+    def test_without_frontmatter(self):
+        assert seo_batch.parse_frontmatter("## 제목\n본문") == ({}, "## 제목\n본문")
+
+
+class TestMain:
+    """Test end-to-end JSONL output."""
+
+    def test_writes_one_record_per_post(self, tmp_path):
+        (tmp_path / "a.md").write_text(POST, encoding="utf-8")
+        (tmp_path / "b.md").write_text(POST.replace("seo_score: 60", "seo_score: 70"), encoding="utf-8")
+        (tmp_path / "a_research.md").write_text("# 조사 노트", encoding="utf-8")
+        out = tmp_path / "scores.jsonl"
+
+        seo_batch.main([str(tmp_path), "--out", str(out), "--workers", "1"])
+
+        records = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+        assert [r["previous_score"] for r in records] == [60, 70]
+        assert records[0]["keywords"] == ["열성 경련", "응급처치"]
+        assert records[0]["h2_count"] == 1
+        assert "score" in records[0]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,97 @@
+"""Unit tests for LLM token streaming from graph nodes."""
+
+import asyncio
+from typing import TypedDict
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import StateGraph, START, END
+
+from blog_writer.agents.streaming import astream_llm, stream_llm
+
+RESPONSE = "## 제목\n\n새벽 1시, 고속도로를 달리는데 순찰차가 저를 멈춰 세웠다."
+
+
+class _State(TypedDict):
+    draft: str
+
+
+def _make_llm():
+    return GenericFakeChatModel(messages=iter([AIMessage(content=RESPONSE)]))
+
+
+def _build_graph(llm):
+    def write(state: _State) -> dict:
+        return {"draft": stream_llm(llm, "prompt", node="write", label="초안")}
+
+    builder = StateGraph(_State)
+    builder.add_node("write", write)
+    builder.add_edge(START, "write")
+    builder.add_edge("write", END)
+    return builder.compile(checkpointer=MemorySaver())
+
+
+class TestStreamLLM:
+    """Test streaming helper inside and outside the graph."""
+
+    def test_outside_graph_falls_back_to_invoke(self):
+        assert stream_llm(_make_llm(), "prompt", node="write", label="초안") == RESPONSE
+
+    def test_custom_stream_emits_tokens(self):
+        graph = _build_graph(_make_llm())
+        config = {"configurable": {"thread_id": "stream"}}
+
+        events = list(graph.stream({"draft": ""}, config, stream_mode="custom"))
+
+        assert events[0] == {"type": "llm_start", "node": "write", "label": "초안"}
+        assert events[-1] == {"type": "llm_end", "node": "write", "label": "초안"}
+        tokens = [e["text"] for e in events if e["type"] == "token"]
+        assert len(tokens) > 1
+        assert "".join(tokens) == RESPONSE
+
+    def test_final_state_matches_non_streaming_path(self):
+        streamed = _build_graph(_make_llm())
+        plain = _build_graph(_make_llm())
+        config = {"configurable": {"thread_id": "same"}}
+
+        list(streamed.stream({"draft": ""}, config, stream_mode=["updates", "custom"]))
+        plain.invoke({"draft": ""}, config)
+
+        assert streamed.get_state(config).values == plain.get_state(config).values
+        assert streamed.get_state(config).values["draft"] == RESPONSE
+
+
+class TestAStreamLLM:
+    """Test the async streaming helper."""
+
+    def test_outside_graph_falls_back_to_ainvoke(self):
+        text = asyncio.run(astream_llm(_make_llm(), "prompt", node="write", label="초안"))
+
+        assert text == RESPONSE
+
+    def test_async_graph_emits_same_events(self):
+        async def write(state: _State) -> dict:
+            return {"draft": await astream_llm(_make_llm(), "prompt", node="write", label="초안")}
+
+        builder = StateGraph(_State)
+        builder.add_node("write", write)
+        builder.add_edge(START, "write")
+        builder.add_edge("write", END)
+        graph = builder.compile(checkpointer=MemorySaver())
+        config = {"configurable": {"thread_id": "astream"}}
+
+        async def collect():
+            return [e async for e in graph.astream({"draft": ""}, config, stream_mode="custom")]
+
+        events = asyncio.run(collect())
+
+        assert events[0] == {"type": "llm_start", "node": "write", "label": "초안"}
+        assert events[-1] == {"type": "llm_end", "node": "write", "label": "초안"}
+        assert "".join(e["text"] for e in events if e["type"] == "token") == RESPONSE
+        assert graph.get_state(config).values["draft"] == RESPONSE
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
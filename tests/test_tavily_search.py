@@ -0,0 +1,299 @@
+"""Unit tests for Tavily search tool, result cache and batch search."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from blog_writer.tools import tavily_search
+from blog_writer.tools.tavily_search import SearchCache, normalize_query
+
+
+class _FakeTavilyClient:
+    """Records search calls instead of hitting the Tavily API."""
+
+    calls = []
+
+    def search(self, query, **kwargs):
+        _FakeTavilyClient.calls.append((query, kwargs))
+        return {
+            "answer": f"answer for {query}",
+            "results": [
+                {
+                    "title": "T",
+                    "url": "https://example.com",
+                    "content": "C",
+                    "score": 0.9,
+                    "raw_content": "R" * 100 if kwargs.get("include_raw_content") else None
+                }
+            ]
+        }
+
+
+@pytest.fixture
+def cache():
+    return SearchCache(db_path=":memory:", ttl_seconds=60, max_entries=3)
+
+
+@pytest.fixture
+def fake_client(monkeypatch, cache):
+    _FakeTavilyClient.calls = []
+    monkeypatch.setattr(tavily_search, "get_tavily_client", _FakeTavilyClient)
+    monkeypatch.setattr(tavily_search, "get_search_cache", lambda: cache)
+    return _FakeTavilyClient
+
+
+class TestQueryNormalization:
+    """Test cache key normalization."""
+
+    def test_whitespace_and_case(self):
+        assert normalize_query("  AI   의료\t진단 ") == normalize_query("ai 의료 진단")
+
+    def test_key_includes_search_params(self):
+        key_a = SearchCache.make_key("q", search_depth="advanced", max_results=10)
+        key_b = SearchCache.make_key("q", search_depth="advanced", max_results=5)
+        assert key_a != key_b
+
+
+class TestSearchCache:
+    """Test TTL, LRU eviction and counters."""
+
+    def test_hit_and_miss_counters(self, cache):
+        assert cache.get("k") is None
+        cache.set("k", "q", {"answer": "a"})
+        assert cache.get("k") == {"answer": "a"}
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_expired_entry_is_miss(self, cache, monkeypatch):
+        cache.set("k", "q", {"answer": "a"})
+        now = tavily_search.time.time()
+        monkeypatch.setattr(tavily_search.time, "time", lambda: now + 61)
+
+        assert cache.get("k") is None
+        assert cache.stats()["entries"] == 0
+
+    def test_lru_eviction(self, cache, monkeypatch):
+        clock = iter(range(100, 200))
+        monkeypatch.setattr(tavily_search.time, "time", lambda: next(clock))
+
+        for key in ("a", "b", "c"):
+            cache.set(key, key, {"v": key})
+        cache.get("a")  # a를 최근 사용으로 갱신
+        cache.set("d", "d", {"v": "d"})
+
+        assert cache.stats()["entries"] == 3
+        assert cache.get("b") is None
+        assert cache.get("a") == {"v": "a"}
+
+
+class TestDeepResearchCaching:
+    """Test deep_research cache integration."""
+
+    def test_repeated_query_served_from_cache(self, fake_client, cache):
+        first = tavily_search.deep_research.invoke({"query": "AI 의료 최신 정보 2025"})
+        second = tavily_search.deep_research.invoke({"query": "ai  의료 최신 정보 2025"})
+
+        assert len(fake_client.calls) == 1
+        assert second["answer"] == first["answer"]
+        assert second["query"] == "ai  의료 최신 정보 2025"
+        assert cache.stats()["hits"] == 1
+
+    def test_force_refresh_bypasses_cache(self, fake_client):
+        tavily_search.deep_research.invoke({"query": "q"})
+        tavily_search.deep_research.invoke({"query": "q", "force_refresh": True})
+
+        assert len(fake_client.calls) == 2
+
+
+class TestSearchProfiles:
+    """Test per-query field profiles."""
+
+    def test_snippets_is_default_and_skips_raw_content(self, fake_client):
+        result = tavily_search.deep_research.invoke({"query": "q"})
+
+        assert fake_client.calls[0][1]["include_raw_content"] is False
+        assert "raw_content" not in result["results"][0]
+        assert result["stats"]["cached"] is False
+
+    def test_full_profile_keeps_raw_content(self, fake_client):
+        result = tavily_search.deep_research.invoke({"query": "q", "profile": "full"})
+
+        assert fake_client.calls[0][1]["include_raw_content"] is True
+        assert result["results"][0]["raw_content"] == "R" * 100
+
+    def test_answer_only_requests_no_results(self, fake_client):
+        result = tavily_search.deep_research.invoke({"query": "q", "profile": "answer-only"})
+
+        assert fake_client.calls[0][1]["max_results"] == 0
+        assert result["answer"] == "answer for q"
+        assert result["results"] == []
+
+    def test_profiles_are_cached_separately(self, fake_client):
+        tavily_search.deep_research.invoke({"query": "q", "profile": "answer-only"})
+        result = tavily_search.deep_research.invoke({"query": "q", "profile": "snippets"})
+
+        assert len(fake_client.calls) == 2
+        assert len(result["results"]) == 1
+
+    def test_cache_hit_reports_zero_bytes(self, fake_client):
+        tavily_search.deep_research.invoke({"query": "q"})
+        result = tavily_search.deep_research.invoke({"query": "q"})
+
+        assert result["stats"] == {"response_bytes": 0, "parse_ms": 0.0, "cached": True}
+
+    def test_summarize_search_stats(self):
+        results = [
+            {"stats": {"response_bytes": 100, "parse_ms": 1.5, "cached": False}},
+            {"stats": {"response_bytes": 0, "parse_ms": 0.0, "cached": True}},
+            {"answer": "N/A", "results": []},
+        ]
+
+        summary = tavily_search.summarize_search_stats(results)
+
+        assert summary == {"queries": 3, "response_bytes": 100, "parse_ms": 1.5, "cache_hits": 1}
+
+
+class _FakeSearch:
+    """Stand-in for the deep_research tool with per-query latency."""
+
+    def __init__(self, delay: float = 0.0, fail_on: str = ""):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def invoke(self, args):
+        query = args["query"]
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if self.fail_on and self.fail_on in query:
+                raise RuntimeError("search failed")
+            return {"answer": f"answer: {query}", "results": [], "query": query}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class TestDeepResearchMany:
+    """Test concurrent batch search."""
+
+    def test_results_keep_query_order(self, monkeypatch):
+        """Results are merged in the same order as the queries."""
+        monkeypatch.setattr(tavily_search, "deep_research", _FakeSearch(delay=0.01))
+        queries = [f"query {i}" for i in range(6)]
+
+        results = tavily_search.deep_research_many(queries)
+
+        assert [r["query"] for r in results] == queries
+
+    def test_partial_failure_degrades_to_na(self, monkeypatch):
+        """A failing keyword query yields N/A instead of raising."""
+        monkeypatch.setattr(tavily_search, "deep_research", _FakeSearch(fail_on="bad"))
+
+        results = tavily_search.deep_research_many(["good 1", "bad", "good 2"])
+
+        assert results[0]["answer"] == "answer: good 1"
+        assert results[1]["answer"] == "N/A"
+        assert results[1]["results"] == []
+        assert results[2]["answer"] == "answer: good 2"
+
+    def test_respects_max_concurrency(self, monkeypatch):
+        """No more than research_max_concurrency searches run at once."""
+        fake = _FakeSearch(delay=0.05)
+        monkeypatch.setattr(tavily_search, "deep_research", fake)
+        monkeypatch.setattr(tavily_search.settings, "research_max_concurrency", 2)
+
+        tavily_search.deep_research_many([f"q{i}" for i in range(6)])
+
+        assert fake.max_in_flight == 2
+
+    def test_wall_clock_scales_with_slowest_query(self, monkeypatch):
+        """Concurrent fan-out takes about one query's latency, not the sum."""
+        monkeypatch.setattr(tavily_search, "deep_research", _FakeSearch(delay=0.2))
+        monkeypatch.setattr(tavily_search.settings, "research_max_concurrency", 7)
+
+        start = time.perf_counter()
+        tavily_search.deep_research_many([f"q{i}" for i in range(7)])
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.2 * 3
+
+    def test_client_is_shared(self):
+        """All searches reuse one pooled client and session."""
+        tavily_search.reset_tavily_client()
+        try:
+            client = tavily_search.get_tavily_client()
+            assert tavily_search.get_tavily_client() is client
+            adapter = client.session.get_adapter("https://api.tavily.com")
+            assert adapter._pool_maxsize == tavily_search.settings.research_max_concurrency
+        finally:
+            tavily_search.reset_tavily_client()
+
+    def test_unsupported_client_is_reported(self, monkeypatch, capsys):
+        """An old tavily-python without session= is reported, not just degraded to N/A."""
+
+        class _OldTavilyClient:
+            def __init__(self, api_key=None, api_base_url=None):
+                pass
+
+        monkeypatch.setattr(tavily_search, "TavilyClient", _OldTavilyClient)
+        tavily_search.reset_tavily_client()
+        try:
+            with pytest.raises(TypeError):
+                tavily_search.get_tavily_client()
+        finally:
+            tavily_search.reset_tavily_client()
+
+        assert tavily_search._MIN_TAVILY_VERSION in capsys.readouterr().out
+
+    def test_async_client_is_shared_per_loop(self, monkeypatch):
+        """The real AsyncTavilyClient is built once per event loop around the pooled httpx client."""
+        monkeypatch.setattr(tavily_search.settings, "tavily_api_key", "test-key")
+
+        async def build():
+            client = tavily_search.get_async_tavily_client()
+            try:
+                assert tavily_search.get_async_tavily_client() is client
+                return client, client._client
+            finally:
+                await client._client.aclose()
+
+        client, http_client = asyncio.run(build())
+
+        assert isinstance(client, tavily_search.AsyncTavilyClient)
+        assert isinstance(http_client, httpx.AsyncClient)
+        assert str(http_client.base_url).startswith("https://api.tavily.com")
+        assert http_client.headers["Authorization"] == "Bearer test-key"
+
+    def test_unsupported_async_client_is_reported(self, monkeypatch, capsys):
+        """An old tavily-python without client= is reported before the search degrades to N/A."""
+
+        class _OldAsyncTavilyClient:
+            def __init__(self, api_key=None):
+                pass
+
+        monkeypatch.setattr(tavily_search, "AsyncTavilyClient", _OldAsyncTavilyClient)
+        monkeypatch.setattr(tavily_search, "get_search_cache", lambda: None)
+
+        with pytest.raises(TypeError):
+            asyncio.run(tavily_search.adeep_research("열성 경련"))
+
+        assert tavily_search._MIN_TAVILY_VERSION in capsys.readouterr().out
+
+    def test_empty_queries(self):
+        """No queries means no searches."""
+        assert tavily_search.deep_research_many([]) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,210 @@
+"""Unit tests for section-parallel drafting in the writing agent."""
+
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from blog_writer.agents import writing_agent
+
+OUTLINE = """# 열성 경련, 3분이 30분 같았던 밤
+
+도입부: 새벽 1시 응급실 장면으로 시작
+
+## 열성 경련이란?
+- 생후 6개월~5세, 발열 동반
+
+### 단순형과 복합형
+- 15분 기준
+
+## 집에서 해야 할 응급처치
+- 옆으로 눕히기, 시간 재기
+
+## 배운 것들
+- 체크리스트
+"""
+
+
+class _FakeLLM:
+    """Echoes the section index from the prompt after a fixed delay."""
+
+    def __init__(self, delay: float = 0.0, reply: str = ""):
+        self.delay = delay
+        self.reply = reply
+        self.prompts = []
+        self._lock = threading.Lock()
+
+    def invoke(self, prompt):
+        with self._lock:
+            self.prompts.append(prompt)
+        time.sleep(self.delay)
+        if self.reply:
+            return SimpleNamespace(content=self.reply)
+        marker = prompt.split("개 섹션의 ", 1)[1].split("번째", 1)[0]
+        return SimpleNamespace(content=f"섹션 {marker} 본문이다.")
+
+
+class _ScriptedLLM:
+    """Plays outline, section and single-shot draft replies; one section fails `failures` times."""
+
+    def __init__(self, failing_section: str = "", failures: int = 10):
+        self.failing_section = failing_section
+        self.failures = failures
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def invoke(self, prompt):
+        if "개 섹션의 " in prompt:
+            marker = prompt.split("개 섹션의 ", 1)[1].split("번째", 1)[0]
+            with self._lock:
+                self.calls.append(f"section {marker}")
+                failing = marker == self.failing_section and self.failures > 0
+                self.failures -= failing
+            if failing:
+                raise RuntimeError("quota exhausted")
+            return SimpleNamespace(content=f"섹션 {marker} 본문이다.")
+        kind = "draft" if "완성된 블로그 글" in prompt else "outline"
+        with self._lock:
+            self.calls.append(kind)
+        return SimpleNamespace(content=OUTLINE if kind == "outline" else "한 번에 쓴 초안")
+
+    async def ainvoke(self, prompt):
+        return self.invoke(prompt)
+
+
+class TestSplitOutline:
+    """Test outline parsing into H2 sections."""
+
+    def test_splits_on_h2_only(self):
+        sections = writing_agent._split_outline_sections(OUTLINE)
+
+        assert [s["title"] for s in sections] == [
+            "도입부", "열성 경련이란?", "집에서 해야 할 응급처치", "배운 것들"
+        ]
+        assert sections[0]["is_intro"] is True
+        assert "### 단순형과 복합형" in sections[1]["plan"]
+
+    def test_no_h2_means_no_sections(self):
+        assert len(writing_agent._split_outline_sections("그냥 한 덩어리 개요")) <= 1
+
+
+class TestResearchSlice:
+    """Test per-section research selection."""
+
+    def test_picks_relevant_paragraphs_in_order(self):
+        research = "열성 경련은 흔하다.\n\n주식 시장 동향.\n\n응급처치는 옆으로 눕히기다."
+
+        sliced = writing_agent._research_slice(research, "열성 경련 응급처치", max_chars=30)
+
+        assert "주식" not in sliced
+        assert sliced.index("열성") < sliced.index("응급처치")
+
+
+class TestWriteSections:
+    """Test concurrent section drafting and stitching."""
+
+    def _write(self, llm, smoothing_llm):
+        sections = writing_agent._split_outline_sections(OUTLINE)
+        return writing_agent._write_sections(
+            llm,
+            smoothing_llm,
+            sections=sections,
+            outline=OUTLINE,
+            research="조사 자료",
+            custom_style="스타일",
+            clarification_context="",
+            keywords=["열성 경련"],
+            target_length=2000
+        )
+
+    def test_sections_stitched_in_outline_order(self):
+        draft = self._write(_FakeLLM(), _FakeLLM(reply="없음"))
+
+        positions = [draft.index(f"섹션 {i} 본문") for i in range(1, 5)]
+        assert positions == sorted(positions)
+
+    def test_transitions_are_inserted_between_sections(self):
+        draft = self._write(_FakeLLM(), _FakeLLM(reply="그렇다면 무엇을 해야 할까?"))
+
+        assert draft.count("그렇다면 무엇을 해야 할까?") == 3
+
+    def test_latency_scales_with_longest_section(self, monkeypatch):
+        monkeypatch.setattr(writing_agent.settings, "draft_max_concurrency", 4)
+
+        start = time.perf_counter()
+        self._write(_FakeLLM(delay=0.2), _FakeLLM(reply="없음"))
+
+        assert time.perf_counter() - start < 0.2 * 3
+
+
+class TestSectionFailure:
+    """Test that a failed section is rewritten alone, then falls back to the single-shot draft."""
+
+    STATE = {"topic": "열성 경련", "research_data": "조사 자료", "keywords": ["열성 경련"], "target_length": 2000}
+
+    def _agent(self, monkeypatch, llm, async_mode=False):
+        monkeypatch.setattr(writing_agent.settings, "draft_mode", "sections")
+        monkeypatch.setattr(writing_agent, "get_llm", lambda *args, **kwargs: llm)
+        return writing_agent.create_writing_agent(async_mode=async_mode)
+
+    def test_write_sections_reports_failure(self):
+        sections = writing_agent._split_outline_sections(OUTLINE)
+        smoothing_llm = _FakeLLM(reply="없음")
+
+        draft = writing_agent._write_sections(
+            _ScriptedLLM(failing_section="2"), smoothing_llm, sections, OUTLINE,
+            "조사 자료", "스타일", "", ["열성 경련"], 2000
+        )
+
+        assert draft is None
+        # 실패한 초안에는 전환 문장을 만들지 않음
+        assert smoothing_llm.prompts == []
+
+    def test_only_failed_section_is_rewritten(self, monkeypatch):
+        llm = _ScriptedLLM(failing_section="2", failures=1)
+
+        result = self._agent(monkeypatch, llm)(self.STATE)
+
+        # 성공한 섹션은 그대로 쓰고 실패한 섹션만 한 번 더 호출
+        assert [llm.calls.count(f"section {i}") for i in range(1, 5)] == [1, 2, 1, 1]
+        assert "draft" not in llm.calls
+        assert "섹션 2 본문" in result["draft_content"]
+
+    def test_async_only_failed_section_is_rewritten(self, monkeypatch):
+        llm = _ScriptedLLM(failing_section="3", failures=1)
+
+        result = asyncio.run(self._agent(monkeypatch, llm, async_mode=True)(self.STATE))
+
+        assert [llm.calls.count(f"section {i}") for i in range(1, 5)] == [1, 1, 2, 1]
+        assert "draft" not in llm.calls
+        assert "섹션 3 본문" in result["draft_content"]
+
+    def test_node_falls_back_to_single_shot(self, monkeypatch):
+        llm = _ScriptedLLM(failing_section="2")
+
+        result = self._agent(monkeypatch, llm)(self.STATE)
+
+        assert result["draft_content"] == "한 번에 쓴 초안"
+        assert llm.calls[-1] == "draft"
+
+    def test_async_node_falls_back_to_single_shot(self, monkeypatch):
+        llm = _ScriptedLLM(failing_section="3")
+
+        result = asyncio.run(self._agent(monkeypatch, llm, async_mode=True)(self.STATE))
+
+        assert result["draft_content"] == "한 번에 쓴 초안"
+        assert llm.calls[-1] == "draft"
+
+    def test_node_keeps_sections_when_all_succeed(self, monkeypatch):
+        llm = _ScriptedLLM()
+
+        result = self._agent(monkeypatch, llm)(self.STATE)
+
+        assert "섹션 4 본문" in result["draft_content"]
+        assert "draft" not in llm.calls
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])